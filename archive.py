@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Sütunlu Koşu Arşivi
+Her koşunun sonucunu ve girdilerini (seed, oyun ayarlarının hash'i, skor,
+süre, ölüm nedeni, tarih, flap kareleri) toplu analiz için sütun blokları
+halinde saklar. JSON satırları milyonlarca koşuda hem yer hem okuma süresi
+olarak ölçeklenmez.
+
+Arşiv bir klasördür:
+  runs.dat  Art arda eklenen bloklar. Blok: başlık (sihirli sözcük, koşu
+            sayısı, sütun boyları) + sütun başına ayrı zlib ile sıkıştırılmış
+            dizi. Flap kareleri bir öncekine göre fark olarak (delta) saklanır.
+  runs.idx  Blok başına sabit boyutlu kayıt: konum, boy, koşu sayısı, en
+            küçük/büyük skor ve tarih. Okuyucu bunu NumPy memmap ile açar.
+
+Okuyucu veriyi mmap ile açar; skor/tarih filtresinde önce dizinle eşleşemeyecek
+bloklar atlanır, kalanlarda yalnızca skor (ve tarih) sütunu açılır; diğer
+sütunlar ve flap'ler ancak blokta eşleşen koşu varsa açılır. Sonuçlar üreteçle
+akar. Yazıcı koşuları bellekte toplayıp blok halinde ekler; önce veri, sonra
+dizin yazıldığından okuyucular yarım blok görmez. Aynı arşive oyun ve ekransız
+koşucular birlikte yazabilir (POSIX'te dosya kilidiyle).
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+import zlib
+from typing import Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+import config
+from config import *
+from collision import CAUSE_ORDER
+from trajectory import config_hash
+
+try:
+    import fcntl  # Eşzamanlı yazıcılar için (Windows'ta yok; tek yazıcı varsayılır)
+except ImportError:
+    fcntl = None
+
+DATA_FILE = 'runs.dat'
+INDEX_FILE = 'runs.idx'
+LOCK_FILE = 'runs.lock'
+BLOCK_MAGIC = b'FRB1'
+
+# Ölüm nedeni kodları: 0 hayatta (kare sınırına ulaştı), sonra step() sırası
+CAUSE_CODES = (None,) + CAUSE_ORDER
+
+# Sütunlar ve disk düzenleri (küçük uçlu); flap_deltas koşuların flap'leri art arda
+COLUMNS = (
+    ('seed', '<i8'),
+    ('config_hash', '<u8'),
+    ('score', '<i4'),
+    ('frames', '<i4'),
+    ('cause', 'u1'),
+    ('timestamp', '<f8'),
+    ('flap_count', '<i4'),
+    ('flap_deltas', '<u4'),
+)
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+BLOCK_HEADER = struct.Struct(f"<4sI{len(COLUMNS)}I")
+
+INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('size', '<u4'),
+    ('count', '<u4'),
+    ('score_min', '<i4'),
+    ('score_max', '<i4'),
+    ('time_min', '<f8'),
+    ('time_max', '<f8'),
+])
+
+# Oyun ayarları hash'ine giren sabitler (sweep.apply_params değiştirebilir)
+GAMEPLAY_CONSTANTS = (
+    'SCREEN_WIDTH', 'SCREEN_HEIGHT', 'FPS',
+    'BIRD_WIDTH', 'BIRD_HEIGHT', 'BIRD_START_X', 'BIRD_START_Y',
+    'BIRD_GRAVITY', 'BIRD_FLAP_STRENGTH', 'BIRD_MAX_FALL_SPEED',
+    'PIPE_WIDTH', 'PIPE_GAP', 'PIPE_SPEED', 'PIPE_SPAWN_DISTANCE',
+    'PIPE_MIN_HEIGHT', 'PIPE_MAX_HEIGHT',
+    'OBSTACLE_WIDTH', 'OBSTACLE_HEIGHT', 'OBSTACLE_SPEED', 'OBSTACLE_SPAWN_CHANCE',
+    'GROUND_HEIGHT', 'GROUND_SPEED', 'LAYOUT_Y_QUANTUM', 'LAYOUT_OBSTACLE_CLEARANCE', 'LAYOUT_OBSTACLES',
+)
+
+
+class Run(NamedTuple):
+    """Arşivdeki bir koşu (flaps yalnızca istenirse okunur)"""
+    seed: int
+    config_hash: int
+    score: int
+    frames: int
+    cause: Optional[str]
+    timestamp: float
+    flaps: Optional[List[int]]
+
+
+def gameplay_hash() -> int:
+    """Koşunun yeniden oynatılabilirliğini belirleyen sabitlerin 64 bitlik hash'i"""
+    key = tuple(getattr(config, name) for name in GAMEPLAY_CONSTANTS)
+    return int(config_hash(key), 16)
+
+
+class _ArchiveLock:
+    """Arşiv klasöründe özel kilit (fcntl yoksa hiçbir şey yapmaz)"""
+
+    def __init__(self, directory: str):
+        self.path = os.path.join(directory, LOCK_FILE)
+        self._file = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self._file = open(self.path, 'a')
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+
+class RunArchiveWriter:
+    """Koşuları bellekte toplayıp sütun blokları halinde arşive ekler"""
+
+    def __init__(self, directory: str = RUN_ARCHIVE_DIR, block_size: int = RUN_ARCHIVE_BLOCK,
+                 level: int = RUN_ARCHIVE_COMPRESSION):
+        """Klasörü gerekirse oluşturur; block_size koşu birikince blok yazılır"""
+        self.directory = directory
+        self.block_size = block_size
+        self.level = level
+        self.config_hash = gameplay_hash()
+        os.makedirs(directory, exist_ok=True)
+        self._columns = {name: [] for name in COLUMN_NAMES if name != 'flap_deltas'}
+        self._deltas: List[np.ndarray] = []
+        self.written = 0
+        self.blocks = 0
+
+    def __len__(self) -> int:
+        """Henüz yazılmamış koşu sayısı"""
+        return len(self._columns['seed'])
+
+    def append(self, seed: int, score: int, frames: int, cause: Optional[str],
+               flaps: Sequence[int], timestamp: Optional[float] = None,
+               gameplay: Optional[int] = None):
+        """Bir koşu ekler (flaps: artan flap kareleri); blok dolunca diske yazar"""
+        columns = self._columns
+        columns['seed'].append(seed)
+        columns['config_hash'].append(self.config_hash if gameplay is None else gameplay)
+        columns['score'].append(score)
+        columns['frames'].append(frames)
+        columns['cause'].append(CAUSE_CODES.index(cause))
+        columns['timestamp'].append(time.time() if timestamp is None else timestamp)
+        columns['flap_count'].append(len(flaps))
+        self._deltas.append(np.diff(np.asarray(flaps, dtype=np.int64), prepend=0))
+        if len(self) >= self.block_size:
+            self.flush()
+
+    def flush(self):
+        """Bekleyen koşuları tek blok olarak ekler (önce veri, sonra dizin)"""
+        count = len(self)
+        if not count:
+            return
+        arrays = {name: np.asarray(values, dtype=dtype)
+                  for (name, dtype), values in zip(COLUMNS, self._columns.values())}
+        arrays['flap_deltas'] = (np.concatenate(self._deltas).astype('<u4') if self._deltas
+                                 else np.empty(0, dtype='<u4'))
+        payloads = [zlib.compress(arrays[name].tobytes(), self.level) for name in COLUMN_NAMES]
+        header = BLOCK_HEADER.pack(BLOCK_MAGIC, count, *(len(payload) for payload in payloads))
+        size = len(header) + sum(len(payload) for payload in payloads)
+
+        entry = np.zeros(1, dtype=INDEX_DTYPE)
+        entry['size'] = size
+        entry['count'] = count
+        entry['score_min'] = arrays['score'].min()
+        entry['score_max'] = arrays['score'].max()
+        entry['time_min'] = arrays['timestamp'].min()
+        entry['time_max'] = arrays['timestamp'].max()
+
+        with _ArchiveLock(self.directory):
+            with open(os.path.join(self.directory, DATA_FILE), 'ab') as data:
+                entry['offset'] = data.seek(0, os.SEEK_END)
+                data.write(header)
+                for payload in payloads:
+                    data.write(payload)
+            with open(os.path.join(self.directory, INDEX_FILE), 'ab') as index:
+                index.write(entry.tobytes())
+
+        for values in self._columns.values():
+            values.clear()
+        self._deltas.clear()
+        self.written += count
+        self.blocks += 1
+
+    def close(self):
+        """Bekleyen koşuları yazar"""
+        self.flush()
+
+    def __enter__(self) -> 'RunArchiveWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RunArchive:
+    """Arşiv okuyucu - dizin memmap, veri mmap; filtreler ve üreteçler"""
+
+    def __init__(self, directory: str = RUN_ARCHIVE_DIR):
+        """Dizini ve veriyi açar (açılış anındaki tamamlanmış bloklar görülür)"""
+        self.directory = directory
+        index_path = os.path.join(directory, INDEX_FILE)
+        entries = os.path.getsize(index_path) // INDEX_DTYPE.itemsize if os.path.exists(index_path) else 0
+        if entries:
+            self.index = np.memmap(index_path, dtype=INDEX_DTYPE, mode='r', shape=(entries,))
+        else:
+            self.index = np.zeros(0, dtype=INDEX_DTYPE)
+        self._file = None
+        self._data = None
+        if entries:
+            # Dizinden sonra açıldığından dizindeki tüm bloklar eşlemede vardır
+            self._file = open(os.path.join(directory, DATA_FILE), 'rb')
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.decompressed = 0  # Açılan sütun sayısı (ölçüm için)
+
+    def __len__(self) -> int:
+        """Arşivdeki koşu sayısı"""
+        return int(self.index['count'].sum())
+
+    def close(self):
+        """Eşlemeleri kapatır"""
+        if self._data is not None:
+            self._data.close()
+            self._file.close()
+            self._data = self._file = None
+        self.index = np.zeros(0, dtype=INDEX_DTYPE)
+
+    def __enter__(self) -> 'RunArchive':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def blocks(self, min_score: Optional[int] = None, max_score: Optional[int] = None,
+               since: Optional[float] = None, until: Optional[float] = None) -> np.ndarray:
+        """Dizine göre eşleşen koşu içerebilecek blokların sıraları"""
+        index = self.index
+        mask = np.ones(len(index), dtype=bool)
+        if min_score is not None:
+            mask &= index['score_max'] >= min_score
+        if max_score is not None:
+            mask &= index['score_min'] <= max_score
+        if since is not None:
+            mask &= index['time_max'] >= since
+        if until is not None:
+            mask &= index['time_min'] <= until
+        return np.flatnonzero(mask)
+
+    def column(self, block: int, name: str) -> np.ndarray:
+        """Bloğun tek bir sütununu açar"""
+        entry = self.index[block]
+        offset = int(entry['offset'])
+        magic, count, *sizes = BLOCK_HEADER.unpack_from(self._data, offset)
+        if magic != BLOCK_MAGIC:
+            raise ValueError(f"Bozuk arşiv bloğu: {block}")
+        position = COLUMN_NAMES.index(name)
+        start = offset + BLOCK_HEADER.size + sum(sizes[:position])
+        raw = zlib.decompress(memoryview(self._data)[start:start + sizes[position]])
+        self.decompressed += 1
+        return np.frombuffer(raw, dtype=COLUMNS[position][1])
+
+    def _matches(self, block: int, min_score, max_score, since, until) -> np.ndarray:
+        """Bloktaki eşleşen koşuların maskesi (yalnızca filtre sütunları açılır)"""
+        entry = self.index[block]
+        mask = np.ones(int(entry['count']), dtype=bool)
+        if ((min_score is not None and entry['score_min'] < min_score)
+                or (max_score is not None and entry['score_max'] > max_score)):
+            scores = self.column(block, 'score')
+            if min_score is not None:
+                mask &= scores >= min_score
+            if max_score is not None:
+                mask &= scores <= max_score
+        if ((since is not None and entry['time_min'] < since)
+                or (until is not None and entry['time_max'] > until)):
+            times = self.column(block, 'timestamp')
+            if since is not None:
+                mask &= times >= since
+            if until is not None:
+                mask &= times <= until
+        return mask
+
+    def count(self, min_score: Optional[int] = None, max_score: Optional[int] = None,
+              since: Optional[float] = None, until: Optional[float] = None) -> int:
+        """Filtreye uyan koşu sayısı (flap ve diğer sütunlar açılmaz)"""
+        return sum(int(self._matches(block, min_score, max_score, since, until).sum())
+                   for block in self.blocks(min_score, max_score, since, until))
+
+    def runs(self, min_score: Optional[int] = None, max_score: Optional[int] = None,
+             since: Optional[float] = None, until: Optional[float] = None,
+             flaps: bool = True) -> Iterator[Run]:
+        """Filtreye uyan koşuları blok blok üretir (flaps=False ise flap sütunu açılmaz)"""
+        for block in self.blocks(min_score, max_score, since, until):
+            mask = self._matches(block, min_score, max_score, since, until)
+            selected = np.flatnonzero(mask)
+            if not len(selected):
+                continue
+            values = {name: self.column(block, name)[selected]
+                      for name in ('seed', 'config_hash', 'score', 'frames', 'cause', 'timestamp')}
+            runs_flaps = [None] * len(selected)
+            if flaps:
+                counts = self.column(block, 'flap_count')
+                deltas = self.column(block, 'flap_deltas').astype(np.int64)
+                ends = np.cumsum(counts)
+                starts = ends - counts
+                runs_flaps = [np.cumsum(deltas[starts[i]:ends[i]]).tolist() for i in selected]
+            for i in range(len(selected)):
+                yield Run(int(values['seed'][i]), int(values['config_hash'][i]),
+                          int(values['score'][i]), int(values['frames'][i]),
+                          CAUSE_CODES[values['cause'][i]], float(values['timestamp'][i]),
+                          runs_flaps[i])
+
+
+def record_bot_runs(writer: RunArchiveWriter, games: int, seed: int, max_frames: int):
+    """Referans botla oyunlar oynayıp sonuçlarını arşive ekler (ekransız koşucu)"""
+    from collision import record_runs
+    from fastforward import fast_forward
+    for index in range(games):
+        run_seed, flaps = record_runs(1, seed + index, max_frames)[0]
+        outcome = fast_forward(run_seed, flaps, max_frames)
+        writer.append(run_seed, outcome.score, outcome.frame, outcome.cause, flaps)
+
+
+def run_benchmark(runs: int, seed: int, min_score: int, max_score: int):
+    """Yapay koşularla arşiv ve JSON satırlarını boyut ve filtre süresiyle kıyaslar"""
+    rng = np.random.default_rng(seed)
+    scores = rng.geometric(0.08, runs) - 1
+    now = time.time()
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, 'runs.jsonl')
+        archive_dir = os.path.join(directory, 'archive')
+        started = time.perf_counter()
+        with RunArchiveWriter(archive_dir) as writer, open(json_path, 'w') as json_file:
+            for i in range(runs):
+                score = int(scores[i])
+                count = score * 3 + int(rng.integers(1, 6))
+                flaps = np.cumsum(rng.integers(8, 40, count)).tolist()
+                frames = flaps[-1] + int(rng.integers(10, 60))
+                cause = CAUSE_ORDER[int(rng.integers(len(CAUSE_ORDER)))]
+                timestamp = now - (runs - i) * 10.0
+                writer.append(seed + i, score, frames, cause, flaps, timestamp)
+                json_file.write(json.dumps({'seed': seed + i, 'score': score, 'frames': frames,
+                                            'cause': cause, 'timestamp': timestamp,
+                                            'flaps': flaps}) + '\n')
+        written = time.perf_counter() - started
+        archive_size = sum(os.path.getsize(os.path.join(archive_dir, name))
+                           for name in (DATA_FILE, INDEX_FILE))
+        json_size = os.path.getsize(json_path)
+
+        started = time.perf_counter()
+        with open(json_path) as f:
+            json_hits = sum(1 for line in f if min_score <= json.loads(line)['score'] <= max_score)
+        json_seconds = time.perf_counter() - started
+
+        with RunArchive(archive_dir) as archive:
+            started = time.perf_counter()
+            hits = archive.count(min_score, max_score)
+            count_seconds = time.perf_counter() - started
+            opened = archive.decompressed
+            started = time.perf_counter()
+            streamed = sum(1 for _ in archive.runs(min_score, max_score))
+            stream_seconds = time.perf_counter() - started
+            blocks = len(archive.index)
+
+    print(f"🗄️  {runs} yapay koşu, {blocks} blok | yazma (arşiv + JSON) {written:.1f} s")
+    print(f"   Boyut: arşiv {archive_size / 1e6:.1f} MB, JSON satırları {json_size / 1e6:.1f} MB "
+          f"({json_size / max(1, archive_size):.1f}x)")
+    print(f"   Skor {min_score}-{max_score}: {hits} koşu (JSON: {json_hits})")
+    print(f"   Sayım: arşiv {count_seconds * 1e3:.1f} ms ({opened} sütun açıldı), "
+          f"JSON {json_seconds:.2f} s ({json_seconds / max(count_seconds, 1e-9):.0f}x)")
+    print(f"   Flap'lerle akış: {stream_seconds:.2f} s")
+
+
+def main():
+    """Komut satırı girişi - bot koşularını ekle, sorgula, ölç"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Sütunlu Koşu Arşivi')
+    parser.add_argument('--path', default=RUN_ARCHIVE_DIR, help='Arşiv klasörü')
+    parser.add_argument('--record', type=int, default=0,
+                        help='Referans botla oynanıp arşive eklenecek oyun sayısı')
+    parser.add_argument('--seed', type=int, default=1, help='İlk oyunun seed değeri')
+    parser.add_argument('--frames', type=int, default=FPS * 60 * 5,
+                        help='Oyun başına en fazla kare')
+    parser.add_argument('--score', type=int, nargs=2, metavar=('EN_AZ', 'EN_ÇOK'),
+                        help='Skor aralığındaki koşuları listele')
+    parser.add_argument('--days', type=float, default=None,
+                        help='Yalnızca son N günün koşuları')
+    parser.add_argument('--limit', type=int, default=10, help='Listelenecek en fazla koşu')
+    parser.add_argument('--bench', type=int, default=0,
+                        help='N yapay koşuyla arşiv / JSON kıyaslaması')
+    args = parser.parse_args()
+
+    if args.bench:
+        low, high = args.score or (20, 30)
+        run_benchmark(args.bench, args.seed, low, high)
+        return
+
+    if args.record:
+        started = time.perf_counter()
+        with RunArchiveWriter(args.path) as writer:
+            record_bot_runs(writer, args.record, args.seed, args.frames)
+        print(f"💾 {writer.written} koşu {writer.blocks} blokta eklendi "
+              f"({time.perf_counter() - started:.1f} s) -> {args.path}")
+
+    since = time.time() - args.days * 86400 if args.days is not None else None
+    low, high = args.score or (None, None)
+    with RunArchive(args.path) as archive:
+        print(f"🗄️  {args.path}: {len(archive)} koşu, {len(archive.index)} blok")
+        matches = archive.count(low, high, since)
+        print(f"   Filtreye uyan: {matches} koşu")
+        for i, run in enumerate(archive.runs(low, high, since, flaps=False)):
+            if i >= args.limit:
+                break
+            when = time.strftime('%Y-%m-%d %H:%M', time.localtime(run.timestamp))
+            print(f"   seed {run.seed}: skor {run.score}, {run.frames / FPS:.1f} s, "
+                  f"{run.cause or 'hayatta'} ({when})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Otopilot
+Her karede flap/flap yok kararını oyun fiziği (BIRD_GRAVITY, BIRD_FLAP_STRENGTH,
+boru boşlukları) üzerinde ileriye doğru arama yaparak verir. Dayanıklılık
+testleri ve vitrin (attract) modu için; hem `main.py --autopilot` ile hem de
+ekransız olarak kullanılabilir.
+
+Arama sınırlıdır: hedef, önündeki ilk boru sütunundan (ve aradaki engellerden)
+sağ çıkmaktır; sütun yoksa AUTOPILOT_HORIZON kare boyunca zemine/tavana
+çarpmamaktır. Dallar, sürekli flap ile sürekli düşüş arasındaki erişilebilir
+y aralığı boşluğu ıskalıyorsa budanır. Sonuçlar (hedefe kalan kare, kuantize
+y, kuantize hız) anahtarıyla saklanır; aynı borular önündeyken bu tablo kareler
+arasında korunduğu için karar başına maliyet mikrosaniyeler düzeyinde kalır.
+"""
+
+import argparse
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import *
+from game import GameSimulation
+from trajectory import trajectory_table
+
+# Kuşun zemine çarpmadan alabileceği en büyük rect.y değeri
+GROUND_LIMIT = SCREEN_HEIGHT - GROUND_HEIGHT - BIRD_HEIGHT
+
+
+def bird_step(y: float, velocity: float, flap: bool) -> Tuple[float, float]:
+    """Bird.flap ve Bird.update ile birebir aynı tek kare fizik adımı"""
+    if flap:
+        velocity = BIRD_FLAP_STRENGTH
+    velocity += BIRD_GRAVITY
+    if velocity > BIRD_MAX_FALL_SPEED:
+        velocity = BIRD_MAX_FALL_SPEED
+    return y + velocity, velocity
+
+
+def gap_chaser(y: float, velocity: float, pipes: Iterable[Tuple[float, int]],
+               margin: float = 10) -> bool:
+    """Referans bot: sıradaki boşluğun altına (margin piksel pay) düşerken flap yapar
+
+    Ölçüm, test ve kıyas araçlarının ortak basit botu; pipes (x, gap_y) çiftleridir
+    (ağdan çözülmüş durum için de kullanılabilir).
+    """
+    target = SCREEN_HEIGHT // 2
+    for pipe_x, gap_y in pipes:
+        if pipe_x + PIPE_WIDTH >= BIRD_START_X:
+            target = gap_y + PIPE_GAP - BIRD_HEIGHT - margin
+            break
+    return velocity >= 0 and y > target
+
+
+def reference_flap(simulation: GameSimulation, margin: float = 10) -> bool:
+    """gap_chaser'ı simülasyonun kuşu ve borularıyla çağırır"""
+    bird = simulation.bird
+    return gap_chaser(bird.y, bird.velocity,
+                      ((pipe.x, pipe.gap_y) for pipe in simulation.pipe_manager.pipes), margin)
+
+
+class Autopilot:
+    """İleriye bakan arama ile flap kararı veren bot"""
+
+    def __init__(self, horizon: int = AUTOPILOT_HORIZON,
+                 memo_limit: int = AUTOPILOT_MEMO_LIMIT):
+        """Otopilotu oluşturur"""
+        self.horizon = horizon
+        self.memo_limit = memo_limit
+        self._memo: Dict[tuple, bool] = {}
+        self._signature: Optional[tuple] = None
+        self._target_frame = 0
+
+        # Hedefe kalan kare (d) ile indekslenen kısıtlar: izinli rect.y aralığı
+        # ve engel kaynaklı yasak bantlar
+        self._low: List[int] = []
+        self._high: List[int] = []
+        self._blocked: List[Tuple[Tuple[int, int], ...]] = []
+        self._entries: List[Tuple[int, int, int]] = []  # Sütun girişleri (d, alt, üst)
+        self._gap_center = SCREEN_HEIGHT // 2
+
+        # Erişilebilir y aralığı: fizik sabitleri başına paylaşılan yörünge tablosu
+        self._trajectory = trajectory_table()
+
+        # İstatistikler
+        self.decisions = 0
+        self.decision_seconds = 0.0
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    def decide(self, simulation: GameSimulation) -> bool:
+        """Bu karede flap yapılmalı mı"""
+        started = time.perf_counter()
+        self._prepare(simulation)
+        bird = simulation.bird
+        d = self._target_frame - simulation.frame
+
+        flap = False
+        first = self._preferred(bird.y, bird.velocity)
+        for action in (first, not first):
+            y, velocity = bird_step(bird.y, bird.velocity, action)
+            if self._allowed(d - 1, y) and self._survives(d - 1, y, velocity):
+                flap = action
+                break
+        else:
+            flap = first  # Kurtuluş yok; en azından boşluğa doğru git
+
+        self.decisions += 1
+        self.decision_seconds += time.perf_counter() - started
+        return flap
+
+    def _prepare(self, simulation: GameSimulation):
+        """Hedefi ve kısıt tablolarını kurar; borular değiştiyse memo'yu temizler"""
+        frame = simulation.frame
+        columns = []
+        for pipe in simulation.pipe_manager.pipes:
+            # Sütundan çıkış: boru kuşun solunda kaldığı ilk kare
+            exit_frames = int((pipe.x + PIPE_WIDTH - BIRD_START_X) // PIPE_SPEED) + 1
+            if exit_frames > 0:
+                columns.append((pipe, exit_frames))
+
+        if not columns:
+            # Önde boru yok: yalnızca zemin/tavan, kayan ufuk (anahtar kareden bağımsız)
+            signature = ('free',)
+            self._target_frame = frame + self.horizon
+            if signature != self._signature:
+                self._reset(signature, self.horizon)
+                self._gap_center = SCREEN_HEIGHT // 2
+            return
+
+        # Bilinen tüm sütunlardan çıkış hedeflenir: bir sütundan çıkış durumu
+        # sonraki sütuna girmeye elverişli olmalı
+        depth = columns[-1][1]
+        target = frame + depth
+        last_pipe = columns[-1][0]
+        obstacles = tuple(obstacle for obstacle in simulation.obstacle_manager.obstacles
+                          if obstacle.x < last_pipe.x + PIPE_WIDTH)
+        signature = ((target,) + tuple(id(pipe) for pipe, _ in columns)
+                     + tuple(id(obstacle) for obstacle in obstacles))
+        self._target_frame = target
+        if signature == self._signature:
+            return
+
+        self._reset(signature, depth)
+        first_pipe = columns[0][0]
+        self._gap_center = first_pipe.gap_y + (PIPE_GAP - BIRD_HEIGHT) // 2
+        for pipe, _ in columns:
+            low = max(0, pipe.gap_y)
+            high = min(GROUND_LIMIT, pipe.gap_y + PIPE_GAP - BIRD_HEIGHT)
+            entry = -1
+            for d in range(depth + 1):
+                k = depth - d  # Şu andan itibaren kaç adım sonra
+                pipe_x = round(pipe.x - PIPE_SPEED * k)
+                if pipe_x < BIRD_START_X + BIRD_WIDTH and pipe_x + PIPE_WIDTH > BIRD_START_X:
+                    self._low[d] = low
+                    self._high[d] = high
+                    entry = d
+            if entry >= 0:
+                self._entries.append((entry, low, high))
+        for d in range(depth + 1):
+            k = depth - d
+            bands = []
+            for obstacle in obstacles:
+                obstacle_x = round(obstacle.x - OBSTACLE_SPEED * k)
+                if (obstacle_x < BIRD_START_X + BIRD_WIDTH
+                        and obstacle_x + OBSTACLE_WIDTH > BIRD_START_X):
+                    bands.append((obstacle.y - BIRD_HEIGHT, obstacle.y + OBSTACLE_HEIGHT))
+            self._blocked[d] = tuple(bands)
+        # Girişler d'ye göre büyükten küçüğe (en yakın sütun önce)
+        self._entries.sort(reverse=True)
+
+    def _reset(self, signature: tuple, depth: int):
+        """Yeni hedef için memo ve kısıt tablolarını sıfırlar"""
+        self._signature = signature
+        self._memo.clear()
+        self._low = [0] * (depth + 1)
+        self._high = [GROUND_LIMIT] * (depth + 1)
+        self._blocked = [()] * (depth + 1)
+        self._entries = []
+
+    def _allowed(self, d: int, y: float) -> bool:
+        """Hedefe d kare kala kuş bu y'de çarpışmadan durabilir mi"""
+        if d < 0:
+            return True
+        rect_y = int(y)
+        if rect_y < self._low[d] or rect_y > self._high[d]:
+            return False
+        for top, bottom in self._blocked[d]:
+            if top < rect_y < bottom:
+                return False
+        return True
+
+    def _preferred(self, y: float, velocity: float) -> bool:
+        """Önce denenecek hamle: boşluk merkezinin altına düşerken flap"""
+        return velocity >= 0 and y > self._gap_center
+
+    def _survives(self, d: int, y: float, velocity: float) -> bool:
+        """(y, hız) durumundan hedefe kadar çarpmadan ulaşan bir flap dizisi var mı"""
+        if d <= 0:
+            return True
+        key = (d, round(y / AUTOPILOT_Y_QUANTUM), round(velocity / AUTOPILOT_VELOCITY_QUANTUM))
+        result = self._memo.get(key)
+        if result is not None:
+            self.memo_hits += 1
+            return result
+        self.memo_misses += 1
+
+        result = False
+        if not self._unreachable(d, y, velocity):
+            first = self._preferred(y, velocity)
+            for action in (first, not first):
+                next_y, next_velocity = bird_step(y, velocity, action)
+                if self._allowed(d - 1, next_y) and self._survives(d - 1, next_y, next_velocity):
+                    result = True
+                    break
+
+        if len(self._memo) >= self.memo_limit:
+            self._memo.clear()
+        self._memo[key] = result
+        return result
+
+    def _unreachable(self, d: int, y: float, velocity: float) -> bool:
+        """Sıradaki sütun girişi erişilebilir y aralığının dışında mı (budama)"""
+        for entry, low, high in self._entries:
+            steps = d - entry
+            if steps > 0:
+                top, bottom = self._trajectory.reach(y, velocity, steps)
+                return int(top) > high or int(bottom) < low
+        return False
+
+    def report(self) -> str:
+        """Karar maliyeti ve memo isabet özetini döndürür"""
+        average_us = self.decision_seconds / self.decisions * 1e6 if self.decisions else 0.0
+        lookups = self.memo_hits + self.memo_misses
+        hit_rate = self.memo_hits / lookups * 100 if lookups else 0.0
+        return (f"{self.decisions} karar, ortalama {average_us:.1f} µs/karar, "
+                f"memo isabeti %{hit_rate:.1f}")
+
+
+def play(seed: Optional[int], max_frames: int,
+         autopilot: Optional[Autopilot] = None) -> GameSimulation:
+    """Ekransız bir oyunu otopilotla oynar ve bitmiş simülasyonu döndürür"""
+    autopilot = autopilot or Autopilot()
+    simulation = GameSimulation(seed)
+    while simulation.state == GAME_STATES['PLAYING'] and simulation.frame < max_frames:
+        if autopilot.decide(simulation):
+            simulation.flap()
+        simulation.step()
+    return simulation
+
+
+def main():
+    """Komut satırı girişi - ekransız otopilot koşusu"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Otopilot (ekransız)')
+    parser.add_argument('--games', type=int, default=1,
+                        help='Oynanacak oyun sayısı')
+    parser.add_argument('--frames', type=int, default=FPS * 60 * 30,
+                        help='Oyun başına en fazla kare (varsayılan 30 dakika)')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='İlk oyunun seed değeri (sonrakiler birer artar)')
+    args = parser.parse_args()
+
+    deaths = 0
+    for game_index in range(args.games):
+        autopilot = Autopilot()
+        started = time.perf_counter()
+        simulation = play(args.seed + game_index, args.frames, autopilot)
+        elapsed = time.perf_counter() - started
+        died = simulation.state == GAME_STATES['GAME_OVER']
+        deaths += died
+        outcome = f"öldü ({simulation.death_cause})" if died else "hayatta"
+        print(f"🤖 seed {args.seed + game_index}: skor {simulation.score}, "
+              f"{simulation.frame} kare, {outcome} | {elapsed:.1f} s | {autopilot.report()}")
+    raise SystemExit(1 if deaths else 0)
+
+
+if __name__ == '__main__':
+    main()
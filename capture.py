@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Arka Planda Kare Yakalama
+Oyun kayıtları (tanıtım, hata raporu) için her çizilen kareyi ana döngüyü
+bekletmeden diske yazar. Ana iş parçacığı yalnızca son kareyi önceden
+ayrılmış bir tampon havuzundaki yüzeylerden birine kopyalar (aynı biçimli
+yüzeyler arası blit); kodlama ve yazma (PNG dizisi ya da bir kodlayıcıya
+borulanacak ham RGB akışı) sınırlı bir kuyruktan beslenen işçi iş parçacığında
+yapılır. Boş tampon yoksa kare beklenmeden düşürülür ve sayılır.
+
+Oyunda F12 kaydı başlatıp durdurur; `main.py --capture` oyun açılırken başlatır.
+Ham akış bir dosyaya ya da adlandırılmış boruya (mkfifo) yazılır, ör.:
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s 288x512 -r 60 -i kayit.rgb kayit.mp4
+"""
+
+import argparse
+import os
+import queue
+import tempfile
+import threading
+import time
+from typing import BinaryIO, List, Optional, Tuple
+
+import pygame
+
+from config import *
+
+CAPTURE_FORMATS = ('png', 'raw')
+
+
+class FrameCapture:
+    """Önceden ayrılmış yüzey havuzu + işçi iş parçacığıyla kare yakalayıcı"""
+
+    def __init__(self, target: str, capture_format: str = 'png',
+                 pool_size: int = CAPTURE_POOL_SIZE):
+        """PNG için hedef klasör, ham akış için hedef dosya/boru yolu"""
+        if capture_format not in CAPTURE_FORMATS:
+            raise ValueError(f"Bilinmeyen yakalama biçimi: {capture_format}")
+        self.target = target
+        self.format = capture_format
+        self.pool_size = pool_size
+        self._pool: List[pygame.Surface] = []
+        self._free: queue.Queue = queue.Queue()
+        self._pending: queue.Queue = queue.Queue(maxsize=pool_size)
+        self._stream: Optional[BinaryIO] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # Sayaçlar (ana iş parçacığı: captured/dropped, işçi: written/errors)
+        self.captured = 0
+        self.dropped = 0
+        self.written = 0
+        self.errors = 0
+        self.copy_seconds = 0.0
+        self.encode_seconds = 0.0
+
+    def _start(self, surface: pygame.Surface):
+        """İlk karede havuzu ekran biçiminde ayırır ve işçiyi başlatır"""
+        for _ in range(self.pool_size):
+            buffer = surface.copy()
+            self._pool.append(buffer)
+            self._free.put(buffer)
+        if self.format == 'png':
+            os.makedirs(self.target, exist_ok=True)
+        else:
+            self._stream = open(self.target, 'wb')
+        self._thread = threading.Thread(target=self._worker, name='frame-capture', daemon=True)
+        self._thread.start()
+
+    def capture(self, surface: pygame.Surface):
+        """Son kareyi boş bir tampona kopyalayıp kuyruğa koyar; boş tampon yoksa düşürür"""
+        started = time.perf_counter()
+        if self._thread is None:
+            self._start(surface)
+        try:
+            buffer = self._free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return
+        if buffer.get_size() != surface.get_size():
+            self._free.put(buffer)
+            self.dropped += 1  # Ekran boyutu değişti; bu kayıt eski boyutta kalır
+            return
+        buffer.blit(surface, (0, 0))
+        self.captured += 1
+        self._pending.put_nowait((self.captured, buffer))
+        self.copy_seconds += time.perf_counter() - started
+
+    def _worker(self):
+        """İşçi: tamponları kodlayıp yazar ve havuza geri verir"""
+        while True:
+            item = self._pending.get()
+            if item is None:
+                break
+            index, buffer = item
+            started = time.perf_counter()
+            try:
+                if self.format == 'png':
+                    pygame.image.save(buffer, os.path.join(self.target, f"frame_{index:06d}.png"))
+                else:
+                    self._stream.write(pygame.image.tobytes(buffer, 'RGB'))
+                self.written += 1
+            except (pygame.error, OSError, ValueError):
+                self.errors += 1
+            finally:
+                self.encode_seconds += time.perf_counter() - started
+                self._free.put(buffer)
+
+    @property
+    def queued(self) -> int:
+        """Yazılmayı bekleyen kare sayısı"""
+        return self._pending.qsize()
+
+    def close(self):
+        """Bekleyen kareleri yazar, işçiyi durdurur, akışı kapatır"""
+        if self._thread is not None:
+            self._pending.put(None)
+            self._thread.join()
+            self._thread = None
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def report(self) -> str:
+        """Yakalama özetini döndürür"""
+        copy_us = self.copy_seconds / self.captured * 1e6 if self.captured else 0.0
+        encode_ms = self.encode_seconds / self.written * 1e3 if self.written else 0.0
+        return (f"🎥 Kare yakalama ({self.format}): {self.written} kare yazıldı, "
+                f"{self.dropped} kare düşürüldü, {self.errors} hata | ana döngüde "
+                f"{copy_us:.0f} µs/kare, işçide {encode_ms:.1f} ms/kare -> {self.target}")
+
+
+def default_target(capture_format: str) -> str:
+    """Zaman damgalı varsayılan hedef (PNG için klasör, ham akış için dosya)"""
+    name = time.strftime('%Y%m%d-%H%M%S')
+    if capture_format == 'raw':
+        name += f"-{SCREEN_WIDTH}x{SCREEN_HEIGHT}.rgb"
+    return os.path.join(CAPTURE_DIR, name)
+
+
+def run_benchmark(frames: int, capture_format: str, target: str, pool_size: int):
+    """Otopilotlu oyunu FPS hızında çizerken yakalar; ana döngü maliyetini satır içi kayıtla kıyaslar"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from game import Game
+
+    game = Game(autopilot=True)
+    game.state = GAME_STATES['PLAYING']
+    budget = 1000 / FPS
+
+    def play(count: int, after_draw) -> Tuple[float, float, int]:
+        """count kare oynar; (ortalama iş ms, en kötü kare ms, bütçeyi aşan kare)"""
+        total = worst = 0.0
+        over = 0
+        for _ in range(count):
+            started = time.perf_counter()
+            game.update()
+            game.draw()
+            after_draw()
+            work = (time.perf_counter() - started) * 1e3
+            total += work
+            worst = max(worst, work)
+            over += work > budget
+            game.clock.tick(FPS)
+        return total / count, worst, over
+
+    plain = play(frames, lambda: None)
+    capture = FrameCapture(target, capture_format, pool_size)
+    captured = play(frames, lambda: capture.capture(game.screen))
+    capture.close()
+
+    # Eski yol: her karede ana döngüde pygame.image.save (kısa bir örnek, geçici klasöre)
+    with tempfile.TemporaryDirectory() as inline_dir:
+        names = iter(range(frames))
+        inline = play(min(frames, FPS * 2), lambda: pygame.image.save(
+            game.screen, os.path.join(inline_dir, f"frame_{next(names):06d}.png")))
+    pygame.quit()
+
+    print(capture.report())
+    for label, (average, worst, over) in (('yakalamasız', plain), ('arka plan yakalama', captured),
+                                          ('satır içi image.save', inline)):
+        print(f"   {label:<22} ortalama {average:.2f} ms, en kötü {worst:.2f} ms, "
+              f"{over} kare {budget:.1f} ms bütçesini aştı")
+
+
+def main():
+    """Komut satırı girişi - ekransız yakalama ölçümü"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Arka Planda Kare Yakalama')
+    parser.add_argument('--frames', type=int, default=FPS * 10,
+                        help='Yakalanacak kare sayısı')
+    parser.add_argument('--format', choices=CAPTURE_FORMATS, default='png',
+                        help='PNG dizisi ya da ham RGB akışı')
+    parser.add_argument('--out', help='Hedef klasör (png) ya da dosya/boru (raw)')
+    parser.add_argument('--pool', type=int, default=CAPTURE_POOL_SIZE,
+                        help='Önceden ayrılan tampon sayısı')
+    args = parser.parse_args()
+    run_benchmark(args.frames, args.format, args.out or default_target(args.format), args.pool)
+
+
+if __name__ == '__main__':
+    main()
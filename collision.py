@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Süpürülmüş (Swept) AABB Çarpışma
+Kuşun ve boruların/engellerin bir zaman aralığında süpürdüğü kutuları
+kesiştirerek ilk temas karesini ve kesin temas zamanını bulur. Böylece
+ekransız simülasyonlar (GameSimulation.advance) tek adımda birden çok kare
+ilerleyebilir: nesneler önce pencere boyunca süpürdükleri kutularla kabaca
+elenir, yalnızca kesişenler kare kare ve step() ile aynı yuvarlamayla
+denetlenir.
+
+Kapalı formlar (x = x0 - hız * k) adım adım toplamayla ancak sabitler ikili
+kesirli (ör. 0.5, 2.0) olduğunda bit düzeyinde aynıdır; exact_arithmetic()
+bunu denetler, değilse advance() step()'e geri düşer.
+
+Komut satırı: kayıtlı flap dizilerini hem step() hem advance() ile oynatıp
+skor, ölüm karesi ve son durumun aynı olduğunu doğrular; --continuous ile
+kareler arasında içinden geçilen (tünelleme) engelleri de sayar.
+"""
+
+import argparse
+import math
+import time
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from config import *
+
+# Kuşun zemine çarpmadan alabileceği en büyük rect.y değeri
+GROUND_LIMIT = SCREEN_HEIGHT - GROUND_HEIGHT - BIRD_HEIGHT
+
+Box = Tuple[float, float, float, float]
+GROUND_BOX: Box = (0.0, float(SCREEN_HEIGHT - GROUND_HEIGHT), float(SCREEN_WIDTH), float(GROUND_HEIGHT))
+
+# Aynı karedeki nedenlerin step() içindeki denetim sırası
+CAUSE_ORDER = ('ground', 'ceiling', 'pipe', 'obstacle')
+
+
+class Contact(NamedTuple):
+    """İlk temas: kare numarası (pencere içinde 1'den), kesin zaman ve nedenler"""
+    frame: int
+    time: float
+    causes: Tuple[str, ...]
+
+
+def rect_round(value: float) -> int:
+    """pygame.Rect'e float atanırken yapılan yuvarlama (yarım sıfırdan uzağa)"""
+    if value >= 0:
+        return int(value + 0.5)
+    return -int(-value + 0.5)
+
+
+def exact_arithmetic() -> bool:
+    """Hız ve fizik sabitleri ikili kesirli mi (kapalı form = adım adım toplama)"""
+    return all((value * 1024).is_integer() for value in
+               (PIPE_SPEED, OBSTACLE_SPEED, GROUND_SPEED,
+                BIRD_GRAVITY, BIRD_FLAP_STRENGTH, BIRD_MAX_FALL_SPEED))
+
+
+def swept_aabb(box: Box, delta: Tuple[float, float], target: Box,
+               target_delta: Tuple[float, float] = (0.0, 0.0)) -> Optional[float]:
+    """İki kutu doğrusal hareket ederken ilk temas zamanı (0-1) ya da None
+
+    Kutular (x, y, genişlik, yükseklik); kenar teması çarpışma sayılmaz
+    (pygame.Rect.colliderect ile aynı). Başta örtüşen kutular için 0 döner.
+    """
+    entry, leave = 0.0, 1.0
+    for axis in (0, 1):
+        low, size = box[axis], box[axis + 2]
+        target_low, target_size = target[axis], target[axis + 2]
+        speed = delta[axis] - target_delta[axis]
+        if speed == 0:
+            if low >= target_low + target_size or low + size <= target_low:
+                return None
+            continue
+        if speed > 0:
+            axis_entry = (target_low - (low + size)) / speed
+            axis_leave = (target_low + target_size - low) / speed
+        else:
+            axis_entry = (target_low + target_size - low) / speed
+            axis_leave = (target_low - (low + size)) / speed
+        entry = max(entry, axis_entry)
+        leave = min(leave, axis_leave)
+        if entry >= leave:
+            return None
+    return entry
+
+
+def inside_at(x: float, speed: float, width: int, k: int) -> bool:
+    """Nesne k. karede (rect yuvarlamasıyla) kuşla yatayda çakışıyor mu"""
+    rect_x = rect_round(x - speed * k)
+    return rect_x < BIRD_START_X + BIRD_WIDTH and rect_x + width > BIRD_START_X
+
+
+def overlap_frames(x: float, speed: float, width: int, frames: int) -> Tuple[int, int]:
+    """x'ten her karede speed kadar sola giden nesnenin kuşla yatayda çakıştığı
+    [ilk, son] kare aralığı (1..frames içinde; boşsa ilk > son)"""
+    right = BIRD_START_X + BIRD_WIDTH
+    if speed <= 0:
+        return (1, frames) if inside_at(x, speed, width, 0) else (1, 0)
+    # Yaklaşık sınırlar kapalı formdan, kesin sınırlar yuvarlamayla düzeltilerek
+    first = max(1, math.ceil((x - right + 0.5) / speed) - 1)
+    while first > 1 and rect_round(x - speed * (first - 1)) < right:
+        first -= 1
+    while first <= frames and not rect_round(x - speed * first) < right:
+        first += 1
+    last = min(frames, math.floor((x + width - BIRD_START_X + 0.5) / speed) + 1)
+    while last >= first and not inside_at(x, speed, width, last):
+        last -= 1
+    while last < frames and inside_at(x, speed, width, last + 1):
+        last += 1
+    return first, last
+
+
+def pipe_hit(rect_y: int, gap_y: int) -> bool:
+    """Yatayda çakışan borunun üst/alt parçasına temas var mı (Pipe.check_collision)"""
+    if rect_y < gap_y and rect_y + BIRD_HEIGHT > 0:
+        return True
+    return rect_y + BIRD_HEIGHT > gap_y + PIPE_GAP and rect_y < SCREEN_HEIGHT
+
+
+def obstacle_hit(rect_y: int, obstacle_y: int) -> bool:
+    """Yatayda çakışan engele temas var mı (Obstacle.check_collision)"""
+    return rect_y < obstacle_y + OBSTACLE_HEIGHT and rect_y + BIRD_HEIGHT > obstacle_y
+
+
+def find_contact(simulation, ys: Sequence[float], continuous: bool = False) -> Optional[Contact]:
+    """Pencere boyunca ilk teması bulur
+
+    ys[0] kuşun başlangıç y'si, ys[k] k. kare sonundaki y'si. Borular ve
+    engeller simulation'daki konumlarından sabit hızla sola kayar (pencere
+    içinde doğum olmadığı varsayılır). continuous=True iken iki kare arasında
+    içinden geçilen nesneler de temas sayılır.
+    """
+    frames = len(ys) - 1
+    rect_ys = [int(y) for y in ys]
+    top = min(rect_ys)
+    bottom = max(rect_ys)
+    hits = []  # (kare, neden, kesin zaman)
+
+    # Zemin ve tavan: kuşun süpürdüğü dikey aralık sınırları aşıyorsa
+    if bottom > GROUND_LIMIT or top < 0:
+        for k in range(1, frames + 1):
+            if rect_ys[k] > GROUND_LIMIT:
+                toi = swept_aabb((BIRD_START_X, ys[k - 1], BIRD_WIDTH, BIRD_HEIGHT),
+                                 (0.0, ys[k] - ys[k - 1]), GROUND_BOX)
+                hits.append((k, 'ground', k - 1 + (toi if toi is not None else 1.0)))
+                break
+        for k in range(1, frames + 1):
+            if rect_ys[k] < 0:
+                # Tavan: rect.y = int(y) < 0 ilk kez y <= -1 olduğunda
+                moment = (ys[k - 1] + 1) / (ys[k - 1] - ys[k])
+                hits.append((k, 'ceiling', k - 1 + min(1.0, max(0.0, moment))))
+                break
+    best = min(hits)[0] if hits else frames + 1
+
+    # Borular ve engeller: önce pencere boyunca süpürülen kutular, sonra kare kare
+    right = BIRD_START_X + BIRD_WIDTH
+    columns = [('pipe', pipe.x, PIPE_SPEED, PIPE_WIDTH, pipe.gap_y)
+               for pipe in simulation.pipe_manager.pipes]
+    columns += [('obstacle', obstacle.x, OBSTACLE_SPEED, OBSTACLE_WIDTH, obstacle.y)
+                for obstacle in simulation.obstacle_manager.obstacles]
+    for cause, x, speed, width, y in columns:
+        if x - speed * frames - 1 >= right or x + width + 1 <= BIRD_START_X:
+            continue  # Yatayda hiç yaklaşmıyor
+        if cause == 'pipe':
+            if not continuous and top >= y and bottom + BIRD_HEIGHT <= y + PIPE_GAP:
+                continue  # Tüm pencere boyunca boşluğun içinde
+            parts = ((0.0, float(y)), (float(y + PIPE_GAP), float(SCREEN_HEIGHT - y - PIPE_GAP)))
+            hit = pipe_hit
+        else:
+            if not continuous and (bottom + BIRD_HEIGHT <= y or top >= y + OBSTACLE_HEIGHT):
+                continue
+            parts = ((float(y), float(OBSTACLE_HEIGHT)),)
+            hit = obstacle_hit
+        first, last = overlap_frames(x, speed, width, frames)
+        if continuous:
+            first, last = max(1, first - 1), min(frames, last + 1)
+        for k in range(first, min(last, best) + 1):
+            overlapping = inside_at(x, speed, width, k) and hit(rect_ys[k], y)
+            if not overlapping and not continuous:
+                continue
+            # Kare içindeki kesin temas zamanı: iki kutu da doğrusal hareket eder
+            box = (BIRD_START_X, ys[k - 1], BIRD_WIDTH, BIRD_HEIGHT)
+            delta = (0.0, ys[k] - ys[k - 1])
+            left = x - speed * (k - 1)
+            moment = None
+            for part_y, part_height in parts:
+                toi = swept_aabb(box, delta, (left, part_y, width, part_height), (-speed, 0.0))
+                if toi is not None and (moment is None or toi < moment):
+                    moment = toi
+            if overlapping or moment is not None:
+                hits.append((k, cause, k - 1 + (moment if moment is not None else 1.0)))
+                best = min(best, k)
+                break
+
+    if not hits:
+        return None
+    first_hits = [hit for hit in hits if hit[0] == best]
+    causes = tuple(cause for cause in CAUSE_ORDER
+                   if any(hit[1] == cause for hit in first_hits))
+    return Contact(best, min(hit[2] for hit in first_hits), causes)
+
+
+def record_runs(games: int, seed: int, max_frames: int) -> List[Tuple[int, List[int]]]:
+    """Referans botla oyunlar oynar ve (seed, flap kareleri) listesini döndürür"""
+    from autopilot import reference_flap
+    from game import GameSimulation
+    runs = []
+    for game_index in range(games):
+        simulation = GameSimulation(seed + game_index)
+        margin = 6 + game_index % 20
+        flaps = []
+        while simulation.state == GAME_STATES['PLAYING'] and simulation.frame < max_frames:
+            if reference_flap(simulation, margin):
+                flaps.append(simulation.frame)
+                simulation.flap()
+            simulation.step()
+        runs.append((seed + game_index, flaps))
+    return runs
+
+
+def replay(seed: int, flaps: List[int], max_frames: int, max_step: int,
+           continuous: bool = False):
+    """Flap dizisini oynatır; max_step > 1 ise flap'ler arası advance() ile"""
+    from game import GameSimulation
+    simulation = GameSimulation(seed)
+    steps = 0
+    index = 0
+    while simulation.state == GAME_STATES['PLAYING'] and simulation.frame < max_frames:
+        if index < len(flaps) and flaps[index] == simulation.frame:
+            simulation.flap()
+            index += 1
+        next_flap = flaps[index] if index < len(flaps) else max_frames
+        frames = min(max_step, next_flap - simulation.frame, max_frames - simulation.frame)
+        if max_step > 1:
+            simulation.advance(max(1, frames), continuous)
+        else:
+            simulation.step()
+        steps += 1
+    return simulation, steps
+
+
+def main():
+    """Komut satırı girişi - kaba adım doğrulaması ve hız kıyaslaması"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Süpürülmüş Çarpışma Doğrulaması')
+    parser.add_argument('--games', type=int, default=50,
+                        help='Kaydedilip yeniden oynatılacak oyun sayısı')
+    parser.add_argument('--frames', type=int, default=FPS * 60 * 5,
+                        help='Oyun başına en fazla kare')
+    parser.add_argument('--step', type=int, default=COLLISION_MAX_STEP,
+                        help='Kaba adımda en fazla kare')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='İlk oyunun seed değeri')
+    parser.add_argument('--continuous', action='store_true',
+                        help='Kareler arası tünellemeyi de çarpışma say')
+    args = parser.parse_args()
+
+    runs = record_runs(args.games, args.seed, args.frames)
+    fine_steps = coarse_steps = 0
+    fine_seconds = coarse_seconds = 0.0
+    mismatches = 0
+    for seed, flaps in runs:
+        started = time.perf_counter()
+        fine, steps = replay(seed, flaps, args.frames, 1)
+        fine_seconds += time.perf_counter() - started
+        fine_steps += steps
+        started = time.perf_counter()
+        coarse, steps = replay(seed, flaps, args.frames, args.step, args.continuous)
+        coarse_seconds += time.perf_counter() - started
+        coarse_steps += steps
+        if fine.snapshot() != coarse.snapshot():
+            mismatches += 1
+            print(f"❌ seed {seed}: kare adımı skor {fine.score} / ölüm {fine.frame} "
+                  f"({fine.death_cause}), kaba adım skor {coarse.score} / ölüm {coarse.frame} "
+                  f"({coarse.death_cause})")
+
+    print(f"🎯 {len(runs)} oyun, {fine_steps} kare | kaba adım (en fazla {args.step} kare): "
+          f"{coarse_steps} adım ({fine_steps / max(1, coarse_steps):.1f}x daha az)")
+    print(f"   step(): {fine_seconds:.2f} s | advance(): {coarse_seconds:.2f} s "
+          f"({fine_seconds / max(coarse_seconds, 1e-9):.1f}x)")
+    if args.continuous:
+        print("   Sürekli çarpışma açık: sonuçlar kare adımından ancak tünelleme varsa ayrışır")
+    elif not mismatches:
+        print("✅ Tüm oyunlar kare adımıyla birebir aynı (skor, ölüm karesi, son durum)")
+    raise SystemExit(1 if mismatches and not args.continuous else 0)
+
+
+if __name__ == '__main__':
+    main()
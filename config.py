@@ -6,7 +6,7 @@ Tüm oyun sabitleri ve ayarları burada tanımlanır
 """
 
 import os
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 # Ekran ayarları
 SCREEN_WIDTH: int = 288
@@ -47,7 +47,7 @@ PIPE_MAX_HEIGHT: int = SCREEN_HEIGHT - PIPE_GAP - 100
 OBSTACLE_WIDTH: int = 40
 OBSTACLE_HEIGHT: int = 40
 OBSTACLE_SPEED: float = PIPE_SPEED
-OBSTACLE_SPAWN_CHANCE: float = 0.3  # Her boru spawn'ında engel oluşma şansı
+OBSTACLE_SPAWN_CHANCE: float = 0.3  # Her boru spawn'ında engel oluşma şansı (engel iki borunun ortasına gelir)
 
 # Zemin ayarları
 GROUND_HEIGHT: int = 112
@@ -78,6 +78,8 @@ ASSETS: Dict[str, str] = {
     'obstacle': os.path.join(IMAGES_DIR, 'obstacle.png'),  # İkinci görsel - engeller
     'background': os.path.join(IMAGES_DIR, 'background.png'),
     'ground': os.path.join(IMAGES_DIR, 'ground.png'),
+    'background_far': os.path.join(IMAGES_DIR, 'background_far.png'),  # Opsiyonel - uzak tepeler (yoksa çizilir)
+    'background_near': os.path.join(IMAGES_DIR, 'background_near.png'),  # Opsiyonel - yakın şehir (yoksa çizilir)
     
     # Ses dosyaları (şimdilik hepsi crash_sound.wav kullanıyor)
     'flap_sound': os.path.join(SOUNDS_DIR, 'crash_sound.wav'),
@@ -86,6 +88,16 @@ ASSETS: Dict[str, str] = {
     'crash_sound': os.path.join(SOUNDS_DIR, 'crash_sound.wav')  # Çarpışma sesi
 }
 
+# Paralaks arkaplan katmanları (arkadan öne): (asset adı, y konumu, kayma hızı)
+# En altta duran hareketsiz katmanlar tek bir önbellek yüzeyinde birleştirilir,
+# görseli bulunamayan uzak/yakın katmanlar için varsayılan şerit çizilir.
+# Zemin kendi katmanı ile ayrıca çizilir.
+PARALLAX_LAYERS: List[Tuple[str, int, float]] = [
+    ('background', 0, 0.0),
+    ('background_far', SCREEN_HEIGHT - GROUND_HEIGHT - 160, PIPE_SPEED * 0.25),
+    ('background_near', SCREEN_HEIGHT - GROUND_HEIGHT - 100, PIPE_SPEED * 0.5),
+]
+
 # Oyun durumları
 GAME_STATES: Dict[str, str] = {
     'MENU': 'menu',
@@ -100,13 +112,132 @@ MENU_TEXT_SIZE: int = 24
 MENU_TITLE_COLOR: Tuple[int, int, int] = COLORS['YELLOW']
 MENU_TEXT_COLOR: Tuple[int, int, int] = COLORS['WHITE']
 
+# Boşta bekleme ayarları (menü, duraklama ve game over ekranlarında)
+# Bu ekranlarda döngü FPS ile dönmek yerine olay bekler; zaman aşımı milisaniye
+IDLE_WAIT_TIMEOUT_MS: int = 1000
+
+# Düşük gecikme modu: kare işinin tahmini süresine eklenen güvenlik payı (ms)
+LOW_LATENCY_SAFETY_MS: float = 1.0
+
+# Çok oyunculu sunucu ayarları (multiplayer_server.py)
+SERVER_HOST: str = '0.0.0.0'
+SERVER_PORT: int = 5555
+SERVER_TICK_RATE: int = FPS  # Her tick bir simülasyon karesi
+SERVER_MAX_CLIENT_BUFFER: int = 64 * 1024  # Bu kadar gönderilmemiş veri biriken istemci düşürülür
+MATCH_MAX_PLAYERS: int = 2
+MATCH_MAX_FRAMES: int = 0  # Maç süre sınırı (kare); 0 = son kalan kazanır
+
+# Rollback netcode ayarları (rollback.py)
+ROLLBACK_MAX_FRAMES: int = 8  # En fazla kaç kare geri sarılır; daha gerideysek beklenir
+ROLLBACK_INPUT_HISTORY: int = 32  # Her girdi paketinde taşınan geçmiş kare sayısı (bit maskesi)
+
+# Seyirci yayını ayarları (spectator.py)
+SPECTATOR_KEYFRAME_INTERVAL: int = FPS * 2  # Sonradan katılanlar için tam durum aralığı (kare)
+SPECTATOR_QUEUE_SIZE: int = FPS * 4  # İzleyici kuyruğu; dolan (yavaş) izleyici düşürülür
+
 # Yüksek skor dosyası
 HIGHSCORE_FILE: str = os.path.join(BASE_DIR, 'highscore.json')
+# asyncio döngüsünde yüksek skorun arka planda diske yazılma aralığı (saniye)
+HIGHSCORE_SAVE_INTERVAL: float = 2.0
+
+# Otopilot ayarları (autopilot.py, main.py --autopilot)
+AUTOPILOT_HORIZON: int = 48  # Önde boru yokken aramanın baktığı kare sayısı
+AUTOPILOT_Y_QUANTUM: float = 0.5  # Memo anahtarında y kuantumu (piksel)
+AUTOPILOT_VELOCITY_QUANTUM: float = 0.25  # Memo anahtarında hız kuantumu
+AUTOPILOT_MEMO_LIMIT: int = 200000  # Memo bu boyuta ulaşınca temizlenir
+AUTOPILOT_RESTART_DELAY: int = FPS  # Vitrin modunda oyun bitince yeniden başlama gecikmesi (kare)
+
+# Zorluk taraması ayarları (sweep.py)
+SWEEP_SURVIVAL_BIN: int = FPS  # Hayatta kalma eğrisinin zaman dilimi (kare)
+SWEEP_BOT_MARGIN: Tuple[float, float] = (4.0, 30.0)  # Referans botun boşluk altı payı aralığı (oyun başına)
+SWEEP_BOT_MISS_CHANCE: float = 0.02  # Botun gereken flap'i o karede kaçırma olasılığı
+
+# Hayalet yarışı ayarları (ghost.py, main.py --ghosts)
+GHOSTS_FILE: str = os.path.join(BASE_DIR, 'ghosts.npz')
+GHOST_SEED: int = 2024  # Hayalet modunda herkes aynı boru dizisinde uçar
+GHOST_MAX_COUNT: int = 500  # Saklanan en fazla hayalet (en uzun yaşayanlar)
+GHOST_ALPHA: int = 90  # Hayalet kuşun opaklığı (0-255)
+
+# Parkur üreteci ayarları (layout.py)
+LAYOUT_LOOKAHEAD: int = 64  # Tamponda önceden üretilip bekletilen boru sayısı
+LAYOUT_Y_QUANTUM: float = 0.5  # Erişilebilirlik ızgarasının y ve hız çözünürlüğü (piksel)
+LAYOUT_OBSTACLE_CLEARANCE: int = 0  # Engel ile iki boşluğu birleştiren koridor arası en az pay (piksel)
+LAYOUT_OBSTACLES: bool = False  # Parkurdaki engeller oyuna konsun mu (kapalıyken yalnızca borular)
+LAYOUT_CACHE_DIR: str = os.path.join(BASE_DIR, '.layout_cache')  # Fizik sabitlerinin hash'iyle anahtarlı erişilebilirlik tabloları
+
+# Süpürülmüş çarpışma ayarları (collision.py, GameSimulation.advance)
+COLLISION_MAX_STEP: int = 8  # Ekransız kaba adımda tek seferde ilerlenen en fazla kare
+
+# Flap yörünge tablosu ayarları (trajectory.py)
+TRAJECTORY_CACHE_DIR: str = os.path.join(BASE_DIR, '.trajectory_cache')  # Fizik sabitlerinin hash'iyle anahtarlı tablolar
+TRAJECTORY_MAX_FRAMES: int = FPS * 10  # Hız hiç sabitlenmezse satırın en fazla uzunluğu (kare)
+TRAJECTORY_LOCATE_CACHE: int = 1024  # Hız -> (satır, adım) eşlemesinde bellekte tutulan en fazla kayıt
+
+# Piksel gözlem ayarları (observation.py)
+OBSERVATION_SIZE: Tuple[int, int] = (84, 84)  # Küçültülmüş gri tonlu karenin (genişlik, yükseklik)
+OBSERVATION_STACK: int = 4  # Halka tamponda üst üste tutulan son kare sayısı
+
+# Ayrık simülasyon/çizim ayarları (split.py, main.py --split)
+SPLIT_RING_SLOTS: int = 8  # Paylaşılan bellek halkasındaki kare yuvası sayısı
+SPLIT_MAX_OBJECTS: int = 8  # Karede taşınan en fazla boru / engel sayısı
+
+# Kare yakalama ayarları (capture.py, F12, main.py --capture)
+CAPTURE_DIR: str = os.path.join(BASE_DIR, 'captures')  # Varsayılan kayıt klasörü
+CAPTURE_POOL_SIZE: int = 8  # Önceden ayrılan kare tamponu sayısı; hepsi doluysa kare düşürülür
+
+# Tekrar çizici ayarları (replay.py)
+REPLAY_CHUNK_FRAMES: int = FPS * 5  # Bir işçinin tek seferde çizdiği kare sayısı
+REPLAY_TAIL_FRAMES: int = FPS  # Ölümden sonra çizilen oyun bitti ekranı karesi
+REPLAY_MAX_FRAMES: int = FPS * 60 * 5  # Ölmeyen koşularda çizilen en fazla oyun karesi
+
+# Ölüm ısı haritası ayarları (heatmap.py, main.py --heatmap)
+HEATMAP_FILE: str = os.path.join(BASE_DIR, 'heatmap.npz')
+HEATMAP_SCREEN_BINS: Tuple[int, int] = (36, 64)  # Ekran ızgarası (sütun, satır); 8 piksellik hücreler
+HEATMAP_PIPE_BINS: int = 64  # Boru sırası sütunları (sonuncusu daha ilerideki borular)
+HEATMAP_GAP_BINS: int = 32  # Boşluk merkezine göre konum sütunları
+HEATMAP_GAP_RANGE: float = 4.0  # Konum aralığı, yarım boşluk cinsinden (±); dışı kenar sütunlarda
+HEATMAP_BATCH: int = 4096  # Histogramlara tek seferde eklenen kayıt sayısı (sabit bellek)
+HEATMAP_OVERLAY_ALPHA: int = 170  # Katmanın en yoğun hücredeki opaklığı (0-255)
+
+# Koşu arşivi ayarları (archive.py, main.py --archive)
+RUN_ARCHIVE_DIR: str = os.path.join(BASE_DIR, 'runs')  # runs.dat (bloklar) + runs.idx (dizin)
+RUN_ARCHIVE_BLOCK: int = 4096  # Ekransız koşucularda blok başına koşu
+RUN_ARCHIVE_GAME_BLOCK: int = 16  # Oyunda blok başına koşu (çıkışta kalanlar yazılır)
+RUN_ARCHIVE_COMPRESSION: int = 6  # zlib sıkıştırma düzeyi
+
+# Ömür boyu istatistik ayarları (lifetime.py; Game, GameWidget, iOSGameWidget)
+LIFETIME_STATS_FILE: str = os.path.join(BASE_DIR, 'lifetime_stats.bin')  # Tüm örneklerin eşlediği dosya
+LIFETIME_STATS_SLOTS: int = 32  # Aynı anda kendi yuvasına kilitsiz yazabilen örnek sayısı
+
+# Geri sarma ayarları (rewind.py, F9, main.py --rewind)
+REWIND_SECONDS: int = 10  # Halkada tutulan son oyun süresi (saniye)
+REWIND_MAX_OBJECTS: int = 8  # Karede saklanan en fazla boru / engel sayısı
+REWIND_DIR: str = os.path.join(BASE_DIR, 'rewinds')  # Oyun bitince halkanın yazıldığı klasör
+REWIND_EXPORT_KEEP: int = 20  # Klasörde tutulan en yeni dışa aktarım sayısı
+REWIND_KEY_REPEAT: Tuple[int, int] = (300, 1000 // FPS)  # Basılı ok tuşunun tekrarı (gecikme, aralık ms)
+
+# Zaman çizelgesi izleyici ayarları (timeline.py, F8, main.py --trace)
+TRACE_DIR: str = os.path.join(BASE_DIR, 'traces')  # Chrome trace-event JSON dökümleri
+TRACE_SECONDS: float = 5.0  # Dökümde yer alan son süre (saniye)
+TRACE_BUFFER_EVENTS: int = 1 << 16  # Önceden ayrılan aralık yuvası (kare başına ~30 aralık)
+TRACE_FRAME_BUDGET_MS: float = 1000 / FPS  # Kare işi bunu aşarsa otomatik döküm (0: kapalı)
+TRACE_DUMP_AFTER_FRAMES: int = FPS // 2  # Yavaş kareden sonra dökümden önce kaydedilen kare
+TRACE_DUMP_COOLDOWN: float = 10.0  # İki otomatik döküm arasındaki en kısa süre (saniye)
+TRACE_DUMP_KEEP: int = 20  # Klasörde tutulan en yeni döküm sayısı
+
+# Profil yakalama ayarları (profiler.py, F10 / SIGUSR1, main.py --profile-frames)
+PROFILE_DIR: str = os.path.join(BASE_DIR, 'profiles')  # .pstats + .collapsed dosyaları
+PROFILE_FRAMES: int = FPS * 5  # İstek başına cProfile altında yakalanan kare sayısı
+PROFILE_KEEP: int = 20  # Klasörde tutulan en yeni yakalama sayısı
 
 # Kontroller
 CONTROLS: Dict[str, str] = {
     'FLAP': 'SPACE veya Sol Mouse Tuşu',
     'PAUSE': 'P',
     'RESTART': 'R (Game Over ekranında)',
+    'CAPTURE': 'F12 (kare kaydını başlat/durdur)',
+    'TRACE': 'F8 (--trace: son saniyelerin zaman çizelgesini yaz)',
+    'PROFILE': 'F10 (sıradaki kareleri cProfile ile yakala)',
+    'REWIND': 'F9 (--rewind: geri sar; ←/→ kare, SHIFT ile saniye; F9/SPACE devam)',
     'QUIT': 'ESC'
 }
\ No newline at end of file
@@ -6,11 +6,132 @@ Flappy Bird için gerekli tüm icon boyutlarını oluşturur
 """
 
 import os
-from PIL import Image, ImageDraw, ImageFont
 import json
+import time
+import shutil
+import hashlib
+import inspect
+import argparse
+from functools import lru_cache
+
+# Not: Pillow yalnızca bir çıktı gerçekten yeniden üretileceği zaman içe
+# aktarılır; böylece değişiklik olmayan build'ler milisaniyeler içinde biter.
+
+# Çıktı klasörü ve build manifest'i
+ICONS_DIR = os.path.join('assets', 'ios_icons')
+MANIFEST_PATH = os.path.join(ICONS_DIR, '.build_manifest.json')
+MANIFEST_VERSION = 1
+
+# Launch screen boyutları (iPhone 12 Pro için)
+LAUNCH_SCREEN_FILE = 'launch_screen.png'
+LAUNCH_SCREEN_SIZE = (390, 844)
+
+# iOS için gerekli icon boyutları: (dosya adı, piksel, idiom, nokta boyutu, ölçek)
+# idiom'u None olan dosyalar Contents.json'a yazılmaz
+IOS_ICONS = [
+    # iPhone
+    ('icon-20.png', 20, None, None, None),
+    ('icon-20@2x.png', 40, 'iphone', '20x20', '2x'),
+    ('icon-20@3x.png', 60, 'iphone', '20x20', '3x'),
+    ('icon-29.png', 29, None, None, None),
+    ('icon-29@2x.png', 58, 'iphone', '29x29', '2x'),
+    ('icon-29@3x.png', 87, 'iphone', '29x29', '3x'),
+    ('icon-40.png', 40, None, None, None),
+    ('icon-40@2x.png', 80, 'iphone', '40x40', '2x'),
+    ('icon-40@3x.png', 120, 'iphone', '40x40', '3x'),
+    ('icon-60@2x.png', 120, 'iphone', '60x60', '2x'),
+    ('icon-60@3x.png', 180, 'iphone', '60x60', '3x'),
+    
+    # iPad
+    ('icon-20-ipad.png', 20, 'ipad', '20x20', '1x'),
+    ('icon-20@2x-ipad.png', 40, 'ipad', '20x20', '2x'),
+    ('icon-29-ipad.png', 29, 'ipad', '29x29', '1x'),
+    ('icon-29@2x-ipad.png', 58, 'ipad', '29x29', '2x'),
+    ('icon-40-ipad.png', 40, 'ipad', '40x40', '1x'),
+    ('icon-40@2x-ipad.png', 80, 'ipad', '40x40', '2x'),
+    ('icon-76.png', 76, 'ipad', '76x76', '1x'),
+    ('icon-76@2x.png', 152, 'ipad', '76x76', '2x'),
+    ('icon-83.5@2x.png', 167, 'ipad', '83.5x83.5', '2x'),
+    
+    # App Store
+    ('icon-1024.png', 1024, 'ios-marketing', '1024x1024', '1x'),
+    
+    # Genel boyutlar
+    ('app_icon.png', 512, None, None, None),
+    ('app_icon_small.png', 256, None, None, None),
+]
+
+@lru_cache(maxsize=None)
+def _source_hash(func):
+    """Üretici fonksiyonun kaynak kodunun hash'i (kod değişince çıktılar bayatlar)"""
+    return hashlib.sha256(inspect.getsource(func).encode('utf-8')).hexdigest()
+
+def _output_hash(func, *params):
+    """Bir çıktının beklenen hash'i: üretici kaynağı + parametreler"""
+    digest = hashlib.sha256()
+    digest.update(f"{MANIFEST_VERSION}:{_source_hash(func)}:{params!r}".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+def load_build_manifest():
+    """Build manifest'ini yükle (yoksa veya bozuksa boş manifest döner)"""
+    try:
+        with open(MANIFEST_PATH, 'r') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'version': MANIFEST_VERSION, 'outputs': {}}
+
+def save_build_manifest(manifest):
+    """Build manifest'ini atomik olarak kaydet"""
+    tmp_path = MANIFEST_PATH + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+def _is_up_to_date(manifest, filename, expected_hash):
+    """Çıktı mevcut, hash'i güncel ve dosya elle değiştirilmemiş mi?"""
+    entry = manifest['outputs'].get(filename)
+    if not entry or entry.get('hash') != expected_hash:
+        return False
+    try:
+        stat = os.stat(os.path.join(ICONS_DIR, filename))
+    except OSError:
+        return False
+    return stat.st_size == entry.get('bytes') and stat.st_mtime_ns == entry.get('mtime_ns')
+
+def _record_output(manifest, filename, output_hash, **extra):
+    """Yeni üretilen çıktıyı manifest'e işle"""
+    stat = os.stat(os.path.join(ICONS_DIR, filename))
+    entry = {'hash': output_hash, 'bytes': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    entry.update(extra)
+    manifest['outputs'][filename] = entry
+
+def build_contents_json():
+    """Contents.json içeriğini IOS_ICONS tablosundan oluştur (Xcode için)"""
+    images = []
+    for filename, _, idiom, point_size, scale in IOS_ICONS:
+        if idiom is None:
+            continue
+        images.append({
+            "size": point_size,
+            "idiom": idiom,
+            "filename": filename,
+            "scale": scale
+        })
+    return {
+        "images": images,
+        "info": {
+            "version": 1,
+            "author": "xcode"
+        }
+    }
 
 def create_app_icon(size, output_path):
     """iOS app icon oluştur"""
+    from PIL import Image, ImageDraw
+    
     # Yeni image oluştur
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
@@ -88,181 +209,54 @@ def create_app_icon(size, output_path):
     img.save(output_path, 'PNG')
     print(f"✅ {size}x{size} icon oluşturuldu: {output_path}")
 
-def create_all_ios_icons():
-    """Tüm iOS icon boyutlarını oluştur"""
-    
-    # Çıktı klasörü
-    icons_dir = os.path.join('assets', 'ios_icons')
-    os.makedirs(icons_dir, exist_ok=True)
-    
-    # iOS için gerekli icon boyutları
-    icon_sizes = {
-        # iPhone
-        'icon-20.png': 20,
-        'icon-20@2x.png': 40,
-        'icon-20@3x.png': 60,
-        'icon-29.png': 29,
-        'icon-29@2x.png': 58,
-        'icon-29@3x.png': 87,
-        'icon-40.png': 40,
-        'icon-40@2x.png': 80,
-        'icon-40@3x.png': 120,
-        'icon-60@2x.png': 120,
-        'icon-60@3x.png': 180,
-        
-        # iPad
-        'icon-20-ipad.png': 20,
-        'icon-20@2x-ipad.png': 40,
-        'icon-29-ipad.png': 29,
-        'icon-29@2x-ipad.png': 58,
-        'icon-40-ipad.png': 40,
-        'icon-40@2x-ipad.png': 80,
-        'icon-76.png': 76,
-        'icon-76@2x.png': 152,
-        'icon-83.5@2x.png': 167,
-        
-        # App Store
-        'icon-1024.png': 1024,
-        
-        # Genel boyutlar
-        'app_icon.png': 512,
-        'app_icon_small.png': 256
-    }
+def create_all_ios_icons(force=False):
+    """Eksik veya bayat iOS iconlarını oluştur (force=True ise hepsini)"""
+    start_time = time.perf_counter()
+    os.makedirs(ICONS_DIR, exist_ok=True)
+    manifest = load_build_manifest()
     
     print("🎨 iOS App Iconları Oluşturuluyor...")
     print("====================================")
     
-    for filename, size in icon_sizes.items():
-        output_path = os.path.join(icons_dir, filename)
-        create_app_icon(size, output_path)
-    
-    # Contents.json oluştur (Xcode için)
-    contents_json = {
-        "images": [
-            {
-                "size": "20x20",
-                "idiom": "iphone",
-                "filename": "icon-20@2x.png",
-                "scale": "2x"
-            },
-            {
-                "size": "20x20",
-                "idiom": "iphone",
-                "filename": "icon-20@3x.png",
-                "scale": "3x"
-            },
-            {
-                "size": "29x29",
-                "idiom": "iphone",
-                "filename": "icon-29@2x.png",
-                "scale": "2x"
-            },
-            {
-                "size": "29x29",
-                "idiom": "iphone",
-                "filename": "icon-29@3x.png",
-                "scale": "3x"
-            },
-            {
-                "size": "40x40",
-                "idiom": "iphone",
-                "filename": "icon-40@2x.png",
-                "scale": "2x"
-            },
-            {
-                "size": "40x40",
-                "idiom": "iphone",
-                "filename": "icon-40@3x.png",
-                "scale": "3x"
-            },
-            {
-                "size": "60x60",
-                "idiom": "iphone",
-                "filename": "icon-60@2x.png",
-                "scale": "2x"
-            },
-            {
-                "size": "60x60",
-                "idiom": "iphone",
-                "filename": "icon-60@3x.png",
-                "scale": "3x"
-            },
-            {
-                "size": "20x20",
-                "idiom": "ipad",
-                "filename": "icon-20-ipad.png",
-                "scale": "1x"
-            },
-            {
-                "size": "20x20",
-                "idiom": "ipad",
-                "filename": "icon-20@2x-ipad.png",
-                "scale": "2x"
-            },
-            {
-                "size": "29x29",
-                "idiom": "ipad",
-                "filename": "icon-29-ipad.png",
-                "scale": "1x"
-            },
-            {
-                "size": "29x29",
-                "idiom": "ipad",
-                "filename": "icon-29@2x-ipad.png",
-                "scale": "2x"
-            },
-            {
-                "size": "40x40",
-                "idiom": "ipad",
-                "filename": "icon-40-ipad.png",
-                "scale": "1x"
-            },
-            {
-                "size": "40x40",
-                "idiom": "ipad",
-                "filename": "icon-40@2x-ipad.png",
-                "scale": "2x"
-            },
-            {
-                "size": "76x76",
-                "idiom": "ipad",
-                "filename": "icon-76.png",
-                "scale": "1x"
-            },
-            {
-                "size": "76x76",
-                "idiom": "ipad",
-                "filename": "icon-76@2x.png",
-                "scale": "2x"
-            },
-            {
-                "size": "83.5x83.5",
-                "idiom": "ipad",
-                "filename": "icon-83.5@2x.png",
-                "scale": "2x"
-            },
-            {
-                "size": "1024x1024",
-                "idiom": "ios-marketing",
-                "filename": "icon-1024.png",
-                "scale": "1x"
-            }
-        ],
-        "info": {
-            "version": 1,
-            "author": "xcode"
-        }
-    }
-    
-    # Contents.json kaydet
-    contents_path = os.path.join(icons_dir, 'Contents.json')
-    with open(contents_path, 'w') as f:
-        json.dump(contents_json, f, indent=2)
-    
-    print(f"✅ Contents.json oluşturuldu: {contents_path}")
+    # Aynı piksel boyutundaki iconlar bir kez çizilip kopyalanır
+    rendered = {}
+    regenerated = 0
+    for filename, size, _, _, _ in IOS_ICONS:
+        output_hash = _output_hash(create_app_icon, size)
+        if not force and _is_up_to_date(manifest, filename, output_hash):
+            continue
+        
+        output_path = os.path.join(ICONS_DIR, filename)
+        if size in rendered:
+            shutil.copyfile(rendered[size], output_path)
+            print(f"✅ {size}x{size} icon kopyalandı: {output_path}")
+        else:
+            create_app_icon(size, output_path)
+            rendered[size] = output_path
+        _record_output(manifest, filename, output_hash, size=size)
+        regenerated += 1
+    
+    # Contents.json aynı tablodan oluşturulur; değişmediyse yazılmaz
+    contents_text = json.dumps(build_contents_json(), indent=2)
+    contents_hash = hashlib.sha256(contents_text.encode('utf-8')).hexdigest()[:16]
+    contents_path = os.path.join(ICONS_DIR, 'Contents.json')
+    if force or not _is_up_to_date(manifest, 'Contents.json', contents_hash):
+        with open(contents_path, 'w') as f:
+            f.write(contents_text)
+        _record_output(manifest, 'Contents.json', contents_hash)
+        regenerated += 1
+        print(f"✅ Contents.json oluşturuldu: {contents_path}")
+    
+    if regenerated:
+        save_build_manifest(manifest)
+    
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    if regenerated == 0:
+        print(f"✅ Tüm iconlar güncel, yeniden oluşturulacak dosya yok ({elapsed_ms:.1f} ms)")
+        return 0
     
     print("")
-    print("🎉 Tüm iOS iconları başarıyla oluşturuldu!")
+    print(f"🎉 {regenerated} dosya oluşturuldu ({elapsed_ms:.1f} ms)")
     print("===========================================")
     print("")
     print("📁 Iconlar şu klasörde: assets/ios_icons/")
@@ -274,12 +268,29 @@ def create_all_ios_icons():
     print("4. Her boyut için uygun dosyayı seçin")
     print("")
     print("💡 İpucu: Contents.json dosyası otomatik eşleştirme için kullanılabilir")
+    return regenerated
+
+def create_launch_screen(force=False):
+    """iOS launch screen oluştur (güncelse atlanır)"""
+    os.makedirs(ICONS_DIR, exist_ok=True)
+    manifest = load_build_manifest()
+    output_hash = _output_hash(render_launch_screen, LAUNCH_SCREEN_SIZE)
+    
+    if not force and _is_up_to_date(manifest, LAUNCH_SCREEN_FILE, output_hash):
+        print("✅ Launch screen güncel, atlandı")
+        return False
+    
+    launch_path = os.path.join(ICONS_DIR, LAUNCH_SCREEN_FILE)
+    render_launch_screen(LAUNCH_SCREEN_SIZE, launch_path)
+    _record_output(manifest, LAUNCH_SCREEN_FILE, output_hash, size=list(LAUNCH_SCREEN_SIZE))
+    save_build_manifest(manifest)
+    return True
 
-def create_launch_screen():
-    """iOS launch screen oluştur"""
+def render_launch_screen(screen_size, launch_path):
+    """iOS launch screen görselini çiz ve kaydet"""
+    from PIL import Image, ImageDraw, ImageFont
     
-    # Launch screen boyutları (iPhone 12 Pro için)
-    width, height = 390, 844
+    width, height = screen_size
     
     img = Image.new('RGB', (width, height), (135, 206, 235))  # Sky blue
     draw = ImageDraw.Draw(img)
@@ -371,25 +382,26 @@ def create_launch_screen():
     draw.text((subtitle_x, subtitle_y), subtitle_text, fill=(255, 255, 255, 200), font=subtitle_font)
     
     # Kaydet
-    launch_path = os.path.join('assets', 'ios_icons', 'launch_screen.png')
     img.save(launch_path, 'PNG')
     print(f"✅ Launch screen oluşturuldu: {launch_path}")
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='iOS App Icon Oluşturucu')
+    parser.add_argument('--force', action='store_true',
+                       help='Güncel olsalar bile tüm çıktıları yeniden oluştur')
+    args = parser.parse_args()
+    
     try:
         print("🍎 iOS Icon Oluşturucu Başlatılıyor...")
         print("=====================================")
         
-        # Pillow kontrolü
-        print("📦 Pillow kütüphanesi kontrol ediliyor...")
-        
-        # Ana iconları oluştur
-        create_all_ios_icons()
+        # Ana iconları oluştur (yalnızca eksik veya bayat olanlar)
+        create_all_ios_icons(force=args.force)
         
         # Launch screen oluştur
         print("")
         print("🚀 Launch screen oluşturuluyor...")
-        create_launch_screen()
+        create_launch_screen(force=args.force)
         
         print("")
         print("🎉 iOS Asset'leri başarıyla oluşturuldu!")
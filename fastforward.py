@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Olay Güdümlü Analitik İleri Sarma
+Bir seed ve flap kareleri listesinden oyunun skorunu, ölüm karesini ve ölüm
+nedenini kare kare simüle etmeden hesaplar.
+
+İki flap arasında kuş kapalı formda bir yörünge izler: hız her karede
+BIRD_GRAVITY kadar artar ve BIRD_MAX_FALL_SPEED'de sabitlenir (kırpılmış
+parabol, trajectory.py tablosundan okunur). Borular ve engeller doğrusal kaydığı için hangi karelerde kuşla
+yatayda çakıştıkları doğum karelerinden bellidir. Böylece olaylar (flap,
+sütun girişi, geçiş/skor, çarpışma) arasında doğrudan atlanır: bir yörünge
+parçası önce azalan, sonra artan olduğundan ilk çarpışma karesi her
+parçada ikili aramayla bulunur. Maliyet kare başına değil olay başınadır.
+
+Sonuçlar GameSimulation.step ile birebir aynıdır (sabitler ikili kesirli
+olduğunda tablo farkları adım adım toplamayla bit düzeyinde eşittir; değilse
+kare kare simülasyona geri düşülür). Komut satırı kayıtlı koşularla doğrular.
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from config import *
+from collision import CAUSE_ORDER, GROUND_LIMIT, exact_arithmetic, record_runs
+from layout import LayoutGenerator, overlap_steps, spawn_interval
+from trajectory import TrajectoryTable, trajectory_table
+
+
+class Outcome(NamedTuple):
+    """Oyun sonucu: skor, son kare, ölüm nedeni (hayattaysa None), işlenen olay sayısı"""
+    score: int
+    frame: int
+    cause: Optional[str]
+    events: int
+
+
+class Segment:
+    """İki flap arasındaki yörünge parçası - y(k) yörünge tablosundan"""
+
+    def __init__(self, frame: int, y: float, velocity: float, table: TrajectoryTable):
+        """frame karesindeki (y, hız) durumundan başlayan parça"""
+        self.frame = frame
+        self.y = y
+        self.velocity = velocity
+        self._row, self._start = table.locate(velocity)
+
+        # Yörüngenin en alçak (en küçük y) noktası: hızın negatif olduğu son adım
+        self.turn = max(0, self._row.apex - self._start - 1)
+
+    def y_at(self, k: int) -> float:
+        """Parçanın başından k kare sonraki y (Bird.update'in k kez çağrılmasıyla aynı)"""
+        return self.y + self._row.offset(self._start, k)
+
+    def velocity_at(self, k: int) -> float:
+        """Parçanın başından k kare sonraki hız"""
+        return self._row.velocity(self._start, k)
+
+    def rect_y(self, k: int) -> int:
+        """k kare sonraki rect.y"""
+        return int(self.y_at(k))
+
+
+def first_true(low: int, high: int, predicate: Callable[[int], bool]) -> Optional[int]:
+    """[low, high] içinde yanlıştan doğruya dönen yüklemin ilk doğru olduğu değer"""
+    if low > high or not predicate(high):
+        return None
+    while low < high:
+        middle = (low + high) // 2
+        if predicate(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def first_exit(segment: Segment, a: int, b: int, low: int, high: int) -> Optional[int]:
+    """Parçada [a, b] yerel karelerinde rect.y'nin [low, high] dışına çıktığı ilk kare"""
+    rect_y = segment.rect_y
+    turn = segment.turn
+    if a <= min(b, turn):
+        # Azalan kısım: alttan dışarıdaysa hemen, değilse üstten çıkış aranır
+        if rect_y(a) > high:
+            return a
+        found = first_true(a, min(b, turn), lambda k: rect_y(k) < low)
+        if found is not None:
+            return found
+    start = max(a, turn)
+    if start <= b:
+        # Artan kısım: üstten dışarıdaysa hemen, değilse alttan çıkış aranır
+        if rect_y(start) < low or rect_y(start) > high:
+            return start
+        return first_true(start, b, lambda k: rect_y(k) > high)
+    return None
+
+
+def first_entry(segment: Segment, a: int, b: int, low: int, high: int) -> Optional[int]:
+    """Parçada [a, b] yerel karelerinde rect.y'nin [low, high] içine girdiği ilk kare"""
+    rect_y = segment.rect_y
+    turn = segment.turn
+    if a <= min(b, turn):
+        found = first_true(a, min(b, turn), lambda k: rect_y(k) <= high)
+        if found is not None and rect_y(found) >= low:
+            return found
+    start = max(a, turn)
+    if start <= b:
+        found = first_true(start, b, lambda k: rect_y(k) >= low)
+        if found is not None and rect_y(found) <= high:
+            return found
+    return None
+
+
+class FastForward:
+    """Bir parkur için olay güdümlü ileri sarma"""
+
+    def __init__(self, seed: int):
+        """GameSimulation(seed) ile aynı parkuru kurar"""
+        self.layout = LayoutGenerator.from_rng(random.Random(seed))
+        self.interval = spawn_interval()
+        self.pipe_steps = overlap_steps(PIPE_WIDTH, PIPE_SPEED)
+        self.obstacle_steps = overlap_steps(OBSTACLE_WIDTH, OBSTACLE_SPEED)
+        self.obstacle_offset = self.interval // 2
+        self.trajectory = trajectory_table()
+
+        # check_score borunun bir önceki karedeki x'ine bakar: doğumdan geçişe kare sayısı
+        offset = 1
+        while not BIRD_START_X > SCREEN_WIDTH - PIPE_SPEED * (offset - 1) + PIPE_WIDTH:
+            offset += 1
+        self.pass_offset = offset
+
+    def score_at(self, frame: int) -> int:
+        """frame karesine kadar (dahil) geçilen boru sayısı"""
+        return max(0, (frame - self.pass_offset) // self.interval)
+
+    def _columns(self, first: int, last: int) -> List[Tuple[int, int, str, int]]:
+        """[first, last] karelerine değen sütunlar: (ilk kare, son kare, tür, y)"""
+        interval = self.interval
+        columns = []
+        start, end = self.pipe_steps[0], self.pipe_steps[-1]
+        index = max(0, (first - end) // interval - 1)
+        while interval * (index + 1) + start <= last:
+            spawn = interval * (index + 1)
+            if spawn + end >= first:
+                columns.append((spawn + start, spawn + end, 'pipe', self.layout.gap(index)))
+            index += 1
+        if not LAYOUT_OBSTACLES:
+            return columns
+        start, end = self.obstacle_steps[0], self.obstacle_steps[-1]
+        index = max(0, (first - end - self.obstacle_offset) // interval - 1)
+        while interval * (index + 1) + self.obstacle_offset + start <= last:
+            spawn = interval * (index + 1) + self.obstacle_offset
+            obstacle_y = self.layout.obstacle(index)
+            if obstacle_y is not None and spawn + end >= first:
+                columns.append((spawn + start, spawn + end, 'obstacle', obstacle_y))
+            index += 1
+        return columns
+
+    def run(self, flaps: List[int], max_frames: int) -> Outcome:
+        """Flap kareleri (flap, o kareden sonraki adımdan önce) ile oyunu ileri sarar"""
+        segment = Segment(0, float(BIRD_START_Y), 0.0, self.trajectory)
+        events = 0
+        flap_index = 0
+        while True:
+            while flap_index < len(flaps) and flaps[flap_index] < segment.frame:
+                flap_index += 1
+            end = flaps[flap_index] if flap_index < len(flaps) else max_frames
+            end = min(end, max_frames)
+            events += 1
+
+            death = self._first_death(segment, segment.frame + 1, end)
+            if death is not None:
+                frame, cause, checked = death
+                return Outcome(self.score_at(frame), frame, cause, events + checked)
+            if end >= max_frames:
+                return Outcome(self.score_at(max_frames), max_frames, None, events)
+
+            # Flap: hız sıfırlanır, sonraki adım yerçekimini ekler
+            k = end - segment.frame
+            segment = Segment(end, segment.y_at(k), BIRD_FLAP_STRENGTH, self.trajectory)
+            flap_index += 1
+
+    def _first_death(self, segment: Segment, first: int, last: int):
+        """Parçanın [first, last] karelerindeki ilk çarpışma: (kare, neden, olay sayısı)"""
+        if first > last:
+            return None
+        origin = segment.frame
+        best = None
+        checked = 0
+        # Zemin ve tavan tüm parça boyunca
+        local = first_exit(segment, first - origin, last - origin, 0, GROUND_LIMIT)
+        if local is not None:
+            best = origin + local
+        for start, end, kind, y in self._columns(first, last):
+            a = max(start, first)
+            b = min(end, last, best if best is not None else last)
+            if a > b:
+                continue
+            checked += 1
+            if kind == 'pipe':
+                local = first_exit(segment, a - origin, b - origin,
+                                   max(0, y), y + PIPE_GAP - BIRD_HEIGHT)
+            else:
+                local = first_entry(segment, a - origin, b - origin,
+                                    y - BIRD_HEIGHT + 1, y + OBSTACLE_HEIGHT - 1)
+            if local is not None and (best is None or origin + local <= best):
+                best = origin + local
+        if best is None:
+            return None
+        return best, self._cause(segment, best), checked
+
+    def _cause(self, segment: Segment, frame: int) -> str:
+        """Ölüm karesinde step()'in ilk kaydedeceği neden"""
+        rect_y = segment.rect_y(frame - segment.frame)
+        causes = set()
+        if rect_y > GROUND_LIMIT:
+            causes.add('ground')
+        if rect_y < 0:
+            causes.add('ceiling')
+        for start, end, kind, y in self._columns(frame, frame):
+            if kind == 'pipe' and (rect_y < y or rect_y > y + PIPE_GAP - BIRD_HEIGHT):
+                causes.add('pipe')
+            if kind == 'obstacle' and y - BIRD_HEIGHT < rect_y < y + OBSTACLE_HEIGHT:
+                causes.add('obstacle')
+        return next(cause for cause in CAUSE_ORDER if cause in causes)
+
+
+def step_outcome(seed: int, flaps: List[int], max_frames: int) -> Outcome:
+    """Aynı koşuyu GameSimulation.step ile kare kare oynatır (referans)"""
+    from game import GameSimulation
+    simulation = GameSimulation(seed)
+    flap_index = 0
+    while simulation.state == GAME_STATES['PLAYING'] and simulation.frame < max_frames:
+        if flap_index < len(flaps) and flaps[flap_index] == simulation.frame:
+            simulation.flap()
+            flap_index += 1
+        simulation.step()
+    return Outcome(simulation.score, simulation.frame, simulation.death_cause, simulation.frame)
+
+
+def fast_forward(seed: int, flaps: List[int], max_frames: int) -> Outcome:
+    """Koşunun sonucunu olay güdümlü hesaplar (sabitler uygun değilse kare kare)"""
+    if not exact_arithmetic():
+        return step_outcome(seed, flaps, max_frames)
+    return FastForward(seed).run(flaps, max_frames)
+
+
+def main():
+    """Komut satırı girişi - kayıtlı koşularla doğrulama ve hız kıyaslaması"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Analitik İleri Sarma')
+    parser.add_argument('--games', type=int, default=100,
+                        help='Kaydedilecek oyun sayısı (--runs yoksa)')
+    parser.add_argument('--frames', type=int, default=FPS * 60 * 5,
+                        help='Oyun başına en fazla kare')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='İlk oyunun seed değeri')
+    parser.add_argument('--runs', default=None,
+                        help='Kayıtlı koşular (JSON satırları: seed, flaps, score, frame, cause)')
+    parser.add_argument('--save', default=None,
+                        help='Kaydedilen koşuları bu dosyaya yaz')
+    args = parser.parse_args()
+
+    if args.runs:
+        with open(args.runs, 'r', encoding='utf-8') as f:
+            stored = [json.loads(line) for line in f if line.strip()]
+    else:
+        stored = []
+        for seed, flaps in record_runs(args.games, args.seed, args.frames):
+            outcome = step_outcome(seed, flaps, args.frames)
+            stored.append({'seed': seed, 'flaps': flaps, 'score': outcome.score,
+                           'frame': outcome.frame, 'cause': outcome.cause})
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            for run in stored:
+                f.write(json.dumps(run) + '\n')
+
+    mismatches = 0
+    frames = events = 0
+    started = time.perf_counter()
+    outcomes = [fast_forward(run['seed'], run['flaps'], args.frames) for run in stored]
+    elapsed = time.perf_counter() - started
+    for run, outcome in zip(stored, outcomes):
+        frames += outcome.frame
+        events += outcome.events
+        if (outcome.score, outcome.frame, outcome.cause) != (run['score'], run['frame'], run['cause']):
+            mismatches += 1
+            print(f"❌ seed {run['seed']}: kayıt skor {run['score']} / kare {run['frame']} "
+                  f"({run['cause']}), ileri sarma skor {outcome.score} / kare {outcome.frame} "
+                  f"({outcome.cause})")
+
+    started = time.perf_counter()
+    for run in stored:
+        step_outcome(run['seed'], run['flaps'], args.frames)
+    stepped = time.perf_counter() - started
+
+    print(f"⏩ {len(stored)} koşu, {frames} kare, {events} olay "
+          f"(kare başına {events / max(1, frames):.3f} olay)")
+    print(f"   İleri sarma: {elapsed:.3f} s ({elapsed / max(1, events) * 1e6:.1f} µs/olay) | "
+          f"kare kare: {stepped:.2f} s ({stepped / max(elapsed, 1e-9):.0f}x)")
+    if mismatches:
+        print(f"❌ {mismatches} koşu kayıttan farklı")
+    else:
+        print("✅ Tüm koşularda skor, ölüm karesi ve nedeni kayıtla aynı")
+    raise SystemExit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
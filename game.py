@@ -7,15 +7,29 @@ Tüm oyun sınıfları ve mantığı burada tanımlanır
 
 import pygame
 import random
+import asyncio
 import json
+import math
 import os
-from typing import List, Tuple, Optional
+import time
+from collections import deque
+from typing import Awaitable, Deque, Dict, List, Sequence, Tuple, Optional
 from config import *
+from collision import Contact, exact_arithmetic, find_contact
+from layout import LayoutGenerator
+from plugins import (ArchivePlugin, CapturePlugin, GamePlugin, GhostPlugin, HeatmapPlugin,
+                     ProfilerPlugin, RewindPlugin, TracePlugin, plugin_hooks)
+from trajectory import trajectory_table
+import timeline
+from timeline import traced
 
 
 class Bird:
     """Kuş sınıfı - oyuncunun kontrol ettiği karakter"""
     
+    # Görseller tüm kuşlar arasında paylaşılır (her yeni kuşta diskten yüklenmez)
+    _image_cache: Optional[List[pygame.Surface]] = None
+    
     def __init__(self, x: int, y: int):
         """Kuş nesnesini başlatır"""
         self.x = x
@@ -28,9 +42,12 @@ class Bird:
         self.animation_counter = 0
         
         # Görselleri yükle
-        self.images = self._load_images()
+        if Bird._image_cache is None:
+            Bird._image_cache = self._load_images()
+        self.images = Bird._image_cache
         self.current_image = self.images[0]
     
+    @traced('asset.bird')
     def _load_images(self) -> List[pygame.Surface]:
         """Karakter görsellerini yükler veya varsayılan oluşturur"""
         images = []
@@ -99,6 +116,24 @@ class Bird:
             self.animation_frame = (self.animation_frame + 1) % len(self.images)
             self.current_image = self.images[self.animation_frame]
     
+    def advance_animation(self, frames: int):
+        """Animasyonu 'frames' kare ilerletir (update'in animasyon kısmıyla aynı)"""
+        turns, self.animation_counter = divmod(self.animation_counter + frames,
+                                               BIRD_ANIMATION_SPEED)
+        if turns:
+            self.animation_frame = (self.animation_frame + turns) % len(self.images)
+            self.current_image = self.images[self.animation_frame]
+    
+    def get_state(self) -> tuple:
+        """Fizik ve animasyon durumunu kompakt demet olarak döndürür"""
+        return (self.y, self.velocity, self.animation_frame, self.animation_counter)
+    
+    def set_state(self, state: tuple):
+        """get_state ile alınmış durumu geri yükler"""
+        self.y, self.velocity, self.animation_frame, self.animation_counter = state
+        self.rect.y = int(self.y)
+        self.current_image = self.images[self.animation_frame]
+    
     def draw(self, screen: pygame.Surface):
         """Kuşu ekrana çizer"""
         screen.blit(self.current_image, (self.x, int(self.y)))
@@ -111,6 +146,10 @@ class Bird:
 class Pipe:
     """Boru sınıfı - engeller"""
     
+    # Ölçeklenmiş görseller boşluk yüksekliğine göre paylaşılır; başsız
+    # simülasyonlarda boru hiç çizilmediği için görsel de yüklenmez
+    _image_cache: Dict[int, Tuple[pygame.Surface, pygame.Surface]] = {}
+    
     def __init__(self, x: int, gap_y: int):
         """Boru çiftini oluşturur"""
         self.x = x
@@ -121,10 +160,24 @@ class Pipe:
         self.top_rect = pygame.Rect(x, 0, PIPE_WIDTH, gap_y)
         self.bottom_rect = pygame.Rect(x, gap_y + PIPE_GAP, PIPE_WIDTH, 
                                      SCREEN_HEIGHT - gap_y - PIPE_GAP)
-        
-        # Görselleri yükle
-        self.top_image, self.bottom_image = self._load_images()
     
+    @property
+    def images(self) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Boru görselleri - ilk çizimde yüklenir ve boşluk yüksekliğine göre önbelleklenir"""
+        images = Pipe._image_cache.get(self.gap_y)
+        if images is None:
+            images = Pipe._image_cache[self.gap_y] = self._load_images()
+        return images
+    
+    @property
+    def top_image(self) -> pygame.Surface:
+        return self.images[0]
+    
+    @property
+    def bottom_image(self) -> pygame.Surface:
+        return self.images[1]
+    
+    @traced('asset.pipe')
     def _load_images(self) -> Tuple[pygame.Surface, pygame.Surface]:
         """Boru görsellerini yükler veya varsayılan oluşturur"""
         try:
@@ -168,10 +221,17 @@ class Pipe:
         self.top_rect.x = self.x
         self.bottom_rect.x = self.x
     
+    def set_position(self, x: float):
+        """Boruyu verilen x konumuna taşır (durum geri yükleme için)"""
+        self.x = x
+        self.top_rect.x = x
+        self.bottom_rect.x = x
+    
     def draw(self, screen: pygame.Surface):
         """Boruları ekrana çizer"""
-        screen.blit(self.top_image, (self.x, 0))
-        screen.blit(self.bottom_image, (self.x, self.gap_y + PIPE_GAP))
+        top_image, bottom_image = self.images
+        screen.blit(top_image, (self.x, 0))
+        screen.blit(bottom_image, (self.x, self.gap_y + PIPE_GAP))
     
     def is_off_screen(self) -> bool:
         """Boru ekrandan çıktı mı kontrol eder"""
@@ -192,10 +252,15 @@ class Pipe:
 class PipeManager:
     """Boru yöneticisi - boruları oluşturur ve yönetir"""
     
-    def __init__(self):
-        """Boru yöneticisini başlatır"""
+    def __init__(self, rng: Optional[random.Random] = None,
+                 layout: Optional[LayoutGenerator] = None):
+        """Boru yöneticisini başlatır (rng verilirse boru dizisi tekrarlanabilir,
+        layout verilirse boşluklar çözülebilir parkur tamponundan alınır)"""
         self.pipes: List[Pipe] = []
         self.spawn_timer = 0
+        self.spawned = 0  # Oluşturulan boru sayısı (parkur indeksi / RNG kullanım sayacı)
+        self.rng = rng if rng is not None else random
+        self.layout = layout
     
     def update(self) -> int:
         """Boruları günceller ve skor artışını döndürür"""
@@ -219,7 +284,11 @@ class PipeManager:
     
     def spawn_pipe(self):
         """Yeni boru çifti oluşturur"""
-        gap_y = random.randint(PIPE_MIN_HEIGHT, PIPE_MAX_HEIGHT)
+        if self.layout is not None:
+            gap_y = self.layout.gap(self.spawned)
+        else:
+            gap_y = self.rng.randint(PIPE_MIN_HEIGHT, PIPE_MAX_HEIGHT)
+        self.spawned += 1
         pipe = Pipe(SCREEN_WIDTH, gap_y)
         self.pipes.append(pipe)
         return True  # Boru oluşturuldu sinyali
@@ -248,18 +317,51 @@ class PipeManager:
         """Tüm boruları temizler"""
         self.pipes.clear()
         self.spawn_timer = 0
+        self.spawned = 0
+    
+    def get_state(self) -> tuple:
+        """Boru durumunu kompakt demet olarak döndürür"""
+        return (self.spawn_timer, self.spawned,
+                tuple((pipe.x, pipe.gap_y, pipe.passed) for pipe in self.pipes))
+    
+    def set_state(self, state: tuple):
+        """get_state ile alınmış durumu geri yükler (aynı borular yeniden kullanılır)"""
+        self.spawn_timer, self.spawned, pipe_states = state
+        pipes = self.pipes
+        del pipes[len(pipe_states):]
+        for index, (x, gap_y, passed) in enumerate(pipe_states):
+            if index < len(pipes) and pipes[index].gap_y == gap_y:
+                pipe = pipes[index]
+            else:
+                pipe = Pipe(SCREEN_WIDTH, gap_y)
+                if index < len(pipes):
+                    pipes[index] = pipe
+                else:
+                    pipes.append(pipe)
+            pipe.set_position(x)
+            pipe.passed = passed
 
 
 class Obstacle:
     """Engel sınıfı - ikinci görseldeki engeller"""
     
+    # Görsel tüm engeller arasında paylaşılır ve ilk çizimde yüklenir
+    _image_cache: Optional[pygame.Surface] = None
+    
     def __init__(self, x: int, y: int):
         """Engel nesnesini oluşturur"""
         self.x = x
         self.y = y
         self.rect = pygame.Rect(x, y, OBSTACLE_WIDTH, OBSTACLE_HEIGHT)
-        self.image = self._load_image()
     
+    @property
+    def image(self) -> pygame.Surface:
+        """Engel görseli"""
+        if Obstacle._image_cache is None:
+            Obstacle._image_cache = self._load_image()
+        return Obstacle._image_cache
+    
+    @traced('asset.obstacle')
     def _load_image(self) -> pygame.Surface:
         """Engel görselini yükler veya varsayılan oluşturur"""
         try:
@@ -302,7 +404,7 @@ class ObstacleManager:
     """Engel yöneticisi - engelleri oluşturur ve yönetir"""
     
     def __init__(self):
-        """Engel yöneticisini başlatır"""
+        """Engel yöneticisini başlatır (engeller parkurdan place_obstacle ile gelir)"""
         self.obstacles: List[Obstacle] = []
     
     def update(self):
@@ -315,13 +417,9 @@ class ObstacleManager:
             if obstacle.is_off_screen():
                 self.obstacles.remove(obstacle)
     
-    def spawn_obstacle(self):
-        """Rastgele pozisyonda yeni engel oluşturur"""
-        if random.random() < OBSTACLE_SPAWN_CHANCE:
-            # Rastgele y pozisyonu (zemin ve tavan arasında)
-            y = random.randint(50, SCREEN_HEIGHT - GROUND_HEIGHT - OBSTACLE_HEIGHT - 50)
-            obstacle = Obstacle(SCREEN_WIDTH, y)
-            self.obstacles.append(obstacle)
+    def place_obstacle(self, y: int):
+        """Parkurda belirlenmiş y konumunda yeni engel oluşturur"""
+        self.obstacles.append(Obstacle(SCREEN_WIDTH, y))
     
     def draw(self, screen: pygame.Surface):
         """Tüm engelleri çizer"""
@@ -338,18 +436,144 @@ class ObstacleManager:
     def reset(self):
         """Tüm engelleri temizler"""
         self.obstacles.clear()
+    
+    def get_state(self) -> tuple:
+        """Engel durumunu kompakt demet olarak döndürür"""
+        return tuple((obstacle.x, obstacle.y) for obstacle in self.obstacles)
+    
+    def set_state(self, state: tuple):
+        """get_state ile alınmış durumu geri yükler"""
+        obstacles = []
+        for x, y in state:
+            obstacle = Obstacle(SCREEN_WIDTH, y)
+            obstacle.x = x
+            obstacle.rect.x = x
+            obstacles.append(obstacle)
+        self.obstacles[:] = obstacles
+
+
+def _is_opaque(image: pygame.Surface) -> bool:
+    """Yüzey tamamen opak mı (alfa kanalı ve colorkey olmadan) kontrol eder"""
+    if image.get_colorkey() is not None:
+        return False
+    if not image.get_flags() & pygame.SRCALPHA:
+        return True
+    # Alfası 254'ten büyük piksel sayısı tüm pikseller kadar ise opaktır
+    width, height = image.get_size()
+    return pygame.mask.from_surface(image, 254).count() == width * height
+
+
+def _prepare_surface(image: pygame.Surface, opaque: bool) -> pygame.Surface:
+    """Ekran varsa yüzeyi ekran piksel formatına çevirir (hızlı blit için)"""
+    if pygame.display.get_surface() is None:
+        return image
+    return image.convert() if opaque else image.convert_alpha()
+
+
+class ParallaxLayer:
+    """Paralaks katmanı - kendi hızında kayan, önceden hazırlanmış sarmal şerit"""
+    
+    def __init__(self, image: pygame.Surface, y: int = 0, speed: float = 0.0):
+        """Katmanı oluşturur; şerit bir kez hazırlanır, karede yalnızca blit yapılır"""
+        self.y = y
+        self.speed = speed
+        self.offset = 0.0
+        self.period = image.get_width()
+        self.opaque = _is_opaque(image)
+        self.strip = _prepare_surface(self._build_strip(image), self.opaque)
+        
+        # Kaynak alan rect'i her karede yeniden kullanılır (ayırma yapılmaz)
+        self.area = pygame.Rect(0, 0, SCREEN_WIDTH, image.get_height())
+    
+    def _build_strip(self, image: pygame.Surface) -> pygame.Surface:
+        """Görüntüyü ekran genişliği kadar uzatarak sarmal şerit oluşturur"""
+        if self.speed == 0:
+            return image
+        
+        width, height = image.get_size()
+        flags = 0 if self.opaque else pygame.SRCALPHA
+        strip = pygame.Surface((width + SCREEN_WIDTH, height), flags)
+        special_flags = 0 if self.opaque else pygame.BLEND_RGBA_MAX
+        for x in range(0, width + SCREEN_WIDTH, width):
+            strip.blit(image, (x, 0), special_flags=special_flags)
+        return strip
+    
+    def update(self):
+        """Katmanı kendi hızında kaydırır"""
+        if self.speed:
+            self.offset = (self.offset + self.speed) % self.period
+    
+    def draw(self, screen: pygame.Surface):
+        """Katmanı tek bir blit ile çizer"""
+        self.area.x = int(self.offset)
+        screen.blit(self.strip, (0, self.y), self.area)
+
+
+class ParallaxCompositor:
+    """Paralaks birleştirici - N katmanı arkadan öne çizer"""
+    
+    def __init__(self, layers: List[ParallaxLayer]):
+        """Katmanları alır ve en alttaki sabit katmanları önbelleğe birleştirir"""
+        self.layers = layers
+        self.cached_surface, self.scrolling_layers = self._merge_static_layers(layers)
+    
+    def _merge_static_layers(self, layers: List[ParallaxLayer]
+                             ) -> Tuple[Optional[pygame.Surface], List[ParallaxLayer]]:
+        """Alttan başlayan hareketsiz katmanları tek bir yüzeyde birleştirir"""
+        static_count = 0
+        for layer in layers:
+            if layer.speed != 0:
+                break
+            static_count += 1
+        
+        if static_count == 0:
+            return None, list(layers)
+        
+        # Taban katman ekranı tamamen kaplıyorsa önbellek de opak olur
+        base = layers[0]
+        opaque = (base.opaque and base.y <= 0 and
+                  base.strip.get_width() >= SCREEN_WIDTH and
+                  base.y + base.strip.get_height() >= SCREEN_HEIGHT)
+        flags = 0 if opaque else pygame.SRCALPHA
+        cached = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
+        for layer in layers[:static_count]:
+            layer.draw(cached)
+        
+        return _prepare_surface(cached, opaque), list(layers[static_count:])
+    
+    def update(self):
+        """Hareketli katmanları kaydırır"""
+        for layer in self.scrolling_layers:
+            layer.update()
+    
+    def draw(self, screen: pygame.Surface):
+        """Önbellek yüzeyini ve hareketli katmanları çizer"""
+        if self.cached_surface is not None:
+            screen.blit(self.cached_surface, (0, 0))
+        for layer in self.scrolling_layers:
+            layer.draw(screen)
 
 
 class Ground:
     """Zemin sınıfı - hareket eden zemin"""
     
+    # Kayan şerit ilk çizimde bir kez hazırlanır ve tüm zeminlerce paylaşılır
+    _layer_cache: Optional[ParallaxLayer] = None
+    
     def __init__(self):
         """Zemini başlatır"""
-        self.x1 = 0
-        self.x2 = SCREEN_WIDTH
         self.y = SCREEN_HEIGHT - GROUND_HEIGHT
-        self.image = self._load_image()
+        self.offset = 0.0
+        self.rect = pygame.Rect(0, self.y, SCREEN_WIDTH, GROUND_HEIGHT)
+    
+    @property
+    def layer(self) -> ParallaxLayer:
+        """Zeminin paralaks katmanı"""
+        if Ground._layer_cache is None:
+            Ground._layer_cache = ParallaxLayer(self._load_image(), self.y, GROUND_SPEED)
+        return Ground._layer_cache
     
+    @traced('asset.ground')
     def _load_image(self) -> pygame.Surface:
         """Zemin görselini yükler veya varsayılan oluşturur"""
         try:
@@ -374,32 +598,77 @@ class Ground:
     
     def update(self):
         """Zemin hareketini günceller"""
-        self.x1 -= GROUND_SPEED
-        self.x2 -= GROUND_SPEED
-        
-        # Sonsuz döngü için pozisyonları sıfırla
-        if self.x1 <= -SCREEN_WIDTH:
-            self.x1 = SCREEN_WIDTH
-        if self.x2 <= -SCREEN_WIDTH:
-            self.x2 = SCREEN_WIDTH
+        self.offset = (self.offset + GROUND_SPEED) % SCREEN_WIDTH
     
     def draw(self, screen: pygame.Surface):
         """Zemini çizer"""
-        screen.blit(self.image, (self.x1, self.y))
-        screen.blit(self.image, (self.x2, self.y))
+        layer = self.layer
+        layer.offset = self.offset
+        layer.draw(screen)
     
     def get_rect(self) -> pygame.Rect:
         """Çarpışma tespiti için rect döndürür"""
-        return pygame.Rect(0, self.y, SCREEN_WIDTH, GROUND_HEIGHT)
+        return self.rect
 
 
-class Background:
-    """Arkaplan sınıfı"""
+class Background(ParallaxCompositor):
+    """Arkaplan sınıfı - gökyüzü ve PARALLAX_LAYERS katmanları"""
     
     def __init__(self):
         """Arkaplanı başlatır"""
         self.image = self._load_image()
+        super().__init__(self._load_layers())
+    
+    @traced('asset.parallax')
+    def _load_layers(self) -> List[ParallaxLayer]:
+        """Config'deki paralaks katmanlarını yükler (eksik görseller atlanır)"""
+        layers = []
+        for asset_name, y, speed in PARALLAX_LAYERS:
+            if asset_name == 'background':
+                layers.append(ParallaxLayer(self.image, y, speed))
+                continue
+            
+            try:
+                if os.path.exists(ASSETS[asset_name]):
+                    img = pygame.image.load(ASSETS[asset_name])
+                else:
+                    # Görseli olmayan katman için varsayılan şerit (tanınmayan ad atlanır)
+                    img = self._default_layer_image(asset_name, SCREEN_HEIGHT - GROUND_HEIGHT - y)
+                if img is not None:
+                    layers.append(ParallaxLayer(img, y, speed))
+            except (pygame.error, KeyError):
+                pass
+        return layers
+    
+    @staticmethod
+    def _default_layer_image(asset_name: str, height: int) -> Optional[pygame.Surface]:
+        """Uzak tepeler / yakın şehir için sarmal (kenarları birleşen) varsayılan şerit"""
+        if height <= 0:
+            return None
+        img = pygame.Surface((SCREEN_WIDTH, height), pygame.SRCALPHA)
+        if asset_name == 'background_far':
+            # Periyodu şerit genişliğine bölünen sinüslerden tepe silueti
+            for x in range(SCREEN_WIDTH):
+                phase = 2 * math.pi * x / SCREEN_WIDTH
+                top = height * (0.45 - 0.2 * math.sin(2 * phase) - 0.1 * math.sin(5 * phase + 1.0))
+                pygame.draw.line(img, (126, 190, 170), (x, int(top)), (x, height))
+        elif asset_name == 'background_near':
+            # Sabit seed'li bina dizisi (oyunun random durumuna dokunmaz)
+            rng = random.Random(7)
+            x = 0
+            while x < SCREEN_WIDTH:
+                width = min(rng.randint(18, 34), SCREEN_WIDTH - x)
+                top = rng.randint(height // 5, height * 3 // 5)
+                img.fill((156, 196, 200), (x, top, width, height - top))
+                for window_y in range(top + 6, height - 4, 8):
+                    for window_x in range(x + 4, x + width - 5, 7):
+                        img.fill((206, 226, 220), (window_x, window_y, 3, 4))
+                x += width
+        else:
+            return None
+        return img
     
+    @traced('asset.background')
     def _load_image(self) -> pygame.Surface:
         """Arkaplan görselini yükler veya varsayılan oluşturur"""
         try:
@@ -422,10 +691,246 @@ class Background:
             img = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
             img.fill(COLORS['BLUE'])
             return img
+
+
+class GameSimulation:
+    """Oyun simülasyonu - çizim ve ses olmadan oyun mantığı
     
-    def draw(self, screen: pygame.Surface):
-        """Arkaplanı çizer"""
-        screen.blit(self.image, (0, 0))
+    Game bu sınıftan türer. Sunucu, botlar ve toplu simülasyonlar ekran
+    açmadan aynı adım fonksiyonunu kullanır; seed verilirse boru ve engel
+    dizisi deterministiktir.
+    """
+    
+    def __init__(self, seed: Optional[int] = None):
+        """Simülasyonu başlatır"""
+        self.rng = random.Random(seed)
+        self.bird = Bird(BIRD_START_X, BIRD_START_Y)
+        self.pipe_manager = PipeManager(self.rng)
+        self.obstacle_manager = ObstacleManager()
+        self.ground = Ground()
+        
+        self.state = GAME_STATES['PLAYING']
+        self.score = 0
+        self.frame = 0
+        self.death_cause: Optional[str] = None
+        
+        # RNG durumu yalnızca yeni parkur seed'i çekilirken değişir; snapshot'lar
+        # bu arada aynı (değişmez) durum demetini paylaşır
+        self._rng_epoch = 0
+        self._rng_cache: Tuple[tuple, tuple] = ((), ())
+        
+        # Çözülebilir parkur: boru ve engeller kendi seed'inden üretilir
+        self.layout: Optional[LayoutGenerator] = None
+        self._new_layout()
+        
+        # Kaba adım (advance): sabitler ikili kesirliyse kapalı formlar birebir doğru
+        self._exact_arithmetic = exact_arithmetic()
+        self.impact: Optional[Contact] = None  # advance'in bulduğu son temas (kesin zamanlı)
+    
+    def _new_layout(self):
+        """RNG'den yeni parkur seed'i çeker (aynı RNG durumu aynı parkuru verir)"""
+        self._rng_epoch += 1
+        self._use_layout(LayoutGenerator.from_rng(self.rng))
+    
+    def _use_layout(self, layout: LayoutGenerator):
+        """Parkuru simülasyona ve boru yöneticisine bağlar"""
+        self.layout = layout
+        self.pipe_manager.layout = layout
+    
+    def flap(self):
+        """Kuşu zıplatır"""
+        self.bird.flap()
+    
+    def reset(self, seed: Optional[int] = None):
+        """Simülasyonu baştan başlatır (seed verilirse RNG yeniden tohumlanır)"""
+        if seed is not None:
+            self.rng.seed(seed)
+        self._new_layout()
+        self.bird = Bird(BIRD_START_X, BIRD_START_Y)
+        self.pipe_manager.reset()
+        self.obstacle_manager.reset()
+        self.score = 0
+        self.frame = 0
+        self.death_cause = None
+        self.impact = None
+        self.state = GAME_STATES['PLAYING']
+    
+    def snapshot(self) -> tuple:
+        """Simülasyonun tüm durumunu (RNG dahil) kompakt demet olarak döndürür"""
+        return (self.frame, self.score, self.state, self.death_cause, self.ground.offset,
+                self.bird.get_state(), self.pipe_manager.get_state(),
+                self.obstacle_manager.get_state(), self._rng_state(), self.layout.seed)
+    
+    def _rng_key(self) -> tuple:
+        """RNG'nin son snapshot'tan beri kullanılıp kullanılmadığını gösteren anahtar"""
+        return (self._rng_epoch,)
+    
+    def _rng_state(self) -> tuple:
+        """RNG durumunu döndürür (değişmediyse önbellekten)"""
+        key = self._rng_key()
+        if self._rng_cache[0] != key:
+            self._rng_cache = (key, self.rng.getstate())
+        return self._rng_cache[1]
+    
+    def restore(self, snapshot: tuple):
+        """snapshot ile alınmış durumu geri yükler"""
+        (self.frame, self.score, self.state, self.death_cause, self.ground.offset,
+         bird_state, pipe_state, obstacle_state, rng_state, layout_seed) = snapshot
+        if layout_seed != self.layout.seed:
+            self._use_layout(LayoutGenerator(layout_seed))
+        self.bird.set_state(bird_state)
+        self.pipe_manager.set_state(pipe_state)
+        self.obstacle_manager.set_state(obstacle_state)
+        self.rng.setstate(rng_state)
+        self._rng_cache = (self._rng_key(), rng_state)
+    
+    def step(self):
+        """Tek bir fizik adımı ilerletir"""
+        self.frame += 1
+        
+        # Kuşu güncelle
+        self.bird.update()
+        
+        # Boruları güncelle ve skor kontrolü
+        score_increase = self.pipe_manager.check_score(self.bird.get_rect())
+        if score_increase > 0:
+            self.score += score_increase
+            self._on_score(score_increase)
+        
+        self.pipe_manager.update()
+        
+        # Engelleri güncelle; yenisi (açıksa) iki borunun ortasında, parkurdan gelir
+        self.obstacle_manager.update()
+        spawned = self.pipe_manager.spawned
+        if (LAYOUT_OBSTACLES and spawned
+                and self.pipe_manager.spawn_timer == self.layout.obstacle_offset):
+            obstacle_y = self.layout.obstacle(spawned - 1)
+            if obstacle_y is not None:
+                self.obstacle_manager.place_obstacle(obstacle_y)
+        
+        # Zemini güncelle
+        self.ground.update()
+        
+        # Çarpışma kontrolü
+        bird_rect = self.bird.get_rect()
+        
+        # Zemin çarpışması
+        if bird_rect.colliderect(self.ground.get_rect()):
+            self._game_over('ground')
+        
+        # Tavan çarpışması
+        if bird_rect.y < 0:
+            self._game_over('ceiling')
+        
+        # Boru çarpışması
+        if self.pipe_manager.check_collisions(bird_rect):
+            self._game_over_with_crash('pipe')
+        
+        # Engel çarpışması
+        if self.obstacle_manager.check_collisions(bird_rect):
+            self._game_over_with_crash('obstacle')
+    
+    def advance(self, frames: int = COLLISION_MAX_STEP, continuous: bool = False) -> int:
+        """Girdi olmadan en fazla 'frames' kare tek seferde ilerler
+        
+        Çarpışma, pencere boyunca süpürülmüş kutularla bir kez aranır
+        (collision.find_contact); sonuç step()'in aynı sayıda çağrılmasıyla
+        birebir aynıdır. Pencere sıradaki boru/engel doğuşundan önce biter.
+        continuous=True iken kareler arasında içinden geçilen nesneler de
+        çarpışma sayılır. İlerlenen kare sayısını döndürür.
+        """
+        pipe_manager = self.pipe_manager
+        timer = pipe_manager.spawn_timer
+        limit = min(frames, math.ceil(PIPE_SPAWN_DISTANCE / PIPE_SPEED - timer) - 1)
+        offset = self.layout.obstacle_offset
+        if LAYOUT_OBSTACLES and pipe_manager.spawned and timer < offset:
+            limit = min(limit, offset - timer - 1)
+        if limit < 2 or not self._exact_arithmetic:
+            self.step()
+            return 1
+        
+        # Kuşun pencere boyunca yörüngesi (paylaşılan flap yörünge tablosundan)
+        bird = self.bird
+        row, start = trajectory_table().locate(bird.velocity)
+        ys, velocities = row.path(bird.y, start, limit)
+        
+        contact = find_contact(self, ys, continuous)
+        count = contact.frame if contact is not None else limit
+        start_frame = self.frame
+        
+        # Skor: check_score borunun bir önceki karedeki x'iyle yapılır
+        passes = []
+        limit_x = bird.rect.x - PIPE_WIDTH
+        for pipe in pipe_manager.pipes:
+            if pipe.passed or pipe.x - PIPE_SPEED * (count - 1) >= limit_x:
+                continue
+            before = max(0, math.floor((pipe.x - limit_x) / PIPE_SPEED) + 1)
+            while before > 0 and pipe.x - PIPE_SPEED * (before - 1) < limit_x:
+                before -= 1
+            while not pipe.x - PIPE_SPEED * before < limit_x:
+                before += 1
+            if before + 1 <= count:
+                passes.append((before + 1, pipe))
+        
+        # Durumu pencere sonuna (ya da temas karesine) taşı
+        self.frame += count
+        bird.y, bird.velocity = ys[count], velocities[count]
+        bird.rect.y = int(bird.y)
+        bird.advance_animation(count)
+        for pipe in pipe_manager.pipes:
+            pipe.set_position(pipe.x - PIPE_SPEED * count)
+        pipe_manager.pipes[:] = [pipe for pipe in pipe_manager.pipes if not pipe.is_off_screen()]
+        pipe_manager.spawn_timer = timer + count
+        obstacles = self.obstacle_manager.obstacles
+        for obstacle in obstacles:
+            obstacle.x -= OBSTACLE_SPEED * count
+            obstacle.rect.x = obstacle.x
+        obstacles[:] = [obstacle for obstacle in obstacles if not obstacle.is_off_screen()]
+        self.ground.offset = (self.ground.offset + GROUND_SPEED * count) % SCREEN_WIDTH
+        
+        passes.sort(key=lambda item: item[0])
+        for _, pipe in passes:
+            pipe.passed = True
+            self.score += 1
+            self._on_score(1)
+        
+        if contact is not None:
+            self.impact = contact._replace(time=start_frame + contact.time)
+            for cause in contact.causes:
+                if cause in ('pipe', 'obstacle'):
+                    self._game_over_with_crash(cause)
+                else:
+                    self._game_over(cause)
+        return count
+    
+    def draw_playfield(self, surface: pygame.Surface, layers: Sequence[tuple] = ()):
+        """Oyun nesnesi katmanlarını Game.draw sırasıyla çizer (arkaplan ve yazılar hariç;
+        layers: engellerin üstüne çizilen (aralık adı, kanca) çiftleri, örn. hayaletler)"""
+        with timeline.span('draw.pipes'):
+            self.pipe_manager.draw(surface)
+        with timeline.span('draw.obstacles'):
+            self.obstacle_manager.draw(surface)
+        for name, hook in layers:
+            with timeline.span(name):
+                hook(self, surface)
+        with timeline.span('draw.ground'):
+            self.ground.draw(surface)
+        with timeline.span('draw.bird'):
+            self.bird.draw(surface)
+    
+    def _on_score(self, score_increase: int):
+        """Skor arttığında çağrılır"""
+        pass
+    
+    def _game_over(self, cause: str = 'ground'):
+        """Oyun bitişini yönetir (aynı karedeki ilk neden saklanır)"""
+        self.state = GAME_STATES['GAME_OVER']
+        if self.death_cause is None:
+            self.death_cause = cause
+    
+    def _game_over_with_crash(self, cause: str = 'pipe'):
+        """Engel çarpışması ile oyun bitişini yönetir"""
+        GameSimulation._game_over(self, cause)
 
 
 class SoundManager:
@@ -443,6 +948,7 @@ class SoundManager:
             self.enabled = False
             print("Uyarı: Ses sistemi başlatılamadı. Oyun sessiz çalışacak.")
     
+    @traced('asset.sounds')
     def _load_sounds(self):
         """Ses dosyalarını yükler"""
         sound_files = ['flap_sound', 'score_sound', 'hit_sound', 'crash_sound']
@@ -464,18 +970,119 @@ class SoundManager:
         """Belirtilen sesi çalar"""
         if self.enabled and sound_name in self.sounds:
             try:
-                self.sounds[sound_name].play()
+                with timeline.span(f"sound.{sound_name}"):
+                    self.sounds[sound_name].play()
             except pygame.error:
                 pass
 
 
-class Game:
+class StateCpuMeter:
+    """Durum bazlı CPU ölçer - her oyun durumunda duvar saniyesi başına CPU süresi"""
+    
+    def __init__(self):
+        """Ölçeri başlatır"""
+        self.cpu_time: Dict[str, float] = {}
+        self.wall_time: Dict[str, float] = {}
+        self._last_cpu = time.process_time()
+        self._last_wall = time.perf_counter()
+    
+    def sample(self, state: str):
+        """Son örnekten bu yana geçen süreyi verilen duruma yazar"""
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        self.cpu_time[state] = self.cpu_time.get(state, 0.0) + cpu - self._last_cpu
+        self.wall_time[state] = self.wall_time.get(state, 0.0) + wall - self._last_wall
+        self._last_cpu = cpu
+        self._last_wall = wall
+    
+    def load(self) -> Dict[str, float]:
+        """Her durum için CPU saniyesi / duvar saniyesi oranını döndürür"""
+        return {state: self.cpu_time[state] / wall
+                for state, wall in self.wall_time.items() if wall > 0}
+    
+    def report(self) -> str:
+        """Okunabilir özet metni döndürür"""
+        lines = ["Durum       Süre (s)   CPU (s)   CPU/s"]
+        for state, ratio in self.load().items():
+            lines.append(f"{state:<10} {self.wall_time[state]:>9.1f} "
+                         f"{self.cpu_time[state]:>9.2f} {ratio:>7.1%}")
+        return "\n".join(lines)
+
+
+class LatencyProbe:
+    """Girdi gecikme ölçer - flap olayından etkisini gösteren ilk flip'e kadar geçen süre"""
+    
+    def __init__(self, max_samples: int = 10000):
+        """Ölçeri başlatır (en fazla max_samples örnek saklanır)"""
+        self.pending: List[float] = []
+        self.samples: Deque[Tuple[float, float]] = deque(maxlen=max_samples)
+    
+    def mark_input(self, event_time: float):
+        """Uygulanan bir flap girdisinin zaman damgasını kaydeder"""
+        self.pending.append(event_time)
+    
+    def mark_present(self, flip_time: float):
+        """Flip zamanını bekleyen tüm girdilerle eşleştirir"""
+        if self.pending:
+            for event_time in self.pending:
+                self.samples.append((event_time, flip_time))
+            self.pending.clear()
+    
+    def latencies_ms(self) -> List[float]:
+        """Girdi→ekran gecikmelerini milisaniye olarak döndürür"""
+        return [(flip_time - event_time) * 1000 for event_time, flip_time in self.samples]
+    
+    def report(self) -> str:
+        """Okunabilir özet metni döndürür"""
+        latencies = sorted(self.latencies_ms())
+        if not latencies:
+            return "Gecikme ölçümü: örnek yok"
+        count = len(latencies)
+        mean = sum(latencies) / count
+        p50 = latencies[count // 2]
+        p95 = latencies[min(count - 1, int(count * 0.95))]
+        return (f"Girdi→ekran gecikmesi ({count} flap): ortalama {mean:.1f} ms, "
+                f"p50 {p50:.1f} ms, p95 {p95:.1f} ms, en fazla {latencies[-1]:.1f} ms")
+    
+    def write_csv(self, path: str):
+        """Olay ve flip zaman damgalarını CSV olarak yazar"""
+        with open(path, 'w') as f:
+            f.write("event_time,flip_time,latency_ms\n")
+            for event_time, flip_time in self.samples:
+                f.write(f"{event_time:.6f},{flip_time:.6f},"
+                        f"{(flip_time - event_time) * 1000:.3f}\n")
+
+
+class Game(GameSimulation):
     """Ana oyun sınıfı - tüm oyun mantığını yönetir"""
     
-    def __init__(self, fullscreen: bool = False, large_screen: bool = False):
-        """Oyunu başlatır"""
+    def __init__(self, fullscreen: bool = False, large_screen: bool = False,
+                 low_latency: bool = False, latency_probe: bool = False,
+                 ghosts: bool = False, autopilot: bool = False,
+                 capture: Optional[str] = None, capture_format: str = 'png',
+                 heatmap: Optional[str] = None, archive: Optional[str] = None,
+                 lifetime_stats: bool = False, lifetime_path: str = LIFETIME_STATS_FILE,
+                 rewind: bool = False,
+                 trace: bool = False, trace_budget_ms: float = TRACE_FRAME_BUDGET_MS,
+                 profile_frames: int = PROFILE_FRAMES):
+        """Oyunu başlatır (capture/heatmap/archive verilirse ilgili özellik açılır; boş: varsayılan yol)"""
         pygame.init()
         
+        # Eklentiler (plugins.py): isteğe bağlı alt sistemler kancalarıyla takılma sırasıyla çağrılır
+        self.plugins: List[GamePlugin] = []
+        self._hooks = plugin_hooks(self.plugins)
+        
+        # Zaman çizelgesi izleyici (F8): asset yüklemeleri de görünsün diye en başta kurulur
+        self.tracer = None
+        if trace:
+            tracer = timeline.start(timeline.Timeline(budget_ms=trace_budget_ms))
+            self.tracer = self.add_plugin(TracePlugin(tracer)).tracer
+        
+        # İstek üzerine profil (F10; SIGUSR1 işleyicisini yalnızca main.py kurar):
+        # cProfile ilk istekte yüklenir, web derlemesi ve araçlar onu hiç içe aktarmaz
+        self.profiler = None
+        self.profile_frames = profile_frames
+        
         # Ekran boyutunu belirle
         if large_screen:
             screen_width = SCREEN_WIDTH * 2
@@ -502,18 +1109,106 @@ class Game:
         self.menu_text_font = pygame.font.Font(None, MENU_TEXT_SIZE)
         
         # Oyun nesnelerini oluştur
-        self.bird = Bird(BIRD_START_X, BIRD_START_Y)
-        self.pipe_manager = PipeManager()
-        self.obstacle_manager = ObstacleManager()
-        self.ground = Ground()
+        super().__init__()
         self.background = Background()
         self.sound_manager = SoundManager()
         
+        # Ömür boyu istatistikler: makinedeki tüm örneklerin paylaştığı mmap sayaçları
+        # (yalnızca oyuncu girişleri açar; araç ve ölçüm oyunları sayılmaz)
+        self.lifetime = None
+        if lifetime_stats:
+            from lifetime import open_lifetime_stats  # mmap yalnızca bu modda gerekir
+            self.lifetime = open_lifetime_stats(lifetime_path)
+        
         # Oyun durumu
         self.state = GAME_STATES['MENU']
-        self.score = 0
         self.high_score = self._load_high_score()
         self.running = True
+        
+        # Boşta bekleme ve pencere durumu (menü/duraklama/game over'da CPU harcanmaz)
+        self.needs_redraw = True
+        self.window_minimized = False
+        self.window_focused = True
+        self.cpu_meter = StateCpuMeter()
+        
+        # Düşük gecikmeli girdi: olaylar uyku sırasında zaman damgasıyla toplanır
+        self.low_latency = low_latency
+        self.latency_probe = LatencyProbe() if latency_probe else None
+        self._input_queue: List[Tuple[float, pygame.event.Event]] = []
+        self._next_frame_time = 0.0
+        self._frame_work_estimate = 0.0
+        
+        # Otopilot (vitrin modu): kararları arama ile verir, oyun bitince yeniden başlar
+        self.autopilot = None
+        self._autopilot_wait = 0
+        if autopilot:
+            from autopilot import Autopilot
+            self.autopilot = Autopilot()
+        
+        # Koşunun seed'i ve flap kareleri (arşiv eklentisi biten koşuyu bunlarla yazar);
+        # seeded_runs açıkken seed'siz her koşuya yeniden üretilebilir bir seed çekilir
+        self.run_seed: Optional[int] = None
+        self.run_flaps: List[int] = []
+        self.seeded_runs = archive is not None
+        
+        # Hayalet yarışı: herkes aynı parkurda uçar, her koşu yeni bir hayalet olur
+        self.ghost_seed: Optional[int] = None
+        if ghosts:
+            ghost_plugin = self.add_plugin(GhostPlugin())
+            self.ghost_seed = GHOST_SEED
+            self.rng.seed(self.ghost_seed)
+            self._new_layout()
+            ghost_plugin.on_reset(self)
+        
+        # Kare yakalama (CapturePlugin): F12 ile açılır/kapanır
+        self.capture = None
+        self.capture_format = capture_format
+        if capture is not None:
+            self._start_capture(capture or None)
+        
+        if heatmap is not None:
+            self.add_plugin(HeatmapPlugin(heatmap or HEATMAP_FILE))
+        
+        if archive is not None:
+            self.add_plugin(ArchivePlugin(archive or RUN_ARCHIVE_DIR))
+            self.reset(self.ghost_seed)  # İlk koşu da seed'inden yeniden üretilebilsin
+            self.state = GAME_STATES['MENU']
+        
+        # Geri sarma (F9): son saniyelerin kareleri halkada; rewind_cursor gösterilen
+        # karenin en yeniden uzaklığı (None: oyun akıyor). Ölümden geri sarılıp
+        # sürdürülen dal, kaydı zaten yapılmış koşuyu ikinci kez kaydetmez
+        self.rewind = None
+        self.rewind_cursor: Optional[int] = None
+        self._run_finished = False
+        if rewind:
+            layers = len(self.background.scrolling_layers)
+            self.rewind = self.add_plugin(RewindPlugin(layers)).buffer
+        
+        # asyncio döngüsü: arka plan görevleri ve ertelenmiş kayıt
+        self._background_tasks: List[Awaitable] = []
+        self._defer_high_score_save = False
+        self._high_score_dirty = False
+    
+    def add_plugin(self, plugin: GamePlugin) -> GamePlugin:
+        """Eklentiyi takar (kancaları takılma sırasıyla çağrılır) ve geri döndürür"""
+        self.plugins.append(plugin)
+        self._hooks = plugin_hooks(self.plugins)
+        return plugin
+    
+    def remove_plugin(self, plugin: GamePlugin):
+        """Eklentiyi kapatıp çıkarır"""
+        self.plugins.remove(plugin)
+        self._hooks = plugin_hooks(self.plugins)
+        plugin.close(self)
+    
+    def _call_hooks(self, hook: str, *args):
+        """Kancayı onu ezen eklentilerde çağırır (aralık adı olanlar zaman çizelgesinde ölçülür)"""
+        for name, method in self._hooks[hook]:
+            if name is None:
+                method(self, *args)
+            else:
+                with timeline.span(name):
+                    method(self, *args)
     
     def _load_high_score(self) -> int:
         """Yüksek skoru yükler"""
@@ -534,43 +1229,189 @@ class Game:
         except IOError:
             pass
     
+    def _request_high_score_save(self):
+        """Yüksek skoru kaydeder; asyncio döngüsünde kayıt arka plan görevine bırakılır"""
+        if self._defer_high_score_save:
+            self._high_score_dirty = True
+        else:
+            self._save_high_score()
+    
+    async def _persist_high_score(self):
+        """Arka plan görevi - bekleyen yüksek skoru aralıklarla diske yazar"""
+        while True:
+            await asyncio.sleep(HIGHSCORE_SAVE_INTERVAL)
+            if self._high_score_dirty:
+                self._high_score_dirty = False
+                self._save_high_score()
+    
+    def add_background_task(self, task: Awaitable):
+        """run_async sırasında oyunla eşzamanlı çalışacak bir coroutine ekler
+        
+        Telemetri, asset ön yükleme gibi işler thread kullanmadan çalışır;
+        döngü her karede event loop'a yol verir, görevler çıkışta iptal edilir.
+        """
+        self._background_tasks.append(task)
+    
+    @traced('handle_events')
     def handle_events(self):
         """Olayları işler"""
+        # Yoklama anı zaman damgası olur; gerçek varış zamanı için --low-latency
+        timestamp = time.perf_counter()
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            self._handle_event(event, timestamp)
+    
+    def _handle_event(self, event: pygame.event.Event, timestamp: Optional[float] = None):
+        """Tek bir olayı işler (timestamp: olayın alındığı perf_counter zamanı)"""
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        
+        if event.type == pygame.QUIT:
+            self.running = False
+        
+        elif event.type == pygame.KEYDOWN:
+            self.needs_redraw = True
+            if event.key == pygame.K_ESCAPE:
                 self.running = False
             
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                
-                elif event.key == pygame.K_SPACE:
-                    self._handle_flap()
-                
-                elif event.key == pygame.K_p:
-                    self._handle_pause()
-                
-                elif event.key == pygame.K_r and self.state == GAME_STATES['GAME_OVER']:
-                    self._restart_game()
+            elif self.rewind_cursor is not None:
+                self._handle_rewind_key(event)
+            
+            elif event.key == pygame.K_SPACE:
+                self._handle_flap(timestamp)
+            
+            elif event.key == pygame.K_p:
+                self._handle_pause()
+            
+            elif event.key == pygame.K_r and self.state == GAME_STATES['GAME_OVER']:
+                self._restart_game()
+            
+            elif event.key == pygame.K_F12:
+                self._toggle_capture()
             
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Sol mouse tuşu
-                    self._handle_flap()
+            elif event.key == pygame.K_F9 and self.rewind is not None:
+                self._start_rewind()
+            
+            elif event.key == pygame.K_F8 and self.tracer is not None:
+                self.tracer.dump()
+            
+            elif event.key == pygame.K_F10:
+                self.frame_profiler().request()
+        
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self.needs_redraw = True
+            if event.button == 1 and self.rewind_cursor is None:  # Sol mouse tuşu
+                self._handle_flap(timestamp)
+        
+        elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            self.window_minimized = True
+            self._handle_window_hidden()
+        
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.window_focused = False
+            self._handle_window_hidden()
+        
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+            self.window_minimized = False
+            self.needs_redraw = True
+        
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.window_focused = True
+            self.needs_redraw = True
+        
+        elif event.type == pygame.WINDOWEXPOSED:
+            self.needs_redraw = True
+    
+    def _toggle_capture(self):
+        """Kare kaydını başlatır veya durdurur"""
+        if self.capture is None:
+            self._start_capture()
+        else:
+            self._stop_capture()
+    
+    def _start_capture(self, target: Optional[str] = None):
+        """Arka planda kare kaydını başlatır (hedef yoksa zaman damgalı klasör/dosya)"""
+        self.capture = self.add_plugin(CapturePlugin(target, self.capture_format))
+    
+    def _stop_capture(self):
+        """Kayıt eklentisini çıkarır (bekleyen kareler yazılır, özet yazdırılır)"""
+        if self.capture is not None:
+            self.remove_plugin(self.capture)
+            self.capture = None
+    
+    def _start_rewind(self):
+        """Oyunu dondurup geri sarmaya geçer (halkadaki en yeni kareden başlar)"""
+        if len(self.rewind) == 0 or self.state == GAME_STATES['MENU']:
+            return
+        self.rewind_cursor = 0
+        self.rewind.restore(self, 0)
+        pygame.key.set_repeat(*REWIND_KEY_REPEAT)
+    
+    def _handle_rewind_key(self, event: pygame.event.Event):
+        """Geri sarmada ←/→ kare kare (SHIFT ile saniye saniye) gezer, F9/SPACE sürdürür"""
+        step = FPS if event.mod & pygame.KMOD_SHIFT else 1
+        if event.key == pygame.K_LEFT:
+            cursor = min(self.rewind_cursor + step, len(self.rewind) - 1)
+        elif event.key == pygame.K_RIGHT:
+            cursor = max(self.rewind_cursor - step, 0)
+        elif event.key in (pygame.K_F9, pygame.K_SPACE):
+            self._resume_from_rewind()
+            return
+        else:
+            return
+        if cursor != self.rewind_cursor:
+            self.rewind_cursor = cursor
+            self.rewind.restore(self, cursor)
     
-    def _handle_flap(self):
+    def _resume_from_rewind(self):
+        """Gösterilen kareden oyunu sürdürür; sonraki kareler ve girdileri atılır"""
+        self.rewind.truncate(self.rewind_cursor)
+        self.rewind_cursor = None
+        pygame.key.set_repeat()
+        if self._run_finished:
+            print("⏪ Koşu zaten kaydedildi; bu dal ısı haritasına, arşive ve sayaçlara yazılmayacak")
+        self.run_flaps = [frame for frame in self.run_flaps if frame < self.frame]
+    
+    def _handle_window_hidden(self):
+        """Pencere küçültülünce veya odak kaybolunca oyunu duraklatır"""
+        if self.state == GAME_STATES['PLAYING']:
+            self.state = GAME_STATES['PAUSED']
+    
+    @property
+    def window_visible(self) -> bool:
+        """Pencere görünür ve odakta mı"""
+        return not self.window_minimized and self.window_focused
+    
+    def _handle_flap(self, timestamp: Optional[float] = None):
         """Zıplama işlemini yönetir"""
         if self.state == GAME_STATES['MENU']:
             self.state = GAME_STATES['PLAYING']
+            if self.lifetime is not None:
+                self.lifetime.game_started()
             self.bird.flap()
             self.sound_manager.play('flap_sound')
+            self._mark_flap_input(timestamp)
+            self._record_flap()
         
         elif self.state == GAME_STATES['PLAYING']:
             self.bird.flap()
             self.sound_manager.play('flap_sound')
+            self._mark_flap_input(timestamp)
+            self._record_flap()
         
         elif self.state == GAME_STATES['GAME_OVER']:
             self._restart_game()
     
+    def _mark_flap_input(self, timestamp: Optional[float]):
+        """Gecikme ölçümü açıksa uygulanan flap'i kaydeder"""
+        if self.latency_probe is not None and timestamp is not None:
+            self.latency_probe.mark_input(timestamp)
+    
+    def _record_flap(self):
+        """Flap'i ömür boyu sayaçlara, karesini koşunun girdilerine ekler"""
+        if self.lifetime is not None:
+            self.lifetime.add('flaps')
+        self.run_flaps.append(self.frame)
+    
     def _handle_pause(self):
         """Duraklama işlemini yönetir"""
         if self.state == GAME_STATES['PLAYING']:
@@ -580,66 +1421,85 @@ class Game:
     
     def _restart_game(self):
         """Oyunu yeniden başlatır"""
-        self.bird = Bird(BIRD_START_X, BIRD_START_Y)
-        self.pipe_manager.reset()
-        self.obstacle_manager.reset()
-        self.score = 0
-        self.state = GAME_STATES['PLAYING']
+        self.reset(self.ghost_seed)
+        if self.lifetime is not None:
+            self.lifetime.game_started()
     
+    def reset(self, seed: Optional[int] = None):
+        """Simülasyonu baştan başlatır ve eklentilere yeni koşuyu bildirir"""
+        if seed is None and self.seeded_runs:
+            seed = self.rng.randrange(2 ** 31)  # Arşivlenen koşu bu seed'le yeniden oynatılır
+        super().reset(seed)
+        self.run_seed = seed
+        self._run_finished = False
+        self.run_flaps = []
+        self._call_hooks('on_reset')
+    
+    @traced('update')
     def update(self):
         """Oyun mantığını günceller"""
+        if self.rewind_cursor is not None:
+            return  # Geri sarmada oyun donuk
+        if self.autopilot is not None:
+            with timeline.span('update.autopilot'):
+                self._drive_autopilot()
         if self.state == GAME_STATES['PLAYING']:
-            # Kuşu güncelle
-            self.bird.update()
-            
-            # Boruları güncelle ve skor kontrolü
-            score_increase = self.pipe_manager.check_score(self.bird.get_rect())
-            if score_increase > 0:
-                self.score += score_increase
-                self.sound_manager.play('score_sound')
-                
-                # Yüksek skor kontrolü
-                if self.score > self.high_score:
-                    self.high_score = self.score
-                    self._save_high_score()
-            
-            self.pipe_manager.update()
-            
-            # Engelleri güncelle
-            self.obstacle_manager.update()
-            
-            # Zemini güncelle
-            self.ground.update()
-            
-            # Çarpışma kontrolü
-            bird_rect = self.bird.get_rect()
-            
-            # Zemin çarpışması
-            if bird_rect.colliderect(self.ground.get_rect()):
-                self._game_over()
-            
-            # Tavan çarpışması
-            if bird_rect.y < 0:
-                self._game_over()
-            
-            # Boru çarpışması
-            if self.pipe_manager.check_collisions(bird_rect):
-                self._game_over_with_crash()
-            
-            # Engel çarpışması
-            if self.obstacle_manager.check_collisions(bird_rect):
-                self._game_over_with_crash()
+            with timeline.span('update.step'):
+                self.step()
+            with timeline.span('update.background'):
+                self.background.update()
+            self._call_hooks('on_frame')
+            if self.state == GAME_STATES['GAME_OVER'] and not self._run_finished:
+                with timeline.span('update.game_over'):
+                    self._finish_run()
+    
+    def _finish_run(self):
+        """Biten koşuyu eklentilere bildirir (ısı haritası, arşiv, hayalet, geri sarma; koşu başına bir kez)"""
+        self._run_finished = True
+        self._call_hooks('on_finish')
     
-    def _game_over(self):
+    def _drive_autopilot(self):
+        """Otopilotun kararını uygular; menüde ve oyun bitince kısa bir beklemeyle başlatır"""
+        if self.state == GAME_STATES['PLAYING']:
+            if self.autopilot.decide(self):
+                self._handle_flap()
+        elif self.state in (GAME_STATES['MENU'], GAME_STATES['GAME_OVER']):
+            self._autopilot_wait += 1
+            if self._autopilot_wait >= AUTOPILOT_RESTART_DELAY:
+                self._autopilot_wait = 0
+                self._handle_flap()
+                self.needs_redraw = True
+    
+    def _on_score(self, score_increase: int):
+        """Skor sesini çalar ve yüksek skoru günceller"""
+        self.sound_manager.play('score_sound')
+        if self.lifetime is not None:
+            self.lifetime.add('pipes', score_increase)
+        
+        # Yüksek skor kontrolü
+        if self.score > self.high_score:
+            self.high_score = self.score
+            self._request_high_score_save()
+    
+    def _game_over(self, cause: str = 'ground'):
         """Oyun bitişini yönetir"""
-        self.state = GAME_STATES['GAME_OVER']
+        self._count_death(cause)
+        super()._game_over(cause)
         self.sound_manager.play('hit_sound')
     
-    def _game_over_with_crash(self):
+    def _game_over_with_crash(self, cause: str = 'pipe'):
         """Engel çarpışması ile oyun bitişini yönetir"""
-        self.state = GAME_STATES['GAME_OVER']
+        self._count_death(cause)
+        super()._game_over_with_crash(cause)
         self.sound_manager.play('crash_sound')
     
+    def _count_death(self, cause: str):
+        """Ölümü ömür boyu sayaçlara ekler (aynı karedeki ikinci neden sayılmaz)"""
+        if (self.lifetime is not None and self.state == GAME_STATES['PLAYING']
+                and not self._run_finished):
+            self.lifetime.game_over(cause, self.score, self.frame * 1000 // FPS)
+    
+    @traced('draw')
     def draw(self):
         """Ekrana çizim yapar"""
         if self.scale_factor > 1.0:
@@ -647,55 +1507,64 @@ class Game:
             temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
             
             # Arkaplanı çiz
-            self.background.draw(temp_surface)
+            with timeline.span('draw.background'):
+                self.background.draw(temp_surface)
+            self._call_hooks('draw_backdrop', temp_surface)
             
             if self.state != GAME_STATES['MENU']:
                 # Oyun nesnelerini çiz
-                self.pipe_manager.draw(temp_surface)
-                self.obstacle_manager.draw(temp_surface)
-                self.ground.draw(temp_surface)
-                self.bird.draw(temp_surface)
+                self.draw_playfield(temp_surface, self._hooks['draw_field'])
                 
                 # Skoru çiz
-                self._draw_score_scaled(temp_surface)
+                with timeline.span('draw.score'):
+                    self._draw_score_scaled(temp_surface)
             
             # Durum bazlı çizimler
-            if self.state == GAME_STATES['MENU']:
-                self._draw_menu_scaled(temp_surface)
-            elif self.state == GAME_STATES['PAUSED']:
-                self._draw_pause_screen_scaled(temp_surface)
-            elif self.state == GAME_STATES['GAME_OVER']:
-                self._draw_game_over_screen_scaled(temp_surface)
+            with timeline.span('draw.screens'):
+                if self.state == GAME_STATES['MENU']:
+                    self._draw_menu_scaled(temp_surface)
+                elif self.state == GAME_STATES['PAUSED']:
+                    self._draw_pause_screen_scaled(temp_surface)
+                elif self.state == GAME_STATES['GAME_OVER']:
+                    self._draw_game_over_screen_scaled(temp_surface)
+                self._call_hooks('draw_overlay', temp_surface)
             
             # Yüzeyi ölçeklendir ve ana ekrana çiz
-            scaled_surface = pygame.transform.scale(temp_surface, 
-                                                   (int(SCREEN_WIDTH * self.scale_factor), 
-                                                    int(SCREEN_HEIGHT * self.scale_factor)))
-            self.screen.blit(scaled_surface, (0, 0))
+            with timeline.span('draw.scale'):
+                scaled_surface = pygame.transform.scale(temp_surface, 
+                                                       (int(SCREEN_WIDTH * self.scale_factor), 
+                                                        int(SCREEN_HEIGHT * self.scale_factor)))
+                self.screen.blit(scaled_surface, (0, 0))
         else:
             # Normal boyut için
             # Arkaplanı çiz
-            self.background.draw(self.screen)
+            with timeline.span('draw.background'):
+                self.background.draw(self.screen)
+            self._call_hooks('draw_backdrop', self.screen)
             
             if self.state != GAME_STATES['MENU']:
                 # Oyun nesnelerini çiz
-                self.pipe_manager.draw(self.screen)
-                self.obstacle_manager.draw(self.screen)
-                self.ground.draw(self.screen)
-                self.bird.draw(self.screen)
+                self.draw_playfield(self.screen, self._hooks['draw_field'])
                 
                 # Skoru çiz
-                self._draw_score()
+                with timeline.span('draw.score'):
+                    self._draw_score()
             
             # Durum bazlı çizimler
-            if self.state == GAME_STATES['MENU']:
-                self._draw_menu()
-            elif self.state == GAME_STATES['PAUSED']:
-                self._draw_pause_screen()
-            elif self.state == GAME_STATES['GAME_OVER']:
-                self._draw_game_over_screen()
+            with timeline.span('draw.screens'):
+                if self.state == GAME_STATES['MENU']:
+                    self._draw_menu()
+                elif self.state == GAME_STATES['PAUSED']:
+                    self._draw_pause_screen()
+                elif self.state == GAME_STATES['GAME_OVER']:
+                    self._draw_game_over_screen()
+                self._call_hooks('draw_overlay', self.screen)
         
-        pygame.display.flip()
+        with timeline.span('display.flip'):
+            pygame.display.flip()
+        if self.latency_probe is not None:
+            self.latency_probe.mark_present(time.perf_counter())
+        self._call_hooks('on_present', self.screen)
     
     def _draw_score(self):
         """Skoru çizer"""
@@ -841,12 +1710,170 @@ class Game:
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 70))
         self.screen.blit(restart_text, restart_rect)
     
+    def _is_idle(self) -> bool:
+        """Ekranda hareket eden bir şey yoksa (veya pencere görünmüyorsa) True"""
+        if not self.window_visible or self.rewind_cursor is not None:
+            return True
+        if self.autopilot is not None and self.state != GAME_STATES['PAUSED']:
+            return False  # Otopilot menü ve game over ekranından kendisi devam eder
+        return self.state != GAME_STATES['PLAYING']
+    
+    def _wait_idle(self):
+        """Boşta bekler: yalnızca girdi, pencere olayı veya durum değişiminde çizer"""
+        if self.needs_redraw and self.window_visible:
+            self.draw()
+            self.needs_redraw = False
+        
+        with timeline.span('idle.wait'):
+            event = pygame.event.wait(IDLE_WAIT_TIMEOUT_MS)
+        if event.type != pygame.NOEVENT:
+            self._handle_event(event, time.perf_counter())
+            self.handle_events()
+        
+        # Oyuna dönüşte ilk karenin süresi bekleme süresini içermesin
+        self.clock.tick()
+    
+    def frame_profiler(self):
+        """İstek üzerine profil yakalayıcıyı döndürür (ilk çağrıda kurulur)"""
+        if self.profiler is None:
+            self.profiler = self.add_plugin(ProfilerPlugin(self.profile_frames)).profiler
+        return self.profiler
+    
+    def _begin_frame(self):
+        """Kare işinin başlangıcı: izleyiciyi işaretler, istenmişse profili açar"""
+        self._call_hooks('begin_frame')
+    
+    def _end_frame(self):
+        """Kare işinin sonu (uykudan önce): profili durdurur, izleyiciye kareyi kaydeder"""
+        self._call_hooks('end_frame')
+    
+    def _collect_events(self, deadline: float):
+        """Verilen perf_counter zamanına kadar olayları geldikleri anda damgalayıp kuyruğa alır"""
+        while True:
+            remaining_ms = int((deadline - time.perf_counter()) * 1000)
+            if remaining_ms <= 0:
+                break
+            event = pygame.event.wait(remaining_ms)
+            if event.type != pygame.NOEVENT:
+                self._input_queue.append((time.perf_counter(), event))
+        
+        timestamp = time.perf_counter()
+        for event in pygame.event.get():
+            self._input_queue.append((timestamp, event))
+    
+    def _run_low_latency_frame(self):
+        """Düşük gecikmeli kare: uyku olay beklemeyle geçer, işleme flip'ten hemen önceye bırakılır"""
+        now = time.perf_counter()
+        if self._next_frame_time < now - 1.0 / FPS:
+            # Bir kareden fazla geride kaldık (ilk kare veya takılma): yeniden hizala
+            self._next_frame_time = now
+        
+        # Kare işinin tahmini süresi kadar erken uyan, o ana kadar gelen olayları topla
+        with timeline.span('input.wait'):
+            self._collect_events(self._next_frame_time - self._frame_work_estimate
+                                 - LOW_LATENCY_SAFETY_MS / 1000)
+        
+        start = time.perf_counter()
+        self._begin_frame()
+        
+        # Kuyruktaki olaylar bu fizik adımına aittir; yeni gelenler sonrakine kalır
+        with timeline.span('handle_events'):
+            for timestamp, event in self._input_queue:
+                self._handle_event(event, timestamp)
+        self._input_queue.clear()
+        
+        self.update()
+        self.draw()
+        self._end_frame()
+        
+        work = time.perf_counter() - start
+        self._frame_work_estimate = max(work, self._frame_work_estimate * 0.95 + work * 0.05)
+        self._next_frame_time += 1.0 / FPS
+        self.clock.tick()
+    
+    async def run_async(self):
+        """asyncio uyumlu ana oyun döngüsü (WebAssembly derlemeleri ve arka plan görevleri için)
+        
+        clock.tick ve pygame.event.wait yerine her karede asyncio.sleep ile
+        event loop'a yol verir; boştayken yalnızca olayları yoklar.
+        """
+        self._defer_high_score_save = True
+        tasks = [asyncio.ensure_future(task) for task in self._background_tasks]
+        tasks.append(asyncio.ensure_future(self._persist_high_score()))
+        self._background_tasks.clear()
+        
+        frame_period = 1.0 / FPS
+        next_frame_time = time.perf_counter()
+        last_state = self.state
+        try:
+            while self.running:
+                frame_state = self.state
+                if self._is_idle():
+                    if self.needs_redraw and self.window_visible:
+                        self.draw()
+                        self.needs_redraw = False
+                    self.handle_events()
+                else:
+                    self._begin_frame()
+                    self.handle_events()
+                    self.update()
+                    self.draw()
+                    self._end_frame()
+                self.clock.tick()
+                
+                if self.state != last_state:
+                    last_state = self.state
+                    self.needs_redraw = True
+                self.cpu_meter.sample(frame_state)
+                
+                # Bir sonraki kareye kadar event loop'a yol ver
+                next_frame_time += frame_period
+                delay = next_frame_time - time.perf_counter()
+                if delay < 0:
+                    next_frame_time = time.perf_counter()
+                    delay = 0
+                with timeline.span('asyncio.sleep'):
+                    await asyncio.sleep(delay)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            
+            if self._high_score_dirty:
+                self._high_score_dirty = False
+                self._save_high_score()
+            self._defer_high_score_save = False
+            self._shutdown()
+    
     def run(self):
         """Ana oyun döngüsü"""
+        last_state = self.state
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            frame_state = self.state
+            if self._is_idle():
+                self._wait_idle()
+            elif self.low_latency:
+                self._run_low_latency_frame()
+            else:
+                self._begin_frame()
+                self.handle_events()
+                self.update()
+                self.draw()
+                self._end_frame()
+                with timeline.span('clock.tick'):
+                    self.clock.tick(FPS)
+            
+            if self.state != last_state:
+                last_state = self.state
+                self.needs_redraw = True
+            self.cpu_meter.sample(frame_state)
         
+        self._shutdown()
+    
+    def _shutdown(self):
+        """Eklentileri (ters sırayla) ve istatistikleri kapatıp pygame'i kapatır"""
+        self._call_hooks('close')
+        self.capture = None
+        if self.lifetime is not None:
+            self.lifetime.close()
         pygame.quit()
\ No newline at end of file
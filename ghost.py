@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Hayalet Yarışı
+Önceki koşuların (kendi rekorların, ilk 10, arkadaşlar) kuşlarını canlı kuşla
+birlikte uçurur. Tüm hayalet yörüngeleri art arda duran NumPy dizilerinde
+tutulur; her karede görünür hayaletler vektörel olarak bulunur ve önceden
+hazırlanmış yarı saydam kuş yüzeyi tek bir Surface.blits çağrısıyla çizilir.
+
+Yörünge: hayaletin her karedeki kuş y konumu (indeks = simülasyon karesi).
+Hayaletler aynı seed ile (GHOST_SEED) oynanan koşulardan kaydedilir ki
+herkes aynı borulardan geçsin.
+"""
+
+import argparse
+import os
+import threading
+import time
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pygame
+
+from autopilot import reference_flap
+from config import *
+from game import Bird, GameSimulation
+
+
+class GhostLayer:
+    """Hayalet kuş katmanı - yörüngeler tek dizide, çizim tek blits çağrısında"""
+
+    def __init__(self):
+        """Boş katman oluşturur"""
+        self.ys = np.empty(0, dtype=np.int16)  # Tüm yörüngeler art arda
+        self.starts = np.empty(0, dtype=np.int64)  # Her hayaletin ilk elemanı
+        self.lengths = np.empty(0, dtype=np.int64)  # Her hayaletin kare sayısı
+        self.labels: List[str] = []
+        self.x = BIRD_START_X
+        self._image: Optional[pygame.Surface] = None
+        self._writer: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        """Hayalet sayısı"""
+        return len(self.lengths)
+
+    def add(self, trajectory: Iterable[int], label: str = ''):
+        """Bir koşunun yörüngesini ekler"""
+        self.add_many([np.asarray(trajectory, dtype=np.int16)], [label])
+
+    def add_many(self, trajectories: List[np.ndarray], labels: List[str]):
+        """Birden çok yörüngeyi tek seferde ekler (diziler bir kez yeniden kurulur)"""
+        lengths = np.array([len(trajectory) for trajectory in trajectories], dtype=np.int64)
+        starts = len(self.ys) + np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        self.ys = np.concatenate([self.ys] + [np.asarray(t, dtype=np.int16)
+                                              for t in trajectories])
+        self.starts = np.concatenate((self.starts, starts.astype(np.int64)))
+        self.lengths = np.concatenate((self.lengths, lengths))
+        self.labels.extend(labels)
+
+    def trim(self, max_count: int = GHOST_MAX_COUNT):
+        """En uzun yaşayan max_count hayaleti tutar"""
+        if len(self) <= max_count:
+            return
+        keep = np.sort(np.argsort(-self.lengths, kind='stable')[:max_count])
+        trajectories = [self.trajectory(index) for index in keep]
+        labels = [self.labels[index] for index in keep]
+        self.__init__()
+        self.add_many(trajectories, labels)
+
+    def trajectory(self, index: int) -> np.ndarray:
+        """Bir hayaletin yörüngesini (görünüm olarak) döndürür"""
+        start = self.starts[index]
+        return self.ys[start:start + self.lengths[index]]
+
+    def visible(self, frame: int) -> np.ndarray:
+        """Karede hâlâ uçan ve ekranda görünen hayaletlerin y değerleri"""
+        alive = self.lengths > frame
+        ys = self.ys[self.starts[alive] + frame]
+        return ys[(ys > -BIRD_HEIGHT) & (ys < SCREEN_HEIGHT)]
+
+    @property
+    def image(self) -> pygame.Surface:
+        """Yarı saydamlığı piksellere işlenmiş hayalet kuş yüzeyi"""
+        if self._image is None:
+            images = Bird._image_cache or Bird(BIRD_START_X, BIRD_START_Y).images
+            if pygame.display.get_surface() is not None:
+                image = images[0].convert_alpha()
+            else:
+                image = pygame.Surface(images[0].get_size(), pygame.SRCALPHA)
+                image.blit(images[0], (0, 0))
+            image.fill((255, 255, 255, GHOST_ALPHA), special_flags=pygame.BLEND_RGBA_MULT)
+            self._image = image
+        return self._image
+
+    def draw(self, screen: pygame.Surface, frame: int):
+        """Karedeki tüm görünür hayaletleri tek blits çağrısıyla çizer"""
+        if not len(self):
+            return
+        image = self.image
+        x = self.x
+        screen.blits([(image, (x, y)) for y in self.visible(frame).tolist()], False)
+
+    def save(self, path: str = GHOSTS_FILE):
+        """Katmanı sıkıştırılmış .npz olarak kaydeder"""
+        try:
+            with open(path, 'wb') as f:
+                np.savez_compressed(f, ys=self.ys, starts=self.starts, lengths=self.lengths,
+                                    labels=np.array(self.labels, dtype=str))
+        except IOError:
+            pass
+
+    def save_in_background(self, path: str = GHOSTS_FILE):
+        """Kaydı bir iş parçacığına bırakır (oyun bitişi karesi sıkıştırmayı beklemez)
+
+        Diziler yerinde değiştirilmez (add_many/trim yenilerini kurar), bu yüzden
+        iş parçacığı o anki dizileri kopyalamadan yazabilir.
+        """
+        self.join()
+        snapshot = GhostLayer()
+        snapshot.ys, snapshot.starts, snapshot.lengths = self.ys, self.starts, self.lengths
+        snapshot.labels = list(self.labels)
+        self._writer = threading.Thread(target=snapshot.save, args=(path,),
+                                        name='ghost-save', daemon=True)
+        self._writer.start()
+
+    def join(self):
+        """Süren kaydı bekler"""
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+
+    @classmethod
+    def load(cls, path: str = GHOSTS_FILE) -> 'GhostLayer':
+        """Kayıtlı hayaletleri yükler; dosya yoksa boş katman döndürür"""
+        layer = cls()
+        try:
+            if os.path.exists(path):
+                with np.load(path) as data:
+                    layer.ys = data['ys'].astype(np.int16)
+                    layer.starts = data['starts'].astype(np.int64)
+                    layer.lengths = data['lengths'].astype(np.int64)
+                    layer.labels = [str(label) for label in data['labels']]
+        except (OSError, ValueError, KeyError):
+            pass
+        return layer
+
+
+def record_bot_runs(count: int, seed: int = GHOST_SEED) -> GhostLayer:
+    """Kusurlu bir botla aynı parkurda count koşu kaydeder (kıyaslama verisi)"""
+    noise = np.random.default_rng(seed)
+    layer = GhostLayer()
+    simulation = GameSimulation(seed)
+    trajectories = []
+    for run in range(count):
+        simulation.reset(seed)
+        margin = int(noise.integers(4, 30))
+        trajectory = [int(simulation.bird.y)]
+        while simulation.state == GAME_STATES['PLAYING'] and simulation.frame < FPS * 60:
+            if reference_flap(simulation, margin):
+                simulation.flap()
+            simulation.step()
+            trajectory.append(int(simulation.bird.y))
+        trajectories.append(np.array(trajectory, dtype=np.int16))
+    layer.add_many(trajectories, [f'bot-{run}' for run in range(count)])
+    return layer
+
+
+def run_benchmark(ghosts: int, frames: int):
+    """Tek blits ile kuş başına blit döngüsünü karşılaştırır"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    layer = record_bot_runs(ghosts)
+    print(f"👻 {len(layer)} hayalet, toplam {len(layer.ys)} kare yörünge "
+          f"({layer.ys.nbytes / 1024:.0f} KB), en uzun {int(layer.lengths.max())} kare")
+
+    # En kötü durum: tüm hayaletlerin hâlâ uçtuğu ilk kareler döngülenir
+    window = max(1, int(layer.lengths.min()))
+
+    def measure(draw) -> float:
+        started = time.perf_counter()
+        for frame in range(frames):
+            draw(frame % window)
+        return (time.perf_counter() - started) / frames * 1000
+
+    # Eski yol: her hayalet ayrı bir Bird, her biri kendi Bird.draw blit'i
+    birds = [Bird(layer.x, 0) for _ in range(len(layer))]
+    for bird in birds:
+        bird.current_image = layer.image
+
+    def per_bird(frame: int):
+        for index, bird in enumerate(birds):
+            bird.y = layer.ys[layer.starts[index] + frame]
+            bird.draw(screen)
+
+    batched = measure(lambda frame: layer.draw(screen, frame))
+    single = measure(per_bird)
+    budget = 1000 / FPS
+    visible = np.mean([len(layer.visible(frame)) for frame in range(window)])
+    print(f"   Görünür hayalet (ölçülen karelerde ortalama): {visible:.0f}")
+    print(f"   Tek blits: {batched:.3f} ms/kare | kuş başına blit: {single:.3f} ms/kare "
+          f"({single / batched:.1f}x)")
+    print(f"   {FPS} FPS bütçesi {budget:.1f} ms: "
+          f"{'✅ sığıyor' if batched < budget else '❌ aşılıyor'}")
+
+
+def main():
+    """Komut satırı girişi - hayalet çizim kıyaslaması"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Hayalet Katmanı Kıyaslaması')
+    parser.add_argument('--ghosts', type=int, default=500,
+                        help='Hayalet sayısı')
+    parser.add_argument('--frames', type=int, default=FPS * 10,
+                        help='Ölçülecek kare sayısı')
+    args = parser.parse_args()
+    run_benchmark(args.ghosts, args.frames)
+
+
+if __name__ == '__main__':
+    main()
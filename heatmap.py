@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Ölüm Isı Haritası
+Oyuncuların nerede öldüğünü koşu sonuçlarından toplar. Her ölüm için
+neden (ground, ceiling, pipe, obstacle; GameSimulation.step'teki ayrım),
+ekrandaki temas noktası, borunun sırası (ölümde geçilmekte olan boru = skor)
+ve kuşun o borunun boşluk merkezine göre konumu (-1 üst kenar, +1 alt kenar)
+kaydedilir.
+
+Kayıtlar sabit boyutlu NumPy 2B histogramlarda (neden başına) birikir:
+ekran ızgarası (HEATMAP_SCREEN_BINS) ve boru sırası x boşluk konumu
+(HEATMAP_PIPE_BINS x HEATMAP_GAP_BINS). Kayıtlar önceden ayrılmış sabit
+boyutlu bir tamponda toplanıp bincount ile histograma eklenir; akış ne kadar
+uzun olursa olsun bellek sabittir. Histogramlar toplanarak birleşir; farklı
+süreçlerin ve dosyaların (.npz) sonuçları aynı ızgaradaysa birleştirilebilir.
+
+İsteğe bağlı katman (HeatmapOverlay) ekran histogramını oyunda arkaplanın
+üzerine yarı saydam çizer (main.py --heatmap).
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from config import *
+
+CAUSES = ('ground', 'ceiling', 'pipe', 'obstacle')
+
+# Tek bir ölüm kaydı: neden sırası, temas noktası, boru sırası, boşluğa göre konum
+RECORD_DTYPE = np.dtype([
+    ('cause', np.uint8),
+    ('x', np.float32),
+    ('y', np.float32),
+    ('pipe', np.int32),
+    ('gap_offset', np.float32),
+])
+
+
+def death_record(simulation) -> Optional[tuple]:
+    """Bitmiş bir simülasyondan ölüm kaydı (cause, x, y, pipe, gap_offset); oyun sürüyorsa None"""
+    cause = simulation.death_cause
+    if cause is None:
+        return None
+    bird_rect = simulation.bird.get_rect()
+
+    # Temas noktası: çarpılan nesneyle kesişimin merkezi, zemin/tavanda kuşun alt/üst ortası
+    if cause == 'ground':
+        x, y = bird_rect.centerx, SCREEN_HEIGHT - GROUND_HEIGHT
+    elif cause == 'ceiling':
+        x, y = bird_rect.centerx, 0
+    else:
+        if cause == 'pipe':
+            rects = [rect for pipe in simulation.pipe_manager.pipes
+                     for rect in (pipe.top_rect, pipe.bottom_rect)]
+        else:
+            rects = [obstacle.rect for obstacle in simulation.obstacle_manager.obstacles]
+        hit = next((rect for rect in rects if bird_rect.colliderect(rect)), None)
+        x, y = bird_rect.clip(hit).center if hit is not None else bird_rect.center
+
+    # Geçilmekte olan boru: skor kadar boru geçilmiştir
+    pipe = simulation.score
+    half_gap = PIPE_GAP / 2
+    gap_center = simulation.layout.gap(pipe) + half_gap
+    gap_offset = (bird_rect.centery - gap_center) / half_gap
+    return CAUSES.index(cause), float(x), float(y), pipe, gap_offset
+
+
+class DeathHeatmap:
+    """Neden başına sabit boyutlu ölüm histogramları (birleştirilebilir)"""
+
+    def __init__(self, screen_bins: Tuple[int, int] = HEATMAP_SCREEN_BINS,
+                 pipe_bins: int = HEATMAP_PIPE_BINS, gap_bins: int = HEATMAP_GAP_BINS,
+                 gap_range: float = HEATMAP_GAP_RANGE, batch: int = HEATMAP_BATCH):
+        """Histogramları ve kayıt tamponunu bir kez ayırır"""
+        self.screen_bins = tuple(screen_bins)
+        self.pipe_bins = pipe_bins
+        self.gap_bins = gap_bins
+        self.gap_range = gap_range
+        columns, rows = self.screen_bins
+        # (neden, satır, sütun): ekran ızgarası; (neden, boru, boşluk konumu)
+        self.screen = np.zeros((len(CAUSES), rows, columns), dtype=np.int64)
+        self.gap = np.zeros((len(CAUSES), pipe_bins, gap_bins), dtype=np.int64)
+        self.deaths = 0
+        self._batch = np.zeros(batch, dtype=RECORD_DTYPE)
+        self._pending = 0
+
+    def add(self, record: tuple):
+        """Bir kaydı tampona ekler; tampon dolunca histogramlara aktarır"""
+        self._batch[self._pending] = record
+        self._pending += 1
+        if self._pending == len(self._batch):
+            self.flush()
+
+    def ingest(self, records: Iterable[tuple]) -> int:
+        """Kayıt akışını sabit bellekle işler; işlenen kayıt sayısını döndürür"""
+        count = 0
+        for record in records:
+            self.add(record)
+            count += 1
+        self.flush()
+        return count
+
+    def flush(self):
+        """Tampondaki kayıtları vektörel olarak histogramlara ekler"""
+        if not self._pending:
+            return
+        batch = self._batch[:self._pending]
+        cause = batch['cause'].astype(np.int64)
+        columns, rows = self.screen_bins
+
+        column = np.clip((batch['x'] * (columns / SCREEN_WIDTH)).astype(np.int64), 0, columns - 1)
+        row = np.clip((batch['y'] * (rows / SCREEN_HEIGHT)).astype(np.int64), 0, rows - 1)
+        flat = (cause * rows + row) * columns + column
+        self.screen.reshape(-1)[:] += np.bincount(flat, minlength=self.screen.size)
+
+        # Son boru sütunu taşanları, kenar boşluk sütunları aralık dışını toplar
+        pipe = np.clip(batch['pipe'], 0, self.pipe_bins - 1).astype(np.int64)
+        scaled = (batch['gap_offset'] + self.gap_range) * (self.gap_bins / (2 * self.gap_range))
+        offset = np.clip(np.floor(scaled), 0, self.gap_bins - 1).astype(np.int64)
+        flat = (cause * self.pipe_bins + pipe) * self.gap_bins + offset
+        self.gap.reshape(-1)[:] += np.bincount(flat, minlength=self.gap.size)
+
+        self.deaths += self._pending
+        self._pending = 0
+
+    def _layout(self) -> tuple:
+        """Izgara ayarları (birleştirmede uyum kontrolü için)"""
+        return self.screen_bins, self.pipe_bins, self.gap_bins, float(self.gap_range)
+
+    def merge(self, other: 'DeathHeatmap'):
+        """Aynı ızgaradaki başka bir haritayı bu haritaya ekler"""
+        if self._layout() != other._layout():
+            raise ValueError("Isı haritaları farklı ızgaralarda; birleştirilemez")
+        self.flush()
+        other.flush()
+        self.screen += other.screen
+        self.gap += other.gap
+        self.deaths += other.deaths
+
+    def counts(self) -> dict:
+        """Neden başına ölüm sayısı"""
+        self.flush()
+        return {cause: int(self.screen[index].sum()) for index, cause in enumerate(CAUSES)}
+
+    def save(self, path: str):
+        """Histogramları .npz olarak kaydeder (geçici dosya + os.replace)"""
+        self.flush()
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'wb') as f:
+            np.savez_compressed(f, screen=self.screen, gap=self.gap,
+                                deaths=np.int64(self.deaths), gap_range=np.float64(self.gap_range))
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'DeathHeatmap':
+        """Kaydedilmiş histogramları yükler (ızgara boyutları dosyadan okunur)"""
+        with np.load(path) as data:
+            screen, gap = data['screen'], data['gap']
+            heatmap = cls((screen.shape[2], screen.shape[1]), gap.shape[1], gap.shape[2],
+                          float(data['gap_range']))
+            heatmap.screen[...] = screen
+            heatmap.gap[...] = gap
+            heatmap.deaths = int(data['deaths'])
+        return heatmap
+
+    def report(self) -> str:
+        """Neden dağılımı ve en çok ölünen boru/boşluk konumu özeti"""
+        counts = self.counts()
+        total = max(1, self.deaths)
+        parts = ', '.join(f"{cause} %{count / total * 100:.1f}" for cause, count in counts.items())
+        lines = [f"🔥 {self.deaths} ölüm: {parts}"]
+        gap = self.gap.sum(axis=0)
+        if gap.any():
+            pipe, offset = np.unravel_index(np.argmax(gap), gap.shape)
+            width = 2 * self.gap_range / self.gap_bins
+            low = -self.gap_range + offset * width
+            lines.append(f"   En sık: {pipe}. boru, boşluk merkezine göre "
+                         f"[{low:+.2f}, {low + width:+.2f}) yarım boşluk ({gap[pipe, offset]} ölüm)")
+        return '\n'.join(lines)
+
+
+class HeatmapOverlay:
+    """Ekran histogramını arkaplanın üzerine yarı saydam çizen katman"""
+
+    def __init__(self, heatmap: DeathHeatmap, cause: Optional[str] = None):
+        """Katman yüzeyini ilk çizimde hazırlar (cause verilirse yalnızca o neden)"""
+        self.heatmap = heatmap
+        self.cause = cause
+        self._surface: Optional[pygame.Surface] = None
+
+    def invalidate(self):
+        """Harita değişti; yüzey sonraki çizimde yeniden hazırlanır"""
+        self._surface = None
+
+    def _build(self) -> pygame.Surface:
+        """Yoğunluğu (log ölçekli) kırmızı tonlu, alfa kanallı bir yüzeye çevirir"""
+        screen = self.heatmap.screen
+        counts = screen[CAUSES.index(self.cause)] if self.cause else screen.sum(axis=0)
+        density = np.log1p(counts.T.astype(np.float64))  # surfarray düzeni: (x, y)
+        if density.max() > 0:
+            density /= density.max()
+        small = pygame.Surface(density.shape, pygame.SRCALPHA, 32)
+        rgb = pygame.surfarray.pixels3d(small)
+        rgb[..., 0] = 255
+        rgb[..., 1] = (200 * (1 - density)).astype(np.uint8)
+        rgb[..., 2] = 0
+        del rgb
+        alpha = pygame.surfarray.pixels_alpha(small)
+        alpha[...] = (HEATMAP_OVERLAY_ALPHA * np.sqrt(density)).astype(np.uint8)
+        del alpha
+        return pygame.transform.smoothscale(small, (SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def draw(self, surface: pygame.Surface):
+        """Katmanı çizer"""
+        if self._surface is None:
+            self._surface = self._build()
+        surface.blit(self._surface, (0, 0))
+
+
+def records_from_log(path: str) -> Iterator[tuple]:
+    """Ölüm kaydı dosyasını (JSON satırları) satır satır okur"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield (CAUSES.index(record['cause']), record['x'], record['y'],
+                       record['pipe'], record['gap_offset'])
+
+
+def records_from_runs(path: str, max_frames: int) -> Iterator[tuple]:
+    """Koşu dosyasındaki (fastforward.py --save) her koşuyu kaba adımla oynatıp ölümü verir"""
+    from collision import replay
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                run = json.loads(line)
+                simulation, _ = replay(run['seed'], run['flaps'], max_frames, COLLISION_MAX_STEP)
+                record = death_record(simulation)
+                if record is not None:
+                    yield record
+
+
+def bot_records(games: int, seed: int, max_frames: int) -> Iterator[tuple]:
+    """Referans botla oynanan oyunların ölümleri"""
+    from collision import record_runs, replay
+    for index in range(games):
+        run_seed, flaps = record_runs(1, seed + index, max_frames)[0]
+        simulation, _ = replay(run_seed, flaps, max_frames, COLLISION_MAX_STEP)
+        record = death_record(simulation)
+        if record is not None:
+            yield record
+
+
+def _bot_heatmap(task: Tuple[int, int, int]) -> DeathHeatmap:
+    """Havuz görevi: bir seed bloğunun haritası (ana süreçte birleştirilir)"""
+    games, seed, max_frames = task
+    heatmap = DeathHeatmap()
+    heatmap.ingest(bot_records(games, seed, max_frames))
+    return heatmap
+
+
+def main():
+    """Komut satırı girişi - ölümleri topla, dosyaları birleştir, özetle"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Ölüm Isı Haritası')
+    parser.add_argument('inputs', nargs='*',
+                        help='Girdiler: .npz haritalar, koşu dosyaları (seed, flaps) '
+                             'ya da ölüm kayıtları (cause, x, y, pipe, gap_offset)')
+    parser.add_argument('--games', type=int, default=0,
+                        help='Referans botla oynanıp eklenecek oyun sayısı')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='Bot oyunlarının ilk seed değeri')
+    parser.add_argument('--frames', type=int, default=FPS * 60 * 5,
+                        help='Oyun başına en fazla kare')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Bot oyunları için işçi süreç sayısı')
+    parser.add_argument('--out', default=HEATMAP_FILE,
+                        help='Birleştirilmiş haritanın kaydedileceği .npz')
+    parser.add_argument('--image', default=None,
+                        help='Arkaplan üzerine çizilmiş haritayı PNG olarak kaydet')
+    args = parser.parse_args()
+
+    heatmap = DeathHeatmap()
+    started = time.perf_counter()
+    for path in args.inputs:
+        if path.endswith('.npz'):
+            heatmap.merge(DeathHeatmap.load(path))
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            first = next((line for line in f if line.strip()), '{}')
+        if 'flaps' in json.loads(first):
+            heatmap.ingest(records_from_runs(path, args.frames))
+        else:
+            heatmap.ingest(records_from_log(path))
+
+    if args.games:
+        workers = max(1, args.workers)
+        block = -(-args.games // workers)
+        tasks = [(min(block, args.games - start), args.seed + start, args.frames)
+                 for start in range(0, args.games, block)]
+        if workers == 1:
+            partials = map(_bot_heatmap, tasks)
+        else:
+            pool = multiprocessing.Pool(workers)
+            partials = pool.imap_unordered(_bot_heatmap, tasks)
+        for partial in partials:
+            heatmap.merge(partial)
+        if workers > 1:
+            pool.close()
+            pool.join()
+
+    elapsed = time.perf_counter() - started
+    print(heatmap.report())
+    print(f"   {elapsed:.2f} s | histogram belleği "
+          f"{(heatmap.screen.nbytes + heatmap.gap.nbytes) / 1024:.0f} KB (sabit)")
+    heatmap.save(args.out)
+    print(f"💾 Harita kaydedildi: {args.out}")
+
+    if args.image:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        from game import Background
+        pygame.init()
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        canvas = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        Background().draw(canvas)
+        HeatmapOverlay(heatmap).draw(canvas)
+        pygame.image.save(canvas, args.image)
+        print(f"🖼️  Görsel kaydedildi: {args.image}")
+
+
+if __name__ == '__main__':
+    main()
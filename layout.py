@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Çözülebilir Parkur Üreteci
+Boru boşluklarını ve engelleri önceden, bir ileri bakış tamponuna üretir.
+PipeManager ve ObstacleManager yeni nesneyi rastgele seçmek yerine tampondan
+sıradakini alır.
+
+Erişilebilirlik tablosu fizik sabitlerinden (BIRD_GRAVITY, BIRD_FLAP_STRENGTH,
+PIPE_SPAWN_DISTANCE, ...) bir kez hesaplanır: kuşun olası (y, hız) durumları
+LAYOUT_Y_QUANTUM ızgarasında, her hız için bir bit kümesi (Python int) olarak
+tutulur ve kareler bit kaydırmalarıyla ilerletilir. Her boşluk çifti için
+"önceki sütundan sağ çıkan bir durumdan sonraki sütundan da sağ çıkılabilir
+mi" sonucu tabloya yazılır. Üretimde çekilen boşluk tabloda ulaşılamazsa en
+yakın ulaşılabilir boşluğa onarılır; çıkmaz boşluklar (hiçbir boşluğa
+ulaşamayan) baştan elenir. Böylece üretim, boru başına birkaç tablo
+okumasından ibarettir.
+
+Engeller iki borunun ortasına yerleşir; iki boşluğu birleştiren dikey
+koridoru kesen engel koridorun üstüne/altına kaydırılır, sığmıyorsa atılır.
+Tablo ardışık boru çiftlerini kontrol eder; tüm diziyi engellerle birlikte
+birebir doğrulamak için verify() kullanılır (komut satırı: --verify).
+
+Tablo ilk boru üretilirken kurulur (yalnızca GameSimulation oluşturmak onu
+kurmaz) ve diskte
+fizik sabitlerinin hash'iyle anahtarlanarak saklanır (trajectory.py gibi);
+sonraki süreçler onu hesaplamak yerine okur. Tampon yalnızca ileriye doğru
+büyümez: tüketilen borular LAYOUT_LOOKAHEAD kadar geride kalınca atılır.
+Engeller parkurda her zaman üretilir (RNG dizisi değişmesin diye); oyuna
+yalnızca LAYOUT_OBSTACLES açıkken konur.
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import math
+import os
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from config import *
+from collision import rect_round
+
+LAYOUT_VERSION = 1
+
+# Engelin tavana ve zemine en az uzaklığı
+OBSTACLE_MIN_Y = 50
+
+
+def spawn_interval() -> int:
+    """İki boru arasındaki adım sayısı (PipeManager.update zamanlayıcısı)"""
+    return math.ceil(PIPE_SPAWN_DISTANCE / PIPE_SPEED)
+
+
+def overlap_steps(width: int, speed: float) -> List[int]:
+    """SCREEN_WIDTH'te doğan nesnenin kuşla yatayda çakıştığı adımlar (doğuştan itibaren)"""
+    steps = []
+    j = 0
+    while True:
+        j += 1
+        x = rect_round(SCREEN_WIDTH - speed * j)
+        if x + width <= BIRD_START_X:
+            return steps
+        if x < BIRD_START_X + BIRD_WIDTH:
+            steps.append(j)
+
+
+class Reachability:
+    """Bit kümesi ızgarasında kuş durumları ve boşluk çiftleri erişilebilirlik tablosu"""
+
+    def __init__(self, table: Optional[Tuple[List[bytes], List[List[int]]]] = None):
+        """Tabloyu fizik sabitlerinden hesaplar (table verilirse diskten okunmuş tablo kullanılır)"""
+        started = time.perf_counter()
+        q = LAYOUT_Y_QUANTUM
+        self.quantum = q
+        self.base = math.ceil(1 / q)  # İndeks 0: y = -1 (tavanın hemen üstü)
+        self.size = self.base + int(SCREEN_HEIGHT / q) + 1
+
+        # Hız satırları: hız ızgara biriminde (aynı zamanda karedeki y kayması)
+        self.v_max = round(BIRD_MAX_FALL_SPEED / q)
+        self.v_flap = min(round((BIRD_FLAP_STRENGTH + BIRD_GRAVITY) / q), self.v_max)
+        self.v_min = min(self.v_flap, 0)
+        gravity = round(BIRD_GRAVITY / q)
+        self.rows = self.v_max - self.v_min + 1
+        self.velocities = list(range(self.v_min, self.v_max + 1))
+        self.next_row = [min(v + gravity, self.v_max) - self.v_min for v in self.velocities]
+        self.flap_row = self.v_flap - self.v_min
+
+        self._masks: Dict[Tuple[int, ...], int] = {}
+        self.ground_limit = SCREEN_HEIGHT - GROUND_HEIGHT - BIRD_HEIGHT
+        self.ground = self.mask(0, self.ground_limit)
+
+        self.interval = spawn_interval()
+        self.pipe_steps = overlap_steps(PIPE_WIDTH, PIPE_SPEED)
+        self.obstacle_steps = overlap_steps(OBSTACLE_WIDTH, OBSTACLE_SPEED)
+        self.obstacle_offset = self.interval // 2
+
+        self.low = PIPE_MIN_HEIGHT
+        self.high = PIPE_MAX_HEIGHT
+        self.allowed, self.nearest = table if table is not None else self._build_table()
+        self.build_seconds = time.perf_counter() - started
+
+    # --- Bit kümesi yardımcıları ---
+
+    def mask(self, low: int, high: int, blocked: Tuple[int, int] = (1, 0)) -> int:
+        """rect.y = int(y) değeri [low, high] içinde (ve blocked dışında) olan y indeksleri"""
+        key = (low, high) + blocked
+        bits = self._masks.get(key)
+        if bits is None:
+            bits = 0
+            for index in range(self.size):
+                rect_y = int((index - self.base) * self.quantum)
+                if low <= rect_y <= high and not blocked[0] <= rect_y <= blocked[1]:
+                    bits |= 1 << index
+            self._masks[key] = bits
+        return bits
+
+    def band(self, gap_y: int) -> int:
+        """Boru sütunu içinde izinli y indeksleri (zemin sınırı dahil)"""
+        return self.mask(max(0, gap_y), min(self.ground_limit, gap_y + PIPE_GAP - BIRD_HEIGHT))
+
+    def obstacle_band(self, obstacle_y: int) -> int:
+        """Engel sütunu içinde izinli y indeksleri"""
+        return self.mask(0, self.ground_limit,
+                         (obstacle_y - BIRD_HEIGHT + 1, obstacle_y + OBSTACLE_HEIGHT - 1))
+
+    @staticmethod
+    def _shift(bits: int, amount: int) -> int:
+        """Bit kümesini y ekseninde kaydırır"""
+        return bits << amount if amount >= 0 else bits >> -amount
+
+    def forward(self, states: List[int], allowed: int) -> List[int]:
+        """Tüm durumları bir kare ilerletir (flap ve flap yok), izinli olanları tutar"""
+        shift = self._shift
+        velocities = self.velocities
+        result = [0] * self.rows
+        union = 0
+        for row, bits in enumerate(states):
+            if bits:
+                union |= bits
+                target = self.next_row[row]
+                result[target] |= shift(bits, velocities[target])
+        if union:
+            target = self.flap_row
+            result[target] |= shift(union, velocities[target])
+        return [bits & allowed for bits in result]
+
+    def backward(self, good: List[int], allowed: int) -> List[int]:
+        """Bir kare sonra 'good' kümesine ulaşabilen durumlar (izinli olanlar)"""
+        shift = self._shift
+        velocities = self.velocities
+        flap_target = self.flap_row
+        via_flap = shift(good[flap_target], -velocities[flap_target])
+        result = []
+        for row in range(self.rows):
+            target = self.next_row[row]
+            result.append((shift(good[target], -velocities[target]) | via_flap) & allowed)
+        return result
+
+    def pack(self, states: List[int]) -> int:
+        """Satırları tek bir tamsayıda birleştirir (küme kesişimi tek AND olur)"""
+        packed = 0
+        for row, bits in enumerate(states):
+            packed |= bits << (row * self.size)
+        return packed
+
+    # --- Tablo ---
+
+    def _build_table(self) -> Tuple[List[bytes], List[List[int]]]:
+        """allowed[p][g]: p boşluğundan g boşluğuna geçilebilir mi; nearest[p][g]: onarım"""
+        gaps = range(self.low, self.high + 1)
+        first, last = self.pipe_steps[0], self.pipe_steps[-1]
+        entry = self.interval + first - 1  # Sonraki sütuna girmeden hemen önceki adım
+
+        # Önceki sütundan sağ çıkan ve sonraki sütunun girişine varan durumlar
+        arrivals = []
+        for gap_y in gaps:
+            states = [self.ground] * self.rows
+            band = self.band(gap_y)
+            for step in range(first, entry + 1):
+                states = self.forward(states, band if step <= last else self.ground)
+            arrivals.append(self.pack(states))
+
+        # Sütun girişinden sütunu sağ geçebilen durumlar (geriye doğru)
+        survivors = []
+        for gap_y in gaps:
+            band = self.band(gap_y)
+            good = [band] * self.rows
+            for _ in range(last - first):
+                good = self.backward(good, band)
+            survivors.append(self.pack(self.backward(good, self.ground)))
+
+        allowed = [bytearray(arrival & survivor != 0 for survivor in survivors)
+                   for arrival in arrivals]
+
+        # Çıkmaz boşlukları (hiçbir yere geçilemeyen) ele; eleme yeni çıkmazlar doğurabilir
+        alive = [True] * len(allowed)
+        changed = True
+        while changed:
+            changed = False
+            for index, row in enumerate(allowed):
+                if alive[index] and not any(row[target] for target in range(len(row))
+                                            if alive[target]):
+                    alive[index] = False
+                    changed = True
+        for row in allowed:
+            for index, ok in enumerate(alive):
+                if not ok:
+                    row[index] = 0
+        if not any(alive):
+            raise ValueError("Fizik sabitleriyle çözülebilir boru dizisi yok")
+
+        nearest = []
+        for index, row in enumerate(allowed):
+            targets = [target for target in range(len(row)) if row[target]]
+            if not alive[index] or not targets:
+                targets = [target for target in range(len(row)) if alive[target]]
+            nearest.append([self.low + self._closest(targets, target)
+                            for target in range(len(row))])
+        return [bytes(row) for row in allowed], nearest
+
+    @staticmethod
+    def _closest(targets: List[int], value: int) -> int:
+        """Sıralı listede value'ya en yakın eleman"""
+        position = bisect.bisect_left(targets, value)
+        if position == 0:
+            return targets[0]
+        if position == len(targets):
+            return targets[-1]
+        before, after = targets[position - 1], targets[position]
+        return before if value - before <= after - value else after
+
+    def reachable(self, previous: int, gap_y: int) -> bool:
+        """previous boşluğundan sonra gap_y boşluğuna geçilebilir mi"""
+        return bool(self.allowed[previous - self.low][gap_y - self.low])
+
+    def to_json(self) -> dict:
+        """Disk önbelleği için JSON uyumlu sözlük"""
+        return {'version': LAYOUT_VERSION, 'key': list(physics_key()),
+                'allowed': [row.hex() for row in self.allowed], 'nearest': self.nearest}
+
+    @classmethod
+    def from_json(cls, data: dict) -> Optional['Reachability']:
+        """to_json çıktısından tablo (sürüm/sabitler uyuşmazsa None)"""
+        if data.get('version') != LAYOUT_VERSION or tuple(data.get('key', ())) != physics_key():
+            return None
+        allowed = [bytes.fromhex(row) for row in data['allowed']]
+        nearest = [list(row) for row in data['nearest']]
+        span = PIPE_MAX_HEIGHT - PIPE_MIN_HEIGHT + 1
+        if len(allowed) != span or len(nearest) != span:
+            return None
+        return cls((allowed, nearest))
+
+    # --- Birebir doğrulama ---
+
+    def verify(self, gaps: List[int], obstacles: List[Optional[int]]) -> int:
+        """Diziyi oyunun başından adım adım doğrular; geçilemeyen ilk borunun indeksi ya da -1"""
+        start = round(BIRD_START_Y / self.quantum) + self.base
+        states = [0] * self.rows
+        states[-self.v_min] = 1 << start  # Hız 0
+        interval = self.interval
+        last_step = interval * len(gaps) + self.pipe_steps[-1]
+        for step in range(1, last_step + 1):
+            allowed = self.ground
+            for offset in self.pipe_steps:
+                spawn = step - offset
+                if spawn > 0 and spawn % interval == 0 and spawn // interval <= len(gaps):
+                    allowed &= self.band(gaps[spawn // interval - 1])
+            for offset in self.obstacle_steps:
+                spawn = step - offset - self.obstacle_offset
+                if spawn > 0 and spawn % interval == 0:
+                    index = spawn // interval - 1
+                    if index < len(obstacles) and obstacles[index] is not None:
+                        allowed &= self.obstacle_band(obstacles[index])
+            states = self.forward(states, allowed)
+            if not any(states):
+                return max(0, -((self.pipe_steps[-1] - step) // interval) - 1)
+        return -1
+
+
+def physics_key() -> tuple:
+    """Tabloyu belirleyen fizik sabitleri"""
+    return (LAYOUT_Y_QUANTUM, SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_HEIGHT,
+            BIRD_START_X, BIRD_START_Y, BIRD_WIDTH, BIRD_HEIGHT,
+            BIRD_GRAVITY, BIRD_FLAP_STRENGTH, BIRD_MAX_FALL_SPEED,
+            PIPE_WIDTH, PIPE_GAP, PIPE_SPEED, PIPE_SPAWN_DISTANCE, PIPE_MIN_HEIGHT, PIPE_MAX_HEIGHT,
+            OBSTACLE_WIDTH, OBSTACLE_HEIGHT, OBSTACLE_SPEED)
+
+
+def config_hash(key: tuple) -> str:
+    """Sabitlerin kısa hash'i (önbellek dosya adı)"""
+    return hashlib.sha256(f"{LAYOUT_VERSION}:{key!r}".encode('utf-8')).hexdigest()[:16]
+
+
+def cache_path(key: tuple, directory: Optional[str] = None) -> str:
+    """Sabitler için önbellek dosyasının yolu"""
+    return os.path.join(directory or LAYOUT_CACHE_DIR, f"reachability-{config_hash(key)}.json")
+
+
+def _load(path: str) -> Optional[Reachability]:
+    """Önbellek dosyasını okur (yoksa veya bozuksa None)"""
+    try:
+        with open(path, 'r') as f:
+            return Reachability.from_json(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save(table: Reachability, path: str):
+    """Tabloyu atomik olarak kaydeder (paralel süreçler aynı dosyayı yazabilir)"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(table.to_json(), f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+_tables: Dict[tuple, Reachability] = {}
+
+
+def reachability() -> Reachability:
+    """Güncel fizik sabitleri için tablo (bellekte, yoksa diskte, yoksa hesaplanır)"""
+    key = physics_key()
+    table = _tables.get(key)
+    if table is None:
+        path = cache_path(key)
+        table = _load(path)
+        if table is None:
+            table = Reachability()
+            _save(table, path)
+        _tables[key] = table
+    return table
+
+
+class LayoutGenerator:
+    """Seed'den türeyen çözülebilir boru/engel dizisi - ileri bakış tamponuyla"""
+
+    def __init__(self, seed: int, lookahead: int = LAYOUT_LOOKAHEAD):
+        """Üreteci oluşturur (aynı seed her zaman aynı parkuru verir)"""
+        self.seed = seed
+        self.lookahead = max(1, lookahead)
+        self.obstacle_offset = spawn_interval() // 2  # Borudan sonraki engelin doğuş adımı
+        self._table: Optional[Reachability] = None
+        self._restart()
+
+    def _restart(self):
+        """Parkuru seed'in başına sarar (tampon ve sayaçlar sıfırlanır)"""
+        self.rng = random.Random(self.seed)
+        self.start = 0  # Tampondaki ilk borunun indeksi (öncekiler tüketilip atıldı)
+        self.gaps: List[int] = []
+        self.obstacles: List[Optional[int]] = []  # obstacles[i]: start+i. ve sonraki boru arası
+        self.repairs = 0  # Ulaşılamaz çekilip onarılan boşluk sayısı
+        self.moved_obstacles = 0  # Koridordan kaydırılan engel sayısı
+        self.dropped_obstacles = 0  # Yer bulunamadığı için atılan engel sayısı
+
+    @property
+    def table(self) -> Reachability:
+        """Erişilebilirlik tablosu (ilk üretimde kurulur ya da diskten okunur)"""
+        if self._table is None:
+            self._table = reachability()
+        return self._table
+
+    @classmethod
+    def from_rng(cls, rng: random.Random) -> 'LayoutGenerator':
+        """Oyun RNG'sinden parkur seed'i çekerek üreteç oluşturur (GameSimulation ile aynı)"""
+        return cls(rng.getrandbits(32))
+
+    def gap(self, index: int) -> int:
+        """index. borunun boşluk y değeri (tampon gerekirse doldurulur)"""
+        position = self._position(index)
+        if position >= len(self.gaps):
+            self.extend(position + 1 - len(self.gaps) + self.lookahead)
+        return self.gaps[position]
+
+    def obstacle(self, index: int) -> Optional[int]:
+        """index. ve sonraki boru arasındaki engelin y değeri (engel yoksa None)"""
+        position = self._position(index)
+        if position >= len(self.obstacles):
+            self.extend(position + 2 - len(self.gaps) + self.lookahead)
+        return self.obstacles[position]
+
+    def _position(self, index: int) -> int:
+        """index'in tampondaki yeri; LAYOUT_LOOKAHEAD'den geride kalan borular atılır"""
+        if index < self.start:
+            self._restart()  # Atılmış boruya dönüldü (geri sarma): seed'den yeniden üret
+        drop = min(index - self.lookahead - self.start, len(self.gaps) - 1)  # Sonuncusu kalır
+        if drop >= self.lookahead:
+            del self.gaps[:drop]
+            del self.obstacles[:drop]
+            self.start += drop
+        return index - self.start
+
+    def extend(self, count: int):
+        """Tampona count boru (ve aralarındaki engelleri) ekler"""
+        rng_random = self.rng.random
+        low = PIPE_MIN_HEIGHT
+        span = PIPE_MAX_HEIGHT - low + 1
+        gaps = self.gaps
+        obstacles = self.obstacles
+        chance = OBSTACLE_SPAWN_CHANCE
+        obstacle_low = OBSTACLE_MIN_Y
+        obstacle_span = SCREEN_HEIGHT - GROUND_HEIGHT - OBSTACLE_HEIGHT - OBSTACLE_MIN_Y * 2 + 1
+        place_obstacle = self._place_obstacle
+
+        previous = gaps[-1] if gaps else None
+        nearest = self.table.nearest
+        for _ in range(count):
+            drawn = low + int(rng_random() * span)
+            if previous is None:
+                gap_y = drawn  # İlk boruya başlangıçtan her boşluk erişilebilir
+            else:
+                gap_y = nearest[previous - low][drawn - low]
+                if gap_y != drawn:
+                    self.repairs += 1
+                obstacle_y = None
+                if rng_random() < chance:
+                    obstacle_y = place_obstacle(previous, gap_y,
+                                                obstacle_low + int(rng_random() * obstacle_span))
+                obstacles.append(obstacle_y)
+            gaps.append(gap_y)
+            previous = gap_y
+
+    def _place_obstacle(self, previous: int, gap_y: int, obstacle_y: int) -> Optional[int]:
+        """Engeli iki boşluğu birleştiren koridorun dışına yerleştirir"""
+        top = min(previous, gap_y) - LAYOUT_OBSTACLE_CLEARANCE
+        bottom = max(previous, gap_y) + PIPE_GAP + LAYOUT_OBSTACLE_CLEARANCE
+        if obstacle_y + OBSTACLE_HEIGHT <= top or obstacle_y >= bottom:
+            return obstacle_y
+        highest = SCREEN_HEIGHT - GROUND_HEIGHT - OBSTACLE_HEIGHT - OBSTACLE_MIN_Y
+        candidates = []
+        if top - OBSTACLE_HEIGHT >= OBSTACLE_MIN_Y:
+            candidates.append(top - OBSTACLE_HEIGHT)
+        if bottom <= highest:
+            candidates.append(bottom)
+        if not candidates:
+            self.dropped_obstacles += 1
+            return None
+        self.moved_obstacles += 1
+        return min(candidates, key=lambda y: abs(y - obstacle_y))
+
+
+def run_benchmark(pipes: int, seed: int, verify: int):
+    """Üretim hızını ölçer ve isteğe bağlı olarak ilk 'verify' boruyu birebir doğrular"""
+    key = physics_key()
+    cached = os.path.exists(cache_path(key))
+    table = reachability()
+    gaps = table.high - table.low + 1
+    pairs = sum(sum(row) for row in table.allowed)
+    print(f"🧭 Erişilebilirlik tablosu {config_hash(key)} ({'diskten' if cached else 'hesaplandı'}): "
+          f"{gaps} boşluk, {pairs}/{gaps * gaps} çift geçilebilir "
+          f"(%{pairs / (gaps * gaps) * 100:.1f}) | {table.build_seconds:.2f} s")
+
+    generator = LayoutGenerator(seed)
+    started = time.perf_counter()
+    generator.extend(pipes)
+    elapsed = time.perf_counter() - started
+    placed = sum(obstacle is not None for obstacle in generator.obstacles)
+    print(f"   {pipes} boru {elapsed:.2f} s ({pipes / elapsed / 1e6:.2f} M boru/s) | "
+          f"onarılan boşluk {generator.repairs} (%{generator.repairs / pipes * 100:.1f}) | "
+          f"engel {placed}, kaydırılan {generator.moved_obstacles}, "
+          f"atılan {generator.dropped_obstacles}")
+
+    if verify:
+        count = min(verify, pipes)
+        started = time.perf_counter()
+        failed = table.verify(generator.gaps[:count], generator.obstacles[:count])
+        elapsed = time.perf_counter() - started
+        if failed < 0:
+            print(f"✅ İlk {count} boru engellerle birlikte çözülebilir ({elapsed:.1f} s)")
+        else:
+            print(f"❌ {failed}. boru geçilemiyor: boşluklar "
+                  f"{generator.gaps[max(0, failed - 2):failed + 1]}")
+        return failed < 0
+    return True
+
+
+def main():
+    """Komut satırı girişi - günlük parkur üretim kıyaslaması"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Çözülebilir Parkur Üreteci')
+    parser.add_argument('--pipes', type=int, default=1_000_000,
+                        help='Üretilecek boru sayısı')
+    parser.add_argument('--seed', type=int, default=int(time.strftime('%Y%m%d')),
+                        help='Parkur seed değeri (varsayılan: bugünün tarihi)')
+    parser.add_argument('--verify', type=int, default=2000,
+                        help='Birebir doğrulanacak ilk boru sayısı (0: kapalı)')
+    args = parser.parse_args()
+    raise SystemExit(0 if run_benchmark(args.pipes, args.seed, args.verify) else 1)
+
+
+if __name__ == '__main__':
+    main()
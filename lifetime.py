@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Ömür Boyu İstatistikler
+Aynı makinedeki tüm oyun örneklerinin (masaüstü, kabinler, ekransız
+koşucular, Kivy sürümleri) oynanan oyun, flap, geçilen boru, nedene göre
+ölüm ve en uzun koşu sayaçlarını küçük, sabit düzenli bir ikili dosyada
+toplar. Her örnek dosyayı mmap ile açar; sayaç artırmak bellekteki bir
+tamsayıyı artırmaktır, olay başına dosya yazılmaz (sayfaları işletim sistemi
+diske yazar).
+
+Düzen (yerel bayt sırası, 8 baytlık tamsayılar):
+  başlık  8 sözcük: sihirli sayı, sürüm, yuva sayısı, yuva boyu, ...
+  yuva    16 sözcük: sahip pid + FIELDS sayaçları
+
+Her örnek açılışta dosya kilidi altında boş (ya da sahibi ölmüş) bir yuvayı
+sahiplenir (aynı süreçteki iki örnek de ayrı yuvalar alır) ve yalnızca kendi yuvasına yazar; tek yazıcı olduğundan artırmalar
+kilitsizdir ve örneklerin birbirini beklemesi gerekmez. Yuva çıkışta bırakılır
+ama sayaçları kalır; sonraki örnek aynı yuvaya eklemeye devam eder. Boş yuva
+kalmazsa örnek hiç sahiplenilmeyen son (ortak) yuvaya yazar ve her artırmayı o
+sözcüğün bayt aralığına fcntl.lockf kilidiyle yapar. Okuyucu tüm yuvaları toplar (en iyi skor ve en
+uzun koşuda en büyüğü alır); okuma anlıktır.
+"""
+
+import argparse
+import mmap
+import os
+import time
+from typing import Dict, Optional
+
+from config import *
+
+try:
+    import fcntl  # Örnekler arası kilit (Windows/iOS'ta yok; tek örnek varsayılır)
+except ImportError:
+    fcntl = None
+
+MAGIC = int.from_bytes(b'FLPSTAT1', 'little')
+VERSION = 1
+HEADER_WORDS = 8
+SLOT_WORDS = 16
+WORD = 8
+
+# Yuvadaki sayaçlar (0. sözcük sahip pid)
+FIELDS = ('games', 'flaps', 'pipes', 'deaths_ground', 'deaths_ceiling', 'deaths_pipe',
+          'deaths_obstacle', 'best_score', 'longest_ms')
+MAX_FIELDS = ('best_score', 'longest_ms')  # Toplanmaz, en büyüğü alınır
+DEATH_CAUSES = ('ground', 'ceiling', 'pipe', 'obstacle')
+
+
+def _process_alive(pid: int) -> bool:
+    """Yuva sahibi süreç hâlâ çalışıyor mu"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class _FileLock:
+    """Tüm dosya üzerinde özel kilit (fcntl yoksa etkisiz)"""
+
+    def __init__(self, file):
+        self.file = file
+
+    def __enter__(self):
+        if fcntl is not None:
+            fcntl.flock(self.file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self.file, fcntl.LOCK_UN)
+
+
+class LifetimeStats:
+    """Paylaşılan istatistik dosyasına bellek eşlemeyle erişim"""
+
+    def __init__(self, path: str = LIFETIME_STATS_FILE, slots: int = LIFETIME_STATS_SLOTS,
+                 writer: bool = True):
+        """Dosyayı gerekirse oluşturur, eşler; writer ise bir yuva sahiplenir"""
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a+b' if writer else 'rb')
+        with _FileLock(self._file):
+            size = (HEADER_WORDS + slots * SLOT_WORDS) * WORD
+            created = writer and os.fstat(self._file.fileno()).st_size == 0
+            if created:
+                self._file.truncate(size)  # Sıfırlarla dolu: tüm sayaçlar 0
+            access = mmap.ACCESS_WRITE if writer else mmap.ACCESS_READ
+            self._map = mmap.mmap(self._file.fileno(), 0, access=access)
+            self._words = memoryview(self._map).cast('q')
+            if created:
+                for index, value in enumerate((MAGIC, VERSION, slots, SLOT_WORDS)):
+                    self._words[index] = value
+            if self._words[0] != MAGIC or self._words[3] != SLOT_WORDS:
+                self._release_map()
+                raise ValueError(f"Tanınmayan istatistik dosyası: {path}")
+            self.slots = int(self._words[2])
+            self.slot: Optional[int] = None
+            self.shared = False
+            if writer:
+                self._claim_slot()
+
+    def _base(self, slot: int) -> int:
+        """Yuvanın ilk sözcüğünün sırası"""
+        return HEADER_WORDS + slot * SLOT_WORDS
+
+    def _claim_slot(self):
+        """Boş ya da sahibi ölmüş bir yuvayı sahiplenir; yoksa paylaşır"""
+        pid = os.getpid()
+        if fcntl is None:
+            # Kilit yoksa tek örnek varsayılır; sahiplik denetlenemez
+            self.slot = 0
+            self._words[self._base(0)] = pid
+            return
+        for slot in range(self.slots - 1):
+            owner = self._words[self._base(slot)]
+            # Aynı süreçteki başka bir örneğin yuvası da dolu sayılır (close onu boşaltır)
+            if owner == 0 or (owner != pid and not _process_alive(owner)):
+                self._words[self._base(slot)] = pid
+                self.slot = slot
+                return
+        self.slot = self.slots - 1  # Sahipsiz ortak yuva: her yazış kilitli
+        self.shared = True
+
+    def add(self, field: str, amount: int = 1):
+        """Kendi yuvasındaki sayacı artırır"""
+        index = self._base(self.slot) + 1 + FIELDS.index(field)
+        if self.shared:
+            self._locked_update(index, lambda value: value + amount)
+        else:
+            self._words[index] += amount
+
+    def record_max(self, field: str, value: int):
+        """En iyi skor / en uzun koşu gibi en büyük değer alanlarını günceller"""
+        index = self._base(self.slot) + 1 + FIELDS.index(field)
+        if self.shared:
+            self._locked_update(index, lambda current: max(current, value))
+        elif value > self._words[index]:
+            self._words[index] = value
+
+    def _locked_update(self, index: int, update):
+        """Paylaşılan yuvada tek sözcüğü bayt aralığı kilidiyle günceller"""
+        fcntl.lockf(self._file, fcntl.LOCK_EX, WORD, index * WORD)
+        try:
+            self._words[index] = update(self._words[index])
+        finally:
+            fcntl.lockf(self._file, fcntl.LOCK_UN, WORD, index * WORD)
+
+    def game_started(self):
+        """Yeni oyun başladı"""
+        self.add('games')
+
+    def game_over(self, cause: str, score: int, duration_ms: int):
+        """Oyun bitti: nedene göre ölüm, en iyi skor ve en uzun koşu"""
+        if cause in DEATH_CAUSES:
+            self.add(f"deaths_{cause}")
+        self.record_max('best_score', score)
+        self.record_max('longest_ms', duration_ms)
+
+    def totals(self) -> Dict[str, int]:
+        """Tüm yuvaların toplamı (en büyük değer alanlarında en büyüğü)"""
+        totals = dict.fromkeys(FIELDS, 0)
+        for slot in range(self.slots):
+            base = self._base(slot) + 1
+            for offset, field in enumerate(FIELDS):
+                value = self._words[base + offset]
+                if field in MAX_FIELDS:
+                    totals[field] = max(totals[field], value)
+                else:
+                    totals[field] += value
+        totals['deaths'] = sum(totals[f"deaths_{cause}"] for cause in DEATH_CAUSES)
+        return totals
+
+    def instances(self) -> int:
+        """Şu an yuva sahibi olan çalışan örnek sayısı"""
+        owners = [self._words[self._base(slot)] for slot in range(self.slots)]
+        return sum(1 for owner in owners if owner and (fcntl is None or _process_alive(owner)))
+
+    def close(self):
+        """Yuvayı bırakır (sayaçlar kalır) ve eşlemeyi kapatır"""
+        if self._map is None:
+            return
+        if self.slot is not None and not self.shared:
+            with _FileLock(self._file):
+                if self._words[self._base(self.slot)] == os.getpid():
+                    self._words[self._base(self.slot)] = 0
+        self._release_map()
+
+    def _release_map(self):
+        """Görünümü ve eşlemeyi bırakır"""
+        self._words.release()
+        self._map.close()
+        self._map = None
+        self._file.close()
+
+    def report(self) -> str:
+        """Okunabilir özet"""
+        totals = self.totals()
+        deaths = ', '.join(f"{cause} {totals[f'deaths_{cause}']}" for cause in DEATH_CAUSES)
+        return (f"📊 Ömür boyu: {totals['games']} oyun, {totals['flaps']} flap, "
+                f"{totals['pipes']} boru | ölüm: {deaths} | en iyi skor {totals['best_score']}, "
+                f"en uzun koşu {totals['longest_ms'] / 1000:.1f} s | {self.instances()} açık örnek")
+
+
+def open_lifetime_stats(path: str = LIFETIME_STATS_FILE) -> Optional[LifetimeStats]:
+    """Yazıcı olarak açar; dosya açılamazsa (salt okunur sistem vb.) uyarıp None döndürür"""
+    try:
+        return LifetimeStats(path)
+    except (OSError, ValueError) as e:
+        print(f"Uyarı: Ömür boyu istatistikler açılamadı ({e}). Sayaçlar tutulmayacak.")
+        return None
+
+
+def run_benchmark(events: int, path: str):
+    """Sayaç artırma maliyetini dosyaya her olayda yazmakla kıyaslar"""
+    stats = LifetimeStats(path)
+    started = time.perf_counter()
+    for _ in range(events):
+        stats.add('flaps')
+    mapped = time.perf_counter() - started
+    stats.close()
+
+    sample = max(1, events // 100)
+    json_path = f"{path}.json"
+    started = time.perf_counter()
+    for count in range(sample):
+        with open(json_path, 'w') as f:
+            f.write(f'{{"flaps": {count}}}')
+    written = (time.perf_counter() - started) / sample * events
+    os.remove(json_path)
+    print(f"   {events} artırma: mmap {mapped / events * 1e9:.0f} ns/olay, "
+          f"olay başına dosya yazma ~{written / events * 1e6:.1f} µs/olay")
+
+
+def main():
+    """Komut satırı girişi - toplamları göster"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Ömür Boyu İstatistikler')
+    parser.add_argument('--path', default=LIFETIME_STATS_FILE, help='İstatistik dosyası')
+    parser.add_argument('--watch', type=float, default=0,
+                        help='Toplamları bu aralıkla (saniye) sürekli göster')
+    parser.add_argument('--bench', type=int, default=0,
+                        help='N artırmayla maliyet ölçümü (--path dosyasına yazar)')
+    args = parser.parse_args()
+
+    if args.bench:
+        run_benchmark(args.bench, args.path)
+    if not os.path.exists(args.path):
+        print(f"Henüz istatistik yok: {args.path}")
+        return
+    stats = LifetimeStats(args.path, writer=False)
+    try:
+        print(stats.report())
+        while args.watch:
+            time.sleep(args.watch)
+            print(stats.report())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stats.close()
+
+
+if __name__ == '__main__':
+    main()
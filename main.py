@@ -6,7 +6,9 @@ Python 3.10+ ve Pygame 2.5+ ile çalışır
 """
 
 import argparse
+import asyncio
 import sys
+from config import PROFILE_FRAMES, TRACE_FRAME_BUDGET_MS
 from game import Game
 
 
@@ -19,6 +21,38 @@ def main():
                        help='Tam ekran modunda çalıştır')
     parser.add_argument('--large', action='store_true', 
                        help='Büyük ekran modunda çalıştır (2x boyut)')
+    parser.add_argument('--cpu-stats', action='store_true', 
+                       help='Çıkışta durum bazlı CPU kullanım özetini yazdır')
+    parser.add_argument('--low-latency', action='store_true', 
+                       help='Girdileri flip\'ten hemen önce işleyen düşük gecikme modu')
+    parser.add_argument('--latency-probe', action='store_true', 
+                       help='Girdi→ekran gecikmesini ölç ve çıkışta özetini yazdır')
+    parser.add_argument('--latency-log', metavar='DOSYA', 
+                       help='Gecikme ölçümlerini (olay ve flip zamanları) CSV olarak kaydet')
+    parser.add_argument('--ghosts', action='store_true', 
+                       help='Önceki koşuların hayaletleriyle aynı parkurda yarış (NumPy gerekir)')
+    parser.add_argument('--autopilot', action='store_true', 
+                       help='Otopilot (vitrin modu): kuşu arama tabanlı bot uçurur')
+    parser.add_argument('--async', dest='use_async', action='store_true', 
+                       help='asyncio uyumlu döngüyü kullan (tarayıcıda/WebAssembly\'de otomatik)')
+    parser.add_argument('--capture', nargs='?', const='', metavar='HEDEF', 
+                       help='Kare kaydını baştan başlat (PNG klasörü veya ham akış dosyası/borusu; F12 aç/kapa)')
+    parser.add_argument('--capture-format', choices=['png', 'raw'], default='png', 
+                       help='Kayıt biçimi: PNG dizisi veya ham RGB akışı')
+    parser.add_argument('--heatmap', nargs='?', const='', metavar='DOSYA', 
+                       help='Ölüm ısı haritasını arkaplanın üzerine çiz ve ölümleri ekle (NumPy gerekir)')
+    parser.add_argument('--archive', nargs='?', const='', metavar='KLASÖR', 
+                       help='Biten koşuları seed ve flap\'leriyle sütunlu arşive ekle (NumPy gerekir)')
+    parser.add_argument('--rewind', action='store_true', 
+                       help='Son saniyeleri kareler halinde tut: F9 ile geri sar, oyun bitince kaydet (NumPy gerekir)')
+    parser.add_argument('--trace', action='store_true', 
+                       help='Oyun döngüsünün zaman çizelgesini tut: F8, yavaş kare ve çıkışta Perfetto JSON yaz')
+    parser.add_argument('--trace-budget', type=float, default=TRACE_FRAME_BUDGET_MS, metavar='MS', 
+                       help='--trace ile bu süreyi aşan kare işi otomatik döküm alır (0: kapalı)')
+    parser.add_argument('--profile-frames', type=int, default=PROFILE_FRAMES, metavar='N', 
+                       help='F10 / SIGUSR1 ile cProfile altında yakalanacak kare sayısı')
+    parser.add_argument('--split', action='store_true', 
+                       help='Simülasyonu ayrı süreçte çalıştır, bu süreç yalnızca çizsin (çift çekirdek)')
     
     args = parser.parse_args()
     
@@ -31,10 +65,44 @@ def main():
         print("Hata: --large ve --fullscreen aynı anda kullanılamaz!")
         sys.exit(1)
     
+    if args.split and (args.ghosts or args.low_latency or args.use_async
+                       or args.heatmap is not None or args.archive is not None or args.rewind
+                       or args.trace):
+        print("Hata: --split, --ghosts / --low-latency / --async / --heatmap / --archive "
+              "/ --rewind / --trace ile birlikte kullanılamaz!")
+        sys.exit(1)
+    
+    # Tarayıcıda (WebAssembly) mmap sayaçları ve sinyal işleyicisi kurulmaz
+    web = sys.platform == 'emscripten'
+    
     # Oyunu başlat
     try:
-        game = Game(fullscreen=args.fullscreen, large_screen=args.large)
-        game.run()
+        if args.split:
+            from split import report, run_split
+            print(report(run_split(fullscreen=args.fullscreen, large_screen=args.large,
+                                   autopilot=args.autopilot, lifetime_stats=True)))
+            return
+        
+        game = Game(fullscreen=args.fullscreen, large_screen=args.large,
+                    low_latency=args.low_latency,
+                    latency_probe=args.latency_probe or bool(args.latency_log),
+                    ghosts=args.ghosts, autopilot=args.autopilot,
+                    capture=args.capture, capture_format=args.capture_format,
+                    heatmap=args.heatmap, archive=args.archive, rewind=args.rewind,
+                    trace=args.trace, trace_budget_ms=args.trace_budget,
+                    profile_frames=args.profile_frames, lifetime_stats=not web)
+        if not web:
+            game.frame_profiler().install_signal()  # Ekransız çalışan oyuna SIGUSR1 ile profil isteği
+        if args.use_async or web:
+            asyncio.run(game.run_async())
+        else:
+            game.run()
+        if game.latency_probe is not None:
+            print(game.latency_probe.report())
+            if args.latency_log:
+                game.latency_probe.write_csv(args.latency_log)
+        if args.cpu_stats:
+            print(game.cpu_meter.report())
     except Exception as e:
         print(f"Oyun başlatılırken hata oluştu: {e}")
         sys.exit(1)
@@ -42,6 +42,13 @@ from kivy.core.audio import SoundLoader
 from kivy.resources import resource_find
 import random
 import json
+import time
+
+# Ömür boyu istatistikler (lifetime.py masaüstü sürümüyle aynı dosyayı paylaşır)
+try:
+    from lifetime import open_lifetime_stats
+except ImportError:
+    open_lifetime_stats = None
 
 # iOS için haptic feedback
 if platform == 'ios':
@@ -282,6 +289,10 @@ class iOSGameWidget(Widget):
         # Ses dosyaları
         self.load_sounds()
         
+        # Ömür boyu istatistikler (açılamazsa sayaçlar tutulmaz)
+        self.lifetime = open_lifetime_stats() if open_lifetime_stats else None
+        self.run_started = time.monotonic()
+        
         # Oyun döngüsü
         Clock.schedule_interval(self.update, 1.0/60.0)  # 60 FPS
         
@@ -322,6 +333,8 @@ class iOSGameWidget(Widget):
             self.start_game()
         elif self.state == iOSConfig.GAME_STATES['PLAYING']:
             self.character.jump()
+            if self.lifetime:
+                self.lifetime.add('flaps')
         elif self.state == iOSConfig.GAME_STATES['GAME_OVER']:
             self.restart_game()
         elif self.state == iOSConfig.GAME_STATES['PAUSED']:
@@ -337,6 +350,9 @@ class iOSGameWidget(Widget):
         self.obstacles = []
         self.pipe_timer = 0
         self.obstacle_timer = 0
+        self.run_started = time.monotonic()
+        if self.lifetime:
+            self.lifetime.game_started()
     
     def restart_game(self):
         """Oyunu yeniden başlat"""
@@ -352,7 +368,7 @@ class iOSGameWidget(Widget):
         
         # Zemin ve tavan kontrolü
         if self.character.y <= 50 or self.character.y >= iOSConfig.SCREEN_HEIGHT - 50:
-            self.game_over()
+            self.game_over('ceiling' if self.character.y <= 50 else 'ground')
             return
         
         # Boru oluşturma
@@ -376,6 +392,8 @@ class iOSGameWidget(Widget):
             if not pipe.passed and pipe.x + pipe.width < self.character.x:
                 pipe.passed = True
                 self.score += 1
+                if self.lifetime:
+                    self.lifetime.add('pipes')
                 if self.score > self.high_score:
                     self.high_score = self.score
                     self.save_high_score()
@@ -417,8 +435,11 @@ class iOSGameWidget(Widget):
                 rect1[1] < rect2[1] + rect2[3] and
                 rect1[1] + rect1[3] > rect2[1])
     
-    def game_over(self):
+    def game_over(self, cause='pipe'):
         """Oyun bitti"""
+        if self.lifetime and self.state == iOSConfig.GAME_STATES['PLAYING']:
+            duration_ms = int((time.monotonic() - self.run_started) * 1000)
+            self.lifetime.game_over(cause, self.score, duration_ms)
         self.state = iOSConfig.GAME_STATES['GAME_OVER']
     
     def game_over_with_crash(self):
@@ -434,7 +455,7 @@ class iOSGameWidget(Widget):
             except:
                 pass
         
-        self.game_over()
+        self.game_over('obstacle')
     
     def draw_game(self):
         """Oyunu çiz"""
@@ -18,6 +18,13 @@ from kivy.core.audio import SoundLoader
 import random
 import json
 import os
+import time
+
+# Ömür boyu istatistikler (lifetime.py masaüstü sürümüyle aynı dosyayı paylaşır)
+try:
+    from lifetime import open_lifetime_stats
+except ImportError:
+    open_lifetime_stats = None
 
 # Mobil optimizasyonlu ayarlar
 class MobileConfig:
@@ -171,6 +178,10 @@ class GameWidget(Widget):
         # Ses dosyaları
         self.sounds = self.load_sounds()
         
+        # Ömür boyu istatistikler (açılamazsa sayaçlar tutulmaz)
+        self.lifetime = open_lifetime_stats() if open_lifetime_stats else None
+        self.run_started = time.monotonic()
+        
         # Oyun döngüsü
         Clock.schedule_interval(self.update, 1.0/60.0)  # 60 FPS
         
@@ -211,6 +222,8 @@ class GameWidget(Widget):
             self.start_game()
         elif self.state == MobileConfig.GAME_STATES['PLAYING']:
             self.character.jump()
+            if self.lifetime:
+                self.lifetime.add('flaps')
         elif self.state == MobileConfig.GAME_STATES['GAME_OVER']:
             self.restart_game()
         elif self.state == MobileConfig.GAME_STATES['PAUSED']:
@@ -225,13 +238,19 @@ class GameWidget(Widget):
         self.pipes = []
         self.obstacles = []
         self.pipe_timer = 0
+        self.run_started = time.monotonic()
+        if self.lifetime:
+            self.lifetime.game_started()
         
     def restart_game(self):
         """Oyunu yeniden başlat"""
         self.start_game()
         
-    def game_over(self, crash_sound=False):
+    def game_over(self, crash_sound=False, cause='pipe'):
         """Oyun bitişi"""
+        if self.lifetime and self.state == MobileConfig.GAME_STATES['PLAYING']:
+            duration_ms = int((time.monotonic() - self.run_started) * 1000)
+            self.lifetime.game_over(cause, self.score, duration_ms)
         self.state = MobileConfig.GAME_STATES['GAME_OVER']
         
         # Yüksek skor kontrolü
@@ -264,6 +283,8 @@ class GameWidget(Widget):
             # Skor kontrolü
             if pipe.check_score(self.character.get_rect()):
                 self.score += 1
+                if self.lifetime:
+                    self.lifetime.add('pipes')
                 
             # Çarpışma kontrolü
             if pipe.check_collision(self.character.get_rect()):
@@ -284,7 +305,7 @@ class GameWidget(Widget):
             
             # Çarpışma kontrolü
             if obstacle.check_collision(self.character.get_rect()):
-                self.game_over(crash_sound=True)
+                self.game_over(crash_sound=True, cause='obstacle')
                 return
                 
             # Ekran dışı kontrolü
@@ -293,11 +314,11 @@ class GameWidget(Widget):
                 
         # Zemin çarpışması
         if self.character.y >= MobileConfig.SCREEN_HEIGHT - 100:
-            self.game_over()
+            self.game_over(cause='ground')
             
         # Tavan çarpışması
         if self.character.y <= 0:
-            self.game_over()
+            self.game_over(cause='ceiling')
             
         # Çizimi güncelle
         self.canvas.clear()
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Çok Oyunculu Sunucu
+Yerel ağ kabinleri için sunucu yetkili (server-authoritative) asyncio sunucusu.
+Tek süreçte çok sayıda eşzamanlı maçı sabit tick hızında yürütür; her maç
+game.py simülasyonunu adımlar, istemcilerden TCP üzerinden flap girdisi alır
+ve kompakt durum paketlerini yayınlar.
+
+Protokol (tüm sayılar ağ bayt sırasında):
+    İstemci -> Sunucu
+        b'J' + H          maça katıl (istenen oyuncu sayısı)
+        b'F'              flap
+    Sunucu -> İstemci
+        b'W' + IIBBH      hoş geldin (maç no, seed, oyuncu sırası, oyuncu sayısı, tick hızı);
+                          lobiden biri ayrılıp sıralar kayarsa yeniden gönderilir
+        b'S' + IB         durum (kare, oyuncu sayısı), ardından her oyuncu için
+                          hhHB (y, hız, skor, canlı mı) ve B + boru başına hh (x, boşluk y)
+        b'E' + B          maç bitti (kazanan sırası, 255 = berabere)
+"""
+
+import argparse
+import asyncio
+import random
+import struct
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from autopilot import gap_chaser
+from config import *
+from game import GameSimulation
+
+# Mesaj türleri
+MSG_JOIN = b'J'
+MSG_FLAP = b'F'
+MSG_WELCOME = b'W'
+MSG_STATE = b'S'
+MSG_END = b'E'
+
+JOIN_FORMAT = struct.Struct('!H')
+WELCOME_FORMAT = struct.Struct('!IIBBH')
+STATE_HEADER_FORMAT = struct.Struct('!IB')
+STATE_PLAYER_FORMAT = struct.Struct('!hhHB')
+STATE_PIPE_FORMAT = struct.Struct('!hh')
+COUNT_FORMAT = struct.Struct('!B')
+END_FORMAT = struct.Struct('!B')
+
+# y ve hız 1/16 piksel hassasiyetle int16 olarak gönderilir
+STATE_FIXED_POINT = 16
+NO_WINNER = 255
+
+
+class Player:
+    """Maçtaki bir oyuncu - bağlantı ve kendi simülasyonu"""
+
+    def __init__(self, index: int, seed: int, writer: asyncio.StreamWriter):
+        """Oyuncuyu oluşturur (aynı seed tüm oyunculara aynı boruları verir)"""
+        self.index = index
+        self.writer = writer
+        self.simulation = GameSimulation(seed)
+        self.pending_flap = False
+        self.connected = True
+
+    @property
+    def alive(self) -> bool:
+        """Oyuncu hâlâ oyunda mı"""
+        return self.connected and self.simulation.state == GAME_STATES['PLAYING']
+
+    def send(self, payload: bytes):
+        """Paketi gönderir; yavaş istemcinin tamponu dolarsa bağlantıyı keser"""
+        if not self.connected:
+            return
+        transport = self.writer.transport
+        if transport.is_closing() or transport.get_write_buffer_size() > SERVER_MAX_CLIENT_BUFFER:
+            self.disconnect()
+            return
+        self.writer.write(payload)
+
+    def disconnect(self):
+        """Bağlantıyı kapatır"""
+        if self.connected:
+            self.connected = False
+            self.writer.close()
+
+
+class Match:
+    """Tek bir maç - oyuncuların simülasyonlarını aynı tick'te adımlar"""
+
+    def __init__(self, match_id: int, capacity: int, seed: int,
+                 max_frames: int = MATCH_MAX_FRAMES):
+        """Maçı oluşturur (max_frames > 0 ise maç o karede skora göre biter)"""
+        self.match_id = match_id
+        self.capacity = capacity
+        self.seed = seed
+        self.max_frames = max_frames
+        self.players: List[Player] = []
+        self.frame = 0
+        self.finished = False
+
+    @property
+    def started(self) -> bool:
+        """Tüm oyuncular katıldı mı"""
+        return len(self.players) == self.capacity
+
+    def add_player(self, writer: asyncio.StreamWriter) -> Player:
+        """Maça oyuncu ekler ve hoş geldin paketini gönderir"""
+        player = Player(len(self.players), self.seed, writer)
+        self.players.append(player)
+        self._welcome(player)
+        return player
+
+    def remove_player(self, player: Player):
+        """Başlamamış maçtan ayrılan oyuncuyu çıkarır; sırası kayanlara yeniden hoş geldin gönderir"""
+        self.players.remove(player)
+        for index, other in enumerate(self.players):
+            if other.index != index:
+                other.index = index
+                self._welcome(other)
+
+    def _welcome(self, player: Player):
+        """Hoş geldin paketini gönderir"""
+        player.send(MSG_WELCOME + WELCOME_FORMAT.pack(
+            self.match_id, self.seed, player.index, self.capacity, SERVER_TICK_RATE))
+
+    def step(self):
+        """Bir tick ilerletir, durumu yayınlar ve bitişi kontrol eder"""
+        self.frame += 1
+        alive_players = []
+        for player in self.players:
+            if not player.alive:
+                continue
+            if player.pending_flap:
+                player.pending_flap = False
+                player.simulation.flap()
+            player.simulation.step()
+            if player.alive:
+                alive_players.append(player)
+
+        payload = self.encode_state()
+        for player in self.players:
+            player.send(payload)
+
+        if len(alive_players) <= (1 if self.capacity > 1 else 0):
+            self.finish(alive_players[0] if alive_players else None)
+        elif self.max_frames and self.frame >= self.max_frames:
+            self.finish(self._leader(alive_players))
+
+    @staticmethod
+    def _leader(players: List[Player]) -> Optional[Player]:
+        """En yüksek skorlu oyuncuyu döndürür (beraberlikte None)"""
+        ranked = sorted(players, key=lambda p: p.simulation.score, reverse=True)
+        if len(ranked) > 1 and ranked[0].simulation.score == ranked[1].simulation.score:
+            return None
+        return ranked[0] if ranked else None
+
+    def encode_state(self) -> bytes:
+        """Maç durumunu kompakt ikili pakete dönüştürür"""
+        parts = [MSG_STATE, STATE_HEADER_FORMAT.pack(self.frame, len(self.players))]
+        for player in self.players:
+            bird = player.simulation.bird
+            parts.append(STATE_PLAYER_FORMAT.pack(
+                int(bird.y * STATE_FIXED_POINT),
+                int(bird.velocity * STATE_FIXED_POINT),
+                player.simulation.score,
+                player.alive))
+
+        # Borular tüm oyuncularda aynıdır; hayatta olan bir oyuncudan alınır
+        reference = next((p for p in self.players if p.alive), self.players[0])
+        pipes = reference.simulation.pipe_manager.pipes
+        parts.append(COUNT_FORMAT.pack(len(pipes)))
+        for pipe in pipes:
+            parts.append(STATE_PIPE_FORMAT.pack(int(pipe.x), pipe.gap_y))
+        return b''.join(parts)
+
+    def finish(self, winner: Optional[Player]):
+        """Maçı bitirir ve sonucu gönderir"""
+        self.finished = True
+        payload = MSG_END + END_FORMAT.pack(winner.index if winner else NO_WINNER)
+        for player in self.players:
+            player.send(payload)
+            player.disconnect()
+
+
+class TickStats:
+    """Tick maliyeti ölçer - tüm maçları adımlamanın süresi"""
+
+    def __init__(self, window: int = SERVER_TICK_RATE * 10):
+        """Son `window` tick'in süresini saklar"""
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.match_ticks: Deque[int] = deque(maxlen=window)
+        self.total_ticks = 0
+        self.overruns = 0
+
+    def record(self, seconds: float, match_count: int):
+        """Bir tick'in süresini ve adımlanan maç sayısını kaydeder"""
+        self.samples.append(seconds)
+        self.match_ticks.append(match_count)
+        self.total_ticks += 1
+        if seconds > 1.0 / SERVER_TICK_RATE:
+            self.overruns += 1
+
+    def report(self) -> str:
+        """Okunabilir özet metni döndürür"""
+        if not self.samples:
+            return "Tick ölçümü: örnek yok"
+        ordered = sorted(self.samples)
+        mean = sum(ordered) / len(ordered)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        match_ticks = sum(self.match_ticks)
+        per_match = sum(self.samples) / match_ticks if match_ticks else 0.0
+        return (f"Tick: ortalama {mean * 1000:.2f} ms, p99 {p99 * 1000:.2f} ms, "
+                f"en fazla {ordered[-1] * 1000:.2f} ms | maç başına {per_match * 1e6:.1f} µs | "
+                f"bütçe {1000 / SERVER_TICK_RATE:.1f} ms, aşım {self.overruns}/{self.total_ticks}")
+
+
+class MatchServer:
+    """Maç sunucusu - bağlantıları maçlara dağıtır ve tüm maçları tek döngüde adımlar"""
+
+    def __init__(self, host: str = SERVER_HOST, port: int = SERVER_PORT,
+                 report_interval: float = 5.0, max_frames: int = MATCH_MAX_FRAMES):
+        """Sunucuyu oluşturur (port 0 ise boş bir port seçilir)"""
+        self.host = host
+        self.port = port
+        self.max_frames = max_frames
+        self.report_interval = report_interval
+        self.matches: Dict[int, Match] = {}
+        self.lobbies: Dict[int, Match] = {}
+        self.stats = TickStats()
+        self.finished_matches = 0
+        self._next_match_id = 1
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tick_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Dinlemeye ve tick döngüsüne başlar"""
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._tick_task = asyncio.ensure_future(self._tick_loop())
+
+    async def stop(self):
+        """Sunucuyu ve tüm maçları kapatır"""
+        if self._tick_task is not None:
+            self._tick_task.cancel()
+            await asyncio.gather(self._tick_task, return_exceptions=True)
+        for match in self.matches.values():
+            for player in match.players:
+                player.disconnect()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    @property
+    def serving(self) -> bool:
+        """Sunucu dinliyor ya da tick döngüsü çalışıyor mu"""
+        return ((self._server is not None and self._server.is_serving())
+                or (self._tick_task is not None and not self._tick_task.done()))
+
+    def _join(self, capacity: int, writer: asyncio.StreamWriter) -> Tuple[Match, Player]:
+        """Oyuncuyu aynı kapasitedeki açık maça (yoksa yeni maça) yerleştirir"""
+        match = self.lobbies.get(capacity)
+        if match is None:
+            match = Match(self._next_match_id, capacity, random.getrandbits(32),
+                          self.max_frames)
+            self._next_match_id += 1
+            self.lobbies[capacity] = match
+            self.matches[match.match_id] = match
+
+        player = match.add_player(writer)
+        if match.started:
+            del self.lobbies[capacity]
+        return match, player
+
+    def _leave(self, match: Match, player: Player):
+        """Lobide bekleyen oyuncu ayrıldıysa koltuğunu boşaltır; boş lobiyi kaldırır"""
+        if match.started or player not in match.players:
+            return
+        match.remove_player(player)
+        if not match.players:
+            del self.lobbies[match.capacity]
+            del self.matches[match.match_id]
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Bir istemci bağlantısını işler: katılım, ardından flap girdileri"""
+        match = player = None
+        try:
+            if await reader.readexactly(1) != MSG_JOIN:
+                return
+            capacity, = JOIN_FORMAT.unpack(await reader.readexactly(JOIN_FORMAT.size))
+            capacity = max(1, min(capacity, MATCH_MAX_PLAYERS))
+            match, player = self._join(capacity, writer)
+
+            while player.connected:
+                message = await reader.read(64)
+                if not message:
+                    break
+                # Bir tick içindeki birden çok flap tek flap sayılır
+                if MSG_FLAP in message:
+                    player.pending_flap = True
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if player is not None:
+                player.disconnect()
+                self._leave(match, player)
+            else:
+                writer.close()
+
+    async def _tick_loop(self):
+        """Tüm başlamış maçları sabit tick hızında adımlar ve maliyeti ölçer"""
+        loop = asyncio.get_running_loop()
+        period = 1.0 / SERVER_TICK_RATE
+        next_tick = loop.time()
+        next_report = loop.time() + self.report_interval
+
+        while True:
+            start = time.perf_counter()
+            stepped = 0
+            for match in list(self.matches.values()):
+                if not match.started:
+                    continue
+                match.step()
+                stepped += 1
+                if match.finished:
+                    del self.matches[match.match_id]
+                    self.finished_matches += 1
+            self.stats.record(time.perf_counter() - start, stepped)
+
+            now = loop.time()
+            if self.report_interval and now >= next_report:
+                next_report = now + self.report_interval
+                print(f"[sunucu] {len(self.matches)} maç | {self.stats.report()}")
+
+            next_tick += period
+            if next_tick < now:
+                # Bütçe aşıldı: biriken tick'leri telafi etmek yerine yeniden hizala
+                next_tick = now
+            await asyncio.sleep(next_tick - now)
+
+
+class LoopbackClient:
+    """Yerel test istemcisi - sunucuya bağlanır ve basit bir kuralla flap yapar"""
+
+    def __init__(self, host: str, port: int, capacity: int = MATCH_MAX_PLAYERS):
+        """İstemciyi oluşturur"""
+        self.host = host
+        self.port = port
+        self.capacity = capacity
+        self.match_id: Optional[int] = None  # Hoş geldin paketi gelince dolar
+        self.player_count = 0
+        self.player_index = -1
+        self.states_received = 0
+        self.score = 0
+        self.winner: Optional[int] = None
+
+    async def play(self):
+        """Maç bitene kadar oynar"""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(MSG_JOIN + JOIN_FORMAT.pack(self.capacity))
+            if await reader.readexactly(1) != MSG_WELCOME:
+                return
+            self.match_id, _, self.player_index, self.player_count, _ = WELCOME_FORMAT.unpack(
+                await reader.readexactly(WELCOME_FORMAT.size))
+
+            while True:
+                message_type = await reader.readexactly(1)
+                if message_type == MSG_WELCOME:
+                    # Lobiden biri ayrıldı, sıramız değişti
+                    _, _, self.player_index, self.player_count, _ = WELCOME_FORMAT.unpack(
+                        await reader.readexactly(WELCOME_FORMAT.size))
+                    continue
+                if message_type == MSG_END:
+                    self.winner, = END_FORMAT.unpack(await reader.readexactly(END_FORMAT.size))
+                    return
+                if message_type != MSG_STATE:
+                    return
+
+                _, player_count = STATE_HEADER_FORMAT.unpack(
+                    await reader.readexactly(STATE_HEADER_FORMAT.size))
+                players = [STATE_PLAYER_FORMAT.unpack(chunk) for chunk in _chunks(
+                    await reader.readexactly(STATE_PLAYER_FORMAT.size * player_count),
+                    STATE_PLAYER_FORMAT.size)]
+                pipe_count, = COUNT_FORMAT.unpack(await reader.readexactly(COUNT_FORMAT.size))
+                pipes = [STATE_PIPE_FORMAT.unpack(chunk) for chunk in _chunks(
+                    await reader.readexactly(STATE_PIPE_FORMAT.size * pipe_count),
+                    STATE_PIPE_FORMAT.size)]
+                self.states_received += 1
+
+                y, velocity, self.score, alive = players[self.player_index]
+                if alive and gap_chaser(y / STATE_FIXED_POINT, velocity / STATE_FIXED_POINT, pipes):
+                    writer.write(MSG_FLAP)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def _chunks(data: bytes, size: int):
+    """Baytları sabit boyutlu parçalara böler"""
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+async def run_loopback(matches: int, players: int, max_frames: int):
+    """Yerel sunucu + loopback istemcilerle yük ölçümü yapar"""
+    server = MatchServer(host='127.0.0.1', port=0, report_interval=2.0,
+                         max_frames=max_frames)
+    await server.start()
+    print(f"🖧 Loopback: {matches} maç x {players} oyuncu, port {server.port}")
+
+    clients = [LoopbackClient('127.0.0.1', server.port, players)
+               for _ in range(matches * players)]
+    await asyncio.gather(*(client.play() for client in clients))
+    await server.stop()
+
+    scores = [client.score for client in clients]
+    print(f"✅ {server.finished_matches} maç bitti | ortalama skor "
+          f"{sum(scores) / len(scores):.1f}, en yüksek {max(scores)}")
+    print(server.stats.report())
+
+
+async def serve(host: str, port: int):
+    """Sunucuyu başlatır ve sonsuza dek çalıştırır"""
+    server = MatchServer(host, port)
+    await server.start()
+    print(f"🖧 Sunucu {host}:{server.port} adresinde dinliyor (tick {SERVER_TICK_RATE} Hz)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    """Komut satırı girişi"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Çok Oyunculu Sunucu')
+    parser.add_argument('--host', default=SERVER_HOST, help='Dinlenecek adres')
+    parser.add_argument('--port', type=int, default=SERVER_PORT, help='Dinlenecek port')
+    parser.add_argument('--loopback', type=int, metavar='MAÇ',
+                       help='Yerel loopback istemcilerle verilen sayıda maç oynat ve ölç')
+    parser.add_argument('--players', type=int, default=MATCH_MAX_PLAYERS,
+                       help='Loopback maçlarında oyuncu sayısı')
+    parser.add_argument('--frames', type=int, default=FPS * 30,
+                       help='Loopback maçlarının en fazla süresi (kare)')
+    args = parser.parse_args()
+
+    try:
+        if args.loopback:
+            asyncio.run(run_loopback(args.loopback, args.players, args.frames))
+        else:
+            asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
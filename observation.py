@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Piksel Gözlem Hattı
+Pikselden öğrenen ajanlar için oyunun çizim katmanlarını (Game.draw sırasıyla
+arkaplan, borular, engeller, zemin, kuş) ekran dışı bir yüzeye çizer ve
+küçültülmüş gri tonlu kareleri önceden ayrılmış bir halka tampona yazar
+(varsayılan 84x84x4 uint8).
+
+Ekran okunmaz: kare önce en yakın komşuyla hedefin iki katına, sonra
+smoothscale ile hedef boyuta (2x2 ortalama) küçültülür; ikisi de pygame'in C
+kodunda, önceden ayrılmış hedef yüzeylere yapılır (tam kareden doğrudan
+smoothscale'in yaklaşık üçte biri maliyet). Küçük yüzeyin piksellerine
+pygame.surfarray.pixels3d ile kopyasız erişilir; gri ton (BT.601 tamsayı
+ağırlıkları) önceden ayrılmış dizilerde hesaplanıp halka tampondaki yuvaya
+yazılır. Tam çözünürlüklü kareye de pixels3d görünümüyle kopyasız
+erişilebilir. SDL dummy video sürücüsüyle pencere açmadan çalışır.
+"""
+
+import argparse
+import os
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+import pygame
+
+from autopilot import reference_flap
+from config import *
+from game import Background, GameSimulation
+
+
+class PixelObserver:
+    """Ekran dışı çizim + küçültülmüş gri tonlu kare yığını"""
+
+    def __init__(self, size: Tuple[int, int] = OBSERVATION_SIZE,
+                 stack: int = OBSERVATION_STACK, show_score: bool = False):
+        """Yüzeyleri ve halka tamponu bir kez ayırır (pygame görüntü modu kurulmuş olmalı)"""
+        self.size = size
+        self.stack = stack
+        self.show_score = show_score
+        width, height = size
+        self.canvas = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 32)
+        self._middle = pygame.Surface((width * 2, height * 2), 0, 32)
+        self._small = pygame.Surface(size, 0, 32)
+        self._gray = np.empty(size, dtype=np.uint16)  # surfarray düzeni: (x, y)
+        self._scratch = np.empty(size, dtype=np.uint16)
+        self.background = Background()
+        self._score_font = pygame.font.Font(None, SCORE_FONT_SIZE) if show_score else None
+
+        # Halka tampon (yükseklik, genişlik, yığın); head en son yazılan yuva
+        self.frames = np.zeros((height, width, stack), dtype=np.uint8)
+        self.head = stack - 1
+        self._stacked = np.empty_like(self.frames)
+        self._order = np.arange(stack)
+        self._frame = -1
+
+    def render(self, simulation: GameSimulation):
+        """Simülasyonu ekran dışı yüzeye çizer (Game.draw ile aynı katmanlar)"""
+        # Arkaplan, Game.update'te olduğu gibi oynanan her karede bir kayar
+        if simulation.frame > self._frame >= 0:
+            for _ in range(min(simulation.frame - self._frame, SCREEN_WIDTH)):
+                self.background.update()
+        self.background.draw(self.canvas)
+        simulation.draw_playfield(self.canvas)
+        if self._score_font is not None:
+            score_text = self._score_font.render(str(simulation.score), True, SCORE_COLOR)
+            self.canvas.blit(score_text, score_text.get_rect(center=SCORE_POSITION))
+
+    def observe(self, simulation: GameSimulation) -> np.ndarray:
+        """Kareyi çizer, küçültüp gri tona çevirir ve yığına ekler; sıralı yığını döndürür
+
+        Yeni bölümde (kare sayacı geri gittiğinde) yığının tamamı ilk kareyle doldurulur.
+        Döndürülen dizi her çağrıda yeniden yazılır; saklanacaksa kopyalanmalıdır.
+        """
+        new_episode = simulation.frame <= self._frame or self._frame < 0
+        self.render(simulation)
+        self._frame = simulation.frame
+
+        pygame.transform.scale(self.canvas, self._middle.get_size(), self._middle)
+        pygame.transform.smoothscale(self._middle, self.size, self._small)
+
+        # Gri ton: (77 R + 150 G + 29 B) >> 8, ara sonuçlar uint16 dizilerde
+        gray, scratch = self._gray, self._scratch
+        rgb = pygame.surfarray.pixels3d(self._small)  # (x, y, RGB), kopyasız
+        np.multiply(rgb[..., 0], 77, out=gray, dtype=np.uint16)
+        np.multiply(rgb[..., 1], 150, out=scratch, dtype=np.uint16)
+        gray += scratch
+        np.multiply(rgb[..., 2], 29, out=scratch, dtype=np.uint16)
+        gray += scratch
+        del rgb  # Görünüm yüzeyi kilitli tutar; sonraki küçültmeden önce bırakılır
+        gray >>= 8
+
+        self.head = (self.head + 1) % self.stack
+        slot = self.frames[:, :, self.head]
+        np.copyto(slot, gray.T, casting='unsafe')
+        if new_episode:
+            self.frames[...] = slot[:, :, None]
+        return self.stacked()
+
+    def latest(self) -> np.ndarray:
+        """En son karenin halka tampondaki görünümü (kopyasız)"""
+        return self.frames[:, :, self.head]
+
+    def stacked(self) -> np.ndarray:
+        """Eskiden yeniye sıralı yığın (önceden ayrılmış diziye yazılır)"""
+        order = (self._order + self.head + 1) % self.stack
+        return np.take(self.frames, order, axis=2, out=self._stacked)
+
+    def pixels(self) -> np.ndarray:
+        """Tam çözünürlüklü karenin (x, y, RGB) kopyasız görünümü
+
+        Görünüm yaşadıkça yüzey kilitli kalır; sonraki observe'dan önce silinmelidir.
+        """
+        return pygame.surfarray.pixels3d(self.canvas)
+
+
+def legacy_observation(surface: pygame.Surface, frames: np.ndarray,
+                       size: Tuple[int, int]) -> np.ndarray:
+    """Eski yol: tam RGB kareyi kopyalayıp NumPy ile gri tona çevirip küçültür"""
+    rgb = pygame.surfarray.array3d(surface).astype(np.float32)
+    gray = rgb[..., 0] * 0.299 + rgb[..., 1] * 0.587 + rgb[..., 2] * 0.114
+    width, height = size
+    xs = (np.arange(width) * SCREEN_WIDTH // width)
+    ys = (np.arange(height) * SCREEN_HEIGHT // height)
+    small = gray[xs][:, ys].T.astype(np.uint8)
+    return np.concatenate([frames[:, :, 1:], small[:, :, None]], axis=2)
+
+
+def run_benchmark(frames: int, seed: int, size: Tuple[int, int], stack: int,
+                  save: Optional[str]):
+    """Bot oyunlarını gözlemleyerek kare/sn ölçer; eski ekran okuma yoluyla kıyaslar"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    observer = PixelObserver(size, stack)
+    simulation = GameSimulation(seed)
+    simulation.state = GAME_STATES['PLAYING']
+    print(f"🖼️  Piksel gözlem: {SCREEN_WIDTH}x{SCREEN_HEIGHT} -> {size[0]}x{size[1]}x{stack} uint8 "
+          f"({observer.frames.nbytes / 1024:.1f} KB halka tampon)")
+
+    def play(observe) -> Tuple[float, float, int]:
+        """frames kare oynar; (toplam sn, gözlem sn, bölüm sayısı)"""
+        simulation.reset(seed)
+        simulation.state = GAME_STATES['PLAYING']
+        episodes = 1
+        observing = 0.0
+        started = time.perf_counter()
+        for _ in range(frames):
+            if simulation.state != GAME_STATES['PLAYING']:
+                episodes += 1
+                simulation.reset(seed + episodes)
+                simulation.state = GAME_STATES['PLAYING']
+            if reference_flap(simulation):
+                simulation.flap()
+            simulation.step()
+            begin = time.perf_counter()
+            observe()
+            observing += time.perf_counter() - begin
+        return time.perf_counter() - started, observing, episodes
+
+    total, observing, episodes = play(lambda: observer.observe(simulation))
+
+    legacy_frames = np.zeros_like(observer.frames)
+    background = Background()
+
+    def legacy():
+        nonlocal legacy_frames
+        background.update()
+        background.draw(display)
+        simulation.draw_playfield(display)
+        pygame.display.flip()
+        legacy_frames = legacy_observation(display, legacy_frames, size)
+
+    legacy_total, legacy_observing, _ = play(legacy)
+
+    print(f"   {frames} kare, {episodes} bölüm")
+    print(f"   Gözlem hattı: {frames / total:.0f} kare/sn (adım + gözlem), "
+          f"gözlem {observing / frames * 1e6:.0f} µs/kare")
+    print(f"   Ekran okuma:  {frames / legacy_total:.0f} kare/sn (adım + gözlem), "
+          f"gözlem {legacy_observing / frames * 1e6:.0f} µs/kare "
+          f"({legacy_observing / observing:.1f}x daha yavaş)")
+
+    if save:
+        # Yığını eskiden yeniye yan yana tek bir gri PNG'ye yaz
+        strip = np.concatenate([observer.stacked()[:, :, i] for i in range(stack)], axis=1)
+        rgb = np.repeat(strip.T[:, :, None], 3, axis=2)
+        pygame.image.save(pygame.surfarray.make_surface(rgb), save)
+        print(f"💾 Son yığın kaydedildi: {save}")
+
+
+def main():
+    """Komut satırı girişi - ekransız gözlem hattı ölçümü"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Piksel Gözlem Hattı')
+    parser.add_argument('--frames', type=int, default=FPS * 60,
+                        help='Ölçülecek kare sayısı')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--size', type=int, nargs=2, default=list(OBSERVATION_SIZE),
+                        metavar=('GENİŞLİK', 'YÜKSEKLİK'), help='Küçültülmüş kare boyutu')
+    parser.add_argument('--stack', type=int, default=OBSERVATION_STACK,
+                        help='Yığındaki kare sayısı')
+    parser.add_argument('--save', help='Son yığını PNG olarak kaydet')
+    args = parser.parse_args()
+    run_benchmark(args.frames, args.seed, tuple(args.size), args.stack, args.save)
+
+
+if __name__ == '__main__':
+    main()
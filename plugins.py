@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Oyun Eklentileri
+İsteğe bağlı alt sistemler (zaman çizelgesi, profil, kare yakalama, ısı
+haritası, koşu arşivi, hayaletler, geri sarma, seyirci yayını) Game'e
+GamePlugin olarak takılır. Game her alt sistem için ayrı bayrak ve
+`if ... is not None` denetimi tutmak yerine kancaları takılma sırasıyla
+çağırır (kare sonu ve kapanış kancaları ters sırayla).
+
+Kancalar:
+    begin_frame / end_frame   kare işinin başı / sonu (uykudan önce)
+    on_frame                  oynanan her adımdan sonra (ölüm karesi dahil)
+    on_finish                 koşu bitince, koşu başına bir kez
+    on_reset                  yeni koşu başlarken
+    draw_backdrop             arkaplanın üstüne, oyun nesnelerinin altına
+    draw_field                engellerin üstüne, zeminin ve kuşun altına
+    draw_overlay              ekran yazılarının üstüne
+    on_present                display.flip'ten sonra (ekranın son hâli)
+    close                     oyun kapanırken ya da eklenti çıkarılırken
+
+Eklentiler yalnızca ezdikleri kancalarda çağrılır. NumPy ya da cProfile
+isteyen modüller eklenti kurulurken içe aktarılır; bu modül yalnızca
+pygame ve timeline'a dayanır (web derlemesi güvenli).
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+from config import *
+import timeline
+
+# Ters sırayla çağrılan kancalar (önce takılan en son kapanır)
+HOOKS = ('begin_frame', 'on_frame', 'on_finish', 'on_reset', 'draw_backdrop', 'draw_field',
+         'draw_overlay', 'on_present', 'end_frame', 'close')
+REVERSED_HOOKS = ('end_frame', 'close')
+
+# Zaman çizelgesinde kancanın aralık öneki (olmayanlar aralıksız çağrılır)
+SPAN_PREFIXES = {'on_frame': 'update', 'on_finish': 'finish', 'draw_backdrop': 'draw',
+                 'draw_field': 'draw', 'draw_overlay': 'draw', 'on_present': 'draw'}
+
+Hook = Tuple[Optional[str], Callable]
+
+
+class GamePlugin:
+    """Game'e takılan isteğe bağlı alt sistem - varsayılan kancalar bir şey yapmaz"""
+
+    name = 'plugin'  # Zaman çizelgesi aralık adı (update.<name>, draw.<name>)
+
+    def begin_frame(self, game):
+        """Kare işi başlıyor"""
+
+    def on_frame(self, game):
+        """Oynanan bir adım bitti"""
+
+    def on_finish(self, game):
+        """Koşu bitti (koşu başına bir kez)"""
+
+    def on_reset(self, game):
+        """Yeni koşu başlıyor"""
+
+    def draw_backdrop(self, game, surface: pygame.Surface):
+        """Arkaplanın üstüne çizer"""
+
+    def draw_field(self, game, surface: pygame.Surface):
+        """Boru ve engellerin üstüne, zemin ve kuşun altına çizer"""
+
+    def draw_overlay(self, game, surface: pygame.Surface):
+        """Ekran yazılarının üstüne çizer"""
+
+    def on_present(self, game, screen: pygame.Surface):
+        """Kare ekrana verildi"""
+
+    def end_frame(self, game):
+        """Kare işi bitti"""
+
+    def close(self, game):
+        """Eklenti kapanıyor (bekleyen kayıtlar burada tamamlanır)"""
+
+
+def plugin_hooks(plugins: Sequence[GamePlugin]) -> Dict[str, List[Hook]]:
+    """Her kanca için onu ezen eklentilerin (aralık adı, bağlı metot) listesi"""
+    hooks: Dict[str, List[Hook]] = {}
+    for hook in HOOKS:
+        ordered = reversed(plugins) if hook in REVERSED_HOOKS else plugins
+        prefix = SPAN_PREFIXES.get(hook)
+        hooks[hook] = [(prefix and f"{prefix}.{plugin.name}", getattr(plugin, hook))
+                       for plugin in ordered
+                       if getattr(type(plugin), hook) is not getattr(GamePlugin, hook)]
+    return hooks
+
+
+class TracePlugin(GamePlugin):
+    """Zaman çizelgesi izleyici (F8 döküm, çıkışta son pencere)"""
+
+    name = 'trace'
+
+    def __init__(self, tracer: timeline.Timeline):
+        """tracer: timeline.start ile etkinleştirilmiş izleyici"""
+        self.tracer = tracer
+
+    def begin_frame(self, game):
+        self.tracer.begin_frame()
+
+    def end_frame(self, game):
+        self.tracer.end_frame(game.state, game.score)
+
+    def close(self, game):
+        self.tracer.dump('cikis')
+        timeline.stop()
+
+
+class ProfilerPlugin(GamePlugin):
+    """İstek üzerine kare profili (F10, main.py'de SIGUSR1)"""
+
+    name = 'profiler'
+
+    def __init__(self, frames: int = PROFILE_FRAMES):
+        """Profil yakalayıcıyı kurar"""
+        from profiler import FrameProfiler  # cProfile yalnızca profil istenince gerekir
+        self.profiler = FrameProfiler(frames)
+
+    def begin_frame(self, game):
+        self.profiler.begin_frame(game)
+
+    def end_frame(self, game):
+        self.profiler.end_frame(game)
+
+    def close(self, game):
+        self.profiler.restore_signal()
+
+
+class CapturePlugin(GamePlugin):
+    """Arka planda kare kaydı (F12 ile açılır/kapanır)"""
+
+    name = 'capture'
+
+    def __init__(self, target: Optional[str] = None, image_format: str = 'png'):
+        """Kaydı başlatır (hedef yoksa zaman damgalı klasör/dosya)"""
+        from capture import FrameCapture, default_target
+        self.capture = FrameCapture(target or default_target(image_format), image_format)
+        print(f"🎥 Kare kaydı başladı: {self.capture.target}")
+
+    def on_present(self, game, screen: pygame.Surface):
+        self.capture.capture(screen)
+
+    def close(self, game):
+        """Bekleyen kareleri yazıp kaydı kapatır ve özetini yazdırır"""
+        self.capture.close()
+        print(self.capture.report())
+
+
+class HeatmapPlugin(GamePlugin):
+    """Ölüm ısı haritası: arkaplanın üzerine çizilir, bu oturumun ölümleri eklenir"""
+
+    name = 'heatmap'
+
+    def __init__(self, path: str = HEATMAP_FILE):
+        """Kayıtlı ısı haritasını yükler (yoksa boş başlar)"""
+        import os
+        from heatmap import DeathHeatmap, HeatmapOverlay  # NumPy yalnızca bu modda gerekir
+        self.path = path
+        self.heatmap = DeathHeatmap.load(path) if os.path.exists(path) else DeathHeatmap()
+        self.overlay = HeatmapOverlay(self.heatmap)
+        self.dirty = False
+
+    def on_finish(self, game):
+        """Ölümü ısı haritasına ekler; katman sonraki çizimde güncellenir"""
+        from heatmap import death_record
+        self.heatmap.add(death_record(game))
+        self.heatmap.flush()
+        self.overlay.invalidate()
+        self.dirty = True
+
+    def draw_backdrop(self, game, surface: pygame.Surface):
+        self.overlay.draw(surface)
+
+    def close(self, game):
+        """Bu oturumda ölüm eklendiyse ısı haritasını diske yazar"""
+        if self.dirty:
+            self.dirty = False
+            self.heatmap.save(self.path)
+
+
+class ArchivePlugin(GamePlugin):
+    """Koşu arşivi: biten her koşu seed ve flap kareleriyle bloklar halinde eklenir"""
+
+    name = 'archive'
+
+    def __init__(self, directory: str = RUN_ARCHIVE_DIR):
+        """Arşiv yazıcısını açar"""
+        from archive import RunArchiveWriter  # NumPy yalnızca bu modda gerekir
+        self.writer = RunArchiveWriter(directory, RUN_ARCHIVE_GAME_BLOCK)
+
+    def on_finish(self, game):
+        self.writer.append(game.run_seed, game.score, game.frame, game.death_cause,
+                           game.run_flaps)
+
+    def close(self, game):
+        self.writer.close()
+
+
+class GhostPlugin(GamePlugin):
+    """Hayalet yarışı: kuşun yolu kaydedilir, her koşu yeni bir hayalet olur"""
+
+    name = 'ghosts'
+
+    def __init__(self):
+        """Kayıtlı hayaletleri yükler"""
+        from ghost import GhostLayer  # NumPy yalnızca bu modda gerekir
+        self.layer = GhostLayer.load()
+        self.track: List[int] = []
+
+    def on_reset(self, game):
+        self.track = [int(game.bird.y)]
+
+    def on_frame(self, game):
+        """Kuşun konumunu karesine yazar (geri sarılıp sürdürülünce sonraki kareler atılır)"""
+        del self.track[game.frame:]
+        self.track.append(int(game.bird.y))
+
+    def on_finish(self, game):
+        """Koşuyu hayalet olarak ekler; dosya bir iş parçacığında yazılır"""
+        self.layer.add(self.track, time.strftime('%Y-%m-%d %H:%M'))
+        self.layer.trim()
+        self.layer.save_in_background()
+
+    def draw_field(self, game, surface: pygame.Surface):
+        self.layer.draw(surface, game.frame)
+
+    def close(self, game):
+        self.layer.join()  # Son koşunun hayalet kaydı yarım kalmasın
+
+
+class RewindPlugin(GamePlugin):
+    """Geri sarma (F9): son saniyelerin kareleri halkada, oyun bitince dışa aktarılır"""
+
+    name = 'rewind'
+
+    def __init__(self, layers: int = 0):
+        """Halkayı ayırır (layers: kayan arkaplan katmanı sayısı)"""
+        from rewind import RewindBuffer  # NumPy yalnızca bu modda gerekir
+        self.buffer = RewindBuffer(layers=layers)
+
+    def on_frame(self, game):
+        self.buffer.record(game)
+
+    def on_reset(self, game):
+        self.buffer.clear()
+
+    def on_finish(self, game):
+        """Biten koşunun son saniyelerini geri sarma klasörüne yazar (iş parçacığında)"""
+        path = self.buffer.export_in_background()
+        print(f"⏪ Son {len(self.buffer) / FPS:.1f} s kaydediliyor: {path}")
+
+    def draw_overlay(self, game, surface: pygame.Surface):
+        """Geri sarmada halkadaki konumu ve gösterilen kareyi çizer"""
+        cursor = game.rewind_cursor
+        if cursor is None:
+            return
+        count = len(self.buffer)
+        bar = pygame.Rect(10, SCREEN_HEIGHT - GROUND_HEIGHT - 40, SCREEN_WIDTH - 20, 6)
+        pygame.draw.rect(surface, COLORS['BLACK'], bar)
+        filled = bar.width * (count - cursor) // max(1, count)
+        pygame.draw.rect(surface, COLORS['WHITE'], (bar.x, bar.y, filled, bar.height))
+
+        label = f"GERI SARMA -{cursor / FPS:.2f} s  kare {game.frame}"
+        text = game.menu_text_font.render(label, True, COLORS['WHITE'])
+        surface.blit(text, text.get_rect(midbottom=(SCREEN_WIDTH // 2, bar.y - 4)))
+
+    def close(self, game):
+        self.buffer.join()
+
+
+class SpectatorPlugin(GamePlugin):
+    """Seyirci yayını: her adımdan sonra durum spectator.SpectatorBroadcaster ile yayınlanır"""
+
+    name = 'spectator'
+
+    def __init__(self, broadcaster):
+        self.broadcaster = broadcaster
+
+    def on_frame(self, game):
+        self.broadcaster.publish(game)
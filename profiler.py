@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - İstek Üzerine Profil Yakalama
+Bütün oturumu profillemek ilginç oyun karelerini menü karelerinde boğar;
+kabinlerde dışarıdan profilleyici bağlamak da mümkün değildir. Oyunda F10
+(ya da ekransız çalışan bir oyuna SIGUSR1 sinyali) sıradaki PROFILE_FRAMES
+oynanan kareyi cProfile altında yakalar. Yalnızca kare işi (olaylar,
+güncelleme, çizim) profillenir; clock.tick uykusu ve boştaki menü beklemesi
+dışarıda kalır.
+
+Yakalama bitince PROFILE_DIR altına iki dosya yazılır; adları oyun durumu,
+skor ve FPS ile etiketlenir:
+  .pstats      python -m pstats / snakeviz ile incelenir
+  .collapsed   flamegraph.pl / speedscope için katlanmış yığınlar (µs)
+Katlanmış yığınlar cProfile'ın çağıran→çağrılan kenarlarından kurulur: bir
+fonksiyonun süresi çağıranlarına kenar sürelerine oranla dağıtılır. Ortak
+timeline.traced sarmalayıcısı yığına girmez; her çağıran kendi sarılan
+fonksiyonuna (__wrapped__) bağlanır.
+"""
+
+import argparse
+import cProfile
+import gc
+import glob
+import os
+import pstats
+import signal
+import threading
+import time
+import types
+from typing import Dict, List, Optional, Tuple
+
+import timeline
+from config import *
+
+FunctionKey = Tuple[str, int, str]
+
+
+def _code_key(code) -> FunctionKey:
+    """Kod nesnesinin cProfile anahtarı (dosya, ilk satır, ad)"""
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+# timeline.traced sarmalayıcıları tek bir kod nesnesini paylaşır; cProfile hepsini tek
+# düğümde toplar. Katlanmış yığınlarda bu düğüm atlanır, sarılan fonksiyonlar çağırana bağlanır.
+TRACED_WRAPPERS = frozenset({_code_key(timeline.traced('')(_code_key).__code__)})
+
+
+def _traced_routes(table: dict) -> Dict[Optional[FunctionKey], List[FunctionKey]]:
+    """Sarmalayıcıyı çağıran her fonksiyon için sarmalayıcı üzerinden çağırdığı fonksiyonlar
+
+    Süreçteki fonksiyonlar taranır: __wrapped__ ile sarılan fonksiyonlar bulunur,
+    çağıranın kodunda adı geçenler (önce aynı sınıftakiler) o çağırana bağlanır.
+    Anahtar None: profil dışından (kökten) gelen çağrılar. Fonksiyonları bu süreçte
+    olmayan profillerde (dosyadan dönüştürme) yol bulunamaz, süre oranla dağıtılır.
+    """
+    functions: Dict[FunctionKey, types.FunctionType] = {}
+    targets: Dict[FunctionKey, str] = {}  # sarılan fonksiyon -> qualname
+    for obj in gc.get_objects():
+        if not isinstance(obj, types.FunctionType):
+            continue
+        key = _code_key(obj.__code__)
+        if key in table:
+            functions[key] = obj
+        if key in TRACED_WRAPPERS and hasattr(obj, '__wrapped__'):
+            wrapped = obj.__wrapped__
+            targets[_code_key(wrapped.__code__)] = wrapped.__qualname__
+
+    routes: Dict[Optional[FunctionKey], List[FunctionKey]] = {}
+    claimed = set()
+    for wrapper in TRACED_WRAPPERS & table.keys():
+        for caller in table[wrapper][4]:
+            function = functions.get(caller)
+            if function is None:
+                continue
+            owner = function.__qualname__.rpartition('.')[0]
+            named = [target for target in targets
+                     if target in table and target[2] in function.__code__.co_names]
+            chosen = [target for target in named
+                      if targets[target].rpartition('.')[0] == owner] or named
+            if chosen:
+                routes[caller] = chosen
+                claimed.update(chosen)
+    routes[None] = [target for target in targets if target in table and target not in claimed]
+    return routes
+
+
+def _label(function: FunctionKey) -> str:
+    """Yığın satırında fonksiyon adı (modül:fonksiyon)"""
+    filename, line, name = function
+    if function in TRACED_WRAPPERS:
+        return 'timeline:traced'
+    if filename == '~':
+        return name.strip('<>').replace(' ', '_')  # Yerleşik fonksiyonlar
+    module = os.path.splitext(os.path.basename(filename))[0]
+    return f"{module}:{name}"
+
+
+def collapsed_stacks(stats: pstats.Stats, min_us: float = 1.0, max_depth: int = 64) -> List[str]:
+    """cProfile istatistiklerinden 'a;b;c süre_µs' satırları üretir"""
+    table = stats.stats
+    callees: Dict[FunctionKey, List[FunctionKey]] = {}
+    for function, (_, _, _, _, callers) in table.items():
+        for caller in callers:
+            callees.setdefault(caller, []).append(function)
+    # Kök: çağıranı profilde olmayan süre (yakalama, çağıranları zaten çalışırken açılır)
+    roots = []
+    for function, (_, _, _, cumulative, callers) in table.items():
+        called = sum(edge[3] for caller, edge in callers.items() if caller in table)
+        if not callers or cumulative - called > 1e-6:
+            roots.append((function, (cumulative - called) / cumulative if cumulative > 0 else 1.0))
+
+    routes = _traced_routes(table)
+    wrapped = set().union(*routes.values())
+    totals: Dict[str, float] = {}
+
+    def wrapper_callees(wrapper: FunctionKey, path: List[FunctionKey], share: float):
+        """Sarmalayıcının bu yoldaki çağrılanları ve payları (çağırana ait fonksiyonlar)"""
+        edges = {callee: table[callee][4][wrapper][3] for callee in callees.get(wrapper, ())}
+        selected = [callee for callee in routes.get(path[-1] if path else None, ())
+                    if callee in edges]
+        selected_total = sum(edges[callee] for callee in selected)
+        if selected_total <= 0:
+            # Yol bilinmiyor: tüm çağrılanlar kenar sürelerine oranla
+            return [(callee, share * edge) for callee, edge in edges.items()]
+        # Sarılan fonksiyonlara giden süre yalnızca bu çağıranın fonksiyonlarına dağıtılır;
+        # aralık kaydı gibi sarmalayıcının kendi çağrıları oranla kalır
+        wrapped_total = sum(edge for callee, edge in edges.items() if callee in wrapped)
+        result = [(callee, share * edge) for callee, edge in edges.items() if callee not in wrapped]
+        result.extend((callee, share * wrapped_total * edges[callee] / selected_total)
+                      for callee in selected)
+        return result
+
+    def walk(function: FunctionKey, stack: List[str], path: List[FunctionKey], share: float):
+        """share: fonksiyonun toplam süresinin bu yola düşen oranı"""
+        _, _, own, cumulative, _ = table[function]
+        # İzleme sarmalayıcısı yığına girmez: sarılan fonksiyonlar çağırana bağlanır (bir
+        # sarmalayıcının payı çağıranlarına oranla dağıtılır), kendi süresi çağırana yazılır
+        transparent = function in TRACED_WRAPPERS
+        if not transparent:
+            stack.append(_label(function))
+            path.append(function)
+        own_us = own * share * 1e6
+        if own_us >= min_us:
+            key = ';'.join(stack) or _label(function)
+            totals[key] = totals.get(key, 0.0) + own_us
+        if len(stack) < max_depth:
+            if transparent:
+                children = wrapper_callees(function, path, share)
+            else:
+                children = [(callee, share * table[callee][4][function][3])
+                            for callee in callees.get(function, ())]
+            for callee, path_cumulative in children:
+                if callee in path:
+                    continue  # Özyineleme: süre zaten üst çağrıda sayıldı
+                callee_cumulative = table[callee][3]
+                if callee_cumulative <= 0:
+                    continue
+                child_share = path_cumulative / callee_cumulative
+                if path_cumulative * 1e6 >= min_us:
+                    walk(callee, stack, path, child_share)
+        if not transparent:
+            stack.pop()
+            path.pop()
+
+    for root, share in roots:
+        walk(root, [], [], min(1.0, share))
+    return [f"{stack} {round(us)}" for stack, us in sorted(totals.items()) if round(us) > 0]
+
+
+class FrameProfiler:
+    """İstendiğinde sıradaki N kareyi cProfile ile yakalar"""
+
+    def __init__(self, frames: int = PROFILE_FRAMES, directory: str = PROFILE_DIR):
+        """Profilleyici hazır bekler; request() ile kurulur"""
+        self.frames = frames
+        self.directory = directory
+        self.requested = False
+        self.remaining = 0
+        self._profile: Optional[cProfile.Profile] = None
+        self._states: Dict[str, int] = {}
+        self._score_start = 0
+        self._signal: Optional[tuple] = None  # (sinyal, önceki işleyici)
+        self.captures: List[str] = []
+
+    @property
+    def active(self) -> bool:
+        """Yakalama sürüyor mu"""
+        return self._profile is not None
+
+    def request(self):
+        """Sıradaki oynanan karede yakalamayı başlatır (sinyal işleyicisinden de güvenli)"""
+        if not self.active:
+            self.requested = True
+
+    def install_signal(self, signum: Optional[int] = None) -> bool:
+        """Sinyal (varsayılan SIGUSR1) gelince yakalama ister; kurulamadıysa False
+
+        Süreç genelindeki işleyiciyi değiştirir; yalnızca oyunun giriş noktası
+        (main.py) çağırır, restore_signal önceki işleyiciyi geri koyar.
+        """
+        signum = signum if signum is not None else getattr(signal, 'SIGUSR1', None)
+        if signum is None or threading.current_thread() is not threading.main_thread():
+            return False
+        self.restore_signal()
+        previous = signal.signal(signum, self._on_signal)
+        self._signal = (signum, previous)
+        return True
+
+    def restore_signal(self):
+        """install_signal öncesindeki işleyiciyi geri yükler"""
+        if self._signal is None or threading.current_thread() is not threading.main_thread():
+            return
+        signum, previous = self._signal
+        self._signal = None
+        signal.signal(signum, previous if previous is not None else signal.SIG_DFL)
+
+    def _on_signal(self, signum, frame):
+        """Sinyal işleyicisi"""
+        self.request()
+
+    def begin_frame(self, game):
+        """Kare işi başlıyor: istek varsa yakalamayı açar"""
+        if self.requested and self._profile is None:
+            self.requested = False
+            self.remaining = self.frames
+            self._states = {}
+            self._score_start = game.score
+            self._profile = cProfile.Profile()
+            print(f"🔬 Profil yakalama başladı: sıradaki {self.frames} kare")
+        if self._profile is not None:
+            self._profile.enable()
+
+    def end_frame(self, game):
+        """Kare işi bitti: profili durdurur; N kare dolunca dosyaları yazar"""
+        if self._profile is None:
+            return
+        self._profile.disable()
+        self._states[game.state] = self._states.get(game.state, 0) + 1
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self._finish(game)
+
+    def _finish(self, game):
+        """Yakalanan profili etiketli .pstats ve .collapsed dosyalarına yazar"""
+        profile, self._profile = self._profile, None
+        fps = game.clock.get_fps()
+        state = max(self._states, key=self._states.get)  # Karelerin çoğunun durumu
+        name = (f"{time.strftime('%Y%m%d-%H%M%S')}-{state}-skor{self._score_start}-{game.score}"
+                f"-{fps:.0f}fps")
+        base = os.path.join(self.directory, name)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            stats = pstats.Stats(profile)
+            stats.dump_stats(f"{base}.pstats")
+            with open(f"{base}.collapsed", 'w', encoding='utf-8') as f:
+                f.write('\n'.join(collapsed_stacks(stats)) + '\n')
+        except OSError as e:
+            print(f"Uyarı: Profil yazılamadı ({e})")
+            return
+        for stale in sorted(glob.glob(os.path.join(self.directory, '*.pstats')),
+                            key=os.path.getmtime)[:-PROFILE_KEEP]:
+            os.remove(stale)
+            collapsed = os.path.splitext(stale)[0] + '.collapsed'
+            if os.path.exists(collapsed):
+                os.remove(collapsed)
+        self.captures.append(base)
+        states = ', '.join(f"{state_name} {count}" for state_name, count in self._states.items())
+        print(f"🔬 {self.frames} kare profillendi ({states}; {fps:.0f} FPS) -> "
+              f"{base}.pstats / .collapsed")
+
+
+def run_headless(frames: int, delay: float):
+    """Otopilotlu oyunu Game.run ile ekransız çalıştırır; 'delay' saniye sonra kendine SIGUSR1 gönderir"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    import pygame
+    from autopilot import Autopilot
+    from replay import _create_game
+
+    game = _create_game()
+    game.autopilot = Autopilot()
+    profiler = game.frame_profiler()
+    profiler.frames = frames
+    profiler.install_signal()
+
+    def trigger():
+        """Bekler, profil ister ve yakalama bitince oyundan çıkar"""
+        time.sleep(delay)
+        if hasattr(signal, 'SIGUSR1'):
+            os.kill(os.getpid(), signal.SIGUSR1)
+        else:
+            profiler.request()
+        deadline = time.perf_counter() + frames / FPS * 4 + 10
+        while not profiler.captures and time.perf_counter() < deadline:
+            time.sleep(0.1)
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    threading.Thread(target=trigger, daemon=True).start()
+    game.run()
+    if not profiler.captures:
+        print("Profil yakalanamadı")
+
+
+def main():
+    """Komut satırı girişi - çalışan oyuna sinyal, .pstats dönüştürme ya da ekransız deneme"""
+    parser = argparse.ArgumentParser(description='Flappy Bird İstek Üzerine Profil Yakalama')
+    parser.add_argument('stats', nargs='*',
+                        help='.pstats dosyaları: yanlarına .collapsed yazılır')
+    parser.add_argument('--pid', type=int, help='Bu süreçteki oyuna SIGUSR1 gönder')
+    parser.add_argument('--frames', type=int, default=PROFILE_FRAMES,
+                        help='Ekransız denemede profillenecek kare sayısı')
+    parser.add_argument('--delay', type=float, default=2.0,
+                        help='Ekransız denemede yakalamadan önce oynanan süre (saniye)')
+    args = parser.parse_args()
+
+    if args.pid:
+        os.kill(args.pid, signal.SIGUSR1)
+        print(f"🔬 {args.pid} sürecine profil isteği gönderildi")
+    elif args.stats:
+        import game  # İzlenen fonksiyonlar yüklensin: sarmalayıcı yolları ayrılabilsin
+        for path in args.stats:
+            target = os.path.splitext(path)[0] + '.collapsed'
+            with open(target, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(collapsed_stacks(pstats.Stats(path))) + '\n')
+            print(f"🔬 {path} -> {target}")
+    else:
+        run_headless(args.frames, args.delay)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Paralel Çevrimdışı Tekrar Çizici
+Bir seed ve flap kareleri listesinden koşunun tüm kare dizisini, oyunun
+gerçek Game.draw koduyla SDL dummy sürücüsü altında (pencere açmadan) çizer.
+Ekran kaydı gibi gerçek zamanı beklemez.
+
+Koşunun uzunluğu önce analitik ileri sarmayla (fastforward.py) bulunur ve
+kareler REPLAY_CHUNK_FRAMES uzunluğunda parçalara bölünür. Her parça bir
+süreç havuzu işçisinde çizilir: işçi oyunu seed ile baştan kurar, parçanın
+ilk karesine kadar çizmeden simüle eder (Game.update; fizik, skor ve kayan
+arkaplan aynen ilerler), sonra parçayı çizer. Simülasyon deterministik
+olduğundan her parça tek süreçte baştan çizilmiş diziyle birebir aynıdır.
+
+Çıktı capture.py biçimleridir: PNG dizisinde her işçi kareyi kendi sıra
+numarasıyla yazar; ham RGB akışında işçiler parça dosyaları yazar, ana süreç
+bunları parça sırasıyla hedef dosyaya (ya da bir kodlayıcının borusuna) ekler.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+from config import *
+from capture import CAPTURE_FORMATS
+
+# İşçi süreçteki oyun (havuz başlatıcısında bir kez kurulur)
+_worker_game = None
+
+
+class Chunk(NamedTuple):
+    """Çizilecek kare aralığı [start, stop) ve çıktı yolu"""
+    index: int
+    start: int
+    stop: int
+    target: str
+
+
+def _create_game():
+    """Ekransız, sessiz ve yüksek skor dosyasına dokunmayan bir Game kurar"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from game import Game
+
+    class ReplayGame(Game):
+        """Tekrar için Game: yüksek skor koşu içinde tutulur, ses çalınmaz"""
+
+        def _load_high_score(self) -> int:
+            return 0
+
+        def _request_high_score_save(self):
+            pass
+
+    game = ReplayGame()  # Tekrarlar ömür boyu sayaçlara eklenmez (varsayılan kapalı)
+    game.sound_manager.enabled = False
+    return game
+
+
+def _init_worker():
+    """Havuz başlatıcısı: işçi başına bir oyun ve görüntü modu"""
+    global _worker_game
+    _worker_game = _create_game()
+
+
+def _play_frame(game, flaps: set):
+    """Tek kare: flap karesiyse zıplatır ve oyunu bir adım günceller"""
+    if game.state == GAME_STATES['PLAYING'] and game.frame in flaps:
+        game.flap()
+    game.update()
+
+
+def render_chunk(seed: int, flaps: List[int], chunk: Chunk, capture_format: str,
+                 game=None) -> Tuple[int, float, float]:
+    """Parçanın başına kadar simüle edip kareleri çizer; (parça, simülasyon sn, çizim sn)"""
+    import pygame
+    from game import Background, Ground
+    game = game if game is not None else _worker_game
+    flap_frames = set(flaps)
+    game.reset(seed)
+    # reset() zemini ve arkaplanı sıfırlamaz (oyunda yeniden başlarken kayma sürer);
+    # işçi önceki parçadan kalan kaymayla başlamasın
+    game.ground = Ground()
+    game.background = Background()
+
+    started = time.perf_counter()
+    for _ in range(chunk.start):
+        _play_frame(game, flap_frames)
+    simulated = time.perf_counter() - started
+
+    started = time.perf_counter()
+    stream = open(chunk.target, 'wb') if capture_format == 'raw' else None
+    try:
+        for index in range(chunk.start, chunk.stop):
+            _play_frame(game, flap_frames)
+            game.draw()
+            if stream is not None:
+                stream.write(pygame.image.tobytes(game.screen, 'RGB'))
+            else:
+                pygame.image.save(game.screen, os.path.join(chunk.target, f"frame_{index:06d}.png"))
+    finally:
+        if stream is not None:
+            stream.close()
+    return chunk.index, simulated, time.perf_counter() - started
+
+
+def _render_chunk_task(task: tuple) -> Tuple[int, float, float]:
+    """Havuz görevi (işçinin kendi oyunuyla)"""
+    seed, flaps, chunk, capture_format = task
+    return render_chunk(seed, flaps, chunk, capture_format)
+
+
+def run_length(seed: int, flaps: List[int], max_frames: int) -> int:
+    """Koşunun çizilecek kare sayısı: ölüm karesi (analitik) + oyun bitti ekranı"""
+    from fastforward import fast_forward
+    outcome = fast_forward(seed, flaps, max_frames)
+    tail = REPLAY_TAIL_FRAMES if outcome.cause is not None else 0
+    return outcome.frame + tail
+
+
+def plan_chunks(frames: int, chunk_frames: int, capture_format: str, target: str) -> List[Chunk]:
+    """Kare aralığını parçalara böler (ham akışta her parçanın kendi dosyası)"""
+    chunks = []
+    for index, start in enumerate(range(0, frames, chunk_frames)):
+        stop = min(frames, start + chunk_frames)
+        path = target if capture_format == 'png' else f"{target}.part{index:04d}"
+        chunks.append(Chunk(index, start, stop, path))
+    return chunks
+
+
+def render_replay(seed: int, flaps: List[int], target: str, capture_format: str = 'png',
+                  workers: Optional[int] = None, chunk_frames: int = REPLAY_CHUNK_FRAMES,
+                  max_frames: int = REPLAY_MAX_FRAMES) -> dict:
+    """Koşuyu süreç havuzunda parça parça çizer; kareler hedefe sırayla yazılır
+
+    workers=0 havuz kurmadan bu süreçte çizer (karşılaştırma için).
+    """
+    if capture_format not in CAPTURE_FORMATS:
+        raise ValueError(f"Bilinmeyen çıktı biçimi: {capture_format}")
+    frames = run_length(seed, flaps, max_frames)
+    chunks = plan_chunks(frames, chunk_frames, capture_format, target)
+    tasks = [(seed, flaps, chunk, capture_format) for chunk in chunks]
+    if capture_format == 'png':
+        os.makedirs(target, exist_ok=True)
+
+    stats = {'frames': frames, 'chunks': len(chunks), 'simulate': 0.0, 'draw': 0.0}
+    started = time.perf_counter()
+    if workers == 0:
+        game = _create_game()
+        results = (render_chunk(*task, game=game) for task in tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers or os.cpu_count(), initializer=_init_worker)
+        results = pool.imap(_render_chunk_task, tasks)  # Sonuçlar parça sırasıyla gelir
+
+    output = open(target, 'wb') if capture_format == 'raw' else None
+    try:
+        for index, simulated, drawn in results:
+            stats['simulate'] += simulated
+            stats['draw'] += drawn
+            if output is not None:
+                # Parçayı sırası gelince hedefe ekle ve sil
+                with open(chunks[index].target, 'rb') as part:
+                    shutil.copyfileobj(part, output)
+                os.remove(chunks[index].target)
+    finally:
+        if output is not None:
+            output.close()
+        if pool is not None:
+            pool.close()
+            pool.join()
+    stats['seconds'] = time.perf_counter() - started
+    return stats
+
+
+def load_run(path: str, index: int) -> Tuple[int, List[int]]:
+    """Koşu dosyasından (fastforward.py --save, JSON satırları) seed ve flap'leri okur"""
+    with open(path, 'r', encoding='utf-8') as f:
+        runs = [json.loads(line) for line in f if line.strip()]
+    run = runs[index]
+    return run['seed'], run['flaps']
+
+
+def default_target(capture_format: str, seed: int) -> str:
+    """Varsayılan hedef: kayıt klasöründe seed adlı klasör ya da ham dosya"""
+    name = f"replay-{seed}"
+    if capture_format == 'raw':
+        name += f"-{SCREEN_WIDTH}x{SCREEN_HEIGHT}.rgb"
+    return os.path.join(CAPTURE_DIR, name)
+
+
+def main():
+    """Komut satırı girişi - kayıtlı ya da botla oynanmış bir koşuyu çiz"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Paralel Tekrar Çizici')
+    parser.add_argument('--runs', default=None,
+                        help='Koşu dosyası (JSON satırları: seed, flaps); yoksa bot oynar')
+    parser.add_argument('--index', type=int, default=0,
+                        help='Koşu dosyasındaki satır')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='Bot koşusunun seed değeri (--runs yoksa)')
+    parser.add_argument('--frames', type=int, default=REPLAY_MAX_FRAMES,
+                        help='Çizilecek en fazla oyun karesi')
+    parser.add_argument('--format', choices=CAPTURE_FORMATS, default='png',
+                        help='PNG dizisi ya da ham RGB akışı')
+    parser.add_argument('--out', help='Hedef klasör (png) ya da dosya/boru (raw)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='İşçi süreç sayısı (varsayılan: çekirdek sayısı, 0: havuzsuz)')
+    parser.add_argument('--chunk', type=int, default=REPLAY_CHUNK_FRAMES,
+                        help='Parça başına kare')
+    args = parser.parse_args()
+
+    if args.runs:
+        seed, flaps = load_run(args.runs, args.index)
+    else:
+        from collision import record_runs
+        seed, flaps = record_runs(1, args.seed, args.frames)[0]
+    target = args.out or default_target(args.format, seed)
+
+    stats = render_replay(seed, flaps, target, args.format, args.workers, args.chunk, args.frames)
+    frames, seconds = stats['frames'], stats['seconds']
+    print(f"🎞️  seed {seed}: {frames} kare ({frames / FPS:.1f} s oyun), {stats['chunks']} parça "
+          f"-> {target}")
+    print(f"   {seconds:.2f} s ({frames / max(seconds, 1e-9):.0f} kare/sn, "
+          f"gerçek zamanın {frames / FPS / max(seconds, 1e-9):.1f}x hızı) | işçilerde "
+          f"çizim {stats['draw'] / max(1, frames) * 1e3:.2f} ms/kare, "
+          f"parça başına yeniden simülasyon ort. {stats['simulate'] / stats['chunks']:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Geri Sarma Tamponu
+Oyun (--rewind) son REWIND_SECONDS saniyenin her karesinin kompakt durumunu
+(GameSimulation.snapshot demeti ve arkaplan kayması) önceden ayrılmış bir
+halkaya yazar. Kayıt nesne kopyalamaz; demetler değişmez olduğundan yuvaya
+olduğu gibi konur (birkaç mikrosaniye).
+
+Oyunda F9 oyunu dondurur; ←/→ halkada bir kare (SHIFT ile bir saniye) geri /
+ileri gider ve her kare GameSimulation.restore ile birebir geri yüklenir.
+F9 ya da SPACE gösterilen kareden oyunu sürdürür (sonraki kareler atılır).
+Oyun bitince halka bir iş parçacığında sabit düzenli NumPy satırlarına
+(FRAME_DTYPE) çevrilip kronolojik sırayla REWIND_DIR altına .npz olarak yazılır;
+`python rewind.py DOSYA --frame N --image kare.png` bir kareyi yeniden çizer.
+"""
+
+import argparse
+import copy
+import glob
+import os
+import threading
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from config import *
+from collision import CAUSE_ORDER
+
+STATE_NAMES: List[str] = list(GAME_STATES.values())
+CAUSE_CODES = (None,) + CAUSE_ORDER
+
+FRAME_DTYPE = np.dtype([
+    ('frame', '<u4'),
+    ('score', '<u4'),
+    ('state', 'u1'),
+    ('cause', 'u1'),  # CAUSE_CODES sırası (0: ölüm yok)
+    ('pipes', 'u1'),
+    ('obstacles', 'u1'),
+    ('bird_animation', 'u1'),
+    ('bird_counter', '<u4'),
+    ('bird_y', '<f8'),
+    ('bird_velocity', '<f8'),
+    ('ground_offset', '<f8'),
+    ('spawn_timer', '<u4'),
+    ('spawned', '<u4'),
+    ('layout_seed', '<u4'),
+    ('pipe_x', '<f8', (REWIND_MAX_OBJECTS,)),
+    ('pipe_gap', '<i4', (REWIND_MAX_OBJECTS,)),
+    ('pipe_passed', 'u1', (REWIND_MAX_OBJECTS,)),
+    ('obstacle_x', '<f8', (REWIND_MAX_OBJECTS,)),
+    ('obstacle_y', '<i4', (REWIND_MAX_OBJECTS,)),
+], align=True)
+
+
+class RewindBuffer:
+    """Son karelerin durumlarını tutan sabit boyutlu halka"""
+
+    def __init__(self, capacity: int = REWIND_SECONDS * FPS, layers: int = 0):
+        """Halkayı ayırır (layers: kayan arkaplan katmanı sayısı)"""
+        self.capacity = capacity
+        self.layers = layers
+        # Yuvalar GameSimulation.snapshot demetlerini tutar: demetler değişmezdir ve
+        # iç içe durumları paylaşır (RNG durumu parkur değişene kadar tek nesne)
+        self._snapshots: List[Optional[tuple]] = [None] * capacity
+        self._background: List[tuple] = [()] * capacity
+        self.head = 0  # Sıradaki yazılacak yuva
+        self.count = 0
+        self.record_seconds = 0.0
+        self.records = 0
+        self._writer: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self):
+        """Halkayı boşaltır (yeni koşu)"""
+        self.head = 0
+        self.count = 0
+        self._snapshots = [None] * self.capacity
+
+    def record(self, game):
+        """Oyunun şu anki karesini sıradaki yuvaya yazar"""
+        started = time.perf_counter()
+        index = self.head
+        self._snapshots[index] = game.snapshot()
+        layers = game.background.scrolling_layers
+        if layers:
+            self._background[index] = tuple([layer.offset for layer in layers])
+
+        self.head = (index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        self.records += 1
+        self.record_seconds += time.perf_counter() - started
+
+    def _slot(self, back: int) -> int:
+        """En yeni kareden 'back' kare önceki yuvanın sırası"""
+        if not 0 <= back < self.count:
+            raise IndexError(f"Halkada {self.count} kare var: {back}")
+        return (self.head - 1 - back) % self.capacity
+
+    def snapshot(self, back: int) -> tuple:
+        """Kareyi GameSimulation.snapshot biçiminde döndürür"""
+        return self._snapshots[self._slot(back)]
+
+    def restore(self, game, back: int):
+        """Oyunu 'back' kare önceki duruma getirir (arkaplan kayması dahil)"""
+        game.restore(self.snapshot(back))
+        game.impact = None
+        for layer, offset in zip(game.background.scrolling_layers,
+                                 self._background[self._slot(back)]):
+            layer.offset = offset
+
+    def truncate(self, back: int):
+        """'back' kareden yeni kareleri atar; kayıt bu kareden sonra devam eder"""
+        index = self._slot(back)
+        self.head = (index + 1) % self.capacity
+        self.count -= back
+
+    def _order(self) -> List[int]:
+        """Dolu yuvaların eskiden yeniye sırası"""
+        return [(self.head - self.count + i) % self.capacity for i in range(self.count)]
+
+    def frames(self) -> np.ndarray:
+        """Kareleri eskiden yeniye sıralı FRAME_DTYPE dizisi olarak döndürür"""
+        return frames_array([self._snapshots[index] for index in self._order()])
+
+    def _export_path(self, directory: str) -> str:
+        """En yeni karenin skor ve kare numarasıyla adlandırılmış dışa aktarım yolu"""
+        last = self._snapshots[self._slot(0)]
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-skor{last[1]}-kare{last[0]}.npz"
+        return os.path.join(directory, name)
+
+    def export(self, directory: str = REWIND_DIR, keep: int = REWIND_EXPORT_KEEP) -> str:
+        """Halkayı kronolojik .npz olarak yazar; klasörde en yeni 'keep' dosya kalır"""
+        order = self._order()
+        path = self._export_path(directory)
+        write_export(path, [self._snapshots[index] for index in order],
+                     [self._background[index] for index in order], self.layers, keep)
+        return path
+
+    def export_in_background(self, directory: str = REWIND_DIR,
+                             keep: int = REWIND_EXPORT_KEEP) -> str:
+        """Dışa aktarımı bir iş parçacığına bırakır (oyun bitişi karesi sıkıştırmayı,
+        eski dosyaların taranıp silinmesini beklemez); yazılacak yolu döndürür
+
+        Yuvalardaki demetler değişmez; iş parçacığı o anki sıranın listesini alır.
+        """
+        self.join()
+        order = self._order()
+        path = self._export_path(directory)
+        args = (path, [self._snapshots[index] for index in order],
+                [self._background[index] for index in order], self.layers, keep)
+        self._writer = threading.Thread(target=_write_export_quietly, args=args,
+                                        name='rewind-export', daemon=True)
+        self._writer.start()
+        return path
+
+    def join(self):
+        """Süren dışa aktarımı bekler"""
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+
+    def report(self) -> str:
+        """Kayıt maliyeti özeti"""
+        average = self.record_seconds / self.records * 1e6 if self.records else 0.0
+        return (f"⏪ Geri sarma: {self.count}/{self.capacity} kare "
+                f"(dışa aktarımda {FRAME_DTYPE.itemsize * self.count // 1024} KB), "
+                f"kayıt ort. {average:.1f} µs/kare")
+
+
+def frame_row(snapshot: tuple) -> tuple:
+    """GameSimulation.snapshot demetini FRAME_DTYPE satırına çevirir"""
+    (frame, score, state, cause, ground_offset, bird_state, pipe_state, obstacle_state,
+     _, layout_seed) = snapshot
+    bird_y, bird_velocity, bird_animation, bird_counter = bird_state
+    spawn_timer, spawned, pipes = pipe_state
+    pipes = pipes[:REWIND_MAX_OBJECTS]
+    obstacles = obstacle_state[:REWIND_MAX_OBJECTS]
+    pipe_pad = [0] * (REWIND_MAX_OBJECTS - len(pipes))
+    obstacle_pad = [0] * (REWIND_MAX_OBJECTS - len(obstacles))
+    return (frame, score, STATE_NAMES.index(state), CAUSE_CODES.index(cause),
+            len(pipes), len(obstacles), bird_animation, bird_counter,
+            bird_y, bird_velocity, ground_offset, spawn_timer, spawned, layout_seed,
+            [pipe[0] for pipe in pipes] + pipe_pad, [pipe[1] for pipe in pipes] + pipe_pad,
+            [pipe[2] for pipe in pipes] + pipe_pad,
+            [obstacle[0] for obstacle in obstacles] + obstacle_pad,
+            [obstacle[1] for obstacle in obstacles] + obstacle_pad)
+
+
+def frames_array(snapshots: List[tuple]) -> np.ndarray:
+    """snapshot demetlerinden FRAME_DTYPE dizisi"""
+    return np.array([frame_row(snapshot) for snapshot in snapshots], dtype=FRAME_DTYPE)
+
+
+def write_export(path: str, snapshots: List[tuple], background: List[tuple], layers: int,
+                 keep: int = REWIND_EXPORT_KEEP):
+    """Kareleri .npz olarak yazar ve klasörde en yeni 'keep' dosyayı bırakır"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    offsets = np.zeros((len(background), layers))
+    for row, values in enumerate(background):
+        offsets[row, :len(values)] = values
+    np.savez_compressed(path, frames=frames_array(snapshots), background=offsets, fps=FPS)
+    for old in sorted(glob.glob(os.path.join(directory, '*.npz')), key=os.path.getmtime)[:-keep]:
+        os.remove(old)
+
+
+def _write_export_quietly(*args):
+    """Arka plan dışa aktarımı: hata oyunu durdurmaz, uyarı olarak yazılır"""
+    try:
+        write_export(*args)
+    except OSError as e:
+        print(f"Uyarı: Geri sarma tamponu yazılamadı ({e})")
+
+
+def frame_snapshot(row: np.ndarray, rng_state: tuple) -> tuple:
+    """Halka satırını GameSimulation.restore'un beklediği demete çevirir"""
+    pipes = int(row['pipes'])
+    obstacles = int(row['obstacles'])
+    pipe_states = tuple(zip(row['pipe_x'][:pipes].tolist(), row['pipe_gap'][:pipes].tolist(),
+                            [bool(passed) for passed in row['pipe_passed'][:pipes].tolist()]))
+    obstacle_states = tuple(zip(row['obstacle_x'][:obstacles].tolist(),
+                                row['obstacle_y'][:obstacles].tolist()))
+    return (int(row['frame']), int(row['score']), STATE_NAMES[int(row['state'])],
+            CAUSE_CODES[int(row['cause'])], float(row['ground_offset']),
+            (float(row['bird_y']), float(row['bird_velocity']),
+             int(row['bird_animation']), int(row['bird_counter'])),
+            (int(row['spawn_timer']), int(row['spawned']), pipe_states),
+            obstacle_states,
+            rng_state, int(row['layout_seed']))
+
+
+def load_export(path: str):
+    """Dışa aktarılmış halkayı (kareler, arkaplan kaymaları) okur"""
+    with np.load(path) as data:
+        return data['frames'], data['background']
+
+
+def render_frame(path: str, frame: Optional[int], image: str):
+    """Dışa aktarımdaki bir kareyi oyunun çizim koduyla PNG'ye çizer"""
+    import pygame
+    from replay import _create_game
+    frames, background = load_export(path)
+    index = len(frames) - 1 if frame is None else int(np.searchsorted(frames['frame'], frame))
+    index = min(index, len(frames) - 1)
+    game = _create_game()
+    game.restore(frame_snapshot(frames[index], game._rng_state()))
+    for layer, offset in zip(game.background.scrolling_layers, background[index].tolist()):
+        layer.offset = offset
+    game.draw()
+    pygame.image.save(game.screen, image)
+    print(f"🖼️  Kare {int(frames[index]['frame'])} (skor {int(frames[index]['score'])}) -> {image}")
+
+
+def summary(path: str) -> str:
+    """Dışa aktarımın okunabilir özeti"""
+    frames, _ = load_export(path)
+    first, last = frames[0], frames[-1]
+    cause = CAUSE_CODES[int(last['cause'])] or '-'
+    return (f"⏪ {os.path.basename(path)}: {len(frames)} kare "
+            f"({int(first['frame'])}-{int(last['frame'])}, {len(frames) / FPS:.1f} s), "
+            f"skor {int(first['score'])} -> {int(last['score'])}, ölüm: {cause}")
+
+
+def run_benchmark(frames: int):
+    """Kare kaydını nesne kopyalamayla ve GameSimulation.snapshot ile kıyaslar"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from replay import _create_game
+    game = _create_game()
+    game.state = GAME_STATES['PLAYING']
+    buffer = RewindBuffer(layers=len(game.background.scrolling_layers))
+
+    recorded = copied = snapshotted = 0.0
+    history = []
+    for _ in range(frames):
+        if game.state != GAME_STATES['PLAYING']:
+            game.reset()
+        if game.bird.y > SCREEN_HEIGHT // 2 and game.bird.velocity > 0:
+            game.flap()
+        game.update()
+
+        started = time.perf_counter()
+        buffer.record(game)
+        recorded += time.perf_counter() - started
+
+        started = time.perf_counter()
+        # Yüzeyler kopyalanamaz; nesneler (rect'leriyle) tek tek kopyalanır
+        history.append((copy.copy(game.bird),
+                        [copy.copy(pipe) for pipe in game.pipe_manager.pipes],
+                        [copy.copy(obstacle) for obstacle in game.obstacle_manager.obstacles]))
+        copied += time.perf_counter() - started
+        del history[:-buffer.capacity]
+
+        started = time.perf_counter()
+        game.snapshot()
+        snapshotted += time.perf_counter() - started
+
+    # Geri yükleme doğruluğu: ortadaki kareden aynı flap'lerle sürdürülen oyun
+    # kesintisiz oynanmış olanla aynı duruma varmalı
+    game.reset(1)
+    game.state = GAME_STATES['PLAYING']
+    buffer.clear()
+    flaps = set()
+    for _ in range(FPS * 3):
+        if game.state != GAME_STATES['PLAYING']:
+            break
+        if game.bird.y > SCREEN_HEIGHT // 2 and game.bird.velocity > 0:
+            flaps.add(game.frame)
+            game.flap()
+        game.update()
+        buffer.record(game)
+    expected = game.snapshot()
+    buffer.restore(game, len(buffer) // 2)
+    while game.frame < expected[0]:
+        if game.frame in flaps:
+            game.flap()
+        game.update()
+    exact = game.snapshot() == expected
+
+    print(buffer.report())
+    for label, seconds in (('halka kaydı', recorded), ('snapshot() demeti', snapshotted),
+                           ('nesne kopyası', copied)):
+        print(f"   {label:<18} {seconds / frames * 1e6:8.1f} µs/kare")
+    print(f"   geri yükleme {'birebir' if exact else 'FARKLI'}")
+
+
+def main():
+    """Komut satırı girişi - dışa aktarımı incele ya da kayıt maliyetini ölç"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Geri Sarma Tamponu')
+    parser.add_argument('exports', nargs='*',
+                        help='Dışa aktarılmış halkalar (varsayılan: klasördeki en yenisi)')
+    parser.add_argument('--frame', type=int, default=None,
+                        help='--image için oyun karesi (varsayılan: son kare)')
+    parser.add_argument('--image', help='Seçilen kareyi bu PNG dosyasına çiz')
+    parser.add_argument('--bench', type=int, default=0,
+                        help='N karelik kayıt maliyeti ölçümü')
+    args = parser.parse_args()
+
+    if args.bench:
+        run_benchmark(args.bench)
+        return
+    exports = args.exports or sorted(glob.glob(os.path.join(REWIND_DIR, '*.npz')),
+                                     key=os.path.getmtime)[-1:]
+    if not exports:
+        print(f"Henüz dışa aktarım yok: {REWIND_DIR}")
+        return
+    for path in exports:
+        print(summary(path))
+    if args.image:
+        render_frame(exports[-1], args.frame, args.image)
+
+
+if __name__ == '__main__':
+    main()
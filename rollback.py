@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Rollback Netcode
+İki oyunculu düellolar için geri sarmalı (rollback) ağ kodu. Her eş kendi
+girdisini hemen uygular, rakibin girdisini tahmin eder (flap yok) ve her kare
+için rakip simülasyonunun anlık görüntüsünü halka tampona yazar. Gerçek girdi
+geldiğinde tahminin yanlış olduğu ilk kareye geri dönülür ve o andan şimdiki
+kareye kadar yeniden simüle edilir.
+
+Girdi paketi (ağ bayt sırasında):
+    IL    son kare numarası + son ROLLBACK_INPUT_HISTORY karenin flap bit maskesi
+          (bit i = kare - i); her paket geçmişi taşıdığı için kayıp paketler
+          sonraki paketle telafi edilir
+"""
+
+import argparse
+import heapq
+import random
+import struct
+import time
+from typing import List, Optional, Tuple
+
+from autopilot import reference_flap
+from config import *
+from game import GameSimulation
+
+INPUT_FORMAT = struct.Struct('!IL')
+
+# Tahmin edilen rakip girdisi: flap anlık bir olay olduğu için "flap yok"
+PREDICTED_INPUT = False
+
+
+def step_simulation(simulation: GameSimulation, flap: bool):
+    """Simülasyonu verilen girdiyle bir kare ilerletir (ölü kuş donar)"""
+    if simulation.state != GAME_STATES['PLAYING']:
+        return
+    if flap:
+        simulation.flap()
+    simulation.step()
+
+
+class RollbackSession:
+    """Bir eşin düello oturumu - yerel ve rakip simülasyonu, girdi ve snapshot halkaları"""
+
+    def __init__(self, seed: int, local_index: int,
+                 max_rollback: int = ROLLBACK_MAX_FRAMES):
+        """Oturumu oluşturur (iki oyuncu da aynı seed ile aynı boruları görür)"""
+        self.local_index = local_index
+        self.remote_index = 1 - local_index
+        self.max_rollback = max_rollback
+        self.simulations = [GameSimulation(seed), GameSimulation(seed)]
+        self.frame = 0  # Sıradaki simüle edilecek kare
+
+        # Halka tamponlar: kare % ring_size ile indekslenir
+        # Rakip bizden en fazla max_rollback kare önde olabilir; girdi halkası
+        # geri sarılacak en eski kareden rakibin son karesine kadar olanı tutar
+        self.ring_size = max_rollback + 1
+        self.input_ring_size = 2 * self.ring_size
+        self.local_inputs = [False] * ROLLBACK_INPUT_HISTORY
+        self.remote_inputs = [PREDICTED_INPUT] * self.input_ring_size
+        self.used_inputs = [PREDICTED_INPUT] * self.ring_size
+        self.snapshots: List[Optional[tuple]] = [None] * self.ring_size
+        self.remote_confirmed = -1  # Rakip girdisinin kesin bilindiği son kare
+
+        # İstatistikler
+        self.rollbacks = 0
+        self.resimulated_frames = 0
+        self.max_depth = 0
+        self.rollback_seconds = 0.0
+
+    @property
+    def local(self) -> GameSimulation:
+        """Yerel oyuncunun simülasyonu"""
+        return self.simulations[self.local_index]
+
+    @property
+    def remote(self) -> GameSimulation:
+        """Rakibin (tahmini) simülasyonu"""
+        return self.simulations[self.remote_index]
+
+    def can_advance(self) -> bool:
+        """Rakipten çok öndeysek (geri sarma sınırı) beklemek gerekir"""
+        return self.frame - self.remote_confirmed <= self.max_rollback
+
+    def _remote_input(self, frame: int) -> bool:
+        """Kare için bilinen ya da tahmin edilen rakip girdisi"""
+        if frame <= self.remote_confirmed:
+            return self.remote_inputs[frame % self.input_ring_size]
+        return PREDICTED_INPUT
+
+    def _step_remote(self, frame: int):
+        """Rakip simülasyonunun snapshot'ını alıp kareyi ilerletir"""
+        slot = frame % self.ring_size
+        flap = self._remote_input(frame)
+        self.snapshots[slot] = self.remote.snapshot()
+        self.used_inputs[slot] = flap
+        step_simulation(self.remote, flap)
+
+    def advance(self, local_flap: bool) -> bytes:
+        """Bir kare ilerletir ve rakibe gönderilecek girdi paketini döndürür"""
+        frame = self.frame
+        self.local_inputs[frame % ROLLBACK_INPUT_HISTORY] = local_flap
+        step_simulation(self.local, local_flap)
+        self._step_remote(frame)
+        self.frame += 1
+        return self.encode_input(frame)
+
+    def encode_input(self, frame: int) -> bytes:
+        """Kareye kadar olan son girdileri bit maskesi olarak paketler"""
+        mask = 0
+        for offset in range(min(ROLLBACK_INPUT_HISTORY, frame + 1)):
+            if self.local_inputs[(frame - offset) % ROLLBACK_INPUT_HISTORY]:
+                mask |= 1 << offset
+        return INPUT_FORMAT.pack(frame, mask)
+
+    def receive(self, packet: bytes) -> int:
+        """Rakip girdisini işler, gerekirse geri sarar; geri sarma derinliğini döndürür"""
+        last_frame, mask = INPUT_FORMAT.unpack(packet)
+        if last_frame <= self.remote_confirmed:
+            return 0  # Eski ya da tekrar eden paket
+        first_frame = last_frame - ROLLBACK_INPUT_HISTORY + 1
+        if first_frame > self.remote_confirmed + 1:
+            return 0  # Arada geçmişin kapsamadığı bir boşluk var, sonraki paketi bekle
+
+        mispredicted = None
+        for frame in range(self.remote_confirmed + 1, last_frame + 1):
+            flap = bool(mask >> (last_frame - frame) & 1)
+            self.remote_inputs[frame % self.input_ring_size] = flap
+            if (mispredicted is None and frame < self.frame
+                    and self.used_inputs[frame % self.ring_size] != flap):
+                mispredicted = frame
+        self.remote_confirmed = last_frame
+
+        if mispredicted is None:
+            return 0
+        return self._rollback(mispredicted)
+
+    def _rollback(self, frame: int) -> int:
+        """Kareye geri döner ve şimdiki kareye kadar yeniden simüle eder"""
+        started = time.perf_counter()
+        depth = self.frame - frame
+        self.remote.restore(self.snapshots[frame % self.ring_size])
+        for resim_frame in range(frame, self.frame):
+            self._step_remote(resim_frame)
+        self.rollback_seconds += time.perf_counter() - started
+        self.rollbacks += 1
+        self.resimulated_frames += depth
+        self.max_depth = max(self.max_depth, depth)
+        return depth
+
+    @property
+    def finished(self) -> bool:
+        """Her iki kuş da öldü mü"""
+        return all(simulation.state != GAME_STATES['PLAYING']
+                   for simulation in self.simulations)
+
+
+def simulate_duel(frames: int, delay: int, jitter: int, loss: float, seed: int,
+                  max_rollback: int = ROLLBACK_MAX_FRAMES) -> Tuple[List[RollbackSession], dict]:
+    """İki eşi sanal bir ağ üzerinden (gecikme, jitter, kayıp) tüm girdiler teslim edilene dek yürütür"""
+    net = random.Random(seed)
+    peers = [RollbackSession(seed, 0, max_rollback), RollbackSession(seed, 1, max_rollback)]
+    in_flight = []  # (varış karesi, sıra, hedef eş, paket)
+    sequence = 0
+    stalls = 0
+    sent = lost = 0
+    tick_times: List[float] = []
+
+    tick = 0
+    while tick < frames or any(peer.remote_confirmed < peer.frame - 1 for peer in peers):
+        # Bu tick'te varan paketleri teslim et
+        while in_flight and in_flight[0][0] <= tick:
+            _, _, target, packet = heapq.heappop(in_flight)
+            started = time.perf_counter()
+            peers[target].receive(packet)
+            tick_times.append(time.perf_counter() - started)
+
+        for index, peer in enumerate(peers):
+            if peer.frame >= frames:
+                # Sona gelen eş son paketini kayıplara karşı tekrar gönderir
+                packet = peer.encode_input(peer.frame - 1)
+            elif not peer.can_advance():
+                stalls += 1
+                continue
+            else:
+                started = time.perf_counter()
+                packet = peer.advance(reference_flap(peer.local))
+                tick_times.append(time.perf_counter() - started)
+
+            sent += 1
+            if net.random() < loss:
+                lost += 1
+                continue
+            arrival = tick + delay + net.randint(0, jitter)
+            heapq.heappush(in_flight, (arrival, sequence, 1 - index, packet))
+            sequence += 1
+        tick += 1
+
+    return peers, {'stalls': stalls, 'sent': sent, 'lost': lost, 'tick_times': tick_times}
+
+
+def peers_in_sync(peers: List[RollbackSession]) -> bool:
+    """Tüm girdiler teslim edildikten sonra iki eş aynı dünyayı görüyor mu"""
+    return (peers[0].simulations[0].snapshot() == peers[1].simulations[0].snapshot()
+            and peers[0].simulations[1].snapshot() == peers[1].simulations[1].snapshot())
+
+
+def run_loopback(frames: int, delay: int, jitter: int, loss: float,
+                 seed: int, max_rollback: int = ROLLBACK_MAX_FRAMES) -> bool:
+    """Sanal ağ üzerindeki düelloyu yürütür ve raporlar"""
+    peers, stats = simulate_duel(frames, delay, jitter, loss, seed, max_rollback)
+    stalls, sent, lost, tick_times = (stats['stalls'], stats['sent'], stats['lost'],
+                                      stats['tick_times'])
+    in_sync = peers_in_sync(peers)
+
+    budget_us = 1_000_000 / FPS
+    print(f"🔁 Rollback loopback: {frames} kare, gecikme {delay}+{jitter} kare jitter, "
+          f"%{loss * 100:.0f} kayıp ({lost}/{sent} paket), en fazla {max_rollback} kare geri sarma")
+    for index, peer in enumerate(peers):
+        per_frame_us = (peer.rollback_seconds / peer.resimulated_frames * 1e6
+                        if peer.resimulated_frames else 0.0)
+        average_depth = peer.resimulated_frames / peer.rollbacks if peer.rollbacks else 0.0
+        print(f"   Eş {index}: {peer.rollbacks} geri sarma, ortalama derinlik {average_depth:.1f}, "
+              f"en fazla {peer.max_depth} | yeniden simüle edilen kare {peer.resimulated_frames} "
+              f"({per_frame_us:.1f} µs/kare) | skorlar "
+              f"{peer.simulations[0].score}-{peer.simulations[1].score}")
+        if per_frame_us:
+            print(f"          Bir kare bütçesine ({budget_us:.0f} µs) sığan geri sarma: "
+                  f"~{int(budget_us / per_frame_us)} kare")
+    tick_times.sort()
+    if tick_times:
+        p99 = tick_times[min(len(tick_times) - 1, int(len(tick_times) * 0.99))] * 1e6
+        print(f"   İşlem başına süre: ortalama {sum(tick_times) / len(tick_times) * 1e6:.1f} µs, "
+              f"p99 {p99:.1f} µs, en fazla {tick_times[-1] * 1e6:.1f} µs | bekleme {stalls} kez")
+    print("✅ Eşler senkron" if in_sync else "❌ Eşler arasında sapma var!")
+    return in_sync
+
+
+def main():
+    """Komut satırı girişi - loopback test düzeneği"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Rollback Netcode Test Düzeneği')
+    parser.add_argument('--frames', type=int, default=FPS * 60,
+                        help='Simüle edilecek kare sayısı')
+    parser.add_argument('--delay', type=int, default=3,
+                        help='Sabit ağ gecikmesi (kare)')
+    parser.add_argument('--jitter', type=int, default=4,
+                        help='Rastgele ek gecikme üst sınırı (kare)')
+    parser.add_argument('--loss', type=float, default=0.05,
+                        help='Paket kayıp oranı (0-1)')
+    parser.add_argument('--max-rollback', type=int, default=ROLLBACK_MAX_FRAMES,
+                        help='En fazla geri sarılacak kare sayısı')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='Oyun ve ağ simülasyonu seed değeri')
+    args = parser.parse_args()
+
+    in_sync = run_loopback(args.frames, args.delay, args.jitter, args.loss,
+                           args.seed, args.max_rollback)
+    raise SystemExit(0 if in_sync else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -80,6 +80,13 @@ else
     echo "⚠️  iOS projesi zaten mevcut"
 fi
 
+# iOS iconları ve launch screen (yalnızca eksik/bayat olanlar yeniden üretilir,
+# hepsini yeniden üretmek için: python3 create_ios_icons.py --force)
+echo "🖼️  iOS iconları kontrol ediliyor..."
+# Pillow yalnızca eksikse kurulur (her çalıştırmada ağa çıkılmaz)
+python3 -c 'import PIL' 2>/dev/null || pip install Pillow
+python3 create_ios_icons.py
+
 # Asset'leri kopyala
 echo "🎨 Asset'ler kopyalanıyor..."
 cp -r assets/* FlappyBird-ios/data/ 2>/dev/null || echo "⚠️  Asset kopyalama hatası (normal olabilir)"
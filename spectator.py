@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Seyirci Yayını
+Tek bir oyunu oyunu yeniden çalıştırmadan çok sayıda izleyiciye (salon
+ekranları) aktarır. Her tick yalnızca değişenler (kuş y/hız, yeni borular,
+silinen borular, skor) kompakt ikili paketlerle gönderilir; sonradan katılan
+izleyiciler için düzenli aralıklarla tam durum (keyframe) yayınlanır.
+
+Paketler (tüm sayılar ağ bayt sırasında, konum/hız 1/16 piksel sabit noktalı):
+    b'K' + IBHhhBBh   keyframe: kare, durum, skor, kuş y, hız, animasyon karesi
+                      ve sayacı, zemin kayması; ardından B + boru başına hH
+                      (x, boşluk y) ve B + engel başına hh (x, y)
+    b'D' + IhhHBBB    delta: kare, kuş y, hız, skor, bayraklar (durum |
+                      animasyon karesi << 2), boru sayaçları (yeni << 4 | silinen),
+                      engel sayaçları; ardından yeni borular hH, yeni engeller hh
+"""
+
+import argparse
+import os
+import queue
+import struct
+import threading
+import time
+from typing import List, Optional
+
+import pygame
+
+from autopilot import reference_flap
+from config import *
+from game import (Background, Bird, GameSimulation, Ground, Obstacle, ObstacleManager,
+                  Pipe, PipeManager)
+
+MSG_KEYFRAME = b'K'
+MSG_DELTA = b'D'
+
+KEYFRAME_FORMAT = struct.Struct('!IBHhhBBh')
+DELTA_FORMAT = struct.Struct('!IhhHBBB')
+PIPE_FORMAT = struct.Struct('!hH')
+OBSTACLE_FORMAT = struct.Struct('!hh')
+COUNT_FORMAT = struct.Struct('!B')
+
+FIXED_POINT = 16
+STATE_CODES: List[str] = list(GAME_STATES.values())
+
+
+def _fixed(value: float) -> int:
+    """Değeri 1/16 piksel hassasiyetli tamsayıya çevirir"""
+    return int(round(value * FIXED_POINT))
+
+
+class SpectatorHub:
+    """Yayın dağıtıcı - her izleyiciye sınırlı bir kuyruk, yavaş olanı düşürür"""
+
+    def __init__(self, queue_size: int = SPECTATOR_QUEUE_SIZE):
+        """Dağıtıcıyı oluşturur"""
+        self.queue_size = queue_size
+        self.subscribers: List[queue.Queue] = []
+        self.dropped = 0
+        self._lock = threading.Lock()
+        # Son keyframe ve sonrasındaki deltalar: yeni izleyici bunlarla yetişir
+        self._catch_up: List[bytes] = []
+
+    def subscribe(self) -> queue.Queue:
+        """Yeni izleyici kuyruğu açar (son keyframe'den itibaren doldurulmuş)"""
+        subscriber = queue.Queue(self.queue_size)
+        with self._lock:
+            for packet in self._catch_up[-self.queue_size:]:
+                subscriber.put_nowait(packet)
+            self.subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue):
+        """İzleyiciyi yayından çıkarır"""
+        with self._lock:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+
+    def publish(self, packet: bytes):
+        """Paketi tüm izleyicilere iletir; kuyruğu dolu olan izleyici düşürülür"""
+        with self._lock:
+            if packet[:1] == MSG_KEYFRAME:
+                self._catch_up.clear()
+            self._catch_up.append(packet)
+            slow = []
+            for subscriber in self.subscribers:
+                try:
+                    subscriber.put_nowait(packet)
+                except queue.Full:
+                    slow.append(subscriber)
+            for subscriber in slow:
+                self.subscribers.remove(subscriber)
+                self._close(subscriber)
+                self.dropped += 1
+
+    def close(self):
+        """Yayını bitirir; izleyiciler None ile sonlandırılır"""
+        with self._lock:
+            for subscriber in self.subscribers:
+                self._close(subscriber)
+            self.subscribers.clear()
+
+    @staticmethod
+    def _close(subscriber: queue.Queue):
+        """Kuyruğa bitiş işareti koyar (doluysa en eski paketi atarak)"""
+        try:
+            subscriber.put_nowait(None)
+        except queue.Full:
+            try:
+                subscriber.get_nowait()
+            except queue.Empty:
+                pass
+            subscriber.put_nowait(None)
+
+
+class SpectatorBroadcaster:
+    """Simülasyonu izleyip her tick delta, aralıklarla keyframe üretir"""
+
+    def __init__(self, hub: SpectatorHub,
+                 keyframe_interval: int = SPECTATOR_KEYFRAME_INTERVAL):
+        """Yayıncıyı oluşturur"""
+        self.hub = hub
+        self.keyframe_interval = keyframe_interval
+        self._last_frame = -1
+        self._pipes: List[Pipe] = []
+        self._obstacles: list = []
+        self.bytes_sent = 0
+        self.deltas = 0
+        self.keyframes = 0
+
+    def publish(self, simulation: GameSimulation):
+        """Simülasyonun son adımını yayınlar (her step sonrası çağrılır)"""
+        frame = simulation.frame
+        if (frame != self._last_frame + 1 or self._last_frame < 0
+                or frame % self.keyframe_interval == 0):
+            packet = self.encode_keyframe(simulation)
+            self.keyframes += 1
+        else:
+            packet = self.encode_delta(simulation)
+            self.deltas += 1
+        self._last_frame = frame
+        self._pipes = list(simulation.pipe_manager.pipes)
+        self._obstacles = list(simulation.obstacle_manager.obstacles)
+        self.bytes_sent += len(packet)
+        self.hub.publish(packet)
+
+    @staticmethod
+    def encode_keyframe(simulation: GameSimulation) -> bytes:
+        """Tam durumu paketler"""
+        bird = simulation.bird
+        pipes = simulation.pipe_manager.pipes
+        obstacles = simulation.obstacle_manager.obstacles
+        parts = [MSG_KEYFRAME, KEYFRAME_FORMAT.pack(
+            simulation.frame, STATE_CODES.index(simulation.state), simulation.score,
+            _fixed(bird.y), _fixed(bird.velocity), bird.animation_frame,
+            bird.animation_counter, _fixed(simulation.ground.offset))]
+        parts.append(COUNT_FORMAT.pack(len(pipes)))
+        parts.extend(PIPE_FORMAT.pack(_fixed(pipe.x), pipe.gap_y) for pipe in pipes)
+        parts.append(COUNT_FORMAT.pack(len(obstacles)))
+        parts.extend(OBSTACLE_FORMAT.pack(_fixed(obstacle.x), obstacle.y)
+                     for obstacle in obstacles)
+        return b''.join(parts)
+
+    def encode_delta(self, simulation: GameSimulation) -> bytes:
+        """Önceki tick'e göre değişenleri paketler"""
+        bird = simulation.bird
+        new_pipes, removed_pipes = self._diff(self._pipes, simulation.pipe_manager.pipes)
+        new_obstacles, removed_obstacles = self._diff(self._obstacles,
+                                                      simulation.obstacle_manager.obstacles)
+        flags = STATE_CODES.index(simulation.state) | bird.animation_frame << 2
+        parts = [MSG_DELTA, DELTA_FORMAT.pack(
+            simulation.frame, _fixed(bird.y), _fixed(bird.velocity), simulation.score, flags,
+            len(new_pipes) << 4 | removed_pipes, len(new_obstacles) << 4 | removed_obstacles)]
+        parts.extend(PIPE_FORMAT.pack(_fixed(pipe.x), pipe.gap_y) for pipe in new_pipes)
+        parts.extend(OBSTACLE_FORMAT.pack(_fixed(obstacle.x), obstacle.y)
+                     for obstacle in new_obstacles)
+        return b''.join(parts)
+
+    @staticmethod
+    def _diff(previous: list, current: list):
+        """Yeni eklenen nesneleri ve baştan silinen nesne sayısını bulur"""
+        # Nesneler sona eklenir, ekrandan çıkanlar baştan silinir
+        previous_ids = {id(item) for item in previous}
+        kept = sum(1 for item in current if id(item) in previous_ids)
+        return current[kept:], len(previous) - kept
+
+
+class SpectatorViewer:
+    """Başsız izleyici - akıştan kareyi yeniden kurar ve oyunun katmanlarını çizer"""
+
+    def __init__(self):
+        """İzleyiciyi oluşturur (ilk keyframe'e kadar görüntü yoktur)"""
+        self.bird = Bird(BIRD_START_X, BIRD_START_Y)
+        self.pipe_manager = PipeManager()
+        self.obstacle_manager = ObstacleManager()
+        self.ground = Ground()
+        self.background: Optional[Background] = None
+        self.frame = -1
+        self.score = 0
+        self.state = GAME_STATES['MENU']
+        self.synced = False
+        self.score_font: Optional[pygame.font.Font] = None
+
+    def apply(self, packet: bytes) -> bool:
+        """Paketi uygular; kare yeniden kurulduysa True döndürür"""
+        kind = packet[:1]
+        if kind == MSG_KEYFRAME:
+            self._apply_keyframe(packet)
+            return True
+        if kind == MSG_DELTA and self.synced:
+            return self._apply_delta(packet)
+        return False
+
+    def _apply_keyframe(self, packet: bytes):
+        """Tam durumu yükler"""
+        (self.frame, state, self.score, y, velocity, animation_frame,
+         animation_counter, ground_offset) = KEYFRAME_FORMAT.unpack_from(packet, 1)
+        self.state = STATE_CODES[state]
+        self.bird.set_state((y / FIXED_POINT, velocity / FIXED_POINT,
+                             animation_frame, animation_counter))
+        self.ground.offset = ground_offset / FIXED_POINT
+
+        offset = 1 + KEYFRAME_FORMAT.size
+        (count,) = COUNT_FORMAT.unpack_from(packet, offset)
+        offset += COUNT_FORMAT.size
+        pipes = []
+        for _ in range(count):
+            x, gap_y = PIPE_FORMAT.unpack_from(packet, offset)
+            offset += PIPE_FORMAT.size
+            pipes.append((x / FIXED_POINT, gap_y, False))
+        self.pipe_manager.set_state((0, 0, tuple(pipes)))
+
+        (count,) = COUNT_FORMAT.unpack_from(packet, offset)
+        offset += COUNT_FORMAT.size
+        obstacles = []
+        for _ in range(count):
+            x, y = OBSTACLE_FORMAT.unpack_from(packet, offset)
+            offset += OBSTACLE_FORMAT.size
+            obstacles.append((x / FIXED_POINT, y))
+        self.obstacle_manager.set_state(tuple(obstacles))
+        self.synced = True
+
+    def _apply_delta(self, packet: bytes) -> bool:
+        """Bir tick'lik değişiklikleri uygular"""
+        frame, y, velocity, self.score, flags, pipe_counts, obstacle_counts = \
+            DELTA_FORMAT.unpack_from(packet, 1)
+        if frame != self.frame + 1:
+            self.synced = False  # Kare atlandı, sonraki keyframe beklenir
+            return False
+        self.frame = frame
+        self.state = STATE_CODES[flags & 3]
+        self.bird.set_state((y / FIXED_POINT, velocity / FIXED_POINT, flags >> 2, 0))
+
+        # Mevcut nesneler simülasyondaki gibi kendi hızlarıyla ilerler
+        pipes = self.pipe_manager.pipes
+        for pipe in pipes:
+            pipe.update()
+        del pipes[:pipe_counts & 15]
+        obstacles = self.obstacle_manager.obstacles
+        for obstacle in obstacles:
+            obstacle.update()
+        del obstacles[:obstacle_counts & 15]
+        self.ground.update()
+        if self.background is not None:
+            self.background.update()
+
+        offset = 1 + DELTA_FORMAT.size
+        for _ in range(pipe_counts >> 4):
+            x, gap_y = PIPE_FORMAT.unpack_from(packet, offset)
+            offset += PIPE_FORMAT.size
+            pipe = Pipe(SCREEN_WIDTH, gap_y)
+            pipe.set_position(x / FIXED_POINT)
+            pipes.append(pipe)
+        for _ in range(obstacle_counts >> 4):
+            x, y = OBSTACLE_FORMAT.unpack_from(packet, offset)
+            offset += OBSTACLE_FORMAT.size
+            obstacle = Obstacle(SCREEN_WIDTH, y)
+            obstacle.x = x / FIXED_POINT
+            obstacle.rect.x = obstacle.x
+            obstacles.append(obstacle)
+        return True
+
+    def draw(self, surface: pygame.Surface):
+        """Oyunun çizim katmanlarını (Game.draw sırasıyla) yüzeye çizer"""
+        if self.background is None:
+            self.background = Background()
+        self.background.draw(surface)
+        if not self.synced:
+            return
+        self.pipe_manager.draw(surface)
+        self.obstacle_manager.draw(surface)
+        self.ground.draw(surface)
+        self.bird.draw(surface)
+
+        if self.score_font is None:
+            pygame.font.init()
+            self.score_font = pygame.font.Font(None, SCORE_FONT_SIZE)
+        score_text = self.score_font.render(str(self.score), True, SCORE_COLOR)
+        surface.blit(score_text, score_text.get_rect(center=SCORE_POSITION))
+
+    def matches(self, simulation: GameSimulation) -> bool:
+        """Yeniden kurulan kare simülasyonla aynı mı (doğrulama için)"""
+        return (self.frame == simulation.frame and self.score == simulation.score
+                and self.state == simulation.state
+                and self.bird.get_state()[:3] == simulation.bird.get_state()[:3]
+                and self.ground.offset == simulation.ground.offset
+                and [(p.x, p.gap_y) for p in self.pipe_manager.pipes]
+                == [(p.x, p.gap_y) for p in simulation.pipe_manager.pipes]
+                and self.obstacle_manager.get_state() == simulation.obstacle_manager.get_state())
+
+
+def _viewer_thread(hub: SpectatorHub, subscriber: queue.Queue, results: list,
+                   index: int, render: bool, delay: float):
+    """İzleyici iş parçacığı - kuyruk kapanana kadar paketleri uygular"""
+    viewer = SpectatorViewer()
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)) if render else None
+    frames = 0
+    while True:
+        packet = subscriber.get()
+        if packet is None:
+            break
+        if viewer.apply(packet):
+            frames += 1
+            if surface is not None:
+                viewer.draw(surface)
+        if delay:
+            time.sleep(delay)
+    results[index] = (viewer, frames)
+
+
+def run_demo(viewers: int, slow: int, render: int, frames: int, seed: int):
+    """Bot oyununu yayınlar; izleyicileri iş parçacıklarında çalıştırıp raporlar"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    hub = SpectatorHub()
+    broadcaster = SpectatorBroadcaster(hub)
+    simulation = GameSimulation(seed)
+    results: list = [None] * viewers
+    threads = []
+    for index in range(viewers):
+        delay = 0.05 if index < slow else 0.0  # İlk 'slow' izleyici kasıtlı yavaş
+        thread = threading.Thread(target=_viewer_thread, daemon=True, args=(
+            hub, hub.subscribe(), results, index, index >= viewers - render, delay))
+        thread.start()
+        threads.append(thread)
+
+    print(f"📺 Seyirci yayını: {viewers} izleyici ({slow} yavaş, {render} çizen), "
+          f"{frames} kare, keyframe her {broadcaster.keyframe_interval} karede")
+    started = time.perf_counter()
+    next_tick = started
+    tick = 0
+    while tick < frames:
+        if simulation.state != GAME_STATES['PLAYING']:
+            simulation.reset()
+        if reference_flap(simulation):
+            simulation.flap()
+        simulation.step()
+        broadcaster.publish(simulation)
+        tick += 1
+        # Gerçek zamanlı yayın: izleyiciler FPS hızında beslenir
+        next_tick += 1.0 / FPS
+        time.sleep(max(0.0, next_tick - time.perf_counter()))
+    hub.close()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    keyframe_size = len(broadcaster.encode_keyframe(simulation))
+    average = broadcaster.bytes_sent / max(1, broadcaster.deltas + broadcaster.keyframes)
+    finished = [result for result in results if result is not None]
+    in_sync = sum(1 for viewer, _ in finished if viewer.matches(simulation))
+    print(f"   {broadcaster.deltas} delta + {broadcaster.keyframes} keyframe, ortalama "
+          f"{average:.1f} bayt/tick ({average * FPS / 1024:.2f} KB/s), tam durum "
+          f"{keyframe_size} bayt olurdu")
+    print(f"   Düşürülen yavaş izleyici: {hub.dropped} | son kareyi birebir kuran: "
+          f"{in_sync}/{viewers - hub.dropped} | süre {elapsed:.1f} s")
+    return in_sync == viewers - hub.dropped
+
+
+def main():
+    """Komut satırı girişi - yerel yayın gösterimi"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Seyirci Yayını')
+    parser.add_argument('--viewers', type=int, default=32,
+                        help='Yerel izleyici sayısı')
+    parser.add_argument('--slow', type=int, default=2,
+                        help='Kasıtlı yavaş izleyici sayısı (düşürülmeleri beklenir)')
+    parser.add_argument('--render', type=int, default=1,
+                        help='Her kareyi offscreen yüzeye çizen izleyici sayısı')
+    parser.add_argument('--frames', type=int, default=FPS * 20,
+                        help='Yayınlanacak kare sayısı')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='Oyun seed değeri')
+    args = parser.parse_args()
+    ok = run_demo(args.viewers, args.slow, args.render, args.frames, args.seed)
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Ayrık Simülasyon ve Çizim Süreçleri
+Simülasyon (oyun mantığı, otopilot, yüksek skor) ayrı bir süreçte kendi
+FPS saatine göre ilerler ve her karenin kompakt durumunu (kuş, boru ve engel
+dizileri, skor, durum, ses sayaçları) multiprocessing.shared_memory üzerindeki
+bir halka tampona yazar. Çizim süreci pencereyi ve olayları yönetir, en son
+tamamlanmış kareyi kilitsiz okur ve Game'in çizim katmanlarıyla çizer; girdiler
+(flap, duraklatma, çıkış) bir Pipe üzerinden simülasyona gider. Çizimdeki
+takılmalar fiziği hiç bekletmez.
+
+Halka: başlıkta en son yayınlanan sıra numarası, ardından SPLIT_RING_SLOTS
+yuva. Yazar bir yuvaya önce 'begin' alanını, sonra veriyi, en son 'end'
+alanını aynı sıra numarasıyla yazar ve ardından başlığı günceller. Okur
+önce 'end'i, sonra veriyi, en son 'begin'i okur; ikisi beklenen sıra
+numarasına eşitse kopya tutarlıdır (seqlock), değilse yeniden dener. Tek
+yazar vardır; okurlar yazarı hiç bekletmez. Aynı adla bağlanan harici
+görselleştiriciler de FrameRing.attach ile kareleri okuyabilir.
+
+Not: Python/NumPy bellek bariyeri vermez; sıra, yazma/okuma sırasını koruyan
+işlemcilerde (x86) garantidir.
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+import numpy as np
+import pygame
+
+from config import *
+from game import Game, Obstacle, Pipe
+
+STATE_NAMES: List[str] = list(GAME_STATES.values())
+SOUND_NAMES: List[str] = ['flap_sound', 'score_sound', 'hit_sound', 'crash_sound']
+
+HEADER_DTYPE = np.dtype([
+    ('latest', '<u8'),  # En son tamamlanan karenin sıra numarası (0: henüz yok)
+    ('slots', '<u4'),
+    ('closed', 'u1'),  # Simülasyon bitti
+], align=True)
+HEADER_SIZE = 64
+
+SLOT_DTYPE = np.dtype([
+    ('begin', '<u8'),
+    ('frame', '<u4'),
+    ('score', '<u4'),
+    ('high_score', '<u4'),
+    ('state', 'u1'),
+    ('pipes', 'u1'),
+    ('obstacles', 'u1'),
+    ('bird_animation', 'u1'),
+    ('bird_counter', '<u4'),
+    ('sounds', '<u4', (len(SOUND_NAMES),)),  # Çalınan ses sayaçları (SOUND_NAMES sırasıyla)
+    ('bird_y', '<f8'),
+    ('bird_velocity', '<f8'),
+    ('ground_offset', '<f8'),
+    ('pipe_x', '<f8', (SPLIT_MAX_OBJECTS,)),
+    ('pipe_gap', '<i4', (SPLIT_MAX_OBJECTS,)),
+    ('obstacle_x', '<f8', (SPLIT_MAX_OBJECTS,)),
+    ('obstacle_y', '<i4', (SPLIT_MAX_OBJECTS,)),
+    ('end', '<u8'),
+], align=True)
+
+
+class FrameRing:
+    """Paylaşılan bellekte kare halkası - tek yazar, kilitsiz okurlar"""
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        """Bellek bloğu üzerinde başlık ve yuva görünümlerini kurar"""
+        self.memory = memory
+        self.owner = owner
+        self.header = np.ndarray((), dtype=HEADER_DTYPE, buffer=memory.buf)
+        count = int(self.header['slots'])
+        self.slots = np.ndarray((count,), dtype=SLOT_DTYPE, buffer=memory.buf, offset=HEADER_SIZE)
+        self._begin = self.slots['begin']
+        self._end = self.slots['end']
+        self.sequence = int(self.header['latest'])
+        self.torn_reads = 0
+
+    @property
+    def name(self) -> str:
+        """Bağlanmak için paylaşılan bellek adı"""
+        return self.memory.name
+
+    @classmethod
+    def create(cls, slots: int = SPLIT_RING_SLOTS) -> 'FrameRing':
+        """Yeni halka ayırır (sahibi kapatırken siler)"""
+        size = HEADER_SIZE + slots * SLOT_DTYPE.itemsize
+        memory = shared_memory.SharedMemory(create=True, size=size)
+        memory.buf[:size] = bytes(size)
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=memory.buf)
+        header['slots'] = slots
+        del header
+        return cls(memory, True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'FrameRing':
+        """Var olan halkaya bağlanır (başka süreçten)"""
+        memory = shared_memory.SharedMemory(name=name)
+        if multiprocessing.parent_process() is None:
+            # Harici süreç: kendi resource_tracker'ı çıkışta bloğu silmesin
+            # (alt süreçler sahibinin izleyicisini paylaşır, onlarda gerekmez)
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(memory._name, 'shared_memory')
+            except (ImportError, AttributeError):
+                pass
+        return cls(memory, False)
+
+    def write(self, game: Game, sounds: List[int]):
+        """Oyunun karesini sıradaki yuvaya yazar ve yayınlar"""
+        self.sequence += 1
+        sequence = self.sequence
+        index = sequence % len(self.slots)
+        self._begin[index] = sequence
+        slot = self.slots[index]
+        slot['frame'] = game.frame
+        slot['score'] = game.score
+        slot['high_score'] = game.high_score
+        slot['state'] = STATE_NAMES.index(game.state)
+        bird = game.bird
+        slot['bird_y'] = bird.y
+        slot['bird_velocity'] = bird.velocity
+        slot['bird_animation'] = bird.animation_frame
+        slot['bird_counter'] = bird.animation_counter
+        slot['ground_offset'] = game.ground.offset
+        slot['sounds'] = sounds
+
+        pipes = game.pipe_manager.pipes[:SPLIT_MAX_OBJECTS]
+        slot['pipes'] = len(pipes)
+        slot['pipe_x'][:len(pipes)] = [pipe.x for pipe in pipes]
+        slot['pipe_gap'][:len(pipes)] = [pipe.gap_y for pipe in pipes]
+        obstacles = game.obstacle_manager.obstacles[:SPLIT_MAX_OBJECTS]
+        slot['obstacles'] = len(obstacles)
+        slot['obstacle_x'][:len(obstacles)] = [obstacle.x for obstacle in obstacles]
+        slot['obstacle_y'][:len(obstacles)] = [obstacle.y for obstacle in obstacles]
+
+        self._end[index] = sequence
+        self.header['latest'] = sequence
+
+    def read_latest(self, out: np.ndarray, retries: int = 8) -> int:
+        """En son tamamlanmış kareyi out'a (SLOT_DTYPE skaler dizi) kopyalar
+
+        Kopyalanan karenin sıra numarasını, kare yoksa 0 döndürür.
+        """
+        count = len(self.slots)
+        for _ in range(retries):
+            sequence = int(self.header['latest'])
+            if sequence == 0:
+                return 0
+            index = sequence % count
+            end = int(self._end[index])
+            out[...] = self.slots[index]
+            if end == sequence and int(self._begin[index]) == sequence:
+                return sequence
+            self.torn_reads += 1  # Yazar bu yuvaya yetişti; en son kareyi yeniden dene
+        return 0
+
+    @property
+    def closed(self) -> bool:
+        """Simülasyon süreci bitti mi"""
+        return bool(self.header['closed'])
+
+    def mark_closed(self):
+        """Okurlara simülasyonun bittiğini bildirir"""
+        self.header['closed'] = 1
+
+    def close(self):
+        """Görünümleri bırakır; sahipse bloğu siler"""
+        del self.header, self.slots, self._begin, self._end
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+
+class SoundCounter:
+    """Simülasyon sürecinde SoundManager yerine geçer: çalınan sesleri sayar"""
+
+    def __init__(self):
+        """Sayaçları sıfırlar"""
+        self.counts = [0] * len(SOUND_NAMES)
+
+    def play(self, sound_name: str):
+        """Sesi çalmak yerine sayacını artırır (çizim süreci çalar)"""
+        if sound_name in SOUND_NAMES:
+            self.counts[SOUND_NAMES.index(sound_name)] += 1
+
+
+def run_simulation(name: str, connection, autopilot: bool = False,
+                   lifetime_stats: bool = False):
+    """Simülasyon süreci: komutları uygular, FPS saatiyle adımlar, kareleri yayınlar"""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    ring = FrameRing.attach(name)
+    game = Game(autopilot=autopilot, lifetime_stats=lifetime_stats)
+    sounds = SoundCounter()
+    game.sound_manager = sounds
+
+    period = 1.0 / FPS
+    next_time = time.perf_counter()
+    late_frames = 0
+    try:
+        ring.write(game, sounds.counts)
+        while game.running:
+            # Boştayken (menü, duraklama, game over) komut gelene kadar uyunur
+            timeout = IDLE_WAIT_TIMEOUT_MS / 1000 if game._is_idle() else 0
+            if connection.poll(timeout):
+                while connection.poll():
+                    _apply_command(game, connection.recv())
+                next_time = max(next_time, time.perf_counter())
+            if not game.running:
+                break
+
+            game.update()
+            ring.write(game, sounds.counts)
+
+            next_time += period
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -period:
+                late_frames += 1
+                next_time = time.perf_counter()
+    except (EOFError, BrokenPipeError, KeyboardInterrupt):
+        pass
+    finally:
+        if game._high_score_dirty:
+            game._save_high_score()
+        if game.lifetime is not None:
+            game.lifetime.close()
+        ring.mark_closed()
+        ring.close()
+        pygame.quit()
+        try:
+            connection.send(('stats', {'frames': ring.sequence, 'late': late_frames}))
+        except (OSError, BrokenPipeError):
+            pass
+
+
+def _apply_command(game: Game, command: tuple):
+    """Çizim sürecinden gelen girdiyi oyuna uygular"""
+    kind = command[0]
+    if kind == 'flap':
+        game._handle_flap()
+    elif kind == 'pause':
+        game._handle_pause()
+    elif kind == 'restart':
+        if game.state == GAME_STATES['GAME_OVER']:
+            game._restart_game()
+    elif kind == 'hidden':
+        game._handle_window_hidden()
+    elif kind == 'quit':
+        game.running = False
+
+
+class FrameView:
+    """Halkadan okunan kareyi bir Game örneğinin nesnelerine aktarır (yalnızca çizim için)"""
+
+    def __init__(self, game: Game):
+        """Görünümü oyun örneğine bağlar"""
+        self.game = game
+        self.frame = np.zeros((), dtype=SLOT_DTYPE)
+        self.sequence = 0
+        self._sounds: Optional[List[int]] = None
+
+    def apply(self):
+        """self.frame'deki durumu oyuna yazar ve yeni sesleri çalar"""
+        game = self.game
+        frame = self.frame
+        simulated = int(frame['frame'])
+        if game.state == GAME_STATES['PLAYING'] and simulated > game.frame:
+            # Arkaplan, Game.update'teki gibi oynanan her karede bir kayar
+            for _ in range(min(simulated - game.frame, SCREEN_WIDTH)):
+                game.background.update()
+        game.frame = simulated
+        game.score = int(frame['score'])
+        game.high_score = int(frame['high_score'])
+        game.state = STATE_NAMES[int(frame['state'])]
+        game.ground.offset = float(frame['ground_offset'])
+
+        bird = game.bird
+        bird.set_state((float(frame['bird_y']), float(frame['bird_velocity']),
+                        int(frame['bird_animation']), int(frame['bird_counter'])))
+        bird.rect.y = int(bird.y)
+
+        pipes = game.pipe_manager.pipes
+        count = int(frame['pipes'])
+        del pipes[count:]
+        for index, (x, gap_y) in enumerate(zip(frame['pipe_x'][:count].tolist(),
+                                                frame['pipe_gap'][:count].tolist())):
+            if index < len(pipes) and pipes[index].gap_y == gap_y:
+                pipes[index].set_position(x)
+            else:
+                pipe = Pipe(int(x), gap_y)
+                pipe.set_position(x)
+                pipes[index:index + 1] = [pipe]
+
+        obstacles = game.obstacle_manager.obstacles
+        count = int(frame['obstacles'])
+        obstacles[:] = [Obstacle(int(x), y) for x, y in
+                        zip(frame['obstacle_x'][:count].tolist(), frame['obstacle_y'][:count].tolist())]
+        for obstacle, x in zip(obstacles, frame['obstacle_x'][:count].tolist()):
+            obstacle.x = x
+            obstacle.rect.x = x
+
+        sounds = frame['sounds'].tolist()
+        if self._sounds is not None:
+            for name, before, after in zip(SOUND_NAMES, self._sounds, sounds):
+                if after > before:
+                    game.sound_manager.play(name)
+        self._sounds = sounds
+
+
+def _command_for(event: pygame.event.Event) -> Optional[tuple]:
+    """Pencere olayını simülasyon komutuna çevirir (Game._handle_event eşlemesi)"""
+    if event.type == pygame.QUIT:
+        return ('quit',)
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_ESCAPE:
+            return ('quit',)
+        if event.key == pygame.K_SPACE:
+            return ('flap',)
+        if event.key == pygame.K_p:
+            return ('pause',)
+        if event.key == pygame.K_r:
+            return ('restart',)
+    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        return ('flap',)
+    if event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN, pygame.WINDOWFOCUSLOST):
+        return ('hidden',)
+    return None
+
+
+def run_split(fullscreen: bool = False, large_screen: bool = False, autopilot: bool = False,
+              max_seconds: float = 0.0, hiccup_every: int = 0,
+              hiccup_ms: float = 0.0, lifetime_stats: bool = False) -> Dict[str, float]:
+    """Simülasyonu ayrı süreçte başlatır, bu süreçte çizer; istatistikleri döndürür
+
+    max_seconds > 0 ise o süre sonunda çıkılır; hiccup_every/hiccup_ms çizim
+    sürecine yapay takılma ekler (fiziğin etkilenmediğini ölçmek için).
+    """
+    ring = FrameRing.create()
+    connection, child_connection = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=run_simulation, daemon=True,
+                                      args=(ring.name, child_connection, autopilot,
+                                            lifetime_stats))
+    process.start()
+
+    game = Game(fullscreen=fullscreen, large_screen=large_screen)  # Yalnızca görünüm
+    view = FrameView(game)
+    drawn = 0
+    skipped = 0
+    worst_gap = 0.0
+    started = time.perf_counter()
+    last_draw = started
+    try:
+        running = True
+        while running and process.is_alive():
+            for event in pygame.event.get():
+                command = _command_for(event)
+                if command is not None:
+                    connection.send(command)
+                    running = command[0] != 'quit'
+                if event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEORESIZE):
+                    view.sequence = 0  # Sonraki karede yeniden çiz
+
+            sequence = ring.read_latest(view.frame)
+            if sequence and sequence != view.sequence:
+                if view.sequence:
+                    skipped += sequence - view.sequence - 1
+                view.sequence = sequence
+                view.apply()
+                game.draw()
+                drawn += 1
+                now = time.perf_counter()
+                worst_gap = max(worst_gap, now - last_draw)
+                last_draw = now
+                if hiccup_every and drawn % hiccup_every == 0:
+                    time.sleep(hiccup_ms / 1000)
+            if ring.closed or (max_seconds and time.perf_counter() - started > max_seconds):
+                break
+            game.clock.tick(FPS)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        elapsed = time.perf_counter() - started
+        stats = {'drawn': drawn, 'skipped': skipped, 'torn': ring.torn_reads,
+                 'worst_gap_ms': worst_gap * 1000, 'seconds': elapsed,
+                 'simulated': int(ring.header['latest'])}
+        try:
+            connection.send(('quit',))
+            if connection.poll(2.0):
+                message = connection.recv()
+                if message[0] == 'stats':
+                    stats['simulated'] = message[1]['frames']
+                    stats['late'] = message[1]['late']
+        except (OSError, EOFError, BrokenPipeError):
+            pass
+        process.join(timeout=2.0)
+        if process.is_alive():
+            process.terminate()
+        ring.close()
+        pygame.quit()
+    return stats
+
+
+def report(stats: Dict[str, float]) -> str:
+    """run_split istatistiklerinin özeti"""
+    seconds = stats['seconds'] or 1.0
+    return (f"🔀 Ayrık mod: {stats['simulated']} kare simüle edildi "
+            f"({stats['simulated'] / seconds:.1f}/sn, geç kalan {stats.get('late', 0)}), "
+            f"{stats['drawn']} kare çizildi ({stats['drawn'] / seconds:.1f}/sn), "
+            f"{stats['skipped']} kare atlandı, {stats['torn']} yırtık okuma yeniden denendi, "
+            f"en uzun çizim arası {stats['worst_gap_ms']:.0f} ms")
+
+
+def main():
+    """Komut satırı girişi - ayrık modu otopilotla ve yapay çizim takılmalarıyla ölçer"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Ayrık Simülasyon/Çizim')
+    parser.add_argument('--seconds', type=float, default=10.0,
+                        help='Ölçüm süresi (saniye)')
+    parser.add_argument('--hiccup-every', type=int, default=30,
+                        help='Kaç çizimde bir yapay takılma eklenir (0: hiç)')
+    parser.add_argument('--hiccup-ms', type=float, default=250.0,
+                        help='Yapay takılma süresi (ms)')
+    parser.add_argument('--headless', action='store_true',
+                        help='SDL dummy sürücüsüyle pencere açmadan çalıştır')
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    stats = run_split(autopilot=True, max_seconds=args.seconds,
+                      hiccup_every=args.hiccup_every, hiccup_ms=args.hiccup_ms)
+    print(report(stats))
+    expected = FPS * stats['seconds']
+    print(f"   Beklenen ~{expected:.0f} kare: fizik "
+          f"{'✅ takılmalardan etkilenmedi' if stats['simulated'] >= expected * 0.95 else '❌ geride kaldı'}")
+
+
+if __name__ == '__main__':
+    main()
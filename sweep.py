@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Monte Carlo Zorluk Taraması
+config.py'deki zorluk parametreleri (PIPE_GAP, PIPE_SPEED, BIRD_GRAVITY,
+BIRD_FLAP_STRENGTH, OBSTACLE_SPAWN_CHANCE ...) için bir ızgara alır, her ızgara
+noktasında referans botla çok sayıda seed'li ekransız oyun oynatır ve işi
+çekirdeklere dağıtır.
+
+Çıktı klasörü:
+    sweep.json     tarama tanımı (ızgara, oyun sayısı, kare sınırı, seed)
+    results.bin    nokta başına sabit boyutlu kayıt: skorlar, ölüm kareleri
+                   (-1 = hayatta kaldı), ölüm nedeni sayıları ve hayatta kalma
+                   eğrisi (load_results ile NumPy yapılandırılmış dizisi olarak okunur)
+    summary.csv    nokta başına özet satırı (parametreler, skor dağılımı, ölüm nedenleri)
+
+Sonuçlar her nokta bittiğinde diske yazılır; yarıda kalan tarama aynı
+komutla kaldığı yerden devam eder (yarım kalmış son kayıt atılır).
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+import autopilot
+import collision
+import config
+import game
+import layout
+import trajectory
+from autopilot import reference_flap
+from config import *
+from game import GameSimulation
+
+MANIFEST_FILE = 'sweep.json'
+RESULTS_FILE = 'results.bin'
+SUMMARY_FILE = 'summary.csv'
+DEATH_CAUSES = ('ground', 'ceiling', 'pipe', 'obstacle')
+
+
+def parse_grid(specs: List[str]) -> Dict[str, List[float]]:
+    """'AD=v1,v2,...' ya da 'AD=başlangıç:bitiş:adım' biçimli ızgara tanımlarını çözer"""
+    grid = {}
+    for spec in specs:
+        name, _, values = spec.partition('=')
+        name = name.strip().upper()
+        if not hasattr(config, name) or not isinstance(getattr(config, name), (int, float)):
+            raise ValueError(f"Bilinmeyen sayısal config parametresi: {name}")
+        if ':' in values:
+            start, stop, step = (float(part) for part in values.split(':'))
+            points = list(np.round(np.arange(start, stop + step / 2, step), 6))
+        else:
+            points = [float(value) for value in values.split(',') if value.strip()]
+        kind = type(getattr(config, name))
+        grid[name] = [kind(value) for value in points]
+    return grid
+
+
+def grid_points(grid: Dict[str, List[float]]) -> List[Dict[str, float]]:
+    """Izgaranın tüm noktaları (sıra sabittir; nokta no = liste indeksi)"""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def apply_params(params: Dict[str, float]):
+    """Parametreleri config, game, layout, collision, trajectory ve autopilot modüllerine uygular (türetilmiş sabitlerle birlikte)"""
+    values = dict(params)
+    # config.py'de başka sabitlerden türetilen değerler
+    gap = values.get('PIPE_GAP', config.PIPE_GAP)
+    speed = values.get('PIPE_SPEED', config.PIPE_SPEED)
+    values.setdefault('PIPE_MAX_HEIGHT', SCREEN_HEIGHT - gap - 100)
+    values.setdefault('OBSTACLE_SPEED', speed)
+    values.setdefault('GROUND_SPEED', speed)
+    for name, value in values.items():
+        setattr(config, name, value)
+        setattr(game, name, value)
+        setattr(layout, name, value)
+        setattr(collision, name, value)
+        setattr(trajectory, name, value)
+        setattr(autopilot, name, value)
+
+
+class ReferenceBot:
+    """Referans bot - insan gibi kusurlu: hedef payı ve tepki kaçırma rastgele"""
+
+    def __init__(self, rng: random.Random):
+        """Botu oyun başına rastgele payla oluşturur"""
+        self.rng = rng
+        self.margin = rng.uniform(SWEEP_BOT_MARGIN[0], SWEEP_BOT_MARGIN[1])
+
+    def decide(self, simulation: GameSimulation) -> bool:
+        """Sıradaki boşluğun altına düşerken flap yapar (arada bir geç kalır)"""
+        return reference_flap(simulation, self.margin) and self.rng.random() >= SWEEP_BOT_MISS_CHANCE
+
+
+def run_point(task: Tuple[int, Dict[str, float], int, int, int, int]):
+    """Bir ızgara noktasını oynatır (işçi süreçte çalışır)"""
+    point, params, games, max_frames, seed, bin_frames = task
+    apply_params(params)
+    scores = np.zeros(games, dtype=np.int32)
+    death_frames = np.full(games, -1, dtype=np.int32)
+    causes = np.zeros(len(DEATH_CAUSES), dtype=np.int32)
+    simulation = GameSimulation(seed)
+    for index in range(games):
+        # Aynı seed'ler her noktada tekrar kullanılır: noktalar aynı oyunlarla kıyaslanır
+        simulation.reset(seed + index)
+        bot = ReferenceBot(random.Random(seed + index))
+        while simulation.state == GAME_STATES['PLAYING'] and simulation.frame < max_frames:
+            if bot.decide(simulation):
+                simulation.flap()
+            simulation.step()
+        scores[index] = simulation.score
+        if simulation.state == GAME_STATES['GAME_OVER']:
+            death_frames[index] = simulation.frame
+            causes[DEATH_CAUSES.index(simulation.death_cause)] += 1
+    return point, scores, death_frames, causes, survival_curve(death_frames, max_frames, bin_frames)
+
+
+def survival_curve(death_frames: np.ndarray, max_frames: int, bin_frames: int) -> np.ndarray:
+    """Her zaman diliminin sonunda hayatta olan oyunların oranı"""
+    edges = np.arange(1, max_frames // bin_frames + 1) * bin_frames
+    lifetimes = np.where(death_frames < 0, max_frames + 1, death_frames)
+    return (lifetimes[None, :] > edges[:, None]).mean(axis=1).astype(np.float32)
+
+
+def record_dtype(games: int, bins: int) -> np.dtype:
+    """results.bin içindeki sabit boyutlu kayıt tipi"""
+    return np.dtype([('point', '<i4'), ('scores', '<i4', games),
+                     ('death_frames', '<i4', games), ('causes', '<i4', len(DEATH_CAUSES)),
+                     ('survival', '<f4', bins)])
+
+
+def load_results(out_dir: str) -> Tuple[dict, np.ndarray]:
+    """Tarama tanımını ve tamamlanmış kayıtları (yapılandırılmış dizi) okur"""
+    with open(os.path.join(out_dir, MANIFEST_FILE)) as f:
+        manifest = json.load(f)
+    dtype = record_dtype(manifest['games'], manifest['bins'])
+    path = os.path.join(out_dir, RESULTS_FILE)
+    if not os.path.exists(path):
+        return manifest, np.zeros(0, dtype=dtype)
+    count = os.path.getsize(path) // dtype.itemsize
+    return manifest, np.fromfile(path, dtype=dtype, count=count)
+
+
+class SweepWriter:
+    """Sonuçları nokta nokta ekler; yeniden başlatmada yarım kaydı kırpar"""
+
+    def __init__(self, out_dir: str, manifest: dict, points: List[Dict[str, float]]):
+        """Çıktı klasörünü hazırlar ve tamamlanmış noktaları bulur"""
+        self.out_dir = out_dir
+        self.manifest = manifest
+        self.points = points
+        self.dtype = record_dtype(manifest['games'], manifest['bins'])
+        os.makedirs(out_dir, exist_ok=True)
+
+        manifest_path = os.path.join(out_dir, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                previous = json.load(f)
+            if previous != manifest:
+                raise ValueError(f"{out_dir} farklı bir taramaya ait; başka bir klasör seçin")
+        else:
+            with open(manifest_path, 'w') as f:
+                json.dump(manifest, f, indent=2)
+
+        # Çökme anında yarım yazılmış son kaydı at
+        results_path = os.path.join(out_dir, RESULTS_FILE)
+        size = os.path.getsize(results_path) if os.path.exists(results_path) else 0
+        whole = size - size % self.dtype.itemsize
+        if whole != size:
+            with open(results_path, 'r+b') as f:
+                f.truncate(whole)
+        _, records = load_results(out_dir)
+        self.completed = set(int(point) for point in records['point'])
+
+        self.results = open(results_path, 'ab')
+        self.summary = open(os.path.join(out_dir, SUMMARY_FILE), 'w', newline='')
+        self.csv = csv.writer(self.summary)
+        self.csv.writerow(['point'] + list(manifest['grid']) + [
+            'games', 'mean_score', 'median_score', 'p90_score', 'max_score',
+            'survived', 'mean_death_frame'] + [f'death_{cause}' for cause in DEATH_CAUSES])
+        # Özet her açılışta mevcut kayıtlardan yeniden kurulur (kayıtla her zaman tutarlı)
+        for record in records:
+            self._write_summary(int(record['point']), record['scores'],
+                                record['death_frames'], record['causes'])
+        self.summary.flush()
+
+    def write(self, point: int, scores: np.ndarray, death_frames: np.ndarray,
+              causes: np.ndarray, survival: np.ndarray):
+        """Bir noktanın sonucunu kalıcı olarak ekler"""
+        record = np.zeros(1, dtype=self.dtype)
+        record['point'] = point
+        record['scores'] = scores
+        record['death_frames'] = death_frames
+        record['causes'] = causes
+        record['survival'] = survival
+        self.results.write(record.tobytes())
+        self.results.flush()
+        os.fsync(self.results.fileno())
+        self._write_summary(point, scores, death_frames, causes)
+        self.summary.flush()
+        self.completed.add(point)
+
+    def _write_summary(self, point: int, scores: np.ndarray, death_frames: np.ndarray,
+                       causes: np.ndarray):
+        """summary.csv'ye bir satır yazar"""
+        died = death_frames[death_frames >= 0]
+        row = [point] + [self.points[point][name] for name in self.manifest['grid']] + [
+            len(scores), f"{scores.mean():.2f}", int(np.median(scores)),
+            int(np.percentile(scores, 90)), int(scores.max()),
+            f"{(death_frames < 0).mean():.3f}",
+            f"{died.mean():.1f}" if len(died) else '']
+        self.csv.writerow(row + [int(count) for count in causes])
+
+    def close(self):
+        """Dosyaları kapatır"""
+        self.results.close()
+        self.summary.close()
+
+
+def run_sweep(grid: Dict[str, List[float]], games: int, max_frames: int, seed: int,
+              out_dir: str, workers: int, bin_frames: int = SWEEP_SURVIVAL_BIN):
+    """Taramayı çalıştırır; tamamlanmış noktaları atlar ve sonuçları akış halinde yazar"""
+    points = grid_points(grid)
+    manifest = {'grid': grid, 'games': games, 'max_frames': max_frames, 'seed': seed,
+                'bin_frames': bin_frames, 'bins': max_frames // bin_frames}
+    writer = SweepWriter(out_dir, manifest, points)
+    tasks = [(point, params, games, max_frames, seed, bin_frames)
+             for point, params in enumerate(points) if point not in writer.completed]
+    print(f"📈 Tarama: {len(points)} nokta x {games} oyun ({len(writer.completed)} nokta "
+          f"zaten tamam), {workers} işçi -> {out_dir}")
+
+    started = time.perf_counter()
+    done = 0
+    try:
+        with multiprocessing.Pool(workers) as pool:
+            for result in pool.imap_unordered(run_point, tasks):
+                writer.write(*result)
+                done += 1
+                point, scores = result[0], result[1]
+                elapsed = time.perf_counter() - started
+                remaining = elapsed / done * (len(tasks) - done)
+                print(f"   [{len(writer.completed)}/{len(points)}] {points[point]} -> ortalama skor "
+                      f"{scores.mean():.1f} | kalan ~{remaining:.0f} s", flush=True)
+    finally:
+        writer.close()
+    print(f"✅ {done} nokta {time.perf_counter() - started:.1f} s'de tamamlandı")
+
+
+def main():
+    """Komut satırı girişi"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Monte Carlo Zorluk Taraması')
+    parser.add_argument('--grid', action='append', required=True, metavar='AD=DEĞERLER',
+                        help="Parametre ızgarası, ör. PIPE_GAP=80,100,120 veya "
+                             "BIRD_GRAVITY=0.3:0.7:0.1 (birden çok kez verilebilir)")
+    parser.add_argument('--games', type=int, default=200,
+                        help='Nokta başına oyun sayısı')
+    parser.add_argument('--max-frames', type=int, default=FPS * 120,
+                        help='Oyun başına kare sınırı')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='İlk oyunun seed değeri (her noktada aynı seed dizisi)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='İşçi süreç sayısı')
+    parser.add_argument('--out', default='sweep_results',
+                        help='Çıktı klasörü (aynı klasörle yeniden çalıştırmak devam ettirir)')
+    args = parser.parse_args()
+
+    try:
+        grid = parse_grid(args.grid)
+        run_sweep(grid, args.games, args.max_frames, args.seed, args.out, args.workers)
+    except ValueError as e:
+        print(f"Hata: {e}")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Test Ayarları
+Modüller proje kökünden içe aktarılır; pygame ekransız (dummy) sürücülerle çalışır.
+"""
+
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
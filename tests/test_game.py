@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Game testleri - ekransız oyun örneği (dummy SDL sürücüleri)
+"""
+
+import os
+import subprocess
+import sys
+
+from game import Game
+
+
+def test_lifetime_stats_are_opt_in(tmp_path):
+    """Araçların kurduğu Game sayaç dosyasına dokunmaz; oyuncu girişi açıkça açar"""
+    stats_path = str(tmp_path / 'lifetime_stats.bin')
+    game = Game(autopilot=True, lifetime_path=stats_path)
+    assert game.lifetime is None
+    assert not os.path.exists(stats_path)
+
+    game = Game(lifetime_stats=True, lifetime_path=stats_path)
+    assert game.lifetime is not None
+    game.lifetime.close()
+    assert os.path.exists(stats_path)
+
+
+SMOKE_SCRIPT = r'''
+import asyncio, signal, sys
+import pygame
+import game
+
+before = signal.getsignal(signal.SIGUSR1) if hasattr(signal, 'SIGUSR1') else None
+instance = game.Game(autopilot=True)
+instance.state = game.GAME_STATES['PLAYING']
+frames = 0
+original_update = instance.update
+
+def update():
+    global frames
+    frames += 1
+    original_update()
+    if frames == 30:
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+instance.update = update
+asyncio.run(asyncio.wait_for(instance.run_async(), timeout=20))
+assert frames >= 30 and not instance.running
+assert instance.lifetime is None and instance.profiler is None
+if before is not None:
+    assert signal.getsignal(signal.SIGUSR1) is before
+print('loaded:', *(name for name in ('mmap', 'cProfile', 'lifetime', 'profiler') if name in sys.modules))
+'''
+
+
+def test_run_async_without_optional_modules():
+    """Web derlemesindeki gibi: run_async çalışır, mmap/cProfile ve sinyal işleyicisine dokunulmaz"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, '-c', SMOKE_SCRIPT], cwd=root,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines()[-1] == 'loaded:', result.stdout
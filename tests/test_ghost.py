@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+Hayalet katmanı testleri - kayıt iş parçacığında yazılır
+"""
+
+import numpy as np
+
+from ghost import GhostLayer
+
+
+def test_background_save_round_trips(tmp_path):
+    """Arka planda yazılan katman aynen geri yüklenir; sonraki eklemeler kaydı bozmaz"""
+    path = str(tmp_path / 'ghosts.npz')
+    layer = GhostLayer()
+    layer.add([100, 101, 103], 'ilk')
+    layer.add(range(200, 260), 'ikinci')
+    layer.save_in_background(path)
+    layer.add([5, 6], 'sonradan')  # Yazım sürerken katman değişebilir
+    layer.join()
+
+    loaded = GhostLayer.load(path)
+    assert loaded.labels == ['ilk', 'ikinci']
+    assert np.array_equal(loaded.trajectory(1), np.arange(200, 260))
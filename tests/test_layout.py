@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Çözülebilir parkur testleri - sıkılaştırılmış fizikle onarım, engel kaydırma/atma
+ve seed belirlenimi
+"""
+
+import os
+
+import pytest
+
+import layout
+from config import *
+from layout import LayoutGenerator, cache_path, physics_key, reachability
+
+
+@pytest.fixture
+def tight_physics(monkeypatch, tmp_path):
+    """Dar boşluk, kısa boru aralığı ve ağır yerçekimi: çekilen boşlukların bir kısmı
+    geçilemez, büyük engeller koridora sığmaz (tablo ve önbellek testlere özel)"""
+    monkeypatch.setattr(layout, '_tables', {})
+    monkeypatch.setattr(layout, 'LAYOUT_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(layout, 'LAYOUT_Y_QUANTUM', 1.0)
+    monkeypatch.setattr(layout, 'PIPE_GAP', 70)
+    monkeypatch.setattr(layout, 'PIPE_MAX_HEIGHT', SCREEN_HEIGHT - 70 - 100)
+    monkeypatch.setattr(layout, 'PIPE_SPAWN_DISTANCE', 120)
+    monkeypatch.setattr(layout, 'BIRD_GRAVITY', 0.8)
+    monkeypatch.setattr(layout, 'OBSTACLE_HEIGHT', 80)
+    return tmp_path
+
+
+def test_tight_physics_repairs_and_stays_solvable(tight_physics):
+    """Geçilemez boşluklar onarılır, sığmayan engeller atılır ve dizi birebir çözülebilir kalır"""
+    generator = LayoutGenerator(1)
+    generator.extend(200)
+    assert generator.repairs > 0
+    assert generator.moved_obstacles > 0
+    assert generator.dropped_obstacles > 0
+
+    table = generator.table
+    assert all(table.reachable(previous, gap_y)
+               for previous, gap_y in zip(generator.gaps, generator.gaps[1:]))
+    assert table.verify(generator.gaps, generator.obstacles) == -1
+
+
+def test_same_seed_gives_same_layout(tight_physics):
+    """Aynı seed aynı boşluk ve engel dizisini verir; farklı seed farklı dizi verir"""
+    first, second = LayoutGenerator(42), LayoutGenerator(42)
+    first.extend(300)
+    second.extend(300)
+    assert first.gaps == second.gaps
+    assert first.obstacles == second.obstacles
+    assert first.repairs == second.repairs
+
+    other = LayoutGenerator(43)
+    other.extend(300)
+    assert other.gaps != first.gaps
+
+
+def test_buffer_is_trimmed_and_replayed(tight_physics):
+    """Tüketilen borular tampondan atılır; atılmış boruya dönülünce seed'den aynısı üretilir"""
+    reference = LayoutGenerator(7, lookahead=8)
+    reference.extend(1000)
+
+    generator = LayoutGenerator(7, lookahead=8)
+    for index in range(900):
+        assert generator.gap(index) == reference.gaps[index]
+        assert generator.obstacle(index) == reference.obstacles[index]
+        assert len(generator.gaps) <= 4 * generator.lookahead
+    assert generator.start > 0
+
+    assert generator.gap(3) == reference.gaps[3]  # Geri sarma: baştan yeniden üretilir
+    assert generator.obstacle(850) == reference.obstacles[850]
+
+
+def test_table_is_cached_on_disk(tight_physics):
+    """Tablo fizik sabitlerinin hash'iyle diske yazılır ve sonraki süreç onu okur"""
+    built = reachability()
+    path = cache_path(physics_key())
+    assert os.path.dirname(path) == str(tight_physics)
+    assert os.path.exists(path)
+
+    layout._tables.clear()
+    loaded = reachability()
+    assert loaded is not built
+    assert loaded.allowed == built.allowed
+    assert loaded.nearest == built.nearest
+
+    generator = LayoutGenerator(5)
+    assert generator._table is None  # Üreteci oluşturmak tabloyu kurmaz
+    generator.gap(0)
+    assert generator.table is loaded
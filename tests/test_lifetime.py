@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Ömür boyu istatistik testleri - aynı süreçteki örnekler yuva paylaşmaz
+"""
+
+import os
+
+from lifetime import LifetimeStats
+
+
+def test_instances_in_one_process_get_own_slots(tmp_path):
+    """İki örnek ayrı yuva alır; biri kapanınca diğerinin yuvası sahipli kalır"""
+    path = str(tmp_path / 'lifetime_stats.bin')
+    first = LifetimeStats(path)
+    second = LifetimeStats(path)
+    assert first.slot != second.slot
+    assert not first.shared and not second.shared
+
+    first.add('flaps', 3)
+    second.add('flaps', 4)
+    first.close()
+    assert second.instances() == 1
+    assert second._words[second._base(second.slot)] == os.getpid()
+
+    third = LifetimeStats(path)
+    assert third.slot != second.slot  # Boşalan yuva yeniden kullanılır, dolu olan değil
+    assert third.totals()['flaps'] == 7
+    third.close()
+    second.close()
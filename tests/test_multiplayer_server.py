@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Çok oyunculu sunucu testleri - yerel MatchServer'a loopback istemcilerle bağlanır
+"""
+
+import asyncio
+
+import multiplayer_server
+from config import *
+from multiplayer_server import (JOIN_FORMAT, MSG_JOIN, MSG_WELCOME, NO_WINNER, LoopbackClient,
+                                MatchServer)
+
+
+async def _play(matches: int, players: int, max_frames: int):
+    """Sunucuyu başlatır, tüm loopback istemcileri oynatır ve sunucuyu durdurur"""
+    server = MatchServer(host='127.0.0.1', port=0, report_interval=0, max_frames=max_frames)
+    await server.start()
+    assert server.serving
+    clients = [LoopbackClient('127.0.0.1', server.port, players)
+               for _ in range(matches * players)]
+    await asyncio.wait_for(asyncio.gather(*(client.play() for client in clients)), timeout=30)
+    await server.stop()
+    return server, clients
+
+
+def test_loopback_matches_finish():
+    """Maçlar biter, her istemci hoş geldin ve durum paketleri alır, kazanan geçerlidir"""
+    matches, players, max_frames = 2, 2, FPS
+    server, clients = asyncio.run(_play(matches, players, max_frames))
+
+    assert server.finished_matches == matches
+    assert not server.matches and not server.lobbies
+    assert not server.serving
+
+    by_match = {}
+    for client in clients:
+        assert client.match_id is not None, "Hoş geldin paketi alınmadı"
+        assert client.player_count == players
+        assert 0 < client.states_received <= max_frames
+        assert client.winner is not None, "Maç sonu paketi alınmadı"
+        assert client.winner == NO_WINNER or 0 <= client.winner < players
+        by_match.setdefault(client.match_id, []).append(client)
+
+    assert len(by_match) == matches
+    for match_clients in by_match.values():
+        assert sorted(client.player_index for client in match_clients) == list(range(players))
+        # Aynı maçtaki herkes aynı sonucu görür
+        assert len({client.winner for client in match_clients}) == 1
+
+
+def test_solo_match_ends_with_frame_limit():
+    """Tek oyunculu maç kare sınırında biter ve oyuncu kazanan olur"""
+    server, clients = asyncio.run(_play(1, 1, FPS // 2))
+    client, = clients
+    assert server.finished_matches == 1
+    assert client.winner in (0, NO_WINNER)
+    assert client.states_received <= FPS // 2
+    assert not server.serving
+
+
+async def _wait_until(condition, timeout: float = 5.0):
+    """Koşul sağlanana kadar event loop'a yol verir"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "Koşul zamanında sağlanmadı"
+        await asyncio.sleep(0.01)
+
+
+async def _join_and_leave(server: MatchServer, capacity: int, players_before: int):
+    """Ham bağlantıyla lobiye katılır ve koltuğu alınınca ayrılır"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+    writer.write(MSG_JOIN + JOIN_FORMAT.pack(capacity))
+    assert await reader.readexactly(1) == MSG_WELCOME
+    await _wait_until(lambda: len(server.lobbies[capacity].players) == players_before + 1)
+    writer.close()
+    await writer.wait_closed()
+
+
+def test_lobby_leavers_free_their_seat(monkeypatch):
+    """Lobide ayrılan oyuncu koltuğunu boşaltır, boş lobi kaldırılır, maç kalanlarla dolar"""
+    monkeypatch.setattr(multiplayer_server, 'MATCH_MAX_PLAYERS', 3)
+
+    async def scenario():
+        server = MatchServer(host='127.0.0.1', port=0, report_interval=0, max_frames=FPS // 2)
+        await server.start()
+
+        # Tek başına bekleyip ayrılan oyuncunun lobisi kalmaz
+        await _join_and_leave(server, 3, 0)
+        await _wait_until(lambda: not server.lobbies and not server.matches)
+
+        # Önce katılan ayrılınca sonraki oyuncunun sırası kayar ve yeniden bildirilir
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+        writer.write(MSG_JOIN + JOIN_FORMAT.pack(3))
+        await reader.readexactly(1)
+        await _wait_until(lambda: len(server.lobbies[3].players) == 1)
+        first = LoopbackClient('127.0.0.1', server.port, 3)
+        first_task = asyncio.ensure_future(first.play())
+        await _wait_until(lambda: first.player_index == 1)
+        writer.close()
+        await _wait_until(lambda: first.player_index == 0)
+        assert len(server.lobbies[3].players) == 1
+
+        others = [LoopbackClient('127.0.0.1', server.port, 3) for _ in range(2)]
+        await asyncio.wait_for(asyncio.gather(first_task, *(client.play() for client in others)),
+                               timeout=30)
+        await server.stop()
+        return server, [first] + others
+
+    server, clients = asyncio.run(scenario())
+    assert server.finished_matches == 1
+    assert not server.lobbies and not server.matches
+    assert sorted(client.player_index for client in clients) == [0, 1, 2]
+    assert len({client.match_id for client in clients}) == 1
+    for client in clients:
+        assert client.states_received > 0 and client.winner is not None
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Eklenti testleri - kanca listesi, adım/bitiş kancaları ve kapanış sırası
+"""
+
+from config import *
+from game import Game
+from plugins import GamePlugin, plugin_hooks
+
+
+class _Recorder(GamePlugin):
+    """Çağrılan kancaları ortak listeye yazar"""
+
+    def __init__(self, name: str, calls: list):
+        self.name = name
+        self.calls = calls
+
+    def on_frame(self, game):
+        self.calls.append((self.name, 'on_frame', game.frame))
+
+    def on_finish(self, game):
+        self.calls.append((self.name, 'on_finish', game.frame))
+
+    def close(self, game):
+        self.calls.append((self.name, 'close'))
+
+
+def test_hooks_list_only_overridden_methods():
+    """Ezilmeyen kancalar listeye girmez; kapanış ters sırayla çağrılır"""
+    first, second = _Recorder('a', []), _Recorder('b', [])
+    hooks = plugin_hooks([first, second])
+    assert hooks['draw_field'] == [] and hooks['begin_frame'] == []
+    assert [name for name, _ in hooks['on_frame']] == ['update.a', 'update.b']
+    assert [method.__self__ for _, method in hooks['close']] == [second, first]
+
+
+def test_game_calls_frame_and_finish_hooks():
+    """Her adımdan sonra on_frame, koşu bitince bir kez on_finish; çıkarılan eklenti kapanır"""
+    calls = []
+    game = Game()
+    plugin = game.add_plugin(_Recorder('kayit', calls))
+    game._handle_flap()
+    for _ in range(FPS * 20):
+        if game.state != GAME_STATES['PLAYING']:
+            break
+        game.update()
+    assert game.state == GAME_STATES['GAME_OVER']
+
+    frames = [entry[2] for entry in calls if entry[1] == 'on_frame']
+    assert frames == list(range(1, game.frame + 1))
+    assert calls[-1] == ('kayit', 'on_finish', game.frame)
+    game.update()  # Oyun bittikten sonra kanca çağrılmaz
+    assert calls.count(('kayit', 'on_finish', game.frame)) == 1
+
+    game.remove_plugin(plugin)
+    assert calls[-1] == ('kayit', 'close') and game.plugins == []
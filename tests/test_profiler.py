@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Profil yakalama testleri - sinyal işleyicisi ve katlanmış yığınlar
+"""
+
+import cProfile
+import pstats
+import signal
+
+import pytest
+
+from game import Game
+from profiler import _code_key, collapsed_stacks
+from timeline import traced
+
+needs_sigusr1 = pytest.mark.skipif(not hasattr(signal, 'SIGUSR1'), reason='SIGUSR1 yok')
+
+
+@needs_sigusr1
+def test_game_leaves_signal_handler_alone():
+    """Game kurmak süreç genelindeki SIGUSR1 işleyicisini değiştirmez"""
+    before = signal.getsignal(signal.SIGUSR1)
+    Game()
+    assert signal.getsignal(signal.SIGUSR1) is before
+
+
+@needs_sigusr1
+def test_install_and_restore_signal():
+    """install_signal isteği bağlar; restore_signal önceki işleyiciyi geri koyar"""
+    def previous(signum, frame):
+        pass
+
+    old = signal.signal(signal.SIGUSR1, previous)
+    try:
+        game = Game()
+        assert game.frame_profiler().install_signal()
+        signal.raise_signal(signal.SIGUSR1)
+        assert game.profiler.requested
+        game._shutdown()
+        assert signal.getsignal(signal.SIGUSR1) is previous
+    finally:
+        signal.signal(signal.SIGUSR1, old)
+
+
+
+class _Sky:
+    """Aynı adlı izlenen yöntemler: yollar sınıfa göre ayrılmalı"""
+
+    @traced('test.sky')
+    def load(self):
+        return sum(range(20000))
+
+    def build_sky(self):
+        return self.load()
+
+
+class _Hills:
+    @traced('test.hills')
+    def load(self):
+        return max(range(60000))
+
+    def build_hills(self):
+        return self.load()
+
+
+def _line_time(lines, prefix: str) -> float:
+    """Bu önekle başlayan yığın satırlarının toplam süresi (µs)"""
+    return sum(int(line.rsplit(' ', 1)[1]) for line in lines if line.startswith(prefix))
+
+
+def test_collapsed_stacks_route_through_traced_wrappers():
+    """İzleme sarmalayıcısı yığında görünmez; her çağıran kendi sarılan fonksiyonuna bağlanır"""
+    profile = cProfile.Profile()
+    profile.enable()
+    for _ in range(20):
+        _Sky().build_sky()
+        _Hills().build_hills()
+    profile.disable()
+    stats = pstats.Stats(profile)
+    lines = collapsed_stacks(stats, min_us=0)
+
+    assert not any('wrapper' in line for line in lines)
+    # Oranla dağıtılsaydı her yol öbür load'un çağrılarını da gösterirdi
+    assert not any('build_sky' in line and 'builtins.max' in line for line in lines)
+    assert not any('build_hills' in line and 'builtins.sum' in line for line in lines)
+    assert any('build_sky;test_profiler:load;built-in_method_builtins.sum' in line for line in lines)
+    cumulative = {key: entry[3] * 1e6 for key, entry in stats.stats.items()}
+    sky = cumulative[_code_key(_Sky.load.__wrapped__.__code__)]
+    hills = cumulative[_code_key(_Hills.load.__wrapped__.__code__)]
+    assert _line_time(lines, 'test_profiler:build_sky;test_profiler:load') == pytest.approx(
+        sky, rel=0.02, abs=20)
+    assert _line_time(lines, 'test_profiler:build_hills;test_profiler:load') == pytest.approx(
+        hills, rel=0.02, abs=20)
+    total = sum(int(line.rsplit(' ', 1)[1]) for line in lines)
+    assert total == pytest.approx(stats.total_tt * 1e6, rel=0.01, abs=len(lines))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Geri sarma testleri - halka kaydı, arka planda dışa aktarım ve ölümden geri sarıp sürdürme
+"""
+
+import os
+
+from config import *
+from game import Game
+from rewind import frame_snapshot, load_export
+
+
+def _play_until_death(game: Game, limit: int = FPS * 20):
+    """Kuş flap yapmadan düşer; oyun bitene kadar update çağrılır"""
+    for _ in range(limit):
+        if game.state != GAME_STATES['PLAYING']:
+            return
+        game.update()
+
+
+def test_export_in_background_round_trips_and_prunes(tmp_path):
+    """Dışa aktarım iş parçacığında yazılır; satırlar kaydedilen demetlere birebir döner"""
+    game = Game(rewind=True)
+    game._handle_flap()
+    paths = []
+    for _ in range(3):
+        for _ in range(20):
+            game.update()
+        paths.append(game.rewind.export_in_background(str(tmp_path), keep=2))
+        game.rewind.join()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        os.path.basename(path) for path in paths[1:])
+    frames, background = load_export(paths[-1])
+    assert len(frames) == len(game.rewind) == background.shape[0]
+    latest = game.rewind.snapshot(0)
+    assert frame_snapshot(frames[-1], latest[8]) == latest
+
+
+def test_resuming_after_death_does_not_finish_twice():
+    """Ölümden geri sarılıp sürdürülen dal ikinci kez ısı haritası/arşiv/dışa aktarım yazmaz"""
+    game = Game(rewind=True)
+    exports = []
+    game.rewind.export_in_background = lambda: exports.append(len(game.rewind)) or 'test.npz'
+    game._handle_flap()
+    _play_until_death(game)
+    assert game.state == GAME_STATES['GAME_OVER']
+    assert len(exports) == 1
+
+    game._start_rewind()
+    game.rewind_cursor = FPS // 2
+    game.rewind.restore(game, game.rewind_cursor)
+    assert game.state == GAME_STATES['PLAYING']
+    game._resume_from_rewind()
+    _play_until_death(game)
+    assert game.state == GAME_STATES['GAME_OVER']
+    assert len(exports) == 1
+
+    game.reset()
+    game.state = GAME_STATES['PLAYING']
+    _play_until_death(game)
+    assert len(exports) == 2  # Yeni koşu yine kaydedilir
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Rollback netcode testleri - iki eş sanal loopback ağı üzerinden düello yapar
+"""
+
+import pytest
+
+from config import *
+from rollback import INPUT_FORMAT, RollbackSession, peers_in_sync, simulate_duel
+
+
+@pytest.mark.parametrize('delay, jitter, loss', [(0, 0, 0.0), (3, 4, 0.05), (2, 6, 0.2)])
+def test_peers_converge(delay, jitter, loss):
+    """Gecikme, jitter ve kayba rağmen tüm girdiler teslim edilince eşler aynı dünyayı görür"""
+    frames = FPS * 10
+    peers, stats = simulate_duel(frames, delay, jitter, loss, seed=3)
+    assert [peer.frame for peer in peers] == [frames, frames]
+    assert all(peer.remote_confirmed == frames - 1 for peer in peers)
+    assert peers_in_sync(peers)
+    if loss:
+        assert stats['lost'] > 0
+
+
+def test_rollback_depth_is_bounded():
+    """Yanlış tahminler geri sarılır ve derinlik sınırı aşılmaz"""
+    max_rollback = 6
+    peers, stats = simulate_duel(FPS * 10, 3, 4, 0.1, seed=5, max_rollback=max_rollback)
+    assert peers_in_sync(peers)
+    assert sum(peer.rollbacks for peer in peers) > 0
+    for peer in peers:
+        assert peer.max_depth <= max_rollback
+        assert peer.resimulated_frames >= peer.rollbacks
+
+
+def test_stale_packet_is_ignored():
+    """Eski ya da tekrar eden paket geri sarma yapmaz"""
+    session = RollbackSession(seed=1, local_index=0)
+    for _ in range(4):
+        session.advance(False)
+    flap_packet = INPUT_FORMAT.pack(2, 0b100)  # Rakip 0. karede flap yaptı
+    assert session.receive(flap_packet) == 4  # 0. kareden şimdiki kareye geri sarılır
+    assert session.remote_confirmed == 2
+    assert session.receive(flap_packet) == 0
+    assert session.rollbacks == 1
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Seyirci yayını testleri - bot oyunu yerel izleyicilere yayınlanır ve kareler yeniden kurulur
+"""
+
+import queue
+
+import pygame
+
+from autopilot import reference_flap
+from config import *
+from game import GameSimulation
+from spectator import MSG_KEYFRAME, SpectatorBroadcaster, SpectatorHub, SpectatorViewer
+
+
+def _broadcast(hub: SpectatorHub, simulation: GameSimulation, frames: int,
+               broadcaster: SpectatorBroadcaster):
+    """Bot oyununu 'frames' tick yayınlar (ölünce oyun yeniden başlar)"""
+    for _ in range(frames):
+        if simulation.state != GAME_STATES['PLAYING']:
+            simulation.reset()
+        if reference_flap(simulation):
+            simulation.flap()
+        simulation.step()
+        broadcaster.publish(simulation)
+
+
+def _drain(subscriber: queue.Queue, viewer: SpectatorViewer) -> int:
+    """Kuyruktaki paketleri uygular; yeniden kurulan kare sayısını döndürür"""
+    frames = 0
+    while True:
+        try:
+            packet = subscriber.get_nowait()
+        except queue.Empty:
+            return frames
+        if packet is not None and viewer.apply(packet):
+            frames += 1
+
+
+def test_viewers_rebuild_every_frame():
+    """Baştan ve sonradan katılan izleyiciler her tick'te yayıncıyla aynı kareyi kurar"""
+    hub = SpectatorHub(queue_size=FPS * 60)
+    broadcaster = SpectatorBroadcaster(hub, keyframe_interval=FPS)
+    simulation = GameSimulation(7)
+    early, early_viewer = hub.subscribe(), SpectatorViewer()
+
+    _broadcast(hub, simulation, FPS * 3 + FPS // 3, broadcaster)
+    late, late_viewer = hub.subscribe(), SpectatorViewer()
+    assert late.queue[0][:1] == MSG_KEYFRAME  # Geç katılan son keyframe'den başlar
+
+    for _ in range(FPS * 3):
+        _broadcast(hub, simulation, 1, broadcaster)
+        _drain(early, early_viewer)
+        _drain(late, late_viewer)
+        assert early_viewer.matches(simulation)
+        assert late_viewer.matches(simulation)
+
+    assert broadcaster.deltas > broadcaster.keyframes > 0
+    hub.close()
+    assert early.get_nowait() is None
+
+
+def test_slow_viewer_is_dropped():
+    """Kuyruğunu boşaltmayan izleyici düşürülür, diğerleri etkilenmez"""
+    hub = SpectatorHub(queue_size=8)
+    broadcaster = SpectatorBroadcaster(hub)
+    simulation = GameSimulation(1)
+    slow, fast = hub.subscribe(), hub.subscribe()
+    viewer = SpectatorViewer()
+
+    for _ in range(FPS):
+        _broadcast(hub, simulation, 1, broadcaster)
+        _drain(fast, viewer)
+
+    assert hub.dropped == 1
+    assert hub.subscribers == [fast]
+    assert list(slow.queue)[-1] is None  # Düşürülen izleyiciye bitiş işareti gider
+    assert viewer.matches(simulation)
+
+
+def test_viewer_draws_rebuilt_frame():
+    """İzleyici yeniden kurduğu kareyi oyunun katmanlarıyla çizer"""
+    pygame.init()
+    hub = SpectatorHub()
+    subscriber = hub.subscribe()
+    _broadcast(hub, GameSimulation(2), FPS, SpectatorBroadcaster(hub))
+    viewer = SpectatorViewer()
+    assert _drain(subscriber, viewer) == FPS
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    viewer.draw(surface)
+    assert viewer.synced
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Oyun Döngüsü Zaman Çizelgesi (Chrome trace-event)
+Toplu süre ölçümleri yavaş karenin ne zaman ve neden yavaş olduğunu
+göstermez. İzleyici (main.py --trace) olayları, güncelleme alt aşamalarını,
+her çizim katmanını, display.flip'i, clock.tick uykusunu, asset yüklemelerini
+ve ses çalmayı başlangıç/süre aralıkları olarak önceden ayrılmış bir halkaya
+yazar. Döküm son TRACE_SECONDS saniyeyi Chrome trace-event JSON olarak yazar;
+dosya Perfetto (ui.perfetto.dev) ya da chrome://tracing ile açılır.
+
+Kare işi (olaylar + güncelleme + çizim, uyku hariç) TRACE_FRAME_BUDGET_MS
+bütçesini aşarsa yavaş kare işaretlenir ve TRACE_DUMP_AFTER_FRAMES kare sonra
+döküm kendiliğinden alınır (ardındaki kareler de görünsün diye). Oyunda F8
+elle döküm alır; çıkışta son pencere de yazılır. Dökümü bir iş parçacığı
+yazar, ana döngü yalnızca pencereyi kopyalar.
+
+İzleyici kapalıyken aralık noktaları paylaşılan boş bir bağlam döndürür.
+"""
+
+import argparse
+import functools
+import glob
+import json
+import os
+import threading
+import time
+from array import array
+from collections import deque
+from typing import List, Optional
+
+from config import *
+
+# Süreçteki etkin izleyici (Game(trace=True) kurar); yoksa aralıklar kaydedilmez
+_active: Optional['Timeline'] = None
+
+
+class _NullSpan:
+    """İzleyici kapalıyken kullanılan boş aralık"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Adlandırılmış aralık - ad başına bir kez oluşturulur, her girişte yeniden kullanılır"""
+
+    __slots__ = ('timeline', 'name', 'start')
+
+    def __init__(self, timeline: 'Timeline', name: str):
+        self.timeline = timeline
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.timeline.record(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class Timeline:
+    """Önceden ayrılmış aralık halkası ve yavaş kare tetikleyicisi"""
+
+    def __init__(self, capacity: int = TRACE_BUFFER_EVENTS, seconds: float = TRACE_SECONDS,
+                 budget_ms: float = TRACE_FRAME_BUDGET_MS, directory: str = TRACE_DIR):
+        """Halkayı ayırır (budget_ms 0 ise otomatik döküm kapalı)"""
+        self.capacity = capacity
+        self.seconds = seconds
+        self.budget_ns = int(budget_ms * 1e6)
+        self.directory = directory
+        self._names: List[Optional[str]] = [None] * capacity
+        self._starts = array('q', bytes(8 * capacity))
+        self._ends = array('q', bytes(8 * capacity))
+        self.head = 0
+        self.count = 0
+        self.origin = time.perf_counter_ns()
+        self._spans = {}
+
+        # Yavaş kareler: (başlangıç, bitiş, durum, skor); döküm penceresindekiler işaretlenir
+        self.slow_frames: deque = deque(maxlen=256)
+        self._frame_start = 0
+        self._dump_countdown = -1
+        self._last_auto_dump = -float('inf')
+        self._writer: Optional[threading.Thread] = None
+        self.dumps: List[str] = []
+
+    def span(self, name: str) -> _Span:
+        """Adın yeniden kullanılan aralık nesnesi (with bloğu için)"""
+        span = self._spans.get(name)
+        if span is None:
+            span = self._spans[name] = _Span(self, name)
+        return span
+
+    def record(self, name: str, start: int, end: int):
+        """Tamamlanmış aralığı halkaya yazar (perf_counter_ns zamanları)"""
+        index = self.head
+        self._names[index] = name
+        self._starts[index] = start
+        self._ends[index] = end
+        self.head = (index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def begin_frame(self):
+        """Kare işinin başlangıcı (olaylar işlenmeden önce)"""
+        self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self, state: str, score: int):
+        """Kare işinin sonu (uykudan önce): bütçe aşıldıysa dökümü zamanlar"""
+        end = time.perf_counter_ns()
+        self.record('frame', self._frame_start, end)
+        if self._dump_countdown > 0:
+            self._dump_countdown -= 1
+            if self._dump_countdown == 0:
+                self.dump('yavas-kare')
+        if self.budget_ns and end - self._frame_start > self.budget_ns:
+            self.slow_frames.append((self._frame_start, end, state, score))
+            now = time.perf_counter()
+            if self._dump_countdown < 0 and now - self._last_auto_dump >= TRACE_DUMP_COOLDOWN:
+                self._last_auto_dump = now
+                self._dump_countdown = max(1, TRACE_DUMP_AFTER_FRAMES)
+
+    def window(self) -> tuple:
+        """Son 'seconds' saniyede biten aralıkların kopyası (eskiden yeniye)"""
+        limit = time.perf_counter_ns() - int(self.seconds * 1e9)
+        first = (self.head - self.count) % self.capacity
+        order = [(first + offset) % self.capacity for offset in range(self.count)]
+        names, starts, ends = self._names, self._starts, self._ends
+        events = [(names[i], starts[i], ends[i]) for i in order if ends[i] >= limit]
+        slow = [frame for frame in self.slow_frames if frame[1] >= limit]
+        return events, slow
+
+    def dump(self, reason: str = 'elle') -> str:
+        """Pencereyi kopyalar ve arka planda JSON olarak yazar; dosya yolunu döndürür"""
+        self._dump_countdown = -1
+        events, slow = self.window()
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory,
+                            f"{time.strftime('%Y%m%d-%H%M%S')}-{len(self.dumps):03d}-{reason}.json")
+        self.join()
+        self._writer = threading.Thread(target=self._write, args=(path, events, slow),
+                                        name='trace-dump', daemon=True)
+        self._writer.start()
+        self.dumps.append(path)
+        return path
+
+    def _write(self, path: str, events: list, slow: list):
+        """Chrome trace-event JSON'u yazar ve eski dökümleri budar"""
+        origin = self.origin
+        pid = os.getpid()
+        trace = [
+            {'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 1,
+             'args': {'name': 'Flappy Bird'}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': 1,
+             'args': {'name': 'oyun döngüsü'}},
+        ]
+        for name, start, end in events:
+            trace.append({'name': name, 'cat': name.split('.', 1)[0], 'ph': 'X', 'pid': pid,
+                          'tid': 1, 'ts': (start - origin) / 1e3, 'dur': (end - start) / 1e3})
+        for start, end, state, score in slow:
+            trace.append({'name': 'bütçe aşıldı', 'cat': 'frame', 'ph': 'i', 's': 't',
+                          'pid': pid, 'tid': 1, 'ts': (end - origin) / 1e3,
+                          'args': {'work_ms': round((end - start) / 1e6, 3),
+                                   'budget_ms': self.budget_ns / 1e6,
+                                   'state': state, 'score': score}})
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+            print(f"🧵 Zaman çizelgesi yazıldı ({len(events)} aralık, "
+                  f"{len(slow)} yavaş kare): {path}")
+            old = sorted(glob.glob(os.path.join(self.directory, '*.json')),
+                         key=os.path.getmtime)[:-TRACE_DUMP_KEEP]
+            for stale in old:
+                os.remove(stale)
+        except OSError as e:
+            print(f"Uyarı: Zaman çizelgesi yazılamadı ({e})")
+
+    def join(self):
+        """Süren döküm yazımını bekler"""
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+
+
+def start(timeline: Optional[Timeline] = None) -> Timeline:
+    """İzleyiciyi süreçte etkinleştirir"""
+    global _active
+    _active = timeline or Timeline()
+    return _active
+
+
+def stop():
+    """İzleyiciyi kapatır (bekleyen döküm yazılır)"""
+    global _active
+    if _active is not None:
+        _active.join()
+    _active = None
+
+
+def span(name: str):
+    """with bloğu için aralık; izleyici kapalıyken boş bağlam"""
+    timeline = _active
+    if timeline is None:
+        return NULL_SPAN
+    return timeline.span(name)
+
+
+def traced(name: str):
+    """Fonksiyonun her çağrısını 'name' aralığı olarak kaydeden dekoratör"""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            timeline = _active
+            if timeline is None:
+                return function(*args, **kwargs)
+            with timeline.span(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def run_benchmark(frames: int, hitch_ms: float):
+    """Otopilotlu oyunu izleyiciyle ve izleyicisiz oynatır; yapay takılmada dökümü denetler"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    import timeline  # python timeline.py ile __main__ olarak çalışırken oyunun gördüğü modül
+    from autopilot import Autopilot
+    from plugins import TracePlugin
+    from replay import _create_game
+
+    def play(game, count: int, hitch_at: int = -1) -> float:
+        """count kare oynar; ortalama kare işi (ms)"""
+        total = 0.0
+        for index in range(count):
+            started = time.perf_counter()
+            game._begin_frame()
+            game.handle_events()
+            game.update()
+            game.draw()
+            if index == hitch_at:
+                with timeline.span('benchmark.hitch'):
+                    time.sleep(hitch_ms / 1000)
+            game._end_frame()
+            total += time.perf_counter() - started
+            game.clock.tick(FPS)
+        return total / count * 1e3
+
+    game = _create_game()
+    game.autopilot = Autopilot()
+    game.state = GAME_STATES['PLAYING']
+    plain = play(game, frames)
+
+    tracer = timeline.start(timeline.Timeline(seconds=frames / FPS))
+    game.tracer = game.add_plugin(TracePlugin(tracer)).tracer
+    traced_ms = play(game, frames, hitch_at=frames // 2)
+    timeline.stop()
+
+    per_frame = tracer.count / frames
+    print(f"🧵 {frames} kare: izleyicisiz {plain:.2f} ms/kare, izleyiciyle {traced_ms:.2f} ms/kare "
+          f"(kare başına {per_frame:.0f} aralık, halka {tracer.capacity} olay)")
+    print(f"   {len(tracer.slow_frames)} yavaş kare, {len(tracer.dumps)} otomatik döküm")
+    for path in tracer.dumps:
+        with open(path, encoding='utf-8') as f:
+            events = json.load(f)['traceEvents']
+        names = sorted({event['name'] for event in events if event['ph'] == 'X'})
+        print(f"   {path}: {len(events)} olay; {', '.join(names)}")
+
+
+def main():
+    """Komut satırı girişi - ekransız izleme ve otomatik döküm denemesi"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Zaman Çizelgesi İzleyici')
+    parser.add_argument('--frames', type=int, default=FPS * 5,
+                        help='Oynatılacak kare sayısı')
+    parser.add_argument('--hitch', type=float, default=50.0,
+                        help='Ortadaki karede yapay takılma (ms) - otomatik dökümü tetikler')
+    args = parser.parse_args()
+    run_benchmark(args.frames, args.hitch)
+
+
+if __name__ == '__main__':
+    main()
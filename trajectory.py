@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flappy Bird Klonu - Flap Yörünge Tablosu
+Flap'ten sonra Bird.update her seferinde aynı hız/yer değiştirme dizisini
+üretir: hız BIRD_FLAP_STRENGTH'ten başlayıp her karede BIRD_GRAVITY kadar
+artar ve BIRD_MAX_FALL_SPEED'de sabitlenir. Bu dizi fizik sabitleri başına
+bir kez hesaplanır ve diskte sabitlerin hash'iyle anahtarlanarak saklanır.
+
+Tablo iki satırdan oluşur: flap hızından ve kuşun başlangıç hızından (0)
+başlayan yörüngeler. Taşınan herhangi bir hız bu satırlardan birinin
+içindeki bir adıma karşılık gelir (flap sonrası k. karedeki hız, k adımlık
+yörüngenin başlangıcıdır); böylece "şu hızla k kare sonra kuş nerede" sorusu
+döngü yerine iki liste okumasıyla yanıtlanır. Hız sabitlendikten sonrası
+doğrusaldır ve tabloya yazılmaz. Satırlara düşmeyen hızlar için satır
+bellekte üretilir ve hız -> (satır, adım) eşlemesi önbellekte tutulur.
+
+Sonuçlar adım adım toplamayla aynı sırada hesaplanır; sabitler ikili
+kesirliyken (collision.exact_arithmetic) y + fark da bit düzeyinde aynıdır.
+Botlar (autopilot.py), kaba adım (GameSimulation.advance) ve analitik ileri
+sarma (fastforward.py) bu tabloyu paylaşır.
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import os
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from config import *
+
+TRAJECTORY_VERSION = 1
+
+
+class Trajectory:
+    """Tek bir başlangıç hızından flap'siz yörünge: adım -> (yer değiştirme, hız)"""
+
+    def __init__(self, origin: float, velocities: List[float], displacements: List[float]):
+        """Hesaplanmış listelerden satır oluşturur (indeks 0 = başlangıç)"""
+        self.origin = origin
+        self.velocities = velocities  # i adım sonraki hız
+        self.displacements = displacements  # i adım sonraki toplam y kayması
+        self.terminal = len(velocities) - 1  # Bu adımdan sonra hız değişmez
+        self.fall = velocities[-1]
+        # Yörüngenin tepe noktası: hızın negatif olmaktan çıktığı ilk adım
+        self.apex = bisect.bisect_left(velocities, 0.0) if velocities[0] < 0 else 0
+
+    @classmethod
+    def compute(cls, origin: float, max_frames: int = TRAJECTORY_MAX_FRAMES) -> 'Trajectory':
+        """Bird.update ile aynı aritmetikle hız sabitlenene kadar adımlar"""
+        velocities = [origin]
+        displacements = [0.0]
+        y, velocity = 0.0, origin
+        for _ in range(max_frames):
+            previous = velocity
+            velocity += BIRD_GRAVITY
+            if velocity > BIRD_MAX_FALL_SPEED:
+                velocity = BIRD_MAX_FALL_SPEED
+            if velocity == previous:
+                break
+            y += velocity
+            velocities.append(velocity)
+            displacements.append(y)
+        return cls(origin, velocities, displacements)
+
+    def offset(self, start: int, k: int) -> float:
+        """start adımından k kare sonraki y kayması"""
+        end = start + k
+        displacements = self.displacements
+        if end <= self.terminal:
+            return displacements[end] - displacements[start]
+        return displacements[-1] - displacements[start] + (end - self.terminal) * self.fall
+
+    def velocity(self, start: int, k: int) -> float:
+        """start adımından k kare sonraki hız"""
+        end = start + k
+        return self.velocities[end] if end <= self.terminal else self.fall
+
+    def path(self, y: float, start: int, frames: int) -> Tuple[List[float], List[float]]:
+        """y'den başlayıp 0..frames karelerindeki y ve hız listeleri"""
+        end = min(start + frames, self.terminal)
+        base = self.displacements[start]
+        ys = [y + (d - base) for d in self.displacements[start:end + 1]]
+        velocities = self.velocities[start:end + 1]
+        if len(ys) <= frames:
+            # Hız sabitlendikten sonrası doğrusal
+            tail = start + frames - end
+            ys.extend(y + self.offset(start, k) for k in range(frames - tail + 1, frames + 1))
+            velocities.extend([self.fall] * tail)
+        return ys, velocities
+
+    def to_json(self) -> dict:
+        """Diske yazılacak biçim"""
+        return {'origin': self.origin, 'velocities': self.velocities,
+                'displacements': self.displacements}
+
+
+class TrajectoryTable:
+    """Fizik sabitleri için flap ve başlangıç yörüngeleri - O(1) sorgular"""
+
+    def __init__(self, rows: List[Trajectory]):
+        """Satırlardan tabloyu kurar (ilk satır flap yörüngesi olmalı)"""
+        self.rows = rows
+        self.flap = rows[0]
+        self.key = physics_key()
+        self._located: Dict[float, Tuple[Trajectory, int]] = {}  # Hız -> (satır, adım)
+        # Her karede flap yapan kuşun sabit hızı (flap + bir kare yerçekimi)
+        self.rise = self.flap.velocity(0, 1)
+
+    @classmethod
+    def compute(cls) -> 'TrajectoryTable':
+        """Güncel sabitlerden tabloyu hesaplar"""
+        rows = [Trajectory.compute(BIRD_FLAP_STRENGTH)]
+        table = cls(rows)
+        if table._find(0.0) is None:
+            rows.append(Trajectory.compute(0.0))
+        return table
+
+    def _find(self, velocity: float) -> Optional[Tuple[Trajectory, int]]:
+        """Hızın kayıtlı satırlardaki adımı (yoksa None)"""
+        for row in self.rows:
+            if velocity == row.fall:
+                return row, row.terminal
+            if BIRD_GRAVITY > 0:
+                index = round((velocity - row.origin) / BIRD_GRAVITY)
+                if 0 <= index <= row.terminal and row.velocities[index] == velocity:
+                    return row, index
+            elif velocity == row.origin:
+                return row, 0
+        return None
+
+    def locate(self, velocity: float) -> Tuple[Trajectory, int]:
+        """Taşınan hızın yörünge satırı ve o satırdaki adımı"""
+        found = self._located.get(velocity)
+        if found is None:
+            found = self._find(velocity)
+            if found is None:
+                found = (Trajectory.compute(velocity), 0)
+            if len(self._located) >= TRAJECTORY_LOCATE_CACHE:
+                self._located.clear()
+            self._located[velocity] = found
+        return found
+
+    def coast(self, velocity: float, k: int) -> Tuple[float, float]:
+        """Flap yapılmazsa k kare sonraki (y kayması, hız)"""
+        row, start = self.locate(velocity)
+        return row.offset(start, k), row.velocity(start, k)
+
+    def after_flap(self, k: int) -> Tuple[float, float]:
+        """Flap'in yapıldığı kare dahil k kare sonraki (y kayması, hız)"""
+        return self.flap.offset(0, k), self.flap.velocity(0, k)
+
+    def reach(self, y: float, velocity: float, k: int) -> Tuple[float, float]:
+        """(y, hız) durumundan k kare sonra erişilebilen en küçük ve en büyük y
+
+        En büyük y hiç flap yapmamaktır. En küçük y için her karede en küçük
+        hız seçilir: hız flap sonrası hızın altındayken süzülür, sonra her
+        karede flap yapılır (hızlar aynı anda elde edilebildiği için bu en iyisidir).
+        """
+        row, start = self.locate(velocity)
+        bottom = y + row.offset(start, k)
+        rise = self.rise
+        following = row.velocities[start + 1] if start < row.terminal else row.fall
+        if following >= rise:
+            return y + k * rise, bottom
+        # Süzülme adımları: hızı hâlâ flap sonrası hızdan küçük olanlar
+        glide = bisect.bisect_left(row.velocities, rise, start + 1) - (start + 1)
+        if glide == row.terminal - start and row.fall < rise:
+            glide = k
+        glide = min(glide, k)
+        return y + row.offset(start, glide) + (k - glide) * rise, bottom
+
+    def to_json(self) -> dict:
+        """Diske yazılacak biçim"""
+        return {'version': TRAJECTORY_VERSION, 'key': list(self.key),
+                'rows': [row.to_json() for row in self.rows]}
+
+    @classmethod
+    def from_json(cls, data: dict) -> Optional['TrajectoryTable']:
+        """Diskteki kayıttan tablo (sürüm ya da sabitler uyuşmazsa None)"""
+        if data.get('version') != TRAJECTORY_VERSION or tuple(data.get('key', ())) != physics_key():
+            return None
+        rows = [Trajectory(row['origin'], [float(v) for v in row['velocities']],
+                           [float(d) for d in row['displacements']])
+                for row in data['rows']]
+        return cls(rows) if rows else None
+
+
+def physics_key() -> tuple:
+    """Tabloyu belirleyen fizik sabitleri"""
+    return (BIRD_GRAVITY, BIRD_FLAP_STRENGTH, BIRD_MAX_FALL_SPEED, TRAJECTORY_MAX_FRAMES)
+
+
+def config_hash(key: tuple) -> str:
+    """Sabitlerin kısa hash'i (önbellek dosya adı)"""
+    return hashlib.sha256(f"{TRAJECTORY_VERSION}:{key!r}".encode('utf-8')).hexdigest()[:16]
+
+
+def cache_path(key: tuple, directory: str = TRAJECTORY_CACHE_DIR) -> str:
+    """Sabitler için önbellek dosyasının yolu"""
+    return os.path.join(directory, f"trajectory-{config_hash(key)}.json")
+
+
+def _load(path: str) -> Optional[TrajectoryTable]:
+    """Önbellek dosyasını okur (yoksa veya bozuksa None)"""
+    try:
+        with open(path, 'r') as f:
+            return TrajectoryTable.from_json(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save(table: TrajectoryTable, path: str):
+    """Tabloyu atomik olarak kaydeder (paralel süreçler aynı dosyayı yazabilir)"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(table.to_json(), f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+_tables: Dict[tuple, TrajectoryTable] = {}
+
+
+def trajectory_table() -> TrajectoryTable:
+    """Güncel fizik sabitleri için tablo (bellekte, yoksa diskte, yoksa hesaplanır)"""
+    key = physics_key()
+    table = _tables.get(key)
+    if table is None:
+        path = cache_path(key)
+        table = _load(path)
+        if table is None:
+            table = TrajectoryTable.compute()
+            _save(table, path)
+        _tables[key] = table
+    return table
+
+
+def step_coast(velocity: float, k: int) -> Tuple[float, float]:
+    """Referans: Bird.update'i k kez çağırmakla aynı (y kayması, hız)"""
+    y = 0.0
+    for _ in range(k):
+        velocity += BIRD_GRAVITY
+        if velocity > BIRD_MAX_FALL_SPEED:
+            velocity = BIRD_MAX_FALL_SPEED
+        y += velocity
+    return y, velocity
+
+
+def step_reach(velocity: float, k: int) -> Tuple[float, float]:
+    """Referans: k karelik tüm flap dizileri arasında en küçük/en büyük y kayması"""
+    states = {(0.0, velocity)}
+    for _ in range(k):
+        following = set()
+        for y, current in states:
+            for flap in (False, True):
+                v = (BIRD_FLAP_STRENGTH if flap else current) + BIRD_GRAVITY
+                if v > BIRD_MAX_FALL_SPEED:
+                    v = BIRD_MAX_FALL_SPEED
+                following.add((y + v, v))
+        states = following
+    ys = [y for y, _ in states]
+    return min(ys), max(ys)
+
+
+def main():
+    """Komut satırı girişi - tabloyu kurar, adım adım fizikle doğrular ve ölçer"""
+    parser = argparse.ArgumentParser(description='Flappy Bird Flap Yörünge Tablosu')
+    parser.add_argument('--samples', type=int, default=20000,
+                        help='Doğrulama ve ölçüm için rastgele (hız, kare) sorgusu')
+    parser.add_argument('--frames', type=int, default=FPS * 2,
+                        help='Sorgulardaki en büyük kare sayısı')
+    parser.add_argument('--reach', type=float, nargs=3, metavar=('Y', 'HIZ', 'KARE'),
+                        help='Tek bir erişilebilir y aralığı sorgusu')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    key = physics_key()
+    path = cache_path(key)
+    cached = os.path.exists(path)
+    started = time.perf_counter()
+    table = trajectory_table()
+    elapsed = (time.perf_counter() - started) * 1e3
+    print(f"📈 Yörünge tablosu {config_hash(key)} ({'diskten' if cached else 'hesaplandı'}, "
+          f"{elapsed:.2f} ms): {len(table.rows)} satır, "
+          f"flap satırı {table.flap.terminal} adım, tepe {table.flap.apex}. adım")
+    print(f"   {path}")
+
+    if args.reach:
+        y, velocity, k = args.reach
+        top, bottom = table.reach(y, velocity, int(k))
+        print(f"🎯 y={y:g}, hız={velocity:g}, {int(k)} kare sonra: y ∈ [{top:g}, {bottom:g}] "
+              f"(rect.y {int(top)}..{int(bottom)})")
+        return
+
+    # Sorgular: oyunda görülen hızlar (flap satırı) ve rastgele taşınan hızlar
+    rng = random.Random(args.seed)
+    lattice = table.flap.velocities
+    queries = []
+    for index in range(args.samples):
+        if index % 4 == 3:
+            velocity = round(rng.uniform(BIRD_FLAP_STRENGTH, BIRD_MAX_FALL_SPEED) * 8) / 8
+        else:
+            velocity = rng.choice(lattice)
+        queries.append((velocity, rng.randint(0, args.frames)))
+
+    mismatches = 0
+    for velocity, k in queries:
+        if table.coast(velocity, k) != step_coast(velocity, k):
+            mismatches += 1
+    for velocity, k in queries[:200]:
+        k = min(k, 12)  # Tüm flap dizilerinin kümesi kare sayısıyla büyür
+        if table.reach(0.0, velocity, k) != step_reach(velocity, k):
+            mismatches += 1
+
+    started = time.perf_counter()
+    for velocity, k in queries:
+        table.coast(velocity, k)
+    lookup = time.perf_counter() - started
+    started = time.perf_counter()
+    for velocity, k in queries:
+        step_coast(velocity, k)
+    stepped = time.perf_counter() - started
+    count = len(queries)
+    print(f"⏱️  {count} sorgu: tablo {lookup / count * 1e6:.2f} µs/sorgu | "
+          f"adım adım {stepped / count * 1e6:.2f} µs/sorgu "
+          f"({stepped / lookup if lookup else 0:.1f}x)")
+    if mismatches:
+        print(f"❌ {mismatches} sorgu adım adım fizikle uyuşmuyor")
+    else:
+        print("✅ Tüm sorgular adım adım fizikle birebir aynı")
+
+
+if __name__ == '__main__':
+    main()